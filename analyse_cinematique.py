@@ -0,0 +1,193 @@
+"""
+Module d'analyse cinématique des chemins du curseur
+
+Tous les essais d'une session sont traités en lot avec NumPy : les chemins
+(x, y, t) sont rééchantillonnés sur une grille temporelle uniforme, lissés par
+un filtre de Savitzky-Golay, puis on en déduit la vitesse et l'accélération
+tangentielles et les marqueurs du mouvement (début, fin, pic de vitesse,
+temps de réaction).
+"""
+import math
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+import config
+
+
+def coefficients_savitzky_golay(fenetre, ordre, derivee=0, pas=1.0):
+    """
+    Calcule les coefficients du filtre de Savitzky-Golay
+
+    Args:
+        fenetre: Nombre de points de la fenêtre (impair)
+        ordre: Ordre du polynôme ajusté
+        derivee: Ordre de la dérivée estimée (0 = lissage)
+        pas: Pas d'échantillonnage (pour mettre la dérivée à l'échelle)
+
+    Returns:
+        Tableau des coefficients, à appliquer de -demi à +demi fenêtre
+    """
+    demi = fenetre // 2
+    k = np.arange(-demi, demi + 1, dtype=float)
+    vandermonde = np.vander(k, ordre + 1, increasing=True)
+    pseudo_inverse = np.linalg.pinv(vandermonde)
+    return pseudo_inverse[derivee] * math.factorial(derivee) / (pas ** derivee)
+
+
+def _appliquer_filtre(signaux, coefficients):
+    """Applique un filtre (fenêtre centrée) sur chaque ligne, bords prolongés."""
+    demi = len(coefficients) // 2
+    etendus = np.pad(signaux, ((0, 0), (demi, demi)), mode='edge')
+    return sliding_window_view(etendus, len(coefficients), axis=1) @ coefficients
+
+
+def mettre_en_tableaux(donnees_chemins):
+    """
+    Concatène les chemins de tous les essais
+
+    Args:
+        donnees_chemins: Liste de dictionnaires (voir GenerateurPDF.generer_pdf)
+
+    Returns:
+        Tuple (x, y, t, longueurs) : tableaux concaténés et nombre de points par essai
+    """
+    longueurs = np.zeros(len(donnees_chemins), dtype=np.int64)
+    xs, ys, ts = [], [], []
+    for i, donnees in enumerate(donnees_chemins):
+        chemin = donnees.get('chemin') or []
+        temps = donnees.get('temps_chemin') or []
+        if not temps and chemin:
+            temps = [j * 16 for j in range(len(chemin))]  # estimation ~60 FPS
+        n = min(len(chemin), len(temps))
+        longueurs[i] = n
+        xs.extend(p[0] for p in chemin[:n])
+        ys.extend(p[1] for p in chemin[:n])
+        ts.extend(temps[:n])
+    return (np.asarray(xs, dtype=float), np.asarray(ys, dtype=float),
+            np.asarray(ts, dtype=float), longueurs)
+
+
+def reechantillonner_lot(t, valeurs, longueurs, pas_ms):
+    """
+    Rééchantillonne des signaux de longueurs différentes sur une grille uniforme
+
+    Les essais sont décalés dans le temps pour former une seule série croissante,
+    ce qui permet une unique interpolation linéaire pour tout le lot.
+
+    Args:
+        t: Temps concaténés (ms), croissants au sein de chaque essai
+        valeurs: Liste de tableaux concaténés à rééchantillonner (même forme que t)
+        longueurs: Nombre de points de chaque essai (>= 1)
+        pas_ms: Pas de la grille (ms)
+
+    Returns:
+        Tuple (grille, signaux, valide) : grille (n_max,), liste de tableaux
+        (n_essais, n_max) prolongés par leur dernière valeur, masque des points
+        situés dans la durée de l'essai
+    """
+    debuts = np.concatenate(([0], np.cumsum(longueurs)[:-1]))
+    t_debut = t[debuts]
+    t_fin = t[debuts + longueurs - 1]
+    n_points = np.floor(t_fin / pas_ms).astype(np.int64) + 1
+    grille = np.arange(n_points.max()) * float(pas_ms)
+
+    # Décalage de chaque essai au-delà de la fin du précédent
+    etendue = max(float(t_fin.max()), float(grille[-1])) - min(float(t_debut.min()), 0.0) + pas_ms
+    decalages = np.arange(len(longueurs)) * etendue
+    t_decale = t + np.repeat(decalages, longueurs)
+    requetes = np.clip(grille[None, :], t_debut[:, None], t_fin[:, None]) + decalages[:, None]
+
+    signaux = [np.interp(requetes.ravel(), t_decale, v).reshape(requetes.shape) for v in valeurs]
+    valide = grille[None, :] <= t_fin[:, None]
+    return grille, signaux, valide
+
+
+def analyser_cinematique(donnees_chemins, pas_ms=None, fenetre=None, ordre=None, seuil_pourcent=None):
+    """
+    Calcule les profils et marqueurs cinématiques de tous les essais
+
+    Args:
+        donnees_chemins: Liste de dictionnaires (voir GenerateurPDF.generer_pdf)
+        pas_ms, fenetre, ordre, seuil_pourcent: Paramètres d'analyse, par défaut ceux de config
+
+    Returns:
+        Dictionnaire de tableaux NumPy :
+            - 'temps': grille temporelle (ms)
+            - 'vitesse', 'acceleration': profils (n_essais, n_max) en px/s et px/s²
+            - 'valide': masque des points appartenant à l'essai
+            - 'duree_ms', 'temps_reaction_ms', 'temps_mouvement_ms',
+              'temps_debut_ms', 'temps_fin_ms', 'vitesse_max',
+              'temps_vitesse_max_ms', 'acceleration_max': un élément par essai
+              (NaN si l'essai n'a pas assez de points)
+    """
+    pas_ms = pas_ms or config.PAS_REECHANTILLONNAGE_MS
+    fenetre = fenetre or config.FENETRE_LISSAGE
+    ordre = ordre if ordre is not None else config.ORDRE_LISSAGE
+    seuil_pourcent = seuil_pourcent if seuil_pourcent is not None else config.SEUIL_DEBUT_MOUVEMENT
+
+    n_essais = len(donnees_chemins)
+    noms_marqueurs = ('duree_ms', 'temps_reaction_ms', 'temps_mouvement_ms', 'temps_debut_ms',
+                      'temps_fin_ms', 'vitesse_max', 'temps_vitesse_max_ms', 'acceleration_max')
+    resultats = {nom: np.full(n_essais, np.nan) for nom in noms_marqueurs}
+
+    x, y, t, longueurs = mettre_en_tableaux(donnees_chemins)
+    exploitables = longueurs >= 2
+    if not exploitables.any():
+        resultats['temps'] = np.zeros(0)
+        resultats['vitesse'] = np.zeros((n_essais, 0))
+        resultats['acceleration'] = np.zeros((n_essais, 0))
+        resultats['valide'] = np.zeros((n_essais, 0), dtype=bool)
+        return resultats
+
+    # Ne garder que les points des essais exploitables
+    garder = np.repeat(exploitables, longueurs)
+    grille, (xr, yr), valide = reechantillonner_lot(t[garder], [x[garder], y[garder]],
+                                                    longueurs[exploitables], pas_ms)
+
+    # Fenêtre impaire et compatible avec l'ordre du polynôme
+    fenetre = max(fenetre | 1, ordre + 2 | 1)
+    pas_s = pas_ms / 1000.0
+    c1 = coefficients_savitzky_golay(fenetre, ordre, derivee=1, pas=pas_s)
+    c2 = coefficients_savitzky_golay(fenetre, ordre, derivee=2, pas=pas_s)
+    vx, vy = _appliquer_filtre(xr, c1), _appliquer_filtre(yr, c1)
+    ax, ay = _appliquer_filtre(xr, c2), _appliquer_filtre(yr, c2)
+
+    vitesse = np.hypot(vx, vy)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        acceleration = np.where(vitesse > 1e-9, (vx * ax + vy * ay) / vitesse, 0.0)
+    vitesse = np.where(valide, vitesse, 0.0)
+    acceleration = np.where(valide, acceleration, 0.0)
+
+    # Pic de vitesse puis début/fin du mouvement au seuil autour du pic
+    indices = np.arange(len(grille))[None, :]
+    i_pic = np.argmax(vitesse, axis=1)
+    v_max = vitesse[np.arange(len(i_pic)), i_pic]
+    au_dessus = vitesse >= (seuil_pourcent / 100.0) * v_max[:, None]
+
+    avant_pic = ~au_dessus & (indices < i_pic[:, None])
+    a_un_depart = avant_pic.any(axis=1)
+    i_debut = np.where(a_un_depart, len(grille) - 1 - np.argmax(avant_pic[:, ::-1], axis=1) + 1, 0)
+
+    apres_pic = ~au_dessus & (indices > i_pic[:, None]) & valide
+    derniers = valide.sum(axis=1) - 1
+    i_fin = np.where(apres_pic.any(axis=1), np.argmax(apres_pic, axis=1), derniers)
+
+    t_fin = t[np.concatenate(([0], np.cumsum(longueurs)[:-1])) + longueurs - 1][exploitables]
+    resultats['duree_ms'][exploitables] = t_fin
+    resultats['temps_debut_ms'][exploitables] = grille[i_debut]
+    resultats['temps_reaction_ms'][exploitables] = grille[i_debut]
+    resultats['temps_fin_ms'][exploitables] = grille[i_fin]
+    resultats['temps_mouvement_ms'][exploitables] = grille[i_fin] - grille[i_debut]
+    resultats['vitesse_max'][exploitables] = v_max
+    resultats['temps_vitesse_max_ms'][exploitables] = grille[i_pic]
+    resultats['acceleration_max'][exploitables] = acceleration.max(axis=1)
+
+    # Profils complets (zéros pour les essais inexploitables)
+    resultats['temps'] = grille
+    resultats['vitesse'] = np.zeros((n_essais, len(grille)))
+    resultats['vitesse'][exploitables] = vitesse
+    resultats['acceleration'] = np.zeros((n_essais, len(grille)))
+    resultats['acceleration'][exploitables] = acceleration
+    resultats['valide'] = np.zeros((n_essais, len(grille)), dtype=bool)
+    resultats['valide'][exploitables] = valide
+    return resultats
+
@@ -0,0 +1,315 @@
+"""
+Module d'analyse de groupe : agrège les sessions de plusieurs participants
+
+Les sessions sont chargées en parallèle, alignées par numéro d'essai, puis on
+calcule la courbe d'apprentissage du groupe et les effets consécutifs avec des
+intervalles de confiance par bootstrap (rééchantillonnage des participants).
+
+Usage : python analyse_groupe.py sessions/*.json [--nom NOM] [--bootstrap N] [--processus N]
+"""
+import argparse
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import numpy as np
+from session import charger_session, appliquer_session, phase_essai
+from metriques_essai import metriques_session
+
+# Nombre d'essais de chaque phase utilisés pour les effets consécutifs
+ESSAIS_EFFET_CONSECUTIF = 8
+
+
+def _charger_erreurs(chemin_fichier):
+    """
+    Charge une session et retourne ses erreurs angulaires signées (exécuté dans un processus)
+
+    Returns:
+        Dictionnaire avec 'nom', 'parametres' et 'erreurs' (tableau, NaN si indisponible)
+    """
+    session = charger_session(chemin_fichier)
+    essais = session['essais']
+    erreurs = [essai['metriques_sauvegardees'].get('erreur_angulaire_signee_deg') for essai in essais]
+    if any(e is None for e in erreurs) and essais:
+        # Anciennes sessions : recalculer avec la géométrie de la session
+        appliquer_session(session)
+        erreurs = [m['erreur_angulaire_signee_deg'] for m in metriques_session(essais)]
+    return {
+        'nom': session.get('nom') or os.path.splitext(os.path.basename(chemin_fichier))[0],
+        'parametres': session['parametres'],
+        'erreurs': np.array([np.nan if e is None else e for e in erreurs], dtype=float),
+    }
+
+
+def charger_sessions(chemins_fichiers, processus=None):
+    """
+    Charge plusieurs sessions en parallèle
+
+    Args:
+        chemins_fichiers: Liste des fichiers de session
+        processus: Nombre de processus (par défaut, nombre de cœurs)
+
+    Returns:
+        Liste de dictionnaires (voir _charger_erreurs), dans l'ordre des fichiers
+    """
+    if len(chemins_fichiers) < 2 or processus == 1:
+        return [_charger_erreurs(chemin) for chemin in chemins_fichiers]
+    with ProcessPoolExecutor(max_workers=processus) as executeur:
+        return list(executeur.map(_charger_erreurs, chemins_fichiers))
+
+
+def aligner_essais(sessions):
+    """
+    Aligne les erreurs des participants par numéro d'essai
+
+    Args:
+        sessions: Liste renvoyée par charger_sessions
+
+    Returns:
+        Matrice (n_participants, n_essais_max), NaN pour les essais manquants
+    """
+    n_max = max((len(s['erreurs']) for s in sessions), default=0)
+    matrice = np.full((len(sessions), n_max), np.nan)
+    for i, session in enumerate(sessions):
+        matrice[i, :len(session['erreurs'])] = session['erreurs']
+    return matrice
+
+
+def _moyennes_bootstrap(matrice, n_reechantillonnages, graine):
+    """
+    Moyennes par colonne de n_reechantillonnages tirages avec remise des lignes
+
+    Chaque tirage est représenté par le nombre de fois où chaque participant est
+    tiré : les moyennes s'obtiennent alors par un seul produit matriciel.
+    """
+    generateur = np.random.default_rng(graine)
+    n_participants = matrice.shape[0]
+    comptes = generateur.multinomial(n_participants, np.full(n_participants, 1.0 / n_participants),
+                                     size=n_reechantillonnages).astype(float)
+    presents = ~np.isnan(matrice)
+    sommes = comptes @ np.where(presents, matrice, 0.0)
+    effectifs = comptes @ presents.astype(float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return sommes / effectifs
+
+
+def bootstrap_intervalle(matrice, n_reechantillonnages=10000, niveau=0.95, graine=0, processus=None):
+    """
+    Intervalle de confiance par bootstrap de la moyenne de chaque colonne
+
+    Args:
+        matrice: Tableau (n_participants, n_colonnes), NaN ignorés
+        n_reechantillonnages: Nombre de rééchantillonnages
+        niveau: Niveau de confiance
+        graine: Graine aléatoire (résultat reproductible quel que soit le nombre de processus)
+        processus: Nombre de processus (1 = calcul dans le processus courant)
+
+    Returns:
+        Tuple (moyenne, borne_basse, borne_haute), chacun de forme (n_colonnes,)
+    """
+    matrice = np.atleast_2d(np.asarray(matrice, dtype=float))
+    processus = processus or os.cpu_count() or 1
+    # Découpage en paquets de taille fixe, chacun avec sa propre graine dérivée
+    taille_paquet = 1000
+    tailles = [taille_paquet] * (n_reechantillonnages // taille_paquet)
+    if n_reechantillonnages % taille_paquet:
+        tailles.append(n_reechantillonnages % taille_paquet)
+    graines = np.random.SeedSequence(graine).spawn(len(tailles))
+
+    if processus == 1 or len(tailles) == 1:
+        paquets = [_moyennes_bootstrap(matrice, n, g) for n, g in zip(tailles, graines)]
+    else:
+        with ProcessPoolExecutor(max_workers=min(processus, len(tailles))) as executeur:
+            paquets = list(executeur.map(_moyennes_bootstrap, [matrice] * len(tailles), tailles, graines))
+    moyennes = np.concatenate(paquets, axis=0)
+
+    alpha = (1 - niveau) / 2
+    with warnings.catch_warnings():
+        # Colonnes sans aucune valeur (ex. pas de phase post-adaptation) : NaN attendu
+        warnings.simplefilter('ignore', RuntimeWarning)
+        moyenne = np.nanmean(matrice, axis=0)
+        basse = np.nanquantile(moyennes, alpha, axis=0)
+        haute = np.nanquantile(moyennes, 1 - alpha, axis=0)
+    return moyenne, basse, haute
+
+
+def _moyenne_lignes(matrice, colonnes):
+    """Moyenne de chaque ligne sur un ensemble de colonnes (NaN si aucune valeur)."""
+    if len(colonnes) == 0:
+        return np.full(matrice.shape[0], np.nan)
+    extrait = matrice[:, colonnes]
+    presents = ~np.isnan(extrait)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(presents, extrait, 0.0).sum(axis=1) / presents.sum(axis=1)
+
+
+def calculer_effets(matrice, phases):
+    """
+    Calcule les effets de chaque participant par rapport à sa moyenne de référence
+
+    Args:
+        matrice: Erreurs alignées (n_participants, n_essais), NaN ignorés
+        phases: Phase de chaque essai (voir phase_essai)
+
+    Returns:
+        Dictionnaire {nom de l'effet: tableau (n_participants,)} :
+            - 'effet_initial': début de l'adaptation moins la référence
+            - 'effet_final': fin de l'adaptation moins la référence
+            - 'effet_consecutif': début de la post-adaptation moins la référence
+    """
+    k = ESSAIS_EFFET_CONSECUTIF
+    reference = _moyenne_lignes(matrice, np.flatnonzero(phases == "reference"))
+    adaptation = np.flatnonzero(phases == "adaptation")
+    post_adaptation = np.flatnonzero(phases == "post_adaptation")
+    return {
+        'effet_initial': _moyenne_lignes(matrice, adaptation[:k]) - reference,
+        'effet_final': _moyenne_lignes(matrice, adaptation[-k:]) - reference,
+        'effet_consecutif': _moyenne_lignes(matrice, post_adaptation[:k]) - reference,
+    }
+
+
+def analyser_groupe(sessions, n_reechantillonnages=10000, niveau=0.95, graine=0, processus=None):
+    """
+    Calcule la courbe d'apprentissage et les effets consécutifs du groupe
+
+    Args:
+        sessions: Liste renvoyée par charger_sessions
+        n_reechantillonnages, niveau, graine, processus: voir bootstrap_intervalle
+
+    Returns:
+        Dictionnaire avec la matrice alignée, la courbe (moyenne et IC par essai),
+        les phases par essai, et les effets (moyenne et IC) :
+            - 'effet_initial': début de l'adaptation moins la référence
+            - 'effet_final': fin de l'adaptation moins la référence
+            - 'effet_consecutif': début de la post-adaptation moins la référence
+    """
+    matrice = aligner_essais(sessions)
+    parametres = sessions[0]['parametres']
+    if any(s['parametres'] != parametres for s in sessions[1:]):
+        print("Attention : les sessions n'ont pas toutes les mêmes paramètres, "
+              "les phases sont celles de la première session")
+    phases = np.array([phase_essai(i + 1, parametres) for i in range(matrice.shape[1])])
+
+    # Une colonne par essai, puis une par effet par participant : un seul bootstrap
+    effets = calculer_effets(matrice, phases)
+    colonnes = np.column_stack([matrice] + list(effets.values()))
+    moyenne, basse, haute = bootstrap_intervalle(colonnes, n_reechantillonnages, niveau, graine, processus)
+
+    n_essais = matrice.shape[1]
+    resultats = {
+        'noms': [s['nom'] for s in sessions],
+        'parametres': parametres,
+        'matrice': matrice,
+        'phases': phases,
+        'niveau': niveau,
+        'n_reechantillonnages': n_reechantillonnages,
+        'courbe': (moyenne[:n_essais], basse[:n_essais], haute[:n_essais]),
+    }
+    for j, nom in enumerate(effets):
+        resultats[nom] = (moyenne[n_essais + j], basse[n_essais + j], haute[n_essais + j])
+    return resultats
+
+
+def generer_pdf_groupe(resultats, nom_fichier=None):
+    """
+    Génère le PDF de l'analyse de groupe
+
+    Args:
+        resultats: Dictionnaire renvoyé par analyser_groupe
+        nom_fichier: Nom du fichier (sans extension). Si None, utilise un timestamp
+
+    Returns:
+        Chemin complet du fichier créé ou None en cas d'erreur
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    dossier_pdf = "pdf"
+    if not os.path.exists(dossier_pdf):
+        os.makedirs(dossier_pdf)
+    if nom_fichier:
+        nom_fichier = "".join(c for c in nom_fichier if c.isalnum() or c in "._- ")
+    if not nom_fichier:
+        nom_fichier = f"analyse_groupe_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    nom_fichier_complet = os.path.join(dossier_pdf, f"{nom_fichier}.pdf")
+
+    couleurs_phases = {'reference': '#d5f5e3', 'adaptation': '#fadbd8', 'post_adaptation': '#d6eaf8'}
+    noms_phases = {'reference': 'Référence', 'adaptation': 'Adaptation', 'post_adaptation': 'Post-adaptation'}
+    pourcentage = int(round(resultats['niveau'] * 100))
+
+    try:
+        with PdfPages(nom_fichier_complet) as pdf:
+            # ----- Page 1 : courbe d'apprentissage du groupe -----
+            fig = plt.figure(figsize=(11, 8))
+            ax = fig.add_subplot(111)
+            moyenne, basse, haute = resultats['courbe']
+            numeros = np.arange(1, len(moyenne) + 1)
+            for phase, couleur in couleurs_phases.items():
+                indices = np.flatnonzero(resultats['phases'] == phase)
+                if len(indices):
+                    ax.axvspan(indices[0] + 0.5, indices[-1] + 1.5, color=couleur, alpha=0.6,
+                               label=noms_phases[phase])
+            for ligne in resultats['matrice']:
+                ax.plot(numeros, ligne, color='gray', linewidth=0.5, alpha=0.3)
+            ax.fill_between(numeros, basse, haute, color='tab:blue', alpha=0.3, label=f'IC {pourcentage} %')
+            ax.plot(numeros, moyenne, 'o-', color='tab:blue', markersize=3, label='Moyenne du groupe')
+            ax.axhline(0, color='black', linewidth=0.8)
+            ax.set_title(f"Courbe d'apprentissage ({len(resultats['noms'])} participants)",
+                         fontsize=14, fontweight='bold')
+            ax.set_xlabel('Essai', fontsize=10)
+            ax.set_ylabel('Erreur angulaire signée (°)', fontsize=10)
+            ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+            ax.legend(loc='upper right', fontsize=8)
+            fig.tight_layout()
+            pdf.savefig(fig, bbox_inches='tight')
+            plt.close(fig)
+
+            # ----- Page 2 : effets par rapport à la référence -----
+            fig = plt.figure(figsize=(11, 8))
+            ax = fig.add_subplot(111)
+            libelles = {'effet_initial': "Début de l'adaptation", 'effet_final': "Fin de l'adaptation",
+                        'effet_consecutif': "Effet consécutif"}
+            lignes_texte = []
+            for j, (cle, libelle) in enumerate(libelles.items()):
+                m, b, h = resultats[cle]
+                if np.isnan(m):
+                    lignes_texte.append(f"{libelle} : non disponible")
+                    continue
+                ax.bar(j, m, color='tab:blue', alpha=0.7)
+                ax.errorbar(j, m, yerr=[[m - b], [h - m]], color='black', capsize=8)
+                lignes_texte.append(f"{libelle} : {m:+.1f}° [{b:+.1f} ; {h:+.1f}]")
+            ax.set_xticks(range(len(libelles)))
+            ax.set_xticklabels(list(libelles.values()))
+            ax.axhline(0, color='black', linewidth=0.8)
+            ax.set_ylabel('Différence avec la référence (°)', fontsize=10)
+            ax.set_title(f"Effets ({ESSAIS_EFFET_CONSECUTIF} essais, IC {pourcentage} %, "
+                         f"{resultats['n_reechantillonnages']} rééchantillonnages)", fontsize=14, fontweight='bold')
+            ax.grid(True, axis='y', alpha=0.3, linestyle='-', linewidth=0.5)
+            ax.text(0.02, 0.98, "\n".join(lignes_texte), transform=ax.transAxes, fontsize=10,
+                    verticalalignment='top', family='monospace',
+                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+            fig.tight_layout()
+            pdf.savefig(fig, bbox_inches='tight')
+            plt.close(fig)
+
+        print(f"PDF de groupe généré : {nom_fichier_complet}")
+        return os.path.abspath(nom_fichier_complet)
+    except Exception as e:
+        print(f"Erreur lors de la génération du PDF de groupe : {e}")
+        return None
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Analyse de groupe de plusieurs sessions")
+    parseur.add_argument('fichiers', nargs='+', help="Fichiers de session (.json)")
+    parseur.add_argument('--nom', default=None, help="Nom du PDF de groupe")
+    parseur.add_argument('--bootstrap', type=int, default=10000, help="Nombre de rééchantillonnages")
+    parseur.add_argument('--processus', type=int, default=None, help="Nombre de processus")
+    arguments = parseur.parse_args()
+
+    debut = time.perf_counter()
+    sessions = charger_sessions(arguments.fichiers, arguments.processus)
+    resultats = analyser_groupe(sessions, arguments.bootstrap, processus=arguments.processus)
+    generer_pdf_groupe(resultats, arguments.nom)
+    print(f"Analyse de {len(sessions)} sessions en {time.perf_counter() - debut:.2f} s")
@@ -0,0 +1,232 @@
+"""
+Module des formats de sortie du rapport (PDF, images PNG/SVG, index HTML)
+
+Chaque backend reçoit les figures matplotlib construites par GenerateurPDF,
+une page à la fois, et se charge uniquement de leur enregistrement.
+Les backends dont les pages sont séparables (images, ou PDF si pypdf est installé)
+peuvent aussi insérer une page déjà rendue, reprise du cache des pages.
+"""
+import html
+import io
+import os
+import re
+from matplotlib.backends.backend_pdf import PdfPages
+import config
+
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:  # Dépendance optionnelle : sans elle, le PDF est écrit d'un seul tenant
+    PdfReader = PdfWriter = None
+
+# Fichiers d'images des pages écrits par BackendImages (les autres fichiers du dossier ne sont pas touchés)
+_PAGE_IMAGE = re.compile(r"page_\d{4}\.(png|svg)")
+
+
+class BackendRapport:
+    """Interface commune des formats de sortie du rapport"""
+
+    # Extension du fichier principal produit
+    extension = None
+    # True si chaque page est produite séparément et peut être insérée depuis le cache
+    pages_separables = False
+
+    def ouvrir(self, chemin_base):
+        """
+        Prépare l'écriture d'un rapport
+
+        Args:
+            chemin_base: Chemin du rapport sans extension (ex. "pdf/session1")
+
+        Returns:
+            Chemin du fichier principal qui sera produit
+        """
+        raise NotImplementedError
+
+    def ajouter_page(self, fig, titre, **options):
+        """
+        Enregistre une page du rapport
+
+        Args:
+            fig: Figure matplotlib de la page
+            titre: Titre court de la page (pour les index)
+            options: Options supplémentaires passées à savefig (ex. facecolor)
+
+        Returns:
+            Contenu de la page rendue (octets) si les pages sont séparables, sinon None
+        """
+        raise NotImplementedError
+
+    def rendre_page(self, fig, **options):
+        """
+        Rend une page sans l'ajouter au rapport (backends à pages séparables)
+
+        Args:
+            fig: Figure matplotlib de la page
+            options: Options supplémentaires passées à savefig (ex. facecolor)
+
+        Returns:
+            Contenu de la page rendue (octets), à insérer plus tard avec inserer_page
+        """
+        raise NotImplementedError
+
+    def inserer_page(self, contenu, titre):
+        """
+        Insère une page déjà rendue (backends à pages séparables)
+
+        Args:
+            contenu: Octets retournés par ajouter_page lors d'un rendu précédent
+            titre: Titre court de la page
+        """
+        raise NotImplementedError
+
+    def fermer(self):
+        """Termine l'écriture du rapport"""
+        pass
+
+
+class BackendPDF(BackendRapport):
+    """Rapport en un seul PDF vectoriel multipage"""
+
+    extension = "pdf"
+    # Avec pypdf, chaque page est rendue en PDF d'une page puis assemblée
+    pages_separables = PdfWriter is not None
+
+    def __init__(self, dpi=None):
+        self.pdf = None
+        self.chemin = None
+
+    def ouvrir(self, chemin_base):
+        self.chemin = f"{chemin_base}.pdf"
+        self.pdf = PdfWriter() if self.pages_separables else PdfPages(self.chemin)
+        return self.chemin
+
+    def ajouter_page(self, fig, titre, **options):
+        if not self.pages_separables:
+            self.pdf.savefig(fig, bbox_inches='tight', **options)
+            return None
+        contenu = self.rendre_page(fig, **options)
+        self.inserer_page(contenu, titre)
+        return contenu
+
+    def rendre_page(self, fig, **options):
+        tampon = io.BytesIO()
+        fig.savefig(tampon, format='pdf', bbox_inches='tight', **options)
+        return tampon.getvalue()
+
+    def inserer_page(self, contenu, titre):
+        self.pdf.append(PdfReader(io.BytesIO(contenu)))
+
+    def fermer(self):
+        if self.pdf is None:
+            return
+        if self.pages_separables:
+            # Les pages assemblées répètent les mêmes ressources (polices) : ne les garder qu'une fois
+            if hasattr(self.pdf, 'compress_identical_objects'):
+                self.pdf.compress_identical_objects()
+            with open(self.chemin, 'wb') as f:
+                self.pdf.write(f)
+        else:
+            self.pdf.close()
+        self.pdf = None
+
+
+class BackendImages(BackendRapport):
+    """Rapport sous forme d'une image par page, dans un dossier dédié"""
+
+    pages_separables = True
+
+    def __init__(self, dpi=None):
+        self.dpi = dpi or config.DPI_IMAGES_RAPPORT
+        self.dossier = None
+        self.pages = []  # Liste de tuples (titre, nom du fichier image)
+
+    def ouvrir(self, chemin_base):
+        self.dossier = chemin_base
+        self.pages = []
+        if not os.path.exists(self.dossier):
+            os.makedirs(self.dossier)
+        # Un export précédent sous le même nom (plus de pages, autre format) ne doit pas laisser de pages périmées
+        for entree in os.scandir(self.dossier):
+            if entree.is_file() and (_PAGE_IMAGE.fullmatch(entree.name) or entree.name == "index.html"):
+                os.remove(entree.path)
+        return self.dossier
+
+    def ajouter_page(self, fig, titre, **options):
+        contenu = self.rendre_page(fig, **options)
+        self.inserer_page(contenu, titre)
+        return contenu
+
+    def rendre_page(self, fig, **options):
+        tampon = io.BytesIO()
+        fig.savefig(tampon, format=self.extension, dpi=self.dpi, bbox_inches='tight', **options)
+        return tampon.getvalue()
+
+    def inserer_page(self, contenu, titre):
+        nom_image = f"page_{len(self.pages) + 1:04d}.{self.extension}"
+        with open(os.path.join(self.dossier, nom_image), 'wb') as f:
+            f.write(contenu)
+        self.pages.append((titre, nom_image))
+
+
+class BackendPNG(BackendImages):
+    """Une vignette PNG par page, à la résolution choisie"""
+
+    extension = "png"
+
+
+class BackendSVG(BackendImages):
+    """Une image SVG vectorielle par page"""
+
+    extension = "svg"
+
+
+class BackendHTML(BackendPNG):
+    """Vignettes PNG et page index.html qui ne les charge qu'à l'affichage"""
+
+    def ouvrir(self, chemin_base):
+        super().ouvrir(chemin_base)
+        return os.path.join(self.dossier, "index.html")
+
+    def fermer(self):
+        if self.dossier is None:
+            return
+        nom_rapport = html.escape(os.path.basename(os.path.normpath(self.dossier)))
+        vignettes = "\n".join(
+            f'<figure><img src="{nom_image}" loading="lazy" alt="{html.escape(titre)}">'
+            f'<figcaption>{html.escape(titre)}</figcaption></figure>'
+            for titre, nom_image in self.pages
+        )
+        with open(os.path.join(self.dossier, "index.html"), 'w', encoding='utf-8') as f:
+            f.write(
+                "<!DOCTYPE html>\n<html lang=\"fr\">\n<head>\n<meta charset=\"utf-8\">\n"
+                f"<title>Rapport des données : {nom_rapport}</title>\n"
+                "<style>body{font-family:sans-serif;background:#f8f9fa;color:#2c3e50}"
+                "figure{display:inline-block;margin:8px;background:white;padding:4px;border:1px solid #bdc3c7}"
+                "img{width:360px;height:auto;display:block}figcaption{text-align:center}</style>\n"
+                f"</head>\n<body>\n<h1>Rapport des données : {nom_rapport}</h1>\n{vignettes}\n</body>\n</html>\n"
+            )
+
+
+BACKENDS = {
+    'pdf': BackendPDF,
+    'png': BackendPNG,
+    'svg': BackendSVG,
+    'html': BackendHTML,
+}
+
+
+def creer_backend(format_sortie, dpi=None):
+    """
+    Crée le backend correspondant à un format de sortie
+
+    Args:
+        format_sortie: "pdf", "png", "svg" ou "html"
+        dpi: Résolution des images (formats matriciels)
+
+    Returns:
+        Instance de BackendRapport
+    """
+    try:
+        return BACKENDS[format_sortie.lower()](dpi)
+    except KeyError:
+        raise ValueError(f"Format de rapport inconnu : {format_sortie} (formats : {', '.join(BACKENDS)})")
@@ -0,0 +1,3 @@
+"""
+Scripts de mesure de performance (à lancer depuis la racine : python -m benchmarks.<nom>)
+"""
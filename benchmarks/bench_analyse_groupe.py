@@ -0,0 +1,56 @@
+"""
+Mesure du temps de l'analyse de groupe (chargement, bootstrap, PDF)
+
+Usage : python -m benchmarks.bench_analyse_groupe [participants] [essais] [reechantillonnages]
+"""
+import glob
+import os
+import sys
+import tempfile
+import time
+import config
+from analyse_groupe import charger_sessions, analyser_groupe, generer_pdf_groupe
+from benchmarks.donnees_synthetiques import generer_donnees_chemins
+from session import sauvegarder_session
+
+
+def mesurer(participants=50, essais=200, reechantillonnages=10000):
+    """
+    Crée des sessions synthétiques puis mesure chaque étape de l'analyse de groupe
+
+    Returns:
+        Dictionnaire {étape: durée en secondes}
+    """
+    config.CIBLE_DEBUT_DEVIATION = 41
+    config.CIBLE_FIN_DEVIATION = 161
+    durees = {}
+    with tempfile.TemporaryDirectory() as dossier:
+        for p in range(participants):
+            sauvegarder_session(generer_donnees_chemins(essais, 40, graine=p), f"participant_{p:03d}", dossier)
+        fichiers = sorted(glob.glob(os.path.join(dossier, "*.json")))
+
+        debut = time.perf_counter()
+        sessions = charger_sessions(fichiers)
+        durees['chargement'] = time.perf_counter() - debut
+
+        debut = time.perf_counter()
+        resultats = analyser_groupe(sessions, reechantillonnages)
+        durees['bootstrap'] = time.perf_counter() - debut
+
+        dossier_courant = os.getcwd()
+        os.chdir(dossier)
+        try:
+            debut = time.perf_counter()
+            generer_pdf_groupe(resultats, "bench_groupe")
+            durees['pdf'] = time.perf_counter() - debut
+        finally:
+            os.chdir(dossier_courant)
+    return durees
+
+
+if __name__ == "__main__":
+    arguments = [int(a) for a in sys.argv[1:4]]
+    durees = mesurer(*arguments)
+    for etape, duree in durees.items():
+        print(f"{etape:>12} : {duree * 1000:8.1f} ms")
+    print(f"{'total':>12} : {sum(durees.values()) * 1000:8.1f} ms")
@@ -0,0 +1,60 @@
+"""
+Comparaison des formats de sortie du rapport : pages par seconde et taille produite
+
+Usage : python -m benchmarks.bench_backends [nombre_essais] [dpi]
+"""
+import os
+import sys
+import tempfile
+import time
+from backends_rapport import BACKENDS
+from benchmarks.donnees_synthetiques import generer_donnees_chemins
+from generateur_pdf import GenerateurPDF
+
+
+def taille_sortie(chemin):
+    """Taille en octets d'un fichier ou de tout le contenu d'un dossier."""
+    if os.path.isfile(chemin):
+        return os.path.getsize(chemin)
+    return sum(os.path.getsize(os.path.join(racine, nom))
+               for racine, _, noms in os.walk(chemin) for nom in noms)
+
+
+def mesurer(nombre_essais=50, dpi=None):
+    """
+    Génère le même rapport avec chaque backend
+
+    Returns:
+        Liste de dictionnaires (format, durée, pages/s, taille en octets)
+    """
+    donnees_chemins = generer_donnees_chemins(nombre_essais, 60)
+    resultats = []
+    dossier_courant = os.getcwd()
+    with tempfile.TemporaryDirectory() as dossier:
+        os.chdir(dossier)
+        try:
+            for format_sortie in BACKENDS:
+                generateur = GenerateurPDF(format_sortie, dpi)
+                debut = time.perf_counter()
+                chemin = generateur.generer_pdf(donnees_chemins, f"bench_{format_sortie}")
+                duree = time.perf_counter() - debut
+                nombre_pages = generateur.pages_rendues + generateur.pages_en_cache
+                racine = chemin if format_sortie == 'pdf' else os.path.dirname(chemin)
+                resultats.append({
+                    'format': format_sortie,
+                    'duree_s': duree,
+                    'pages_par_s': nombre_pages / duree,
+                    'taille_octets': taille_sortie(racine),
+                })
+        finally:
+            os.chdir(dossier_courant)
+    return resultats
+
+
+if __name__ == "__main__":
+    nombre_essais = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    dpi = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    resultats = mesurer(nombre_essais, dpi)
+    print(f"{'format':>8} {'durée (s)':>10} {'pages/s':>8} {'taille (Ko)':>12}")
+    for r in resultats:
+        print(f"{r['format']:>8} {r['duree_s']:>10.2f} {r['pages_par_s']:>8.1f} {r['taille_octets'] / 1024:>12.0f}")
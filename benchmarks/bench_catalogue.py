@@ -0,0 +1,165 @@
+"""
+Vérification et mesure du catalogue SQLite des sessions
+
+Des sessions synthétiques sont sauvegardées avec différents angles de déviation
+(catalogue alimenté par session.sauvegarder_session) ; les requêtes du catalogue
+doivent retourner les mêmes sessions et essais qu'un filtrage direct des
+fichiers JSON, l'import d'un dossier ne doit reprendre que les fichiers nouveaux
+ou modifiés, la base doit être en mode WAL et les requêtes doivent passer par
+les index. Le script s'arrête avec un code d'erreur en cas d'écart, puis mesure
+l'insertion en lot d'une grande étude et le temps des requêtes sur toutes les
+sessions.
+
+Usage : python -m benchmarks.bench_catalogue [sessions_mesurees] [essais] [repetitions]
+"""
+import copy
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import config
+from benchmarks.donnees_synthetiques import generer_donnees_chemins
+from catalogue import (ouvrir_catalogue, inserer_sessions, importer_dossier, associer_rapport, rechercher_sessions,
+                       rechercher_essais)
+from session import sauvegarder_session, charger_session, construire_session, phase_essai
+
+ANGLES = (30, 50)
+
+
+def filtrer_fichiers(dossier, angle, numero, minimum):
+    """Version de référence : (fichier, numéro, phase, erreur) lus dans les fichiers JSON."""
+    resultats = []
+    for nom in sorted(os.listdir(dossier)):
+        if not nom.endswith(".json"):
+            continue
+        session = charger_session(os.path.join(dossier, nom))
+        if session['parametres']['ANGLE_DEVIATION'] != angle:
+            continue
+        for n, essai in enumerate(session['essais'], start=1):
+            erreur = essai['metriques_sauvegardees']['erreur_angulaire_deg']
+            if n == numero and erreur is not None and erreur > minimum:
+                resultats.append((nom, n, phase_essai(n, session['parametres']), erreur))
+    return resultats
+
+
+def verifier(sessions=12, essais=24):
+    """
+    Returns:
+        Liste de messages décrivant les écarts (vide si tout concorde)
+    """
+    config.CIBLE_DEBUT_DEVIATION, config.CIBLE_FIN_DEVIATION = 5, 21
+    ecarts = []
+    with tempfile.TemporaryDirectory() as dossier:
+        chemins = []
+        for p in range(sessions):
+            config.ANGLE_DEVIATION = ANGLES[p % len(ANGLES)]
+            chemins.append(sauvegarder_session(generer_donnees_chemins(essais, 40, graine=p), f"session_{p:03d}",
+                                               dossier))
+        connexion = ouvrir_catalogue(dossier)
+        try:
+            if connexion.execute("PRAGMA journal_mode").fetchone()[0] != 'wal':
+                ecarts.append("catalogue hors du mode WAL")
+            nombre = connexion.execute("SELECT COUNT(*) FROM essais").fetchone()[0]
+            if nombre != sessions * essais:
+                ecarts.append(f"{nombre} essais catalogués au lieu de {sessions * essais}")
+
+            for angle in ANGLES:
+                for numero in (1, 10):
+                    minimum = 3.0
+                    attendu = filtrer_fichiers(dossier, angle, numero, minimum)
+                    obtenu = rechercher_essais(connexion, angle_deviation=angle, numero=numero, minimum=minimum)
+                    if obtenu != attendu:
+                        ecarts.append(f"{angle}°, essai {numero} : essais {obtenu} au lieu de {attendu}")
+                    fichiers = [os.path.basename(s['chemin'])
+                                for s in rechercher_sessions(connexion, angle_deviation=angle, numero=numero,
+                                                             minimum=minimum)]
+                    if sorted(fichiers) != sorted({nom for nom, _, _, _ in attendu}):
+                        ecarts.append(f"{angle}°, essai {numero} : sessions {fichiers} différentes des fichiers")
+
+            plan = " ".join(ligne[-1] for ligne in connexion.execute(
+                "EXPLAIN QUERY PLAN SELECT s.id FROM sessions s JOIN essais e ON e.session_id = s.id "
+                "WHERE s.angle_deviation = 50 AND e.numero = 10 AND e.erreur_angulaire_deg > 20"))
+            if "USING" not in plan or "SCAN e" in plan:
+                ecarts.append(f"requête sans index : {plan}")
+
+            # Import : rien à reprendre, puis uniquement les sessions sauvegardées sans catalogue
+            if importer_dossier(dossier, connexion) != 0:
+                ecarts.append("import d'un dossier déjà catalogué non vide")
+            sauvegarder_session(generer_donnees_chemins(essais, 40, graine=99), "hors_catalogue", dossier,
+                                cataloguer=False)
+            if importer_dossier(dossier, connexion) != 1:
+                ecarts.append("la session sauvegardée sans catalogue n'est pas importée seule")
+            nombre = connexion.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+            if nombre != sessions + 1:
+                ecarts.append(f"{nombre} sessions cataloguées au lieu de {sessions + 1}")
+
+            if not associer_rapport(chemins[0], os.path.join(dossier, "rapport.pdf")):
+                ecarts.append("rapport non associé à la session")
+        finally:
+            connexion.close()
+    return ecarts
+
+
+def mesurer(sessions=2000, essais=120, repetitions=20):
+    """
+    Insère une étude synthétique puis mesure les requêtes sur toutes les sessions
+
+    Returns:
+        Dictionnaire {mesure: durée en secondes}
+    """
+    modele = construire_session(generer_donnees_chemins(essais, 40, graine=0), "modele")
+    alea = random.Random(0)
+    durees = {}
+    with tempfile.TemporaryDirectory() as dossier:
+        etude = []
+        for p in range(sessions):
+            session = copy.deepcopy(modele)
+            session['parametres']['ANGLE_DEVIATION'] = ANGLES[p % len(ANGLES)]
+            session['date'] = f"2025-{1 + p % 12:02d}-{1 + p % 28:02d}T10:00:00"
+            for essai in session['essais']:
+                essai['metriques']['erreur_angulaire_deg'] = abs(alea.gauss(0, 12))
+            etude.append((session, os.path.join(dossier, f"session_{p:05d}.json")))
+
+        connexion = ouvrir_catalogue(dossier)
+        try:
+            debut = time.perf_counter()
+            inserer_sessions(connexion, etude)
+            durees['insertion'] = time.perf_counter() - debut
+
+            requetes = {
+                'sessions (angle, essai, erreur)': lambda: rechercher_sessions(connexion, angle_deviation=50,
+                                                                               numero=10, minimum=20),
+                'essais (phase, erreur)': lambda: rechercher_essais(connexion, phase='adaptation', minimum=40),
+                'sessions (date)': lambda: rechercher_sessions(connexion, depuis="2025-12-01"),
+            }
+            for nom, requete in requetes.items():
+                temps = []
+                for _ in range(repetitions):
+                    debut = time.perf_counter()
+                    requete()
+                    temps.append(time.perf_counter() - debut)
+                durees[nom] = statistics.median(temps)
+        finally:
+            connexion.close()
+    return durees
+
+
+if __name__ == "__main__":
+    arguments = [int(a) for a in sys.argv[1:4]]
+    sessions = arguments[0] if len(arguments) > 0 else 2000
+    essais = arguments[1] if len(arguments) > 1 else 120
+    repetitions = arguments[2] if len(arguments) > 2 else 20
+
+    ecarts = verifier()
+    for message in ecarts:
+        print(f"Écart : {message}")
+    if ecarts:
+        sys.exit(1)
+    print("Requêtes du catalogue conformes aux fichiers de session, import incrémental, WAL et index utilisés")
+
+    durees = mesurer(sessions, essais, repetitions)
+    print(f"Insertion en lot de {sessions} sessions x {essais} essais : {durees.pop('insertion'):.2f} s")
+    for nom, duree in durees.items():
+        print(f"  {nom} : {duree * 1000:.2f} ms (médiane de {repetitions})")
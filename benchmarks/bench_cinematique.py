@@ -0,0 +1,33 @@
+"""
+Mesure du temps d'analyse cinématique d'une session
+
+Usage : python -m benchmarks.bench_cinematique [nombre_essais] [points_par_chemin]
+"""
+import sys
+import time
+from analyse_cinematique import analyser_cinematique
+from benchmarks.donnees_synthetiques import generer_donnees_chemins
+
+
+def mesurer(nombre_essais=1000, points_par_chemin=60, repetitions=5):
+    """
+    Mesure le meilleur temps d'analyse sur plusieurs répétitions
+
+    Returns:
+        Temps en secondes
+    """
+    donnees_chemins = generer_donnees_chemins(nombre_essais, points_par_chemin)
+    meilleur = float('inf')
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        analyser_cinematique(donnees_chemins)
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    return meilleur
+
+
+if __name__ == "__main__":
+    nombre_essais = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    points_par_chemin = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    duree = mesurer(nombre_essais, points_par_chemin)
+    print(f"{nombre_essais} essais x {points_par_chemin} points : {duree * 1000:.1f} ms "
+          f"({'OK' if duree < 1.0 else 'TROP LENT'}, objectif < 1 s)")
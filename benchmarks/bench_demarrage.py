@@ -0,0 +1,78 @@
+"""
+Mesure du temps de démarrage : du lancement du processus à la première image du menu
+
+Chaque mesure lance un nouvel interpréteur (imports et initialisation à froid).
+Le chemin « complet » reproduit l'ancien démarrage : pygame.init() et import
+immédiat du jeu et du générateur de rapport.
+
+Usage : python -m benchmarks.bench_demarrage [repetitions]
+"""
+import os
+import subprocess
+import sys
+import time
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROGRAMME = """
+import sys
+import pygame
+import main
+complet = sys.argv[1] == "complet"
+if complet:
+    import jeu, generateur_pdf
+rendu = main.initialiser(tous_sous_systemes=complet)
+from menu import Menu
+Menu(rendu.surface, rendu).dessiner()
+rendu.presenter()
+print("premiere_image", flush=True)
+pygame.quit()
+"""
+
+
+def mesurer_lancement(chemin):
+    """
+    Lance le jeu jusqu'à la première image du menu
+
+    Args:
+        chemin: "selectif" (démarrage actuel) ou "complet"
+
+    Returns:
+        Temps en secondes entre le lancement et la première image
+    """
+    environnement = dict(os.environ)
+    environnement.setdefault('SDL_VIDEODRIVER', 'dummy')
+    debut = time.perf_counter()
+    processus = subprocess.Popen([sys.executable, "-c", PROGRAMME, chemin], cwd=RACINE,
+                                 env=environnement, stdout=subprocess.PIPE, text=True)
+    for ligne in processus.stdout:
+        if ligne.strip() == "premiere_image":
+            duree = time.perf_counter() - debut
+            break
+    else:
+        raise RuntimeError(f"Le menu ne s'est pas affiché (chemin {chemin})")
+    processus.wait()
+    return duree
+
+
+def mesurer(repetitions=5):
+    """
+    Mesure les deux chemins de démarrage plusieurs fois, en alternance
+
+    Returns:
+        Dictionnaire chemin -> (meilleur temps, temps médian) en secondes
+    """
+    durees = {'selectif': [], 'complet': []}
+    for _ in range(repetitions):
+        for chemin in durees:
+            durees[chemin].append(mesurer_lancement(chemin))
+    return {chemin: (min(valeurs), sorted(valeurs)[len(valeurs) // 2])
+            for chemin, valeurs in durees.items()}
+
+
+if __name__ == "__main__":
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    resultats = mesurer(repetitions)
+    print(f"{'démarrage':>10} {'meilleur (ms)':>14} {'médian (ms)':>12}")
+    for chemin, (meilleur, median) in resultats.items():
+        print(f"{chemin:>10} {meilleur * 1000:>14.0f} {median * 1000:>12.0f}")
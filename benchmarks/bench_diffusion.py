@@ -0,0 +1,100 @@
+"""
+Mesure du coût de la diffusion en direct côté jeu, avec un client normal et un client bloqué
+
+Le client normal lit le flux SSE ; le client bloqué ouvre le flux puis ne lit
+plus rien, jusqu'à remplir les tampons du système. La publication d'un essai ou
+de statistiques d'images ne doit pas ralentir pour autant, et le client normal
+doit recevoir tous les essais (publiés ici à 200 par seconde, bien plus vite
+qu'en session ; en rafale, les plus anciens seraient oubliés par conception).
+
+Usage : python -m benchmarks.bench_diffusion [essais]
+"""
+import json
+import socket
+import sys
+import threading
+import time
+import urllib.request
+from diffusion import ServeurDiffusion
+
+REQUETE_FLUX = b"GET /flux HTTP/1.1\r\nHost: localhost\r\n\r\n"
+
+
+def lire_flux(port, evenements, arret):
+    """Client normal : accumule les événements (nom, données) reçus."""
+    with socket.create_connection(("127.0.0.1", port)) as connexion:
+        connexion.sendall(REQUETE_FLUX)
+        connexion.settimeout(0.2)
+        tampon = b""
+        while not arret.is_set():
+            try:
+                morceau = connexion.recv(65536)
+            except socket.timeout:
+                continue
+            if not morceau:
+                break
+            tampon += morceau
+            *messages, tampon = tampon.split(b"\n\n")
+            for message in messages:
+                lignes = dict(ligne.split(": ", 1) for ligne in message.decode('utf-8').splitlines() if ": " in ligne)
+                if 'event' in lignes:
+                    evenements.append((lignes['event'], json.loads(lignes['data'])))
+
+
+def mesurer(nombre_essais=1000):
+    """
+    Publie une session synthétique et mesure le temps de chaque publication
+
+    Returns:
+        Tuple (temps moyen et maximum d'une publication en µs, événements reçus par le client normal, état final)
+    """
+    serveur = ServeurDiffusion(port=0, taille_file=64)
+    adresse = serveur.demarrer()
+    evenements = []
+    arret = threading.Event()
+    lecteur = threading.Thread(target=lire_flux, args=(serveur.port, evenements, arret))
+    lecteur.start()
+    # Client bloqué : petit tampon de réception, jamais lu
+    bloque = socket.socket()
+    bloque.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    bloque.connect(("127.0.0.1", serveur.port))
+    bloque.sendall(REQUETE_FLUX)
+    time.sleep(0.3)
+
+    donnees_chemins = []
+    durees = []
+    for i in range(nombre_essais):
+        donnees_chemins.append({'metriques': {'erreur_angulaire_deg': i % 50, 'erreur_angulaire_signee_deg': -(i % 50),
+                                              'duree_ms': 400.0 + i, 'temps_reaction_ms': float('nan')}})
+        debut = time.perf_counter()
+        serveur.publier_essais(donnees_chemins)
+        serveur.publier_images({'images': 30, 'erreur_moyenne_ms': 0.1 * i, 'images_en_retard': 0})
+        durees.append((time.perf_counter() - debut) * 1e6)
+        time.sleep(0.005)
+    time.sleep(1.0)
+    with urllib.request.urlopen(f"{adresse}/etat") as reponse:
+        etat = json.load(reponse)
+    arret.set()
+    lecteur.join()
+    bloque.close()
+    serveur.fermer()
+    return sum(durees) / len(durees), max(durees), evenements, etat
+
+
+if __name__ == "__main__":
+    nombre_essais = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    moyenne, maximum, evenements, etat = mesurer(nombre_essais)
+    print(f"Publication (essai + images) : {moyenne:.1f} µs en moyenne, {maximum:.0f} µs au pire")
+    essais = [donnees['essai'] for nom, donnees in evenements if nom == 'essai']
+    images = sum(1 for nom, _ in evenements if nom == 'images')
+    print(f"Client normal : {len(essais)} essai(s), {images} statistique(s) d'images reçus")
+    ecarts = []
+    if essais != list(range(1, nombre_essais + 1)):
+        ecarts.append("le client normal n'a pas reçu tous les essais dans l'ordre")
+    if etat['essai'] is None or etat['essai']['essai'] != nombre_essais:
+        ecarts.append("l'état final ne correspond pas au dernier essai")
+    if etat['essai'] and etat['essai']['temps_reaction_ms'] is not None:
+        ecarts.append("NaN non converti en null")
+    for message in ecarts:
+        print(f"Écart : {message}")
+    sys.exit(1 if ecarts else 0)
@@ -0,0 +1,194 @@
+"""
+Mesure de l'export du rapport selon le nombre d'essais et la densité des chemins
+
+Chaque cas (essais × points par chemin × format × mode de pages) s'exécute dans un
+processus neuf, sans cache de pages, pour mesurer le pic de mémoire (RSS) de
+l'export seul. Les résultats sont écrits en JSON et comparés à une référence
+enregistrée : un cas plus lent ou plus gourmand que la tolérance est signalé.
+
+Usage :
+    python -m benchmarks.bench_generateur                        # grille par défaut
+    python -m benchmarks.bench_generateur --essais 10 100 --points 60 --formats pdf
+    python -m benchmarks.bench_generateur --enregistrer-reference  # fixe la référence
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+
+try:
+    import resource
+except ImportError:  # Windows : pas de mesure du pic de mémoire
+    resource = None
+
+DOSSIER_BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+FICHIER_REFERENCE = os.path.join(DOSSIER_BENCHMARKS, "reference_generateur.json")
+DOSSIER_RESULTATS = os.path.join(DOSSIER_BENCHMARKS, "resultats")
+
+
+def _pic_rss_mo():
+    """Pic de mémoire résidente du processus en Mo (None si indisponible)."""
+    if resource is None:
+        return None
+    pic = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux : kilo-octets ; macOS : octets
+    return pic / (1024 * 1024) if sys.platform == 'darwin' else pic / 1024
+
+
+def executer_cas(nombre_essais, points_par_chemin, format_sortie, mode_pages):
+    """
+    Génère un rapport synthétique et mesure l'export (exécuté dans un processus neuf)
+
+    Returns:
+        Dictionnaire des mesures du cas
+    """
+    from benchmarks.bench_backends import taille_sortie
+    from benchmarks.donnees_synthetiques import generer_donnees_chemins
+    from generateur_pdf import GenerateurPDF
+
+    donnees_chemins = generer_donnees_chemins(nombre_essais, points_par_chemin)
+    rss_avant = _pic_rss_mo()
+    dossier_courant = os.getcwd()
+    with tempfile.TemporaryDirectory() as dossier:
+        os.chdir(dossier)
+        try:
+            generateur = GenerateurPDF(format_sortie, mode_pages=mode_pages, utiliser_cache=False)
+            debut = time.perf_counter()
+            chemin = generateur.generer_pdf(donnees_chemins, "bench")
+            duree = time.perf_counter() - debut
+            if chemin is None:
+                raise RuntimeError("La génération du rapport a échoué")
+            racine = chemin if os.path.isfile(chemin) and format_sortie == 'pdf' else os.path.dirname(chemin)
+            taille = taille_sortie(racine)
+        finally:
+            os.chdir(dossier_courant)
+    rss_pic = _pic_rss_mo()
+    return {
+        'essais': nombre_essais,
+        'points': points_par_chemin,
+        'format': format_sortie,
+        'mode': mode_pages,
+        'pages': generateur.pages_rendues,
+        'duree_s': duree,
+        'pages_par_s': generateur.pages_rendues / duree,
+        'rss_pic_mo': rss_pic,
+        'rss_donnees_mo': rss_avant,
+        'taille_octets': taille,
+    }
+
+
+def cle_cas(cas):
+    """Identifiant d'un cas, pour l'apparier avec la référence."""
+    return f"{cas['format']}/{cas['mode']}/{cas['essais']}x{cas['points']}"
+
+
+def mesurer(liste_essais, liste_points, formats, modes):
+    """
+    Exécute tous les cas de la grille, chacun dans un processus neuf
+
+    Returns:
+        Liste des mesures
+    """
+    resultats = []
+    contexte = get_context("spawn")
+    for format_sortie in formats:
+        for mode_pages in modes:
+            for nombre_essais in liste_essais:
+                for points_par_chemin in liste_points:
+                    with ProcessPoolExecutor(max_workers=1, mp_context=contexte) as executeur:
+                        cas = executeur.submit(executer_cas, nombre_essais, points_par_chemin,
+                                               format_sortie, mode_pages).result()
+                    print(f"{cle_cas(cas):>28} {cas['duree_s']:>8.2f} s {cas['pages_par_s']:>7.1f} pages/s "
+                          f"{cas['rss_pic_mo'] or 0:>7.0f} Mo {cas['taille_octets'] / 1024:>9.0f} Ko", flush=True)
+                    resultats.append(cas)
+    return resultats
+
+
+def comparer(resultats, reference, tolerance):
+    """
+    Compare les mesures à la référence
+
+    Args:
+        resultats: Liste des mesures
+        reference: Liste des mesures de référence
+        tolerance: Écart relatif toléré (ex. 0.2 pour 20 %)
+
+    Returns:
+        Liste de messages décrivant les régressions
+    """
+    par_cle = {cle_cas(cas): cas for cas in reference}
+    regressions = []
+    for cas in resultats:
+        ancien = par_cle.get(cle_cas(cas))
+        if ancien is None:
+            continue
+        for mesure, unite in (('duree_s', 's'), ('rss_pic_mo', 'Mo'), ('taille_octets', 'octets')):
+            if cas[mesure] is None or not ancien.get(mesure):
+                continue
+            ecart = cas[mesure] / ancien[mesure] - 1
+            if ecart > tolerance:
+                regressions.append(f"{cle_cas(cas)} : {mesure} {ancien[mesure]:.2f} -> {cas[mesure]:.2f} {unite} "
+                                   f"(+{ecart * 100:.0f} %)")
+    return regressions
+
+
+def environnement():
+    """Versions et machine, enregistrées avec les résultats."""
+    import matplotlib
+    import numpy
+    from backends_rapport import PdfWriter
+    return {
+        'python': platform.python_version(),
+        'matplotlib': matplotlib.__version__,
+        'numpy': numpy.__version__,
+        'pypdf': PdfWriter is not None,
+        'plateforme': platform.platform(),
+        'processeurs': os.cpu_count(),
+    }
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Mesure de l'export du rapport (temps, mémoire, taille)")
+    parseur.add_argument('--essais', type=int, nargs='+', default=[10, 50, 100], help="Nombres d'essais")
+    parseur.add_argument('--points', type=int, nargs='+', default=[60, 600], help="Points par chemin")
+    parseur.add_argument('--formats', nargs='+', default=['pdf', 'png'], help="Formats de sortie")
+    parseur.add_argument('--modes', nargs='+', default=['essais', 'directions'], help="Modes de pages")
+    parseur.add_argument('--reference', default=FICHIER_REFERENCE, help="Fichier de référence")
+    parseur.add_argument('--tolerance', type=float, default=0.2, help="Écart relatif toléré avant régression")
+    parseur.add_argument('--enregistrer-reference', action='store_true',
+                         help="Enregistrer ces mesures comme nouvelle référence")
+    arguments = parseur.parse_args()
+
+    resultats = mesurer(arguments.essais, arguments.points, arguments.formats, arguments.modes)
+    rapport = {'date': datetime.now().isoformat(timespec='seconds'), 'environnement': environnement(),
+               'resultats': resultats}
+
+    if not os.path.exists(DOSSIER_RESULTATS):
+        os.makedirs(DOSSIER_RESULTATS)
+    chemin_resultats = os.path.join(DOSSIER_RESULTATS, f"generateur_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(chemin_resultats, 'w', encoding='utf-8') as f:
+        json.dump(rapport, f, indent=2)
+    print(f"Résultats : {chemin_resultats}")
+
+    if arguments.enregistrer_reference:
+        with open(arguments.reference, 'w', encoding='utf-8') as f:
+            json.dump(rapport, f, indent=2)
+        print(f"Référence enregistrée : {arguments.reference}")
+    elif os.path.exists(arguments.reference):
+        with open(arguments.reference, encoding='utf-8') as f:
+            reference = json.load(f)
+        regressions = comparer(resultats, reference['resultats'], arguments.tolerance)
+        if regressions:
+            print(f"{len(regressions)} régression(s) par rapport à la référence du {reference['date']} :")
+            for message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+        print(f"Aucune régression par rapport à la référence du {reference['date']}")
+    else:
+        print("Pas de référence : relancer avec --enregistrer-reference pour en créer une")
@@ -0,0 +1,392 @@
+"""
+Microbenchmarks (ns par appel) et vérification d'équivalence des calculs géométriques
+
+Les implémentations de référence ci-dessous sont les versions d'origine, gardées
+telles quelles. Avant toute mesure, chaque version actuelle ou vectorisée est
+comparée à sa référence sur des cas aléatoires et des cas limites (segments
+tangents, de longueur nulle ou presque, extrémités sur le cercle, vecteurs nuls) ;
+le script s'arrête avec un code d'erreur en cas d'écart.
+
+Usage : python -m benchmarks.bench_geometrie [nombre_cas]
+"""
+import math
+import random
+import sys
+import timeit
+from types import SimpleNamespace
+import numpy as np
+import config
+from geometrie import (
+    intersection_segment_cercle, intersections_segments_cercle_lot,
+    point_intersection_chemin_cercle, angle_entre_vecteurs_deg, angles_entre_vecteurs_deg_lot,
+)
+from jeu import Jeu
+from benchmarks.donnees_synthetiques import generer_donnees_chemins
+
+CENTRE = (960, 540)
+RAYON = 378
+
+
+# ----- Implémentations de référence (versions d'origine) -----
+
+def reference_intersection_segment_cercle(p0, p1, centre, rayon):
+    cx, cy = centre
+    x0, y0 = p0
+    x1, y1 = p1
+    dx = x1 - x0
+    dy = y1 - y0
+    ex = x0 - cx
+    ey = y0 - cy
+    a = dx * dx + dy * dy
+    if a < 1e-12:
+        return None
+    b = 2 * (ex * dx + ey * dy)
+    c = ex * ex + ey * ey - rayon * rayon
+    disc = b * b - 4 * a * c
+    if disc < 0:
+        return None
+    t1 = (-b - math.sqrt(disc)) / (2 * a)
+    t2 = (-b + math.sqrt(disc)) / (2 * a)
+    for t in sorted([t1, t2]):
+        if 0 <= t <= 1:
+            return (x0 + t * dx, y0 + t * dy)
+    return None
+
+
+def reference_point_intersection_chemin_cercle(chemin, centre, rayon):
+    if not chemin or len(chemin) < 2:
+        return None
+    for i in range(len(chemin) - 1):
+        pt = reference_intersection_segment_cercle(chemin[i], chemin[i + 1], centre, rayon)
+        if pt is not None:
+            return pt
+    return None
+
+
+def reference_angle_entre_vecteurs_deg(centre, p1, p2):
+    x0, y0 = centre
+    ux = p1[0] - x0
+    uy = p1[1] - y0
+    vx = p2[0] - x0
+    vy = p2[1] - y0
+    norm_u = math.hypot(ux, uy)
+    norm_v = math.hypot(vx, vy)
+    if norm_u < 1e-10 or norm_v < 1e-10:
+        return None
+    cos_a = (ux * vx + uy * vy) / (norm_u * norm_v)
+    cos_a = max(-1, min(1, cos_a))
+    return math.degrees(math.acos(cos_a))
+
+
+def reference_detecter_traversee_cercle(self, position_actuelle):
+    if self.en_affichage_resultat:
+        return None
+    x0, y0 = self.position_curseur_precedente_deviée
+    x1, y1 = position_actuelle
+    if x0 == x1 and y0 == y1:
+        return None
+    cx, cy = config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y
+    r = config.CERCLE_RAYON
+    dx = x1 - x0
+    dy = y1 - y0
+    fx = x0 - cx
+    fy = y0 - cy
+    a = dx * dx + dy * dy
+    if a == 0:
+        return None
+    b = 2 * (fx * dx + fy * dy)
+    c = fx * fx + fy * fy - r * r
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return None
+    sqrt_disc = math.sqrt(discriminant)
+    t1 = (-b - sqrt_disc) / (2 * a)
+    t2 = (-b + sqrt_disc) / (2 * a)
+    for t in sorted((t1, t2)):
+        if 0 <= t <= 1:
+            return (int(x0 + t * dx), int(y0 + t * dy))
+    return None
+
+
+def reference_appliquer_deviation_mouvement(self, position_reelle):
+    if not self.deviation_active():
+        return position_reelle
+    x_reel, y_reel = position_reelle
+    x_prec_reel, y_prec_reel = self.position_curseur_precedente
+    dx_reel = x_reel - x_prec_reel
+    dy_reel = y_reel - y_prec_reel
+    if dx_reel == 0 and dy_reel == 0:
+        return self.position_curseur_precedente_deviée
+    angle_mouvement = math.atan2(dy_reel, dx_reel)
+    angle_devié = angle_mouvement + math.radians(config.ANGLE_DEVIATION)
+    longueur = math.sqrt(dx_reel * dx_reel + dy_reel * dy_reel)
+    dx_devié = longueur * math.cos(angle_devié)
+    dy_devié = longueur * math.sin(angle_devié)
+    x_prec_devié, y_prec_devié = self.position_curseur_precedente_deviée
+    return (int(x_prec_devié + dx_devié), int(y_prec_devié + dy_devié))
+
+
+def deviation_par_rotation(position, precedente, precedente_deviee, cos_angle, sin_angle):
+    """Candidat non retenu : rotation par matrice précalculée (arrondit parfois au pixel voisin)."""
+    dx = position[0] - precedente[0]
+    dy = position[1] - precedente[1]
+    if dx == 0 and dy == 0:
+        return precedente_deviee
+    return (int(precedente_deviee[0] + dx * cos_angle - dy * sin_angle),
+            int(precedente_deviee[1] + dx * sin_angle + dy * cos_angle))
+
+
+# ----- Cas de test -----
+
+def generer_segments(nombre, alea):
+    """
+    Segments autour du cercle : aléatoires (entiers et réels), tangents,
+    de longueur nulle ou quasi nulle, avec une extrémité sur le cercle, intérieurs
+
+    Returns:
+        Liste de tuples (p0, p1)
+    """
+    cx, cy = CENTRE
+    segments = []
+    for _ in range(nombre):
+        x0, y0 = alea.randint(cx - 500, cx + 500), alea.randint(cy - 500, cy + 500)
+        segments.append(((x0, y0), (x0 + alea.randint(-30, 30), y0 + alea.randint(-30, 30))))
+        u0, v0 = alea.uniform(cx - 500, cx + 500), alea.uniform(cy - 500, cy + 500)
+        segments.append(((u0, v0), (u0 + alea.uniform(-30, 30), v0 + alea.uniform(-30, 30))))
+        # Tangents (horizontaux et verticaux, discriminant exactement nul)
+        d = alea.randint(0, 40)
+        segments.append(((cx - d, cy + RAYON), (cx + alea.randint(1, 40), cy + RAYON)))
+        segments.append(((cx - RAYON, cy - d), (cx - RAYON, cy + alea.randint(1, 40))))
+        # Longueur nulle et quasi nulle
+        segments.append(((x0, y0), (x0, y0)))
+        segments.append(((u0, v0), (u0 + alea.uniform(-1e-7, 1e-7), v0)))
+        # Extrémité exactement sur le cercle, de l'intérieur vers l'extérieur et inversement
+        segments.append(((cx + RAYON, cy), (cx + RAYON + alea.randint(-5, 5), cy + alea.randint(-5, 5))))
+        segments.append(((cx, cy - RAYON + alea.randint(-5, 5)), (cx, cy - RAYON)))
+        # Entièrement dans le disque (cas le plus fréquent pendant un mouvement)
+        x2, y2 = cx + alea.randint(-200, 200), cy + alea.randint(-200, 200)
+        segments.append(((x2, y2), (x2 + alea.randint(-8, 8), y2 + alea.randint(-8, 8))))
+    return segments
+
+
+def generer_paires_angles(nombre, alea):
+    """Paires de points pour les angles, dont vecteurs nuls, colinéaires et opposés."""
+    cx, cy = CENTRE
+    paires = []
+    for _ in range(nombre):
+        p1 = (alea.uniform(0, 1920), alea.uniform(0, 1080))
+        p2 = (alea.randint(0, 1920), alea.randint(0, 1080))
+        paires.append((p1, p2))
+        paires.append((CENTRE, p2))
+        paires.append(((cx + 2 * (p2[0] - cx), cy + 2 * (p2[1] - cy)), p2))
+        paires.append(((cx - (p2[0] - cx), cy - (p2[1] - cy)), p2))
+        paires.append(((cx + 1e-11, cy), p2))
+    return paires
+
+
+def egaux(a, b):
+    """Égalité exacte de deux résultats (None et NaN sont équivalents)."""
+    if a is None or b is None:
+        return a is None and b is None
+    return tuple(a) == tuple(b)
+
+
+def verifier_equivalences(nombre_cas=2000, graine=0):
+    """
+    Compare chaque version actuelle ou vectorisée à sa référence
+
+    Returns:
+        Liste de messages décrivant les écarts (vide si tout est équivalent)
+    """
+    alea = random.Random(graine)
+    config.definir_geometrie(1920, 1080)
+    segments = generer_segments(nombre_cas, alea)
+    ecarts = []
+
+    # Intersection segment / cercle : scalaire et vectorisée
+    attendus = [reference_intersection_segment_cercle(p0, p1, CENTRE, RAYON) for p0, p1 in segments]
+    obtenus = [intersection_segment_cercle(p0, p1, CENTRE, RAYON) for p0, p1 in segments]
+    ecarts += [f"intersection_segment_cercle{s} : {a} != {o}"
+               for s, a, o in zip(segments, attendus, obtenus) if not egaux(a, o)]
+    lot = intersections_segments_cercle_lot([s[0] for s in segments], [s[1] for s in segments], CENTRE, RAYON)
+    obtenus_lot = [None if np.isnan(x) else (x, y) for x, y in lot.tolist()]
+    ecarts += [f"intersections_segments_cercle_lot{s} : {a} != {o}"
+               for s, a, o in zip(segments, attendus, obtenus_lot) if not egaux(a, o)]
+
+    # Détection de traversée dans Jeu
+    etat = SimpleNamespace(en_affichage_resultat=False)
+    centre_config = (config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y)
+    for p0, p1 in segments:
+        if isinstance(p0[0], float) or isinstance(p1[0], float):
+            continue  # Le jeu ne reçoit que des positions entières
+        p0 = (p0[0] - CENTRE[0] + centre_config[0], p0[1] - CENTRE[1] + centre_config[1])
+        p1 = (p1[0] - CENTRE[0] + centre_config[0], p1[1] - CENTRE[1] + centre_config[1])
+        etat.position_curseur_precedente_deviée = p0
+        a = reference_detecter_traversee_cercle(etat, p1)
+        o = Jeu.detecter_traversee_cercle(etat, p1)
+        if not egaux(a, o):
+            ecarts.append(f"Jeu.detecter_traversee_cercle{(p0, p1)} : {a} != {o}")
+
+    # Déviation du mouvement
+    etat = SimpleNamespace(deviation_active=lambda: True, angle_deviation_rad=math.radians(config.ANGLE_DEVIATION))
+    for p0, p1 in segments:
+        if isinstance(p0[0], float) or isinstance(p1[0], float):
+            continue
+        etat.position_curseur_precedente = p0
+        etat.position_curseur_precedente_deviée = (p0[0] + 7, p0[1] - 3)
+        a = reference_appliquer_deviation_mouvement(etat, p1)
+        o = Jeu.appliquer_deviation_mouvement(etat, p1)
+        if not egaux(a, o):
+            ecarts.append(f"Jeu.appliquer_deviation_mouvement{(p0, p1)} : {a} != {o}")
+
+    # Intersection chemin / cercle sur des chemins synthétiques (petit et grand cercle)
+    chemins = [d['chemin'] for d in generer_donnees_chemins(200, 60, graine=graine)]
+    centre = (config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y)
+    for rayon in (config.CERCLE_RAYON / 10, config.CERCLE_RAYON):
+        for chemin in chemins + [[], chemins[0][:1], [chemins[0][0]] * 5]:
+            a = reference_point_intersection_chemin_cercle(chemin, centre, rayon)
+            o = point_intersection_chemin_cercle(chemin, centre, rayon)
+            if not egaux(a, o):
+                ecarts.append(f"point_intersection_chemin_cercle (rayon {rayon}) : {a} != {o}")
+
+    # Angles : scalaire et vectorisé. np.hypot peut différer de math.hypot au dernier bit, et acos
+    # est mal conditionné près de 0° et 180° : un bit d'écart sur le cosinus y donne ~1e-6°
+    paires = generer_paires_angles(nombre_cas, alea)
+    attendus = [reference_angle_entre_vecteurs_deg(CENTRE, p1, p2) for p1, p2 in paires]
+    obtenus = [angle_entre_vecteurs_deg(CENTRE, p1, p2) for p1, p2 in paires]
+    ecarts += [f"angle_entre_vecteurs_deg{p} : {a} != {o}" for p, a, o in zip(paires, attendus, obtenus) if a != o]
+    lot = angles_entre_vecteurs_deg_lot(CENTRE, [p[0] for p in paires], [p[1] for p in paires])
+    for p, a, o in zip(paires, attendus, lot.tolist()):
+        if (a is None) != math.isnan(o) or (a is not None and abs(a - o) > 1e-5):
+            ecarts.append(f"angles_entre_vecteurs_deg_lot{p} : {a} != {o}")
+    return ecarts
+
+
+# ----- Mesures -----
+
+def ns_par_appel(fonction, nombre_appels, repetitions=7):
+    """Meilleur temps par appel en ns, fonction() effectuant nombre_appels appels."""
+    return min(timeit.repeat(fonction, number=1, repeat=repetitions)) / nombre_appels * 1e9
+
+
+def mesurer(nombre_cas=2000, graine=1):
+    """
+    Mesure chaque fonction, sa référence et ses variantes
+
+    Returns:
+        Liste de tuples (nom, ns par appel)
+    """
+    alea = random.Random(graine)
+    config.definir_geometrie(1920, 1080)
+    segments = generer_segments(nombre_cas, alea)
+    debuts = np.array([s[0] for s in segments], dtype=float)
+    fins = np.array([s[1] for s in segments], dtype=float)
+    n = len(segments)
+    resultats = [
+        ("intersection_segment_cercle (référence)",
+         ns_par_appel(lambda: [reference_intersection_segment_cercle(p0, p1, CENTRE, RAYON) for p0, p1 in segments], n)),
+        ("intersection_segment_cercle",
+         ns_par_appel(lambda: [intersection_segment_cercle(p0, p1, CENTRE, RAYON) for p0, p1 in segments], n)),
+        ("intersections_segments_cercle_lot (par segment)",
+         ns_par_appel(lambda: intersections_segments_cercle_lot(debuts, fins, CENTRE, RAYON), n)),
+    ]
+
+    # Méthodes de Jeu appelées à chaque pas de simulation : pas successifs de chemins synthétiques
+    chemins = [d['chemin'] for d in generer_donnees_chemins(200, 60, graine=graine)]
+    entiers = [(p0, p1) for chemin in chemins for p0, p1 in zip(chemin, chemin[1:])]
+    etat = SimpleNamespace(en_affichage_resultat=False, deviation_active=lambda: True,
+                           angle_deviation_rad=math.radians(config.ANGLE_DEVIATION),
+                           position_curseur_precedente_deviée=(0, 0))
+
+    def boucle_traversee(methode):
+        for p0, p1 in entiers:
+            etat.position_curseur_precedente_deviée = p0
+            methode(etat, p1)
+
+    def boucle_deviation(methode):
+        for p0, p1 in entiers:
+            etat.position_curseur_precedente = p0
+            methode(etat, p1)
+
+    cos_angle = math.cos(etat.angle_deviation_rad)
+    sin_angle = math.sin(etat.angle_deviation_rad)
+    resultats += [
+        ("Jeu.detecter_traversee_cercle (référence)",
+         ns_par_appel(lambda: boucle_traversee(reference_detecter_traversee_cercle), len(entiers))),
+        ("Jeu.detecter_traversee_cercle",
+         ns_par_appel(lambda: boucle_traversee(Jeu.detecter_traversee_cercle), len(entiers))),
+        ("Jeu.appliquer_deviation_mouvement (référence)",
+         ns_par_appel(lambda: boucle_deviation(reference_appliquer_deviation_mouvement), len(entiers))),
+        ("Jeu.appliquer_deviation_mouvement",
+         ns_par_appel(lambda: boucle_deviation(Jeu.appliquer_deviation_mouvement), len(entiers))),
+        ("deviation_par_rotation (non retenue)",
+         ns_par_appel(lambda: [deviation_par_rotation(p1, p0, p0, cos_angle, sin_angle) for p0, p1 in entiers],
+                      len(entiers))),
+    ]
+
+    # Chemins entiers (par chemin), petit cercle des métriques et grand cercle
+    centre = (config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y)
+    tableaux = [np.asarray(chemin, dtype=float) for chemin in chemins]
+
+    def premier_point_lot(tableau, rayon):
+        points = intersections_segments_cercle_lot(tableau[:-1], tableau[1:], centre, rayon)
+        indices = np.flatnonzero(~np.isnan(points[:, 0]))
+        return tuple(points[indices[0]]) if len(indices) else None
+
+    for nom_cercle, rayon in (("petit cercle", config.CERCLE_RAYON / 10), ("grand cercle", config.CERCLE_RAYON)):
+        resultats += [
+            (f"point_intersection_chemin_cercle, {nom_cercle} (référence)",
+             ns_par_appel(lambda: [reference_point_intersection_chemin_cercle(c, centre, rayon) for c in chemins],
+                          len(chemins))),
+            (f"point_intersection_chemin_cercle, {nom_cercle}",
+             ns_par_appel(lambda: [point_intersection_chemin_cercle(c, centre, rayon) for c in chemins],
+                          len(chemins))),
+            (f"intersections_segments_cercle_lot, {nom_cercle} (par chemin)",
+             ns_par_appel(lambda: [premier_point_lot(t, rayon) for t in tableaux], len(chemins))),
+        ]
+
+    paires = generer_paires_angles(nombre_cas, alea)
+    p1 = np.array([p[0] for p in paires], dtype=float)
+    p2 = np.array([p[1] for p in paires], dtype=float)
+    resultats += [
+        ("angle_entre_vecteurs_deg (référence)",
+         ns_par_appel(lambda: [reference_angle_entre_vecteurs_deg(CENTRE, a, b) for a, b in paires], len(paires))),
+        ("angle_entre_vecteurs_deg",
+         ns_par_appel(lambda: [angle_entre_vecteurs_deg(CENTRE, a, b) for a, b in paires], len(paires))),
+        ("angles_entre_vecteurs_deg_lot (par paire)",
+         ns_par_appel(lambda: angles_entre_vecteurs_deg_lot(CENTRE, p1, p2), len(paires))),
+    ]
+    return resultats
+
+
+def compter_ecarts_rotation(nombre_cas=2000, graine=2):
+    """Nombre de déviations où la rotation par matrice s'écarte d'un pixel de la référence."""
+    alea = random.Random(graine)
+    angle = math.radians(config.ANGLE_DEVIATION)
+    etat = SimpleNamespace(deviation_active=lambda: True)
+    ecarts = 0
+    segments = [(p0, p1) for p0, p1 in generer_segments(nombre_cas, alea)
+                if not isinstance(p0[0], float) and not isinstance(p1[0], float)]
+    for p0, p1 in segments:
+        etat.position_curseur_precedente = p0
+        etat.position_curseur_precedente_deviée = p0
+        if reference_appliquer_deviation_mouvement(etat, p1) != deviation_par_rotation(
+                p1, p0, p0, math.cos(angle), math.sin(angle)):
+            ecarts += 1
+    return ecarts, len(segments)
+
+
+if __name__ == "__main__":
+    nombre_cas = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    ecarts = verifier_equivalences(nombre_cas)
+    if ecarts:
+        print(f"{len(ecarts)} écart(s) avec les implémentations de référence :")
+        for message in ecarts[:20]:
+            print(f"  {message}")
+        sys.exit(1)
+    print("Équivalence vérifiée avec les implémentations de référence")
+    ecarts_rotation, total = compter_ecarts_rotation(nombre_cas)
+    print(f"Rotation par matrice (non retenue) : {ecarts_rotation} écart(s) d'un pixel sur {total}")
+    print(f"{'fonction':<66} {'ns/appel':>10}")
+    for nom, ns in mesurer(nombre_cas):
+        print(f"{nom:<66} {ns:>10.0f}")
@@ -0,0 +1,114 @@
+"""
+Vérification et mesure de l'ajustement des modèles d'adaptation
+
+La log-vraisemblance en lot est comparée à une version de référence essai par
+essai et série par série ; l'optimum du modèle à un taux trouvé par Nelder-Mead
+en lot est comparé au minimum d'une grille fine ; les paramètres sont retrouvés
+sur des participants simulés sans variabilité (voir simulateur.py). Le script
+s'arrête avec un code d'erreur en cas d'écart, puis mesure l'ajustement d'une
+étude entière.
+
+Usage : python -m benchmarks.bench_modeles [sessions] [essais] [processus]
+"""
+import math
+import sys
+import time
+import numpy as np
+import config
+from modeles_adaptation import (MODELES, perturbations_protocole, parametres_naturels, log_vraisemblance_negative,
+                                ajuster_series)
+from simulateur import simuler_participants, parametres_protocole, modele_adaptation
+
+
+def reference_log_vraisemblance_negative(modele, naturels, erreurs, perturbations):
+    """Version de référence : une série et un essai à la fois."""
+    if modele == 'un_taux':
+        retentions, taux = [naturels[0]], [naturels[1]]
+    else:
+        retentions, taux = naturels[:2], naturels[2:]
+    etats = [0.0] * len(retentions)
+    residus = []
+    for erreur, perturbation in zip(erreurs, perturbations):
+        if not math.isnan(erreur):
+            residus.append(erreur - (perturbation - sum(etats)))
+        e = perturbation - sum(etats)
+        etats = [a * x + b * e for a, b, x in zip(retentions, taux, etats)]
+    biais = sum(residus) / len(residus)
+    variance = sum((r - biais) ** 2 for r in residus) / len(residus)
+    return 0.5 * len(residus) * (math.log(2 * math.pi * variance) + 1)
+
+
+def simuler(sessions, essais, graine=0):
+    """Erreurs (sessions, essais) de participants simulés sans variabilité, et perturbations."""
+    config.NOMBRE_CIBLES_MAX = essais
+    config.CIBLE_DEBUT_DEVIATION = essais // 6 + 1
+    config.CIBLE_FIN_DEVIATION = essais * 3 // 4 + 1
+    parametres = parametres_protocole()
+    modele = modele_adaptation(variabilite=0.0, bruit_etat_deg=0.0)
+    erreurs = simuler_participants(sessions, parametres, modele, graine=graine)['erreurs']
+    perturbations = np.tile(perturbations_protocole(essais, parametres), (sessions, 1))
+    return erreurs, perturbations, modele
+
+
+def verifier(erreurs, perturbations, modele_simule):
+    """
+    Returns:
+        Liste de messages décrivant les écarts (vide si tout concorde)
+    """
+    ecarts = []
+    generateur = np.random.default_rng(1)
+    erreurs = erreurs.copy()
+    erreurs[0, 3] = erreurs[1, 10] = np.nan  # Essais manquants
+    for modele, noms in MODELES.items():
+        u = generateur.normal(0.0, 2.0, (len(erreurs), len(noms)))
+        lot = log_vraisemblance_negative(modele, u, erreurs, perturbations)
+        naturels = parametres_naturels(modele, u)
+        reference = np.array([reference_log_vraisemblance_negative(modele, n, e, p)
+                              for n, e, p in zip(naturels, erreurs, perturbations)])
+        if not np.allclose(lot, reference, rtol=1e-9):
+            ecarts.append(f"{modele} : log-vraisemblance en lot différente de la référence "
+                          f"(écart maximal {np.max(np.abs(lot - reference)):.3g})")
+
+    # Optimum du modèle à un taux : Nelder-Mead en lot contre une grille fine
+    series = slice(0, 5)
+    resultats = ajuster_series(erreurs[series], perturbations[series], processus=1)['un_taux']
+    grille = np.linspace(-4.0, 9.0, 261)
+    u = np.array(np.meshgrid(grille, grille)).reshape(2, -1).T
+    for i in range(5):
+        valeurs = log_vraisemblance_negative('un_taux', u, np.repeat(erreurs[i:i + 1], len(u), axis=0),
+                                             np.repeat(perturbations[i:i + 1], len(u), axis=0))
+        if -resultats['log_vraisemblance'][i] > valeurs.min() + 1e-6:
+            ecarts.append(f"série {i} : optimum moins bon que la grille "
+                          f"({-resultats['log_vraisemblance'][i]:.4f} > {valeurs.min():.4f})")
+
+    # Paramètres retrouvés (médiane sur les sessions) : bruit moteur seul, sans variabilité
+    resultats = ajuster_series(erreurs, perturbations, processus=1)['un_taux']
+    retention, taux = np.nanmedian(resultats['parametres'], axis=0)
+    if abs(retention - modele_simule['retention']) > 0.01 or abs(taux - modele_simule['taux_apprentissage']) > 0.03:
+        ecarts.append(f"paramètres retrouvés A = {retention:.3f}, B = {taux:.3f} "
+                      f"(simulés : {modele_simule['retention']}, {modele_simule['taux_apprentissage']})")
+    return ecarts
+
+
+if __name__ == "__main__":
+    arguments = [int(a) for a in sys.argv[1:4]]
+    sessions = arguments[0] if len(arguments) > 0 else 100
+    essais = arguments[1] if len(arguments) > 1 else 120
+    processus = arguments[2] if len(arguments) > 2 else None
+
+    erreurs, perturbations, modele_simule = simuler(max(sessions, 40), essais)
+    ecarts = verifier(erreurs[:40], perturbations[:40], modele_simule)
+    for message in ecarts:
+        print(f"Écart : {message}")
+    if ecarts:
+        sys.exit(1)
+    print("Vraisemblance conforme à la référence, optimum au moins aussi bon que la grille, paramètres retrouvés")
+
+    debut = time.perf_counter()
+    resultats = ajuster_series(erreurs[:sessions], perturbations[:sessions], processus=processus)
+    duree = time.perf_counter() - debut
+    print(f"{sessions} sessions x {essais} essais, {config.AJUSTEMENT_DEPARTS} départs, deux modèles : {duree:.2f} s")
+    for modele in MODELES:
+        r = resultats[modele]
+        print(f"  {modele} : itérations médianes {np.median(r['iterations']):.0f}, "
+              f"départs convergents {np.nanmean(r['departs_convergents']):.0%}")
@@ -0,0 +1,159 @@
+"""
+Mesure du coût de la fenêtre de suivi côté jeu et vérification de la lecture
+
+1. Coût d'un point écrit dans la mémoire partagée, comparé à l'ajout au chemin
+   que le jeu fait déjà à chaque pas de simulation.
+2. Relecture : un lecteur (dans ce processus) doit retrouver exactement les
+   chemins écrits, et compter les points perdus quand le tampon déborde.
+3. Fenêtre de suivi réelle dans son processus, alimentée par une session
+   synthétique au rythme de la simulation ; sa dernière image est enregistrée.
+
+Fonctionne sans écran (SDL_VIDEODRIVER=dummy par défaut).
+
+Usage : python -m benchmarks.bench_moniteur [essais]
+"""
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+import config
+from benchmarks.donnees_synthetiques import generer_donnees_chemins
+from metriques_essai import metriques_session
+from moniteur import LecteurMoniteur, Moniteur
+
+
+def mesurer_ecriture(nombre_points=200000):
+    """
+    Temps moyen d'un point écrit, et de l'ajout de référence à une liste
+
+    Returns:
+        Tuple (écriture mémoire partagée, ajout à une liste) en microsecondes
+    """
+    moniteur = Moniteur(capacite_points=4096)
+    try:
+        debut = time.perf_counter()
+        for i in range(nombre_points):
+            moniteur.ajouter_point(i % 1920, i % 1080)
+        ecriture = (time.perf_counter() - debut) / nombre_points * 1e6
+    finally:
+        moniteur.fermer()
+    chemin = []
+    debut = time.perf_counter()
+    for i in range(nombre_points):
+        chemin.append((i % 1920, i % 1080, i))
+    ajout = (time.perf_counter() - debut) / nombre_points * 1e6
+    return ecriture, ajout
+
+
+def ecrire_session(moniteur, donnees_chemins, lecteur=None, pause_s=0.0):
+    """Écrit une session comme le fait le jeu (un point par pas, métriques à la fin de chaque essai)."""
+    for i, donnees in enumerate(donnees_chemins):
+        moniteur.nouvel_essai(i, donnees['cible'])
+        for x, y in donnees['chemin']:
+            moniteur.ajouter_point(x, y)
+            if pause_s:
+                time.sleep(pause_s)
+        metriques_session(donnees_chemins[:i + 1])
+        moniteur.publier_metriques(donnees_chemins)
+        if lecteur is not None:
+            lecteur.lire()
+
+
+def verifier_lecture(donnees_chemins):
+    """
+    Vérifie que le lecteur retrouve les chemins et les métriques écrits
+
+    Returns:
+        Liste de messages décrivant les écarts (vide si tout concorde)
+    """
+    ecarts = []
+    # Lecture après chaque essai : rien ne doit être perdu
+    moniteur = Moniteur()
+    lecteur = LecteurMoniteur(moniteur.memoire.name, moniteur.capacite_points, moniteur.capacite_essais)
+    try:
+        ecrire_session(moniteur, donnees_chemins[:-1], lecteur)
+        # Dernier essai lu en deux fois, au milieu du chemin
+        dernier = donnees_chemins[-1]
+        moniteur.nouvel_essai(len(donnees_chemins) - 1, dernier['cible'])
+        moitie = len(dernier['chemin']) // 2
+        for x, y in dernier['chemin'][:moitie]:
+            moniteur.ajouter_point(x, y)
+        lecteur.lire()
+        for x, y in dernier['chemin'][moitie:]:
+            moniteur.ajouter_point(x, y)
+        metriques_session(donnees_chemins)
+        moniteur.publier_metriques(donnees_chemins)
+        lecteur.lire()
+        if not np.array_equal(lecteur.chemin_courant, np.array(dernier['chemin'], dtype=float)):
+            ecarts.append("chemin de l'essai en cours différent du chemin écrit")
+        if not np.array_equal(lecteur.chemin_precedent, np.array(donnees_chemins[-2]['chemin'], dtype=float)):
+            ecarts.append("chemin de l'essai précédent différent du chemin écrit")
+        attendues = [d['metriques']['erreur_angulaire_signee_deg'] for d in donnees_chemins]
+        lues = lecteur.metriques[:, 1]
+        if len(lues) != len(attendues) or not np.allclose(lues, np.array(attendues, dtype=float), equal_nan=True):
+            ecarts.append("courbe d'apprentissage différente des métriques écrites")
+        if lecteur.points_perdus:
+            ecarts.append(f"{lecteur.points_perdus} point(s) perdu(s) sans débordement")
+        moniteur.reinitialiser()
+        lecteur.lire()
+        if len(lecteur.metriques):
+            ecarts.append("courbe d'apprentissage non remise à zéro avec la session")
+    finally:
+        lecteur.fermer()
+        moniteur.fermer()
+
+    # Tampon trop petit pour la session : les points écrasés sont comptés, les autres intacts
+    moniteur = Moniteur(capacite_points=50)
+    lecteur = LecteurMoniteur(moniteur.memoire.name, moniteur.capacite_points, moniteur.capacite_essais)
+    try:
+        ecrire_session(moniteur, donnees_chemins)
+        lecteur.lire()
+        total = sum(len(d['chemin']) for d in donnees_chemins)
+        if lecteur.points_perdus != total - 50:
+            ecarts.append(f"débordement : {lecteur.points_perdus} point(s) perdu(s) au lieu de {total - 50}")
+        if not np.array_equal(lecteur.chemin_courant, np.array(donnees_chemins[-1]['chemin'][-50:], dtype=float)):
+            ecarts.append("débordement : derniers points différents des points écrits")
+    finally:
+        lecteur.fermer()
+        moniteur.fermer()
+    return ecarts
+
+
+def executer_fenetre(donnees_chemins, capture):
+    """
+    Ouvre la fenêtre de suivi et l'alimente au rythme de la simulation
+
+    Returns:
+        Durée de l'écriture de la session en secondes
+    """
+    moniteur = Moniteur()
+    moniteur.lancer(capture=capture)
+    try:
+        debut = time.perf_counter()
+        ecrire_session(moniteur, donnees_chemins, pause_s=1 / config.FREQUENCE_SIMULATION)
+        duree = time.perf_counter() - debut
+        time.sleep(0.5)  # Laisser la fenêtre afficher la fin de session
+    finally:
+        moniteur.fermer(delai_s=5.0)
+    return duree
+
+
+if __name__ == "__main__":
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    nombre_essais = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    donnees_chemins = generer_donnees_chemins(nombre_essais, 120)
+
+    ecriture, ajout = mesurer_ecriture()
+    print(f"Point écrit en mémoire partagée : {ecriture:.2f} µs (ajout au chemin : {ajout:.2f} µs)")
+
+    ecarts = verifier_lecture(generer_donnees_chemins(nombre_essais, 120))
+    for message in ecarts:
+        print(f"Écart : {message}")
+    print("Lecture conforme" if not ecarts else f"{len(ecarts)} écart(s) de lecture")
+
+    capture = os.path.join(tempfile.gettempdir(), "moniteur.png")
+    duree = executer_fenetre(donnees_chemins, capture)
+    print(f"Session de {nombre_essais} essais écrite en {duree:.2f} s pendant l'affichage du suivi")
+    print(f"Dernière image du suivi : {capture}" if os.path.exists(capture) else "Pas d'image du suivi")
+    sys.exit(1 if ecarts else 0)
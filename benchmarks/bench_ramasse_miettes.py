@@ -0,0 +1,142 @@
+"""
+Vérification et mesure de la politique du ramasse-miettes autour des essais
+
+La politique doit figer les objets du démarrage, suspendre le ramasse-miettes
+(ou relever ses seuils) pendant un essai puis rétablir l'état initial, et la
+collecte explicite doit retrouver les cycles abandonnés pendant l'essai. Le
+script s'arrête avec un code d'erreur en cas d'écart, puis rejoue une session
+synthétique (pas de simulation qui allouent comme Jeu.mettre_a_jour, tas de
+démarrage volumineux) avec le comportement par défaut de Python puis avec
+chaque politique, et compare les pauses pendant l'enregistrement et la durée
+maximale d'un pas.
+
+Usage : python -m benchmarks.bench_ramasse_miettes [essais] [pas_par_essai] [objets_demarrage]
+"""
+import gc
+import sys
+import time
+import weakref
+import config
+import ramasse_miettes
+
+
+class Noeud:
+    """Objet qui se référence lui-même (cycle que seul le ramasse-miettes peut libérer)"""
+
+    def __init__(self):
+        self.suivant = self
+
+
+def verifier():
+    """
+    Returns:
+        Liste de messages décrivant les écarts (vide si tout concorde)
+    """
+    ecarts = []
+    seuils = gc.get_threshold()
+    config.GC_FIGER_DEMARRAGE = 1
+    ramasse_miettes.demarrer()
+    if gc.get_freeze_count() == 0:
+        ecarts.append("aucun objet figé au démarrage")
+
+    config.GC_POLITIQUE_ESSAI = "suspendu"
+    ramasse_miettes.debut_essai(1)
+    if gc.isenabled():
+        ecarts.append("ramasse-miettes actif pendant un essai en politique 'suspendu'")
+    temoins = [weakref.ref(Noeud()) for _ in range(20000)]
+    if sum(temoin() is not None for temoin in temoins) != len(temoins):
+        ecarts.append("cycles libérés pendant l'essai")
+    ramasse_miettes.fin_essai()
+    if not gc.isenabled() or gc.get_threshold() != seuils:
+        ecarts.append("ramasse-miettes non rétabli après l'essai")
+    ramasse_miettes.collecter()
+    restants = sum(temoin() is not None for temoin in temoins)
+    if restants:
+        ecarts.append(f"{restants} cycles abandonnés pendant l'essai toujours en mémoire après la collecte")
+
+    config.GC_POLITIQUE_ESSAI = "seuils"
+    ramasse_miettes.debut_essai(2)
+    if gc.get_threshold() != tuple(config.GC_SEUILS_ESSAI) or not gc.isenabled():
+        ecarts.append(f"seuils pendant l'essai {gc.get_threshold()} au lieu de {config.GC_SEUILS_ESSAI}")
+    ramasse_miettes.fin_essai()
+    if gc.get_threshold() != seuils:
+        ecarts.append("seuils non rétablis après l'essai")
+
+    bilan = ramasse_miettes.resume()
+    premier = bilan['essais'][0]
+    if premier['pauses_enregistrement'] != 0 or premier['pauses_hors_enregistrement'] < 1:
+        ecarts.append(f"pauses de l'essai 1 mal attribuées : {premier}")
+
+    ramasse_miettes.arreter()
+    if gc.get_freeze_count() != 0 or ramasse_miettes._rappel in gc.callbacks:
+        ecarts.append("état du ramasse-miettes non rétabli par arreter()")
+    return ecarts
+
+
+def rejouer_session(essais, pas_par_essai):
+    """
+    Rejoue une session : chaque pas alloue comme Jeu.mettre_a_jour, chaque essai garde son chemin
+
+    Returns:
+        Durées des pas pendant l'enregistrement, en secondes
+    """
+    donnees_chemins = []
+    durees = []
+    for numero in range(1, essais + 1):
+        ramasse_miettes.debut_essai(numero)
+        chemin = [(960, 540, 0)]
+        for k in range(pas_par_essai):
+            debut = time.perf_counter()
+            position = (960 + k % 300, 540 - k % 200)
+            precedente = {'position': position, 'pas': [position, (k, k)]}
+            if position != chemin[-1][:2]:
+                chemin.append((position[0], position[1], k * 2))
+            if k % 50 == 0:
+                Noeud()  # Quelques cycles (événements, gestionnaires de contexte)
+            durees.append(time.perf_counter() - debut)
+            del precedente
+        donnees_chemins.append({'chemin': [(x, y) for x, y, _ in chemin], 'temps_chemin': [t for _, _, t in chemin]})
+        ramasse_miettes.fin_essai()
+        ramasse_miettes.collecter()
+    return durees
+
+
+def mesurer(essais=60, pas_par_essai=1000, objets_demarrage=500000):
+    """
+    Compare le comportement par défaut de Python et les politiques de config
+
+    Returns:
+        Dictionnaire {politique: (bilan de ramasse_miettes.resume, durée maximale d'un pas en ms)}
+    """
+    demarrage = [{'indice': i, 'valeurs': [i]} for i in range(objets_demarrage // 3)]  # Tas de démarrage
+    resultats = {}
+    for nom, figer, politique in (("python", 0, "python"), ("seuils", 1, "seuils"), ("suspendu", 1, "suspendu")):
+        config.GC_FIGER_DEMARRAGE, config.GC_POLITIQUE_ESSAI = figer, politique
+        gc.collect()
+        ramasse_miettes.demarrer()
+        durees = rejouer_session(essais, pas_par_essai)
+        resultats[nom] = (ramasse_miettes.resume(), max(durees) * 1000)
+        ramasse_miettes.arreter()
+    del demarrage
+    return resultats
+
+
+if __name__ == "__main__":
+    arguments = [int(a) for a in sys.argv[1:4]]
+    essais = arguments[0] if len(arguments) > 0 else 60
+    pas_par_essai = arguments[1] if len(arguments) > 1 else 1000
+    objets_demarrage = arguments[2] if len(arguments) > 2 else 500000
+
+    ecarts = verifier()
+    for message in ecarts:
+        print(f"Écart : {message}")
+    if ecarts:
+        sys.exit(1)
+    print("Objets du démarrage figés, ramasse-miettes suspendu puis rétabli, cycles retrouvés par la collecte")
+
+    print(f"Session de {essais} essais x {pas_par_essai} pas, {objets_demarrage} objets au démarrage :")
+    for nom, (bilan, pas_max_ms) in mesurer(essais, pas_par_essai, objets_demarrage).items():
+        print(f"  {nom} : {bilan['pauses_enregistrement']} pause(s) pendant les essais "
+              f"({bilan['duree_enregistrement_ms']:.1f} ms, max {bilan['pause_max_enregistrement_ms']:.2f} ms), "
+              f"pas le plus long {pas_max_ms:.2f} ms, "
+              f"collectes hors essais {bilan['duree_hors_enregistrement_ms']:.1f} ms")
@@ -0,0 +1,81 @@
+"""
+Comparaison des moteurs de rendu : temps d'image (dessin + présentation) en 1080p et en 4K
+
+Deux scènes sont mesurées : un essai en cours (cercle, cible, curseur dévié) et
+l'écran de fin de partie (calque d'interface semi-transparent par-dessus le jeu).
+Sans écran (SDL_VIDEODRIVER=dummy), le rendu par textures utilise le renderer
+logiciel de SDL.
+
+Usage : python -m benchmarks.bench_rendu [images]
+"""
+import os
+import sys
+import time
+import pygame
+import config
+from rendu import RENDUS, creer_rendu
+
+RESOLUTIONS = {'1080p': (1920, 1080), '4K': (3840, 2160)}
+
+
+def mesurer_scene(jeu, rendu, images):
+    """
+    Dessine et présente plusieurs images de la scène courante
+
+    Returns:
+        Tuple (temps moyen, 95e centile) en ms
+    """
+    durees = []
+    for i in range(images):
+        # Faire bouger le curseur pour que chaque image soit différente
+        jeu.position_deviée_actuelle = (config.CERCLE_CENTRE_X + i % 200, config.CERCLE_CENTRE_Y)
+        debut = time.perf_counter()
+        jeu.dessiner()
+        rendu.presenter()
+        durees.append((time.perf_counter() - debut) * 1000)
+    durees.sort()
+    return sum(durees) / len(durees), durees[int(len(durees) * 0.95)]
+
+
+def mesurer(images=200):
+    """
+    Mesure chaque moteur de rendu à chaque résolution
+
+    Returns:
+        Liste de dictionnaires (résolution, rendu, scène, moyenne et 95e centile en ms)
+    """
+    from jeu import Jeu
+    resultats = []
+    debut_deviation = config.CIBLE_DEBUT_DEVIATION
+    config.CIBLE_DEBUT_DEVIATION = 1  # Curseur personnalisé affiché dès la première cible
+    try:
+        for nom_resolution, taille in RESOLUTIONS.items():
+            for mode in RENDUS:
+                pygame.display.init()
+                pygame.font.init()
+                config.definir_geometrie(*taille)
+                rendu = creer_rendu(mode, taille, plein_ecran=False)
+                jeu = Jeu(rendu.surface, rendu)
+                for scene in ("essai", "fin"):
+                    jeu.fin_de_partie = scene == "fin"
+                    moyenne, p95 = mesurer_scene(jeu, rendu, images)
+                    resultats.append({
+                        'resolution': nom_resolution,
+                        'rendu': mode if mode == "logiciel" or rendu.accelere else "textures (SDL logiciel)",
+                        'scene': scene,
+                        'moyenne_ms': moyenne,
+                        'p95_ms': p95,
+                    })
+                rendu.fermer()
+    finally:
+        config.CIBLE_DEBUT_DEVIATION = debut_deviation
+    return resultats
+
+
+if __name__ == "__main__":
+    images = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    resultats = mesurer(images)
+    print(f"{'résolution':>10} {'rendu':>24} {'scène':>6} {'moyenne (ms)':>13} {'p95 (ms)':>9}")
+    for r in resultats:
+        print(f"{r['resolution']:>10} {r['rendu']:>24} {r['scene']:>6} {r['moyenne_ms']:>13.2f} {r['p95_ms']:>9.2f}")
@@ -0,0 +1,90 @@
+"""
+Mesure de l'attente en fin de session avec et sans rendu anticipé des pages
+
+Une session synthétique est rejouée comme dans le jeu : métriques de chaque essai
+calculées à la fin de l'essai puis transmises au processus de rendu, pages de la
+session demandées à la fin. On mesure ensuite le temps de l'export (attente du
+rendu anticipé comprise), à comparer à un export complet avec un cache vide.
+Avec le rendu anticipé, seule la page de garde doit être rendue par l'export.
+
+Usage : python -m benchmarks.bench_rendu_anticipe [essais] [points_par_chemin] [duree_essai_s]
+"""
+import os
+import sys
+import tempfile
+import time
+import config
+from benchmarks.donnees_synthetiques import generer_donnees_chemins
+from metriques_essai import calculer_metriques_essai, metriques_session
+from rendu_anticipe import RenduAnticipe
+
+
+def exporter(donnees_chemins, nom):
+    """Export du rapport comme dans le jeu ; retourne (durée en s, pages reprises du cache, pages rendues)."""
+    from generateur_pdf import GenerateurPDF
+    debut = time.perf_counter()
+    generateur = GenerateurPDF()
+    generateur.generer_pdf(donnees_chemins, nom)
+    return time.perf_counter() - debut, generateur.pages_en_cache, generateur.pages_rendues
+
+
+def mesurer(nombre_essais=48, points_par_chemin=120, duree_essai_s=0.5):
+    """
+    Returns:
+        Dictionnaire des mesures (export sans et avec rendu anticipé, pages)
+    """
+    config.CACHE_PAGES = 1
+    config.NOMBRE_CIBLES_MAX = nombre_essais
+    dossier_courant = os.getcwd()
+    mesures = {}
+    with tempfile.TemporaryDirectory() as dossier:
+        os.chdir(dossier)  # Cache des pages et rapports relatifs au dossier courant
+        try:
+            # Sans rendu anticipé : tout est rendu à l'export (cache vide)
+            donnees_chemins = generer_donnees_chemins(nombre_essais, points_par_chemin)
+            config.DOSSIER_CACHE_PAGES = os.path.join(dossier, "cache_sans")
+            mesures['sans'] = exporter(donnees_chemins, "sans")
+
+            # Avec rendu anticipé : la session est rejouée au rythme des essais
+            donnees_chemins = generer_donnees_chemins(nombre_essais, points_par_chemin)
+            config.DOSSIER_CACHE_PAGES = os.path.join(dossier, "cache_avec")
+            rendu_anticipe = RenduAnticipe()
+            rendu_anticipe.lancer()
+            debut_session = time.perf_counter()
+            for i, donnees in enumerate(donnees_chemins):
+                calculer_metriques_essai(donnees)
+                rendu_anticipe.soumettre_essai(i, donnees)
+                time.sleep(duree_essai_s)
+            metriques_session(donnees_chemins)
+            rendu_anticipe.soumettre_rapport(donnees_chemins)
+            mesures['session_s'] = time.perf_counter() - debut_session
+            mesures['en_retard'] = rendu_anticipe.en_attente()
+
+            debut = time.perf_counter()
+            rendu_anticipe.attendre(delai_s=600)
+            mesures['attente_s'] = time.perf_counter() - debut
+            duree, en_cache, rendues = exporter(donnees_chemins, "avec")
+            mesures['avec'] = (duree + mesures['attente_s'], en_cache, rendues)
+            mesures['pages_anticipees'] = rendu_anticipe.pages_rendues
+            rendu_anticipe.fermer()
+        finally:
+            os.chdir(dossier_courant)
+    return mesures
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:4]
+    nombre_essais = int(arguments[0]) if len(arguments) > 0 else 48
+    points_par_chemin = int(arguments[1]) if len(arguments) > 1 else 120
+    duree_essai_s = float(arguments[2]) if len(arguments) > 2 else 0.5
+    mesures = mesurer(nombre_essais, points_par_chemin, duree_essai_s)
+    duree, en_cache, rendues = mesures['sans']
+    print(f"Export sans rendu anticipé : {duree:.2f} s ({rendues} page(s) rendue(s))")
+    duree, en_cache, rendues = mesures['avec']
+    print(f"Export avec rendu anticipé : {duree:.2f} s dont {mesures['attente_s']:.2f} s d'attente "
+          f"({mesures['pages_anticipees']} page(s) anticipée(s), {mesures['en_retard']} travail(aux) en retard "
+          f"à la fin de la session ; {en_cache} reprise(s) du cache, {rendues} rendue(s))")
+    ecart = rendues != 1
+    if ecart:
+        print("Écart : l'export aurait dû ne rendre que la page de garde")
+    sys.exit(1 if ecart else 0)
@@ -0,0 +1,89 @@
+"""
+Vérification du service de génération des rapports et mesure de ses temps par travail
+
+Des sessions synthétiques (et un fichier JSON qui n'en est pas une) sont déposées
+dans un dossier temporaire, traité une première fois ; un second passage ne doit
+rien refaire, une session seulement touchée (même contenu) non plus, et une
+session modifiée doit être la seule rendue à nouveau. Chaque rapport produit
+doit être enregistré dans le catalogue, y compris celui d'une session déposée
+sans passer par le catalogue.
+
+Usage : python -m benchmarks.bench_service_rapports [sessions] [essais] [processus]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from benchmarks.donnees_synthetiques import generer_donnees_chemins
+from catalogue import ouvrir_catalogue
+from service_rapports import ServiceRapports
+from session import sauvegarder_session
+
+
+def traiter(dossier, processus):
+    """Un passage du service sur le dossier ; retourne les fichiers traités (rendus ou ignorés) et l'état."""
+    service = ServiceRapports(dossier, processus, "png")
+    avant = {nom: entree['date'] for nom, entree in service.registre.items()}
+    service.executer(intervalle_s=0.1, une_fois=True)
+    return {nom: entree for nom, entree in service.registre.items() if avant.get(nom) != entree['date']}, service.etat()
+
+
+def verifier(sessions=4, essais=20, processus=2):
+    """
+    Returns:
+        Tuple (liste des écarts constatés, état du service après le premier passage)
+    """
+    ecarts = []
+    dossier_courant = os.getcwd()
+    with tempfile.TemporaryDirectory() as dossier:
+        os.chdir(dossier)  # Les rapports sont écrits relativement au dossier courant
+        try:
+            for p in range(sessions):
+                # La dernière session est déposée sans être cataloguée (fichier copié dans le dossier)
+                sauvegarder_session(generer_donnees_chemins(essais, 40, graine=p), f"participant_{p:03d}", dossier,
+                                    cataloguer=p < sessions - 1)
+            with open(os.path.join(dossier, "memoire_test.json"), 'w', encoding='utf-8') as f:
+                json.dump({'echantillons': []}, f)
+
+            traites, etat = traiter(dossier, processus)
+            if etat['produits'] != sessions or etat['echecs'] or etat['ignores'] != 1:
+                ecarts.append(f"premier passage : {etat}")
+            connexion = ouvrir_catalogue(dossier)
+            try:
+                rapports = {ligne['fichier']: ligne['rapport'] for ligne in connexion.execute(
+                    "SELECT fichier, rapport FROM sessions")}
+            finally:
+                connexion.close()
+            sans_rapport = sorted(nom for nom in (f"participant_{p:03d}.json" for p in range(sessions))
+                                  if not rapports.get(nom))
+            if sans_rapport:
+                ecarts.append(f"rapport absent du catalogue : {sans_rapport}")
+
+            traites, _ = traiter(dossier, processus)
+            if traites:
+                ecarts.append(f"second passage : {sorted(traites)} traité(s) à nouveau")
+
+            chemin = os.path.join(dossier, "participant_000.json")
+            os.utime(chemin, (time.time() + 10, time.time() + 10))
+            traites, _ = traiter(dossier, processus)
+            if any(entree.get('sortie') for entree in traites.values()):
+                ecarts.append("session touchée sans changement de contenu rendue à nouveau")
+
+            sauvegarder_session(generer_donnees_chemins(essais, 40, graine=99), "participant_001", dossier)
+            traites, _ = traiter(dossier, processus)
+            if sorted(traites) != ["participant_001.json"]:
+                ecarts.append(f"session modifiée : {sorted(traites)} traité(s) au lieu de participant_001.json")
+        finally:
+            os.chdir(dossier_courant)
+    return ecarts, etat
+
+
+if __name__ == "__main__":
+    arguments = [int(a) for a in sys.argv[1:4]]
+    ecarts, etat = verifier(*arguments)
+    print(f"Premier passage : {etat['produits']} rapport(s), {etat['duree_moyenne_s']:.2f} s par rapport en moyenne")
+    for message in ecarts:
+        print(f"Écart : {message}")
+    print("Service conforme" if not ecarts else f"{len(ecarts)} écart(s)")
+    sys.exit(1 if ecarts else 0)
@@ -0,0 +1,103 @@
+"""
+Vérification et mesure du simulateur de participants
+
+Quelques participants sont simulés en gardant leurs essais ; les positions de
+la souris de chaque essai sont rejouées pas à pas dans les méthodes du jeu
+(Jeu.appliquer_deviation_mouvement, Jeu.detecter_traversee_cercle) et le chemin
+enregistré, ses temps et le point de traversée doivent être identiques à ceux du
+simulateur. Les erreurs simulées doivent aussi être celles des métriques. Le
+script s'arrête avec un code d'erreur en cas d'écart, puis mesure le débit de
+la simulation et le temps d'une courbe de puissance.
+
+Usage : python -m benchmarks.bench_simulateur [participants_verifies] [participants_mesures] [groupes]
+"""
+import math
+import sys
+import time
+import numpy as np
+import config
+from jeu import Jeu
+from metriques_essai import metriques_session
+from simulateur import simuler_participants, parametres_protocole, courbes_puissance
+
+
+def rejouer_essai(numero, mains, cible):
+    """Rejoue un essai dans les méthodes du jeu ; retourne l'essai au format de Jeu.donnees_chemins."""
+    centre = (config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
+    jeu = Jeu.__new__(Jeu)  # Sans fenêtre : seules les méthodes de déviation et de traversée sont utilisées
+    jeu.nombre_cibles = numero
+    jeu.angle_deviation_rad = math.radians(config.ANGLE_DEVIATION)
+    jeu.en_affichage_resultat = False
+    jeu.position_curseur_precedente = centre
+    jeu.position_curseur_precedente_deviée = centre
+    pas_ms = 1000.0 / config.FREQUENCE_SIMULATION
+    chemin = [(centre[0], centre[1], 0)]
+    for k in range(1, len(mains)):
+        position_reelle = (int(mains[k][0]), int(mains[k][1]))
+        position = jeu.appliquer_deviation_mouvement(position_reelle)
+        if position != chemin[-1][:2]:
+            chemin.append((position[0], position[1], round(k * pas_ms)))
+        point_traversee = jeu.detecter_traversee_cercle(position)
+        if point_traversee:
+            chemin.append((point_traversee[0], point_traversee[1], round(k * pas_ms)))
+            break
+        jeu.position_curseur_precedente = position_reelle
+        jeu.position_curseur_precedente_deviée = position
+    else:
+        point_traversee = None
+    return {
+        'chemin': [(x, y) for x, y, _ in chemin],
+        'temps_chemin': [t for _, _, t in chemin],
+        'cible': cible,
+        'point_traversee': point_traversee,
+    }
+
+
+def verifier(participants=20, graine=0):
+    """
+    Returns:
+        Liste de messages décrivant les écarts (vide si tout concorde)
+    """
+    config.CIBLE_DEBUT_DEVIATION, config.CIBLE_FIN_DEVIATION = 5, 21
+    config.NOMBRE_CIBLES_MAX = 28
+    simulation = simuler_participants(participants, parametres_protocole(), graine=graine, conserver_chemins=True,
+                                      processus=1)
+    ecarts = []
+    for p, (donnees_chemins, mains) in enumerate(zip(simulation['donnees_chemins'], simulation['mains'])):
+        for n, (donnees, mains_essai) in enumerate(zip(donnees_chemins, mains)):
+            attendu = rejouer_essai(n + 1, mains_essai, donnees['cible'])
+            for cle in ('chemin', 'temps_chemin', 'point_traversee'):
+                if donnees[cle] != attendu[cle]:
+                    ecarts.append(f"participant {p}, essai {n + 1} : '{cle}' différent du jeu")
+        erreurs = np.array([np.nan if m['erreur_angulaire_signee_deg'] is None else m['erreur_angulaire_signee_deg']
+                            for m in metriques_session(donnees_chemins)])
+        if not np.allclose(erreurs, simulation['erreurs'][p], atol=1e-9, equal_nan=True):
+            ecarts.append(f"participant {p} : erreurs différentes des métriques")
+    return ecarts
+
+
+if __name__ == "__main__":
+    arguments = [int(a) for a in sys.argv[1:4]]
+    participants_verifies = arguments[0] if len(arguments) > 0 else 20
+    participants_mesures = arguments[1] if len(arguments) > 1 else 4000
+    groupes = arguments[2] if len(arguments) > 2 else 200
+
+    ecarts = verifier(participants_verifies)
+    for message in ecarts[:20]:
+        print(f"Écart : {message}")
+    if ecarts:
+        sys.exit(1)
+    print(f"Simulation conforme au jeu ({participants_verifies} participants rejoués pas à pas)")
+
+    debut = time.perf_counter()
+    simulation = simuler_participants(participants_mesures, parametres_protocole())
+    duree = time.perf_counter() - debut
+    non_traverses = int(np.isnan(simulation['erreurs_vues']).sum())
+    print(f"{participants_mesures} participants x {config.NOMBRE_CIBLES_MAX} essais : {duree:.2f} s "
+          f"({participants_mesures / duree:.0f} participants/s, {non_traverses} essai(s) sans traversée)")
+
+    debut = time.perf_counter()
+    resultats = courbes_puissance([30, 50], [8, 16, 24], groupes)
+    print(f"Courbes de puissance (2 angles, {groupes} groupes de 24) : {time.perf_counter() - debut:.2f} s")
+    for angle, ligne in zip(resultats['angles'], resultats['puissance']):
+        print(f"  {angle:g}° : " + ", ".join(f"n={n} : {p:.2f}" for n, p in zip(resultats['effectifs'], ligne)))
@@ -0,0 +1,113 @@
+"""
+Vérification et mesure du rééchantillonnage normalisé des trajectoires
+
+Le rééchantillonnage en lot (une interpolation pour tous les essais) est comparé
+à une version de référence essai par essai, pour les deux bases de normalisation,
+sur des sessions synthétiques complétées de cas limites (essai d'un seul point,
+essai immobile, points répétés) ; le script s'arrête avec un code d'erreur en cas
+d'écart. La page des trajectoires moyennes et l'archive .npz sont ensuite
+produites dans un dossier temporaire.
+
+Usage : python -m benchmarks.bench_trajectoires [essais] [points_par_chemin]
+"""
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+from benchmarks.donnees_synthetiques import generer_donnees_chemins
+from trajectoires_moyennes import reechantillonner_normalise, trajectoires_moyennes, exporter_trajectoires_npz
+
+
+def reference_reechantillonner(donnees_chemins, nombre_points, base):
+    """Version de référence : un essai à la fois."""
+    grille = np.linspace(0.0, 1.0, nombre_points)
+    positions = np.full((len(donnees_chemins), nombre_points, 2), np.nan)
+    for i, donnees in enumerate(donnees_chemins):
+        chemin = np.array(donnees['chemin'], dtype=float).reshape(-1, 2)
+        temps = np.array(donnees['temps_chemin'], dtype=float)
+        if len(chemin) < 2:
+            continue
+        if base == "longueur":
+            abscisse = np.concatenate(([0.0], np.cumsum(np.hypot(*np.diff(chemin, axis=0).T))))
+        else:
+            abscisse = temps - temps[0]
+        if abscisse[-1] <= 0:
+            continue
+        u = abscisse / abscisse[-1]
+        positions[i, :, 0] = np.interp(grille, u, chemin[:, 0])
+        positions[i, :, 1] = np.interp(grille, u, chemin[:, 1])
+    return positions
+
+
+def cas_limites(donnees_chemins):
+    """Ajoute des essais dégénérés à une session."""
+    cible = donnees_chemins[0]['cible']
+    return donnees_chemins + [
+        {'chemin': [(960, 540)], 'temps_chemin': [0], 'cible': cible, 'point_traversee': None},
+        {'chemin': [(960, 540)] * 5, 'temps_chemin': [0, 2, 4, 6, 8], 'cible': cible, 'point_traversee': None},
+        {'chemin': [(960, 540), (960, 540), (970, 530), (970, 530), (990, 510)],
+         'temps_chemin': [0, 2, 4, 4, 10], 'cible': cible, 'point_traversee': None},
+    ]
+
+
+def verifier(donnees_chemins, nombre_points=101):
+    """
+    Returns:
+        Liste de messages décrivant les écarts (vide si tout concorde)
+    """
+    ecarts = []
+    for base in ("temps", "longueur"):
+        _, positions, exploitable = reechantillonner_normalise(donnees_chemins, nombre_points, base)
+        attendues = reference_reechantillonner(donnees_chemins, nombre_points, base)
+        if not np.array_equal(exploitable, ~np.isnan(attendues[:, 0, 0])):
+            ecarts.append(f"{base} : essais exploitables différents de la référence")
+        elif not np.allclose(positions, attendues, atol=1e-6, equal_nan=True):
+            pire = np.nanmax(np.abs(positions - attendues))
+            ecarts.append(f"{base} : écart maximal de {pire:.3g} px avec la référence")
+    return ecarts
+
+
+def mesurer(donnees_chemins, nombre_points=101, repetitions=5):
+    """
+    Returns:
+        Tuple (durée du lot, durée de la référence) en millisecondes
+    """
+    durees = []
+    for fonction in (lambda: reechantillonner_normalise(donnees_chemins, nombre_points, "temps"),
+                     lambda: reference_reechantillonner(donnees_chemins, nombre_points, "temps")):
+        meilleure = float('inf')
+        for _ in range(repetitions):
+            debut = time.perf_counter()
+            fonction()
+            meilleure = min(meilleure, time.perf_counter() - debut)
+        durees.append(meilleure * 1000)
+    return tuple(durees)
+
+
+if __name__ == "__main__":
+    nombre_essais = int(sys.argv[1]) if len(sys.argv) > 1 else 480
+    points_par_chemin = int(sys.argv[2]) if len(sys.argv) > 2 else 120
+    donnees_chemins = cas_limites(generer_donnees_chemins(nombre_essais, points_par_chemin))
+
+    ecarts = verifier(donnees_chemins)
+    for message in ecarts:
+        print(f"Écart : {message}")
+    if ecarts:
+        sys.exit(1)
+    print("Rééchantillonnage conforme à la référence (temps et longueur)")
+
+    lot, reference = mesurer(donnees_chemins)
+    print(f"{len(donnees_chemins)} essais : {lot:.1f} ms en lot, {reference:.1f} ms essai par essai")
+
+    debut = time.perf_counter()
+    resultats = trajectoires_moyennes(donnees_chemins)
+    print(f"Trajectoires moyennes ({len(resultats['groupes'])} groupes) : {(time.perf_counter() - debut) * 1000:.1f} ms")
+
+    from generateur_pdf import GenerateurPDF
+    generateur = GenerateurPDF("png", utiliser_cache=False)
+    dossier = tempfile.mkdtemp()
+    chemin_npz = exporter_trajectoires_npz(os.path.join(dossier, "trajectoires.npz"), resultats)
+    fig = generateur._creer_page_trajectoires(resultats)
+    fig.savefig(os.path.join(dossier, "trajectoires_moyennes.png"), dpi=100)
+    print(f"Page et archive : {dossier}")
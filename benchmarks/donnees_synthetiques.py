@@ -0,0 +1,52 @@
+"""
+Génération de données de chemins synthétiques pour les mesures de performance
+"""
+import math
+import random
+import config
+from cible import ANGLES_POSITIONS_FIXES
+
+
+def generer_donnees_chemins(nombre_essais, points_par_chemin, largeur=1920, hauteur=1080, graine=0):
+    """
+    Génère des essais au format de Jeu.donnees_chemins
+
+    Chaque chemin va du centre vers une des 8 positions avec un profil de vitesse
+    en cloche (jerk minimal), un peu de bruit et un échantillonnage irrégulier.
+
+    Args:
+        nombre_essais: Nombre d'essais à générer
+        points_par_chemin: Nombre de points de chaque chemin
+        largeur, hauteur: Dimensions d'écran simulées (config est mis à jour)
+        graine: Graine du générateur aléatoire
+
+    Returns:
+        Liste de dictionnaires avec chemin, temps_chemin, cible, point_traversee
+    """
+    config.definir_geometrie(largeur, hauteur)
+    alea = random.Random(graine)
+    cx, cy, r = config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y, config.CERCLE_RAYON
+    donnees_chemins = []
+    for i in range(nombre_essais):
+        angle_cible = ANGLES_POSITIONS_FIXES[i % 8]
+        angle = angle_cible + math.radians(alea.gauss(0, 8))
+        temps_reaction = alea.uniform(150, 300)
+        duree = alea.uniform(300, 600)
+        chemin, temps = [], []
+        t = 0.0
+        for j in range(points_par_chemin):
+            s = min(1.0, max(0.0, (t - temps_reaction) / duree))
+            avance = 10 * s ** 3 - 15 * s ** 4 + 6 * s ** 5
+            distance = 1.02 * r * avance
+            chemin.append((int(cx + distance * math.cos(angle) + alea.gauss(0, 0.5)),
+                           int(cy + distance * math.sin(angle) + alea.gauss(0, 0.5))))
+            temps.append(int(t))
+            t += (temps_reaction + duree) / max(1, points_par_chemin - 1) * alea.uniform(0.8, 1.2)
+        point_traversee = (int(cx + r * math.cos(angle)), int(cy + r * math.sin(angle)))
+        donnees_chemins.append({
+            'chemin': chemin,
+            'temps_chemin': temps,
+            'cible': (int(cx + r * math.cos(angle_cible)), int(cy + r * math.sin(angle_cible))),
+            'point_traversee': point_traversee
+        })
+    return donnees_chemins
@@ -0,0 +1,134 @@
+"""
+Module du cache disque des pages de rapport
+
+Chaque page rendue est conservée sous le hachage de tout ce qui détermine son
+contenu (données de l'essai, valeurs de config utilisées, version du rendu,
+format de sortie). Une page dont les entrées n'ont pas changé est donc reprise
+telle quelle à l'export suivant. La taille du cache est bornée : les pages les
+moins récemment utilisées sont supprimées en premier.
+"""
+import hashlib
+import os
+import tempfile
+import numpy as np
+import config
+
+
+def _ajouter_a_empreinte(hachage, valeur):
+    """Ajoute une valeur au hachage sous une forme canonique (indépendante de l'ordre des clés)."""
+    if isinstance(valeur, dict):
+        hachage.update(b'{')
+        for cle in sorted(valeur, key=str):
+            _ajouter_a_empreinte(hachage, cle)
+            _ajouter_a_empreinte(hachage, valeur[cle])
+        hachage.update(b'}')
+    elif isinstance(valeur, (list, tuple)):
+        hachage.update(b'[')
+        for element in valeur:
+            _ajouter_a_empreinte(hachage, element)
+        hachage.update(b']')
+    elif isinstance(valeur, np.ndarray):
+        hachage.update(f"ndarray{valeur.dtype.str}{valeur.shape}".encode())
+        hachage.update(np.ascontiguousarray(valeur).tobytes())
+    else:
+        hachage.update(f"{type(valeur).__name__}:{valeur!r};".encode())
+
+
+def empreinte(*elements):
+    """
+    Calcule la clé de cache d'une page
+
+    Args:
+        elements: Valeurs dont dépend le contenu de la page (dictionnaires, listes,
+            tableaux numpy, nombres, chaînes)
+
+    Returns:
+        Empreinte SHA-256 en hexadécimal
+    """
+    hachage = hashlib.sha256()
+    for element in elements:
+        _ajouter_a_empreinte(hachage, element)
+    return hachage.hexdigest()
+
+
+class CachePages:
+    """Cache des pages rendues sur disque, de taille bornée (éviction LRU)"""
+
+    def __init__(self, dossier=None, taille_max_mo=None):
+        """
+        Args:
+            dossier: Dossier du cache (par défaut config.DOSSIER_CACHE_PAGES)
+            taille_max_mo: Taille maximale en Mo (par défaut config.TAILLE_CACHE_PAGES_MO)
+        """
+        self.dossier = dossier or config.DOSSIER_CACHE_PAGES
+        self.taille_max = (taille_max_mo or config.TAILLE_CACHE_PAGES_MO) * 1024 * 1024
+        self._taille_totale = None  # Calculée au premier ajout
+
+    def _chemin(self, cle):
+        return os.path.join(self.dossier, cle)
+
+    def contient(self, cle):
+        """Indique si une page est en cache (sans la marquer comme utilisée)."""
+        return os.path.exists(self._chemin(cle))
+
+    def obtenir(self, cle):
+        """
+        Retourne le contenu d'une page en cache et la marque comme récemment utilisée
+
+        Args:
+            cle: Empreinte de la page
+
+        Returns:
+            Contenu (octets) ou None si la page n'est pas en cache
+        """
+        chemin = self._chemin(cle)
+        try:
+            with open(chemin, 'rb') as f:
+                contenu = f.read()
+            os.utime(chemin)
+        except OSError:
+            return None
+        return contenu
+
+    def ajouter(self, cle, contenu):
+        """
+        Enregistre une page puis libère de la place si le cache dépasse sa taille maximale
+
+        Args:
+            cle: Empreinte de la page
+            contenu: Octets de la page rendue
+        """
+        if not os.path.exists(self.dossier):
+            os.makedirs(self.dossier, exist_ok=True)
+        if self._taille_totale is None:
+            self._taille_totale = sum(e.stat().st_size for e in os.scandir(self.dossier) if e.is_file())
+        # Écriture atomique : un autre processus peut lire le cache en même temps
+        descripteur, chemin_temporaire = tempfile.mkstemp(dir=self.dossier, suffix=".tmp")
+        with os.fdopen(descripteur, 'wb') as f:
+            f.write(contenu)
+        os.replace(chemin_temporaire, self._chemin(cle))
+        self._taille_totale += len(contenu)
+        if self._taille_totale > self.taille_max:
+            self.evincer()
+
+    def evincer(self):
+        """Supprime les pages les moins récemment utilisées jusqu'à repasser sous la taille maximale."""
+        entrees = [e for e in os.scandir(self.dossier) if e.is_file() and not e.name.endswith(".tmp")]
+        fichiers = sorted(((e.stat().st_mtime, e.stat().st_size, e.path) for e in entrees))
+        self._taille_totale = sum(taille for _, taille, _ in fichiers)
+        for _, taille, chemin in fichiers:
+            if self._taille_totale <= self.taille_max:
+                break
+            try:
+                os.remove(chemin)
+                self._taille_totale -= taille
+            except OSError:
+                pass
+
+    def vider(self):
+        """Supprime toutes les pages du cache."""
+        if os.path.exists(self.dossier):
+            for entree in os.scandir(self.dossier):
+                if entree.is_file():
+                    os.remove(entree.path)
+        self._taille_totale = 0
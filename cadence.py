@@ -0,0 +1,154 @@
+"""
+Module de cadencement des images (frame pacing)
+
+pygame.time.Clock.tick s'endort avec la granularité de l'ordonnanceur du système,
+ce qui fait arriver les images en retard et de façon irrégulière. Le cadenceur
+vise une échéance absolue par image : il dort jusqu'à peu avant l'échéance puis
+termine par une attente active, et mesure l'erreur de chaque image.
+"""
+import os
+import time
+from array import array
+from datetime import datetime
+import pygame
+import config
+
+
+def detecter_frequence_affichage():
+    """
+    Détermine la fréquence de rafraîchissement cible
+
+    Returns:
+        config.FREQUENCE_AFFICHAGE si elle est définie, sinon la fréquence de l'écran
+        quand pygame sait la fournir, sinon 60 Hz
+    """
+    if config.FREQUENCE_AFFICHAGE:
+        return config.FREQUENCE_AFFICHAGE
+    obtenir_frequences = getattr(pygame.display, 'get_desktop_refresh_rates', None)
+    if obtenir_frequences is not None:
+        try:
+            frequences = obtenir_frequences()
+            if frequences and frequences[0] > 0:
+                return frequences[0]
+        except pygame.error:
+            pass
+    return 60
+
+
+class CadenceurImages:
+    """Classe qui cadence la boucle d'affichage et journalise l'erreur de chaque image"""
+
+    def __init__(self, frequence=None, vsync=False):
+        """
+        Initialise le cadenceur
+
+        Args:
+            frequence: Nombre d'images par seconde visé (par défaut, détection automatique)
+            vsync: True si flip attend déjà la synchronisation verticale (le cadenceur mesure seulement)
+        """
+        self.frequence = frequence or detecter_frequence_affichage()
+        self.periode = 1.0 / self.frequence
+        self.vsync = vsync
+        self.marge_attente_active = config.MARGE_ATTENTE_ACTIVE_MS / 1000
+        self.prochaine_echeance = None
+        self.derniere_image = None
+        # Journal des images (tableaux compacts) : erreur par rapport à l'échéance et durée, en ms
+        self.erreurs_ms = array('d')
+        self.durees_ms = array('d')
+        self.images_en_retard = 0
+
+    def attendre(self, tache=None):
+        """
+        Attend l'échéance de l'image suivante et enregistre l'erreur de cadencement
+        
+        Args:
+            tache: Fonction courte appelée en boucle pendant l'attente (ex. pas de simulation
+                dus), qui retourne le délai en secondes avant son prochain appel utile
+        """
+        maintenant = time.perf_counter()
+        if self.prochaine_echeance is None:
+            self.prochaine_echeance = maintenant + self.periode
+            self.derniere_image = maintenant
+            return
+
+        if self.vsync:
+            # flip a déjà attendu la synchronisation : seulement rattraper la tâche
+            if tache is not None:
+                tache()
+        else:
+            while True:
+                delai_tache = tache() if tache is not None else float('inf')
+                restant = self.prochaine_echeance - time.perf_counter()
+                if restant <= 0:
+                    break
+                if delai_tache < restant:
+                    # Prochain appel de la tâche avant l'échéance : simple sommeil, un léger retard
+                    # du pas est sans conséquence (il est rattrapé à l'appel suivant)
+                    if delai_tache > 0:
+                        time.sleep(delai_tache)
+                elif restant > self.marge_attente_active:
+                    # Sommeil jusqu'à peu avant l'échéance, puis attente active
+                    time.sleep(restant - self.marge_attente_active)
+            maintenant = time.perf_counter()
+
+        erreur = maintenant - self.prochaine_echeance
+        self.erreurs_ms.append(erreur * 1000)
+        self.durees_ms.append((maintenant - self.derniere_image) * 1000)
+        self.derniere_image = maintenant
+
+        if erreur > self.periode:
+            # Image manquée : repartir de maintenant plutôt que d'enchaîner des images en rafale
+            self.images_en_retard += 1
+            self.prochaine_echeance = maintenant + self.periode
+        else:
+            self.prochaine_echeance += self.periode
+
+    def statistiques(self, depuis=0):
+        """
+        Résume l'erreur de cadencement
+
+        Args:
+            depuis: Indice de la première image prise en compte (0 : toute la session)
+
+        Returns:
+            Dictionnaire (nombre d'images, erreur moyenne, 95e centile et maximum en ms,
+            durée moyenne d'image en ms, images en retard), ou None sans image
+        """
+        if len(self.erreurs_ms) <= depuis:
+            return None
+        erreurs = sorted(abs(e) for e in self.erreurs_ms[depuis:])
+        durees = self.durees_ms[depuis:]
+        if depuis:
+            periode_ms = self.periode * 1000
+            en_retard = sum(1 for e in self.erreurs_ms[depuis:] if e > periode_ms)
+        else:
+            en_retard = self.images_en_retard
+        return {
+            'images': len(erreurs),
+            'erreur_moyenne_ms': sum(erreurs) / len(erreurs),
+            'erreur_p95_ms': erreurs[min(len(erreurs) - 1, int(len(erreurs) * 0.95))],
+            'erreur_max_ms': erreurs[-1],
+            'duree_image_moyenne_ms': sum(durees) / len(durees),
+            'images_en_retard': en_retard,
+        }
+
+    def ecrire_journal(self, dossier=None):
+        """
+        Écrit le journal image par image dans un fichier CSV
+
+        Args:
+            dossier: Dossier de destination (par défaut config.DOSSIER_SESSIONS)
+
+        Returns:
+            Chemin du fichier créé
+        """
+        dossier = dossier or config.DOSSIER_SESSIONS
+        if not os.path.exists(dossier):
+            os.makedirs(dossier)
+        chemin = os.path.join(dossier, f"cadence_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
+        with open(chemin, 'w', encoding='utf-8') as f:
+            f.write(f"# frequence={self.frequence} vsync={int(self.vsync)}\n")
+            f.write("image;erreur_ms;duree_image_ms\n")
+            for i, (erreur, duree) in enumerate(zip(self.erreurs_ms, self.durees_ms)):
+                f.write(f"{i};{erreur:.3f};{duree:.3f}\n")
+        return chemin
@@ -0,0 +1,359 @@
+"""
+Catalogue SQLite des sessions et des métriques par essai
+
+Le catalogue est une base SQLite placée dans le dossier des sessions
+(config.FICHIER_CATALOGUE). Il contient une ligne par session (paramètres de
+config, géométrie de l'écran, date, rapport produit) et une ligne par essai
+(phase, cible et métriques scalaires). Les trajectoires restent dans les
+fichiers de session JSON, référencés depuis le catalogue par leur chemin
+relatif au dossier. Les colonnes des filtres courants (angle de déviation,
+numéro d'essai, phase, erreur angulaire) sont indexées, si bien qu'une requête
+sur toutes les sessions répond en quelques millisecondes.
+
+Le catalogue est alimenté à chaque sauvegarde de session (session.sauvegarder_session)
+et le rapport produit y est associé par le jeu et par le service des rapports. Les insertions se font par
+lots dans une seule transaction ; la base est en mode WAL, pour que le service
+des rapports ou une analyse puissent la lire pendant une écriture.
+
+Usage : python catalogue.py [--dossier sessions] [--importer] [--angle 50] [--essai 10] [--minimum 20]
+                            [--maximum X] [--metrique erreur_angulaire_deg] [--phase adaptation]
+"""
+import argparse
+import json
+import os
+import sqlite3
+import time
+import config
+from session import METRIQUES_SAUVEGARDEES, phase_essai
+
+# Colonnes de la table des sessions tirées des paramètres de config (le reste est gardé en JSON)
+COLONNES_PARAMETRES = {
+    'angle_deviation': 'ANGLE_DEVIATION',
+    'distance_deviation': 'DISTANCE_DEVIATION',
+    'mode_entree': 'MODE_ENTREE',
+    'debut_deviation': 'CIBLE_DEBUT_DEVIATION',
+    'fin_deviation': 'CIBLE_FIN_DEVIATION',
+}
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    fichier TEXT NOT NULL UNIQUE,
+    modification REAL,
+    nom TEXT,
+    date TEXT,
+    angle_deviation REAL,
+    distance_deviation REAL,
+    mode_entree TEXT,
+    debut_deviation INTEGER,
+    fin_deviation INTEGER,
+    nombre_essais INTEGER,
+    largeur INTEGER,
+    hauteur INTEGER,
+    centre_x INTEGER,
+    centre_y INTEGER,
+    rayon REAL,
+    parametres TEXT,
+    rapport TEXT
+);
+CREATE TABLE IF NOT EXISTS essais (
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    numero INTEGER NOT NULL,
+    phase TEXT,
+    cible_x REAL,
+    cible_y REAL,
+    traverse INTEGER,
+    {', '.join(f'{nom} REAL' for nom in METRIQUES_SAUVEGARDEES)},
+    PRIMARY KEY (session_id, numero)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS index_sessions_angle ON sessions (angle_deviation, date);
+CREATE INDEX IF NOT EXISTS index_sessions_date ON sessions (date);
+CREATE INDEX IF NOT EXISTS index_essais_numero ON essais (numero, erreur_angulaire_deg);
+CREATE INDEX IF NOT EXISTS index_essais_phase ON essais (phase, erreur_angulaire_deg);
+"""
+
+_INSERTION_SESSION = (f"INSERT INTO sessions (fichier, modification, nom, date, {', '.join(COLONNES_PARAMETRES)}, "
+                      f"nombre_essais, largeur, hauteur, centre_x, centre_y, rayon, parametres) "
+                      f"VALUES ({', '.join('?' * (11 + len(COLONNES_PARAMETRES)))})")
+_INSERTION_ESSAI = (f"INSERT INTO essais (session_id, numero, phase, cible_x, cible_y, traverse, "
+                    f"{', '.join(METRIQUES_SAUVEGARDEES)}) VALUES ({', '.join('?' * (6 + len(METRIQUES_SAUVEGARDEES)))})")
+
+
+def ouvrir_catalogue(dossier=None):
+    """
+    Ouvre (et crée au besoin) le catalogue d'un dossier de sessions
+
+    Args:
+        dossier: Dossier des sessions (par défaut config.DOSSIER_SESSIONS)
+
+    Returns:
+        Connexion sqlite3 (lignes accessibles par nom de colonne)
+    """
+    dossier = dossier or config.DOSSIER_SESSIONS
+    if not os.path.exists(dossier):
+        os.makedirs(dossier)
+    connexion = sqlite3.connect(os.path.join(dossier, config.FICHIER_CATALOGUE), timeout=10)
+    connexion.row_factory = sqlite3.Row
+    # WAL : les lecteurs ne bloquent pas l'écrivain ; NORMAL suffit en WAL (pas de corruption possible)
+    connexion.execute("PRAGMA journal_mode=WAL")
+    connexion.execute("PRAGMA synchronous=NORMAL")
+    connexion.executescript(SCHEMA)
+    return connexion
+
+
+def _dossier_catalogue(connexion):
+    """Dossier du fichier de la base (les chemins des sessions y sont relatifs)."""
+    for ligne in connexion.execute("PRAGMA database_list"):
+        if ligne['name'] == 'main':
+            return os.path.dirname(ligne['file'])
+    return ""
+
+
+def _fichier_relatif(connexion, chemin_fichier):
+    """Chemin d'un fichier de session tel qu'enregistré dans le catalogue."""
+    return os.path.relpath(os.path.abspath(chemin_fichier), _dossier_catalogue(connexion))
+
+
+def _lignes_essais(session_id, session):
+    """Lignes de la table des essais pour une session au format de construire_session."""
+    parametres = session['parametres']
+    lignes = []
+    for numero, essai in enumerate(session['essais'], start=1):
+        metriques = essai.get('metriques', {})
+        lignes.append((session_id, numero, phase_essai(numero, parametres), essai['cible'][0], essai['cible'][1],
+                       int(essai['point_traversee'] is not None))
+                      + tuple(map(metriques.get, METRIQUES_SAUVEGARDEES)))
+    return lignes
+
+
+def inserer_sessions(connexion, sessions):
+    """
+    Insère des sessions dans le catalogue, en une seule transaction
+
+    Une session déjà cataloguée sous le même fichier est remplacée.
+
+    Args:
+        connexion: Connexion au catalogue (voir ouvrir_catalogue)
+        sessions: Itérable de couples (session au format de construire_session, chemin du fichier JSON)
+
+    Returns:
+        Nombre de sessions insérées
+    """
+    nombre = 0
+    with connexion:
+        for session, chemin_fichier in sessions:
+            fichier = _fichier_relatif(connexion, chemin_fichier)
+            modification = os.path.getmtime(chemin_fichier) if os.path.exists(chemin_fichier) else None
+            connexion.execute("DELETE FROM essais WHERE session_id IN (SELECT id FROM sessions WHERE fichier = ?)",
+                              (fichier,))
+            connexion.execute("DELETE FROM sessions WHERE fichier = ?", (fichier,))
+            parametres = session['parametres']
+            ecran = session['ecran']
+            curseur = connexion.execute(_INSERTION_SESSION, (
+                fichier, modification, session.get('nom'), session.get('date'),
+                *(parametres.get(cle) for cle in COLONNES_PARAMETRES.values()),
+                len(session['essais']), ecran['largeur'], ecran['hauteur'], ecran['centre'][0], ecran['centre'][1],
+                ecran['rayon'], json.dumps(parametres)))
+            connexion.executemany(_INSERTION_ESSAI, _lignes_essais(curseur.lastrowid, session))
+            nombre += 1
+    return nombre
+
+
+def cataloguer_session(session, chemin_fichier):
+    """
+    Ajoute une session qui vient d'être sauvegardée au catalogue de son dossier
+
+    Args:
+        session: Dictionnaire de la session (voir session.construire_session)
+        chemin_fichier: Fichier JSON de la session (contient les trajectoires)
+
+    Returns:
+        True si la session a été cataloguée
+    """
+    try:
+        connexion = ouvrir_catalogue(os.path.dirname(os.path.abspath(chemin_fichier)))
+        try:
+            inserer_sessions(connexion, [(session, chemin_fichier)])
+        finally:
+            connexion.close()
+        return True
+    except (sqlite3.Error, OSError) as e:
+        print(f"Erreur lors de l'ajout de la session au catalogue : {e}")
+        return False
+
+
+def associer_rapport(chemin_session, chemin_rapport):
+    """
+    Enregistre dans le catalogue le rapport produit pour une session
+
+    Une session absente du catalogue (fichier copié dans le dossier des sessions
+    par exemple) est d'abord cataloguée avec les autres fichiers nouveaux du dossier.
+
+    Args:
+        chemin_session: Fichier JSON de la session
+        chemin_rapport: Fichier (ou dossier) du rapport
+
+    Returns:
+        True si une session cataloguée a été mise à jour
+    """
+    try:
+        connexion = ouvrir_catalogue(os.path.dirname(os.path.abspath(chemin_session)))
+        try:
+            mise_a_jour = ("UPDATE sessions SET rapport = ? WHERE fichier = ?",
+                           (os.path.abspath(chemin_rapport), _fichier_relatif(connexion, chemin_session)))
+            with connexion:
+                curseur = connexion.execute(*mise_a_jour)
+            if curseur.rowcount == 0 and os.path.exists(chemin_session):
+                importer_dossier(os.path.dirname(os.path.abspath(chemin_session)), connexion)
+                with connexion:
+                    curseur = connexion.execute(*mise_a_jour)
+        finally:
+            connexion.close()
+        return curseur.rowcount > 0
+    except (sqlite3.Error, OSError) as e:
+        print(f"Erreur lors de la mise à jour du catalogue : {e}")
+        return False
+
+
+def importer_dossier(dossier=None, connexion=None):
+    """
+    Catalogue les fichiers de session d'un dossier qui n'y sont pas encore (ou ont été modifiés)
+
+    Les fichiers JSON qui ne sont pas des sessions (registre du service des
+    rapports, résumés mémoire) sont ignorés.
+
+    Args:
+        dossier: Dossier des sessions (par défaut config.DOSSIER_SESSIONS)
+        connexion: Connexion au catalogue du dossier (ouverte puis fermée si None)
+
+    Returns:
+        Nombre de sessions ajoutées ou mises à jour
+    """
+    dossier = dossier or config.DOSSIER_SESSIONS
+    fermer = connexion is None
+    if connexion is None:
+        connexion = ouvrir_catalogue(dossier)
+    try:
+        connues = {ligne['fichier']: ligne['modification']
+                   for ligne in connexion.execute("SELECT fichier, modification FROM sessions")}
+
+        def sessions_a_importer():
+            for entree in sorted(os.scandir(dossier), key=lambda e: e.name):
+                if not entree.is_file() or not entree.name.endswith(".json") or entree.name.startswith("."):
+                    continue
+                if connues.get(_fichier_relatif(connexion, entree.path)) == entree.stat().st_mtime:
+                    continue
+                try:
+                    with open(entree.path, 'r', encoding='utf-8') as f:
+                        session = json.load(f)
+                    session['parametres'], session['ecran'], session['essais']
+                except (OSError, ValueError, KeyError, TypeError):
+                    continue
+                yield session, entree.path
+
+        return inserer_sessions(connexion, sessions_a_importer())
+    finally:
+        if fermer:
+            connexion.close()
+
+
+def _verifier_metrique(metrique):
+    """Les noms de colonnes ne pouvant pas être paramétrés, seules les métriques connues sont acceptées."""
+    if metrique not in METRIQUES_SAUVEGARDEES:
+        raise ValueError(f"Métrique inconnue : {metrique} (attendu : {', '.join(METRIQUES_SAUVEGARDEES)})")
+
+
+def _conditions(angle_deviation=None, mode_entree=None, depuis=None, numero=None, phase=None,
+                metrique='erreur_angulaire_deg', minimum=None, maximum=None):
+    """Clause WHERE et paramètres communs aux requêtes (tables sessions s et essais e)."""
+    _verifier_metrique(metrique)
+    conditions, parametres = [], []
+    for condition, valeur in (("s.angle_deviation = ?", angle_deviation), ("s.mode_entree = ?", mode_entree),
+                              ("s.date >= ?", depuis), ("e.numero = ?", numero), ("e.phase = ?", phase),
+                              (f"e.{metrique} > ?", minimum), (f"e.{metrique} < ?", maximum)):
+        if valeur is not None:
+            conditions.append(condition)
+            parametres.append(valeur)
+    return (" WHERE " + " AND ".join(conditions)) if conditions else "", parametres
+
+
+def rechercher_sessions(connexion, angle_deviation=None, mode_entree=None, depuis=None, numero=None, phase=None,
+                        metrique='erreur_angulaire_deg', minimum=None, maximum=None):
+    """
+    Sessions dont au moins un essai vérifie les conditions données
+
+    Par exemple, les sessions déviées de 50° où l'erreur de l'essai 10 dépasse 20° :
+    rechercher_sessions(connexion, angle_deviation=50, numero=10, minimum=20)
+
+    Args:
+        connexion: Connexion au catalogue (voir ouvrir_catalogue)
+        angle_deviation: Angle de déviation de la session (°)
+        mode_entree: Mode d'entrée de la session
+        depuis: Date minimale de la session (ISO 8601, ex. "2025-03-01")
+        numero: Numéro de l'essai (à partir de 1)
+        phase: Phase de l'essai ("reference", "adaptation" ou "post_adaptation")
+        metrique: Métrique filtrée par minimum et maximum (voir session.METRIQUES_SAUVEGARDEES)
+        minimum, maximum: Bornes strictes de la métrique
+
+    Returns:
+        Liste de dictionnaires (colonnes de la table des sessions, 'chemin' absolu du fichier
+        des trajectoires), triée par date
+    """
+    clause, parametres = _conditions(angle_deviation, mode_entree, depuis, numero, phase, metrique, minimum, maximum)
+    requete = (f"SELECT * FROM sessions WHERE id IN (SELECT s.id FROM sessions s JOIN essais e "
+               f"ON e.session_id = s.id{clause}) ORDER BY date, fichier")
+    dossier = _dossier_catalogue(connexion)
+    sessions = []
+    for ligne in connexion.execute(requete, parametres):
+        session = dict(ligne)
+        session['chemin'] = os.path.join(dossier, session['fichier'])
+        sessions.append(session)
+    return sessions
+
+
+def rechercher_essais(connexion, angle_deviation=None, mode_entree=None, depuis=None, numero=None, phase=None,
+                      metrique='erreur_angulaire_deg', minimum=None, maximum=None):
+    """
+    Essais de toutes les sessions vérifiant les conditions données (voir rechercher_sessions)
+
+    Returns:
+        Liste de tuples (fichier de la session, numéro, phase, valeur de la métrique),
+        triée par fichier puis par numéro
+    """
+    clause, parametres = _conditions(angle_deviation, mode_entree, depuis, numero, phase, metrique, minimum, maximum)
+    requete = (f"SELECT s.fichier, e.numero, e.phase, e.{metrique} FROM sessions s JOIN essais e "
+               f"ON e.session_id = s.id{clause} ORDER BY s.fichier, e.numero")
+    return [tuple(ligne) for ligne in connexion.execute(requete, parametres)]
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Catalogue des sessions et des métriques par essai")
+    parseur.add_argument('--dossier', default=None, help="Dossier des sessions (contient le catalogue)")
+    parseur.add_argument('--importer', action='store_true',
+                         help="Cataloguer d'abord les fichiers de session nouveaux ou modifiés du dossier")
+    parseur.add_argument('--angle', type=float, default=None, help="Angle de déviation de la session (°)")
+    parseur.add_argument('--mode', default=None, help="Mode d'entrée de la session")
+    parseur.add_argument('--depuis', default=None, help="Date minimale (AAAA-MM-JJ)")
+    parseur.add_argument('--essai', type=int, default=None, help="Numéro de l'essai")
+    parseur.add_argument('--phase', choices=('reference', 'adaptation', 'post_adaptation'), default=None,
+                         help="Phase de l'essai")
+    parseur.add_argument('--metrique', choices=METRIQUES_SAUVEGARDEES, default='erreur_angulaire_deg',
+                         help="Métrique filtrée")
+    parseur.add_argument('--minimum', type=float, default=None, help="Valeur minimale (stricte) de la métrique")
+    parseur.add_argument('--maximum', type=float, default=None, help="Valeur maximale (stricte) de la métrique")
+    arguments = parseur.parse_args()
+
+    connexion = ouvrir_catalogue(arguments.dossier)
+    if arguments.importer:
+        debut = time.perf_counter()
+        nombre = importer_dossier(arguments.dossier, connexion)
+        print(f"{nombre} session(s) cataloguée(s) en {time.perf_counter() - debut:.2f} s")
+    debut = time.perf_counter()
+    sessions = rechercher_sessions(connexion, arguments.angle, arguments.mode, arguments.depuis, arguments.essai,
+                                   arguments.phase, arguments.metrique, arguments.minimum, arguments.maximum)
+    duree_ms = (time.perf_counter() - debut) * 1000
+    for session in sessions:
+        print(f"{session['date']}  {session['angle_deviation']:g}°  {session['nombre_essais']} essais  "
+              f"{session['chemin']}" + (f"  ({session['rapport']})" if session['rapport'] else ""))
+    print(f"{len(sessions)} session(s) en {duree_ms:.1f} ms")
+    connexion.close()
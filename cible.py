@@ -11,6 +11,21 @@ import config
 ANGLES_POSITIONS_FIXES = [i * (2 * math.pi / 8) for i in range(8)]
 
 
+def index_position_fixe(x, y):
+    """
+    Retourne l'indice (0..7) de la position fixe la plus proche d'un point
+    
+    Args:
+        x: Position x (coordonnées écran)
+        y: Position y (coordonnées écran)
+        
+    Returns:
+        Indice dans ANGLES_POSITIONS_FIXES
+    """
+    angle = math.atan2(y - config.CERCLE_CENTRE_Y, x - config.CERCLE_CENTRE_X)
+    return int(round(angle / (2 * math.pi / 8))) % 8
+
+
 class Cible:
     """Classe représentant une cible dans le jeu"""
     
@@ -29,57 +44,61 @@ class Cible:
         # File des indices (0..7) pour le bloc de 8 en cours ; vidée au redémarrage
         self._indices_restants = []
     
-    def dessiner(self, surface):
+    def dessiner(self, surface, centre=None):
         """
         Dessine la cible sur la surface
         
         Args:
             surface: Surface pygame sur laquelle dessiner
+            centre: Centre du dessin sur la surface (par défaut, la position de la cible)
         """
+        centre = centre or (self.x, self.y)
         # Cercle extérieur (rouge)
-        pygame.draw.circle(surface, config.ROUGE, (self.x, self.y), self.rayon)
-        pygame.draw.circle(surface, config.ROUGE_FONCE, (self.x, self.y), self.rayon, 2)
+        pygame.draw.circle(surface, config.ROUGE, centre, self.rayon)
+        pygame.draw.circle(surface, config.ROUGE_FONCE, centre, self.rayon, 2)
         
         # Cercle moyen (blanc)
         rayon_moyen = int(self.rayon * 0.7)
-        pygame.draw.circle(surface, config.BLANC, (self.x, self.y), rayon_moyen)
-        pygame.draw.circle(surface, config.ROUGE_FONCE, (self.x, self.y), rayon_moyen, 2)
+        pygame.draw.circle(surface, config.BLANC, centre, rayon_moyen)
+        pygame.draw.circle(surface, config.ROUGE_FONCE, centre, rayon_moyen, 2)
         
         # Cercle intérieur (rouge)
         rayon_interieur = int(self.rayon * 0.4)
-        pygame.draw.circle(surface, config.ROUGE, (self.x, self.y), rayon_interieur)
-        pygame.draw.circle(surface, config.ROUGE_FONCE, (self.x, self.y), rayon_interieur, 2)
+        pygame.draw.circle(surface, config.ROUGE, centre, rayon_interieur)
+        pygame.draw.circle(surface, config.ROUGE_FONCE, centre, rayon_interieur, 2)
         
         # Centre (noir)
         rayon_centre = max(3, int(self.rayon * 0.15))
-        pygame.draw.circle(surface, config.NOIR, (self.x, self.y), rayon_centre)
+        pygame.draw.circle(surface, config.NOIR, centre, rayon_centre)
     
-    def dessiner_fantome(self, surface):
+    def dessiner_fantome(self, surface, centre=None):
         """
         Dessine la cible en mode fantôme (gris clair) pour l'affichage du résultat
         
         Args:
             surface: Surface pygame sur laquelle dessiner
+            centre: Centre du dessin sur la surface (par défaut, la position de la cible)
         """
+        centre = centre or (self.x, self.y)
         GRIS_FANTOME = (150, 150, 150)  # Couleur grise pour le fantôme
         
         # Cercle extérieur (gris)
-        pygame.draw.circle(surface, GRIS_FANTOME, (self.x, self.y), self.rayon)
-        pygame.draw.circle(surface, config.NOIR, (self.x, self.y), self.rayon, 2)
+        pygame.draw.circle(surface, GRIS_FANTOME, centre, self.rayon)
+        pygame.draw.circle(surface, config.NOIR, centre, self.rayon, 2)
         
         # Cercle moyen (gris clair)
         rayon_moyen = int(self.rayon * 0.7)
-        pygame.draw.circle(surface, (200, 200, 200), (self.x, self.y), rayon_moyen)
-        pygame.draw.circle(surface, config.NOIR, (self.x, self.y), rayon_moyen, 2)
+        pygame.draw.circle(surface, (200, 200, 200), centre, rayon_moyen)
+        pygame.draw.circle(surface, config.NOIR, centre, rayon_moyen, 2)
         
         # Cercle intérieur (gris)
         rayon_interieur = int(self.rayon * 0.4)
-        pygame.draw.circle(surface, GRIS_FANTOME, (self.x, self.y), rayon_interieur)
-        pygame.draw.circle(surface, config.NOIR, (self.x, self.y), rayon_interieur, 2)
+        pygame.draw.circle(surface, GRIS_FANTOME, centre, rayon_interieur)
+        pygame.draw.circle(surface, config.NOIR, centre, rayon_interieur, 2)
         
         # Centre (noir)
         rayon_centre = max(3, int(self.rayon * 0.15))
-        pygame.draw.circle(surface, config.NOIR, (self.x, self.y), rayon_centre)
+        pygame.draw.circle(surface, config.NOIR, centre, rayon_centre)
     
     def est_clique(self, clic_x, clic_y):
         """
@@ -8,6 +8,29 @@ def obtenir_dimensions_ecran():
     info_ecran = pygame.display.Info()
     return info_ecran.current_w, info_ecran.current_h
 
+def definir_geometrie(largeur, hauteur):
+    """
+    Met à jour les dimensions et les positions qui en dépendent (cercle, cible, curseur)
+    
+    Args:
+        largeur: Largeur de l'écran en pixels
+        hauteur: Hauteur de l'écran en pixels
+    """
+    global LARGEUR, HAUTEUR, CERCLE_CENTRE_X, CERCLE_CENTRE_Y, CERCLE_RAYON
+    global POSITION_X_INITIALE, POSITION_Y_INITIALE, CURSEUR_X_APRES_CLIC, CURSEUR_Y_APRES_CLIC
+    LARGEUR, HAUTEUR = largeur, hauteur
+    
+    # Définir le cercle imaginaire (centré et proportionnel à l'écran)
+    CERCLE_CENTRE_X = LARGEUR // 2
+    CERCLE_CENTRE_Y = HAUTEUR // 2
+    CERCLE_RAYON = int(min(LARGEUR, HAUTEUR) * 0.35)
+    
+    # Mettre à jour les positions liées au cercle
+    POSITION_X_INITIALE = CERCLE_CENTRE_X + CERCLE_RAYON
+    POSITION_Y_INITIALE = CERCLE_CENTRE_Y
+    CURSEUR_X_APRES_CLIC = CERCLE_CENTRE_X
+    CURSEUR_Y_APRES_CLIC = CERCLE_CENTRE_Y
+
 # Dimensions de la fenêtre (seront définies après l'initialisation de pygame)
 LARGEUR = 1920  # Valeur par défaut, sera mise à jour
 HAUTEUR = 1080  # Valeur par défaut, sera mise à jour
@@ -28,7 +51,7 @@ VERT = (0, 255, 0)  # Couleur pour le point de traversée
 # Paramètres de la cible
 RAYON_CIBLE = 20
 # POSITION_Y_INITIALE, POSITION_X_INITIALE, CURSEUR_X_APRES_CLIC, CURSEUR_Y_APRES_CLIC
-# seront calculées dans main.py après avoir obtenu les dimensions de l'écran
+# seront calculées par definir_geometrie après avoir obtenu les dimensions de l'écran
 POSITION_Y_INITIALE = None  # Sera calculée
 POSITION_X_INITIALE = None  # Sera calculée
 CURSEUR_X_APRES_CLIC = None  # Sera calculée
@@ -42,6 +65,97 @@ NOMBRE_CIBLES_MAX = 24
 
 # Paramètres de déviation du curseur
 CIBLE_DEBUT_DEVIATION = 5
+CIBLE_FIN_DEVIATION = 0  # Première cible sans déviation après l'adaptation (0 = jamais)
 ANGLE_DEVIATION = 50
 DISTANCE_DEVIATION = 20  # Distance en pixels pour la déviation
 
+
+# Paramètres de l'analyse cinématique
+PAS_REECHANTILLONNAGE_MS = 5  # Pas de la grille temporelle uniforme (ms)
+FENETRE_LISSAGE = 11  # Nombre de points (impair) de la fenêtre de Savitzky-Golay
+ORDRE_LISSAGE = 3  # Ordre du polynôme de Savitzky-Golay
+SEUIL_DEBUT_MOUVEMENT = 5  # Seuil de début/fin de mouvement (% du pic de vitesse)
+
+# Trajectoires moyennes par direction et par phase (chaque essai rééchantillonné sur un nombre fixe de points)
+NOMBRE_POINTS_NORMALISES = 101  # Points de chaque trajectoire normalisée
+BASE_NORMALISATION = "temps"  # "temps" (fraction de la durée de l'essai) ou "longueur" (fraction du chemin parcouru)
+
+# Ajustement des modèles d'adaptation (un et deux taux) aux erreurs signées
+AJUSTEMENT_DEPARTS = 16  # Points de départ de l'optimisation par session et par modèle
+AJUSTEMENT_ITERATIONS_MAX = 1500  # Itérations maximales de Nelder-Mead
+
+# Budget de calcul des métriques d'un essai pendant l'affichage du résultat (ms)
+BUDGET_CALCUL_METRIQUES_MS = 5
+
+# Dossier des fichiers de session (données brutes et métriques au format JSON)
+DOSSIER_SESSIONS = "sessions"
+FICHIER_CATALOGUE = "catalogue.sqlite"  # Catalogue SQLite des sessions et des métriques par essai, dans ce dossier
+
+# Format du rapport ("pdf", "png", "svg" ou "html") et résolution des images (points par pouce)
+FORMAT_RAPPORT = "pdf"
+DPI_IMAGES_RAPPORT = 100
+
+# Pages du rapport : "essais" (une page par essai) ou "directions" (une page par direction de cible)
+MODE_PAGES_RAPPORT = "essais"
+COULEUR_SUPERPOSITION = "essai"  # Couleur des chemins superposés : "essai" ou "phase"
+CACHE_PAGES = 1  # 1 pour reprendre du cache les pages inchangées (formats images, ou PDF avec pypdf)
+DOSSIER_CACHE_PAGES = "cache_pages"  # Dossier du cache des pages rendues
+TAILLE_CACHE_PAGES_MO = 200  # Taille maximale du cache ; les pages les moins récemment utilisées sont supprimées
+RENDU_ANTICIPE = 0  # 1 pour rendre les pages dans le cache en arrière-plan pendant la session (nécessite le cache)
+
+# Cadencement de l'affichage
+FREQUENCE_AFFICHAGE = 0  # Images par seconde visées (0 = fréquence de l'écran si détectable, sinon 60)
+VSYNC = 0  # 1 pour demander la synchronisation verticale à SDL
+RENDU = "logiciel"  # "logiciel" (pygame.draw + flip) ou "textures" (renderer SDL2, repli sur le logiciel)
+MARGE_ATTENTE_ACTIVE_MS = 0.2  # Fin de l'attente en boucle active pour tomber précisément sur l'échéance
+JOURNAL_CADENCE = 0  # 1 pour écrire l'erreur de cadencement de chaque image en fin de session
+
+# Simulation à pas fixe (échantillonnage de la souris, traversée, chronométrage)
+FREQUENCE_SIMULATION = 500  # Pas de simulation par seconde
+PAS_SIMULATION_MAX_RATTRAPAGE = 50  # Au-delà de ce retard (en pas), le retard est abandonné
+MODE_ENTREE = "absolu"  # "absolu" (position du curseur système) ou "relatif" (souris capturée, déplacements bruts)
+
+# Traçage des performances (touche F9 pour démarrer/arrêter pendant une session)
+TRACES_AU_DEMARRAGE = 0  # 1 pour enregistrer dès le lancement
+TRACES_MAX_EVENEMENTS = 1000000  # Les événements les plus anciens sont oubliés au-delà
+DOSSIER_TRACES = "traces"
+
+# Télémétrie mémoire (tracemalloc et RSS aux frontières d'essai et autour des pages du rapport)
+TELEMETRIE_MEMOIRE = 0  # 1 pour l'activer (ralentit les allocations Python)
+BUDGET_MEMOIRE_MO = 500  # Avertissement quand la mémoire résidente dépasse ce budget
+MEMOIRE_SITES_AFFICHES = 10  # Nombre de sites d'allocation listés dans le résumé
+
+# Ramasse-miettes (gc) : objets du démarrage figés, collectes déplacées hors de l'enregistrement des essais
+GC_FIGER_DEMARRAGE = 1  # 1 pour geler (gc.freeze) les objets créés au démarrage
+GC_POLITIQUE_ESSAI = "suspendu"  # Pendant un essai : "suspendu" (gc.disable), "seuils" (GC_SEUILS_ESSAI) ou "python"
+GC_SEUILS_ESSAI = (50000, 50, 100)  # Seuils des générations 0, 1 et 2 pendant un essai en politique "seuils"
+
+# Fenêtre de suivi de l'expérimentateur (processus séparé, alimenté par mémoire partagée)
+MONITEUR = 0  # 1 pour ouvrir la fenêtre de suivi pendant le jeu
+MONITEUR_ECRAN = 1  # Écran de la fenêtre de suivi (le premier si cet écran n'existe pas)
+MONITEUR_LARGEUR = 960
+MONITEUR_HAUTEUR = 540
+MONITEUR_IMAGES_PAR_SECONDE = 30
+MONITEUR_CAPACITE_POINTS = 65536  # Points du tampon circulaire (au-delà, les plus anciens non lus sont perdus)
+MONITEUR_CAPACITE_ESSAIS = 1024
+
+# Diffusion des métriques en direct (server-sent events : GET /flux, GET /etat)
+DIFFUSION = 0  # 1 pour démarrer le serveur pendant le jeu
+DIFFUSION_ADRESSE = "127.0.0.1"  # "0.0.0.0" pour suivre la session depuis une autre machine du réseau
+DIFFUSION_PORT = 8765
+DIFFUSION_IMAGES_PAR_SECONDE = 2  # Fréquence de publication des statistiques de cadencement
+DIFFUSION_TAILLE_FILE = 64  # Messages d'essai gardés pour un client en retard (les plus anciens sont oubliés)
+
+# Service de génération automatique des rapports (python service_rapports.py)
+SERVICE_RAPPORTS_PROCESSUS = 2  # Rapports générés en même temps
+SERVICE_RAPPORTS_INTERVALLE_S = 2  # Période de scrutation du dossier des sessions
+SERVICE_RAPPORTS_STABILITE_S = 2  # Délai sans modification avant de traiter un fichier (copie en cours)
+FICHIER_RAPPORTS_TRAITES = ".rapports_traites.json"  # Registre des sessions traitées, dans le dossier des sessions
+
+# Simulateur de participants synthétiques (python simulateur.py)
+SIMULATION_RETENTION = 0.98  # Part de l'adaptation conservée d'un essai au suivant (A du modèle d'état)
+SIMULATION_TAUX_APPRENTISSAGE = 0.15  # Part de l'erreur vue corrigée à l'essai suivant (B du modèle d'état)
+SIMULATION_BRUIT_MOTEUR_DEG = 4  # Écart-type de la direction visée autour de l'intention
+SIMULATION_BRUIT_ETAT_DEG = 0.5  # Écart-type du bruit de l'état d'adaptation d'un essai au suivant
+SIMULATION_VARIABILITE_PARTICIPANTS = 0.3  # Dispersion (log-normale) de A et B entre participants
+SIMULATION_PARTICIPANTS_PAR_PAQUET = 1000  # Participants simulés ensemble (environ 100 Mo par paquet)
@@ -3,7 +3,12 @@ Module pour afficher un dialogue demandant le nom du fichier PDF
 """
 import pygame
 import config
-import string
+from widgets import Bouton, ChampTexte, Couche, Etiquette, Panneau
+
+
+def _caractere_nom_fichier(caractere):
+    """Caractères acceptés dans un nom de fichier"""
+    return caractere.isalnum() or caractere in "._- "
 
 
 class DialogueNomFichier:
@@ -17,119 +22,59 @@ class DialogueNomFichier:
             ecran: Surface pygame de la fenêtre
         """
         self.ecran = ecran
-        self.texte_saisi = ""
         self.actif = True
         
+        # Fenêtre modale sur un fond assombri (disposée d'après la taille de l'écran)
+        self.couche = Couche(self.disposer, fond=config.NOIR, opacite_fond=180)
+        self.panneau = self.couche.ajouter(Panneau())
+        self.titre = self.couche.ajouter(Etiquette("Nom du fichier PDF", 0.05))
+        self.champ = self.couche.ajouter(ChampTexte(
+            "", 0.04, caracteres_acceptes=_caractere_nom_fichier,
+            indication="Entrez un nom...", couleur_bordure_active=config.NOIR
+        ))
+        self.champ.definir_actif(True)  # Seul champ du dialogue : toujours en saisie
+        self.bouton_ok = self.couche.ajouter(Bouton("ok", "OK", config.VERT, 0.04, 2))
+        self.bouton_annuler = self.couche.ajouter(Bouton("annuler", "Annuler", config.ROUGE, 0.04, 2))
+    
+    @property
+    def texte_saisi(self):
+        """Texte saisi dans le champ"""
+        return self.champ.valeur
+    
+    def disposer(self):
+        """Place la fenêtre, le champ de saisie et les boutons (proportionnellement à l'écran)"""
         # Dimensions de la fenêtre de dialogue
-        self.largeur_dialogue = int(config.LARGEUR * 0.4)
-        self.hauteur_dialogue = int(config.HAUTEUR * 0.2)
-        self.x_dialogue = (config.LARGEUR - self.largeur_dialogue) // 2
-        self.y_dialogue = (config.HAUTEUR - self.hauteur_dialogue) // 2
+        largeur_dialogue = int(config.LARGEUR * 0.4)
+        hauteur_dialogue = int(config.HAUTEUR * 0.2)
+        x_dialogue = (config.LARGEUR - largeur_dialogue) // 2
+        y_dialogue = (config.HAUTEUR - hauteur_dialogue) // 2
+        self.panneau.placer((x_dialogue, y_dialogue, largeur_dialogue, hauteur_dialogue))
+        self.titre.placer((config.LARGEUR // 2, y_dialogue + int(hauteur_dialogue * 0.15)))
         
         # Zone de saisie
-        self.hauteur_champ = int(self.hauteur_dialogue * 0.3)
-        self.x_champ = self.x_dialogue + int(self.largeur_dialogue * 0.1)
-        self.y_champ = self.y_dialogue + int(self.hauteur_dialogue * 0.4)
-        self.largeur_champ = int(self.largeur_dialogue * 0.8)
-        
-        # Boutons
-        self.hauteur_bouton = int(self.hauteur_dialogue * 0.25)
-        self.largeur_bouton = int(self.largeur_dialogue * 0.3)
-        self.y_bouton = self.y_dialogue + int(self.hauteur_dialogue * 0.65)
-        
-        # Bouton OK
-        self.x_bouton_ok = self.x_dialogue + int(self.largeur_dialogue * 0.15)
-        self.bouton_ok_rect = pygame.Rect(
-            self.x_bouton_ok,
-            self.y_bouton,
-            self.largeur_bouton,
-            self.hauteur_bouton
-        )
-        
-        # Bouton Annuler
-        self.x_bouton_annuler = self.x_dialogue + int(self.largeur_dialogue * 0.55)
-        self.bouton_annuler_rect = pygame.Rect(
-            self.x_bouton_annuler,
-            self.y_bouton,
-            self.largeur_bouton,
-            self.hauteur_bouton
-        )
-        
-        # Police
-        taille_titre = int(config.HAUTEUR * 0.05)
-        taille_texte = int(config.HAUTEUR * 0.04)
-        self.font_titre = pygame.font.Font(None, taille_titre)
-        self.font_texte = pygame.font.Font(None, taille_texte)
+        self.champ.placer((
+            x_dialogue + int(largeur_dialogue * 0.1),
+            y_dialogue + int(hauteur_dialogue * 0.4),
+            int(largeur_dialogue * 0.8),
+            int(hauteur_dialogue * 0.3)
+        ))
+        
+        # Boutons OK et Annuler
+        hauteur_bouton = int(hauteur_dialogue * 0.25)
+        largeur_bouton = int(largeur_dialogue * 0.3)
+        y_bouton = y_dialogue + int(hauteur_dialogue * 0.65)
+        self.bouton_ok.placer((x_dialogue + int(largeur_dialogue * 0.15), y_bouton, largeur_bouton, hauteur_bouton))
+        self.bouton_annuler.placer((x_dialogue + int(largeur_dialogue * 0.55), y_bouton,
+                                    largeur_bouton, hauteur_bouton))
     
     def dessiner(self):
-        """Dessine le dialogue"""
-        # Overlay semi-transparent
-        overlay = pygame.Surface((config.LARGEUR, config.HAUTEUR))
-        overlay.set_alpha(180)
-        overlay.fill(config.NOIR)
-        self.ecran.blit(overlay, (0, 0))
-        
-        # Fond du dialogue
-        dialogue_rect = pygame.Rect(
-            self.x_dialogue,
-            self.y_dialogue,
-            self.largeur_dialogue,
-            self.hauteur_dialogue
-        )
-        pygame.draw.rect(self.ecran, config.BLANC, dialogue_rect)
-        pygame.draw.rect(self.ecran, config.NOIR, dialogue_rect, 3)
-        
-        # Titre
-        titre = self.font_titre.render("Nom du fichier PDF", True, config.NOIR)
-        titre_rect = titre.get_rect(center=(config.LARGEUR // 2, self.y_dialogue + int(self.hauteur_dialogue * 0.15)))
-        self.ecran.blit(titre, titre_rect)
-        
-        # Champ de saisie
-        champ_rect = pygame.Rect(
-            self.x_champ,
-            self.y_champ,
-            self.largeur_champ,
-            self.hauteur_champ
-        )
-        pygame.draw.rect(self.ecran, config.BLANC, champ_rect)
-        pygame.draw.rect(self.ecran, config.NOIR, champ_rect, 2)
-        
-        # Texte saisi
-        texte_affiche = self.texte_saisi if self.texte_saisi else "Entrez un nom..."
-        couleur_texte = config.NOIR if self.texte_saisi else (150, 150, 150)
-        texte_surface = self.font_texte.render(texte_affiche, True, couleur_texte)
-        # Limiter la largeur du texte affiché
-        if texte_surface.get_width() > self.largeur_champ - 10:
-            # Tronquer le texte avec "..."
-            while texte_surface.get_width() > self.largeur_champ - 30:
-                texte_affiche = texte_affiche[:-1]
-                texte_surface = self.font_texte.render(texte_affiche + "...", True, couleur_texte)
-        self.ecran.blit(texte_surface, (self.x_champ + 5, self.y_champ + (self.hauteur_champ - texte_surface.get_height()) // 2))
-        
-        # Curseur clignotant
-        if pygame.time.get_ticks() % 1000 < 500:
-            curseur_x = self.x_champ + 5 + texte_surface.get_width()
-            pygame.draw.line(
-                self.ecran,
-                config.NOIR,
-                (curseur_x, self.y_champ + 5),
-                (curseur_x, self.y_champ + self.hauteur_champ - 5),
-                2
-            )
-        
-        # Bouton OK
-        pygame.draw.rect(self.ecran, config.VERT, self.bouton_ok_rect)
-        pygame.draw.rect(self.ecran, config.NOIR, self.bouton_ok_rect, 2)
-        texte_ok = self.font_texte.render("OK", True, config.BLANC)
-        texte_ok_rect = texte_ok.get_rect(center=self.bouton_ok_rect.center)
-        self.ecran.blit(texte_ok, texte_ok_rect)
+        """
+        Dessine le dialogue
         
-        # Bouton Annuler
-        pygame.draw.rect(self.ecran, config.ROUGE, self.bouton_annuler_rect)
-        pygame.draw.rect(self.ecran, config.NOIR, self.bouton_annuler_rect, 2)
-        texte_annuler = self.font_texte.render("Annuler", True, config.BLANC)
-        texte_annuler_rect = texte_annuler.get_rect(center=self.bouton_annuler_rect.center)
-        self.ecran.blit(texte_annuler, texte_annuler_rect)
+        Returns:
+            État de l'image dessinée (voir Couche.dessiner)
+        """
+        return self.couche.dessiner(self.ecran)
     
     def gerer_evenement(self, event):
         """
@@ -147,20 +92,17 @@ class DialogueNomFichier:
                     return "ok"
             elif event.key == pygame.K_ESCAPE:
                 return "annuler"
-            elif event.key == pygame.K_BACKSPACE:
-                self.texte_saisi = self.texte_saisi[:-1]
             else:
-                # Ajouter le caractère si c'est un caractère valide pour un nom de fichier
-                caractere = event.unicode
-                if caractere and (caractere.isalnum() or caractere in "._- "):
-                    self.texte_saisi += caractere
+                # Retour arrière ou caractère valide pour un nom de fichier
+                self.champ.gerer_touche(event)
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Clic gauche
-                if self.bouton_ok_rect.collidepoint(event.pos):
+                action = self.couche.action_a(event.pos)
+                if action == "ok":
                     if self.texte_saisi:
                         return "ok"
-                elif self.bouton_annuler_rect.collidepoint(event.pos):
+                elif action == "annuler":
                     return "annuler"
         
         return None
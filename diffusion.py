@@ -0,0 +1,247 @@
+"""
+Module de diffusion des métriques en direct (server-sent events sur HTTP)
+
+Un serveur HTTP minimal tourne sur sa propre boucle asyncio, dans un thread
+séparé. Le jeu y publie les métriques de chaque essai terminé et, à cadence
+réduite, les statistiques de cadencement des images ; chaque client connecté
+les reçoit en flux SSE. Le jeu ne fait que déposer ses messages dans des files
+que la boucle asyncio relève périodiquement (sans réveil par socket, qui
+rendrait la main à l'autre thread). Toutes les files sont bornées et oublient
+les données les plus anciennes : un client lent ne ralentit jamais le jeu.
+
+Points d'accès :
+    GET /flux  flux d'événements "etat", "essai" et "images" (text/event-stream)
+    GET /etat  dernier état connu (JSON)
+
+Usage :
+    diffusion = ServeurDiffusion()
+    diffusion.demarrer()
+    diffusion.publier_essais(donnees_chemins)
+    diffusion.publier_images(statistiques)
+    diffusion.fermer()
+"""
+import asyncio
+import json
+import math
+import threading
+from collections import deque
+import config
+from session import phase_essai
+
+METRIQUES_DIFFUSEES = ('erreur_angulaire_deg', 'erreur_angulaire_signee_deg', 'duree_ms', 'temps_reaction_ms')
+DELAI_REQUETE_S = 5  # Temps laissé à un client pour envoyer sa requête
+PERIODE_RELAIS_S = 0.05  # Période de relève des messages publiés par le jeu
+
+_ENTETES_FLUX = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/event-stream\r\n"
+    b"Cache-Control: no-cache\r\n"
+    b"Connection: keep-alive\r\n"
+    b"Access-Control-Allow-Origin: *\r\n\r\n"
+)
+
+
+def _nombre(valeur):
+    """Valeur JSON d'une métrique (None pour une valeur absente ou NaN)."""
+    if valeur is None or (isinstance(valeur, float) and math.isnan(valeur)):
+        return None
+    return float(valeur)
+
+
+def _evenement(nom, donnees):
+    """Message SSE encodé."""
+    return f"event: {nom}\ndata: {json.dumps(donnees, ensure_ascii=False)}\n\n".encode('utf-8')
+
+
+def _reponse(statut, type_contenu, corps):
+    return (f"HTTP/1.1 {statut}\r\nContent-Type: {type_contenu}\r\nContent-Length: {len(corps)}\r\n"
+            f"Access-Control-Allow-Origin: *\r\nConnection: close\r\n\r\n").encode('latin-1') + corps
+
+
+class _Client:
+    """File d'un client connecté (manipulée uniquement depuis la boucle asyncio)"""
+
+    __slots__ = ('essais', 'images', 'signal')
+
+    def __init__(self, taille_file):
+        self.essais = deque(maxlen=taille_file)  # Les essais les plus anciens sont oubliés
+        self.images = None  # Seules les dernières statistiques d'images comptent
+        self.signal = asyncio.Event()
+
+
+class ServeurDiffusion:
+    """Serveur SSE des métriques en direct, sur sa propre boucle asyncio"""
+
+    def __init__(self, adresse=None, port=None, taille_file=None):
+        """
+        Args:
+            adresse: Adresse d'écoute (par défaut config.DIFFUSION_ADRESSE)
+            port: Port d'écoute (par défaut config.DIFFUSION_PORT ; 0 pour un port libre)
+            taille_file: Messages d'essai gardés par client en retard (par défaut config.DIFFUSION_TAILLE_FILE)
+        """
+        self.adresse = adresse or config.DIFFUSION_ADRESSE
+        self.port = config.DIFFUSION_PORT if port is None else port
+        self.taille_file = taille_file or config.DIFFUSION_TAILLE_FILE
+        self.actif = False
+        self._boucle = None
+        self._thread = None
+        self._serveur = None
+        self._pret = threading.Event()
+        self._clients = set()
+        self._etat = {'session': 0, 'essai': None, 'images': None}
+        self._essais_publies = 0
+        self._session = 0
+        # Messages déposés par le jeu, relevés par la boucle asyncio (deque : ajout et retrait atomiques)
+        self._en_attente = deque(maxlen=self.taille_file)
+        self._images_en_attente = deque(maxlen=1)
+
+    def demarrer(self, delai_s=5.0):
+        """
+        Démarre le serveur dans un thread (l'appel attend seulement l'ouverture du port)
+
+        Returns:
+            Adresse "http://hôte:port" du serveur, ou None si le port n'a pas pu être ouvert
+        """
+        self._thread = threading.Thread(target=self._executer, name="diffusion", daemon=True)
+        self._thread.start()
+        self._pret.wait(delai_s)
+        if not self.actif:
+            return None
+        return f"http://{self.adresse}:{self.port}"
+
+    def _executer(self):
+        self._boucle = asyncio.new_event_loop()
+        try:
+            self._serveur = self._boucle.run_until_complete(
+                asyncio.start_server(self._servir, self.adresse, self.port))
+        except OSError as e:
+            print(f"Diffusion impossible sur {self.adresse}:{self.port} : {e}")
+            self._pret.set()
+            self._boucle.close()
+            return
+        self.port = self._serveur.sockets[0].getsockname()[1]
+        self.actif = True
+        self._pret.set()
+        self._boucle.create_task(self._relayer())
+        try:
+            self._boucle.run_forever()
+        finally:
+            self._boucle.close()
+
+    def _publier(self, nom, donnees):
+        """Dépose un message pour la boucle asyncio (ne bloque pas et ne rend pas la main)."""
+        if not self.actif:
+            return
+        if nom == 'images':
+            self._images_en_attente.append(donnees)
+        else:
+            self._en_attente.append((nom, donnees))
+
+    async def _relayer(self):
+        """Relève périodiquement les messages déposés par le jeu et les distribue aux clients."""
+        while True:
+            await asyncio.sleep(PERIODE_RELAIS_S)
+            while self._en_attente:
+                self._distribuer(*self._en_attente.popleft())
+            if self._images_en_attente:
+                self._distribuer('images', self._images_en_attente.pop())
+
+    def _distribuer(self, nom, donnees):
+        if nom == 'session':
+            self._etat = {'session': donnees, 'essai': None, 'images': None}
+            message = _evenement('etat', self._etat)
+        else:
+            self._etat[nom] = donnees
+            message = _evenement(nom, donnees)
+        for client in self._clients:
+            if nom == 'images':
+                client.images = message
+            else:
+                client.essais.append(message)
+            client.signal.set()
+
+    def publier_essais(self, donnees_chemins):
+        """
+        Publie les métriques des essais terminés qui ne l'ont pas encore été (dans l'ordre)
+
+        Args:
+            donnees_chemins: Liste des essais de la session (voir Jeu.donnees_chemins)
+        """
+        n = self._essais_publies
+        while n < len(donnees_chemins) and 'metriques' in donnees_chemins[n]:
+            metriques = donnees_chemins[n]['metriques']
+            essai = {'essai': n + 1, 'phase': phase_essai(n + 1)}
+            essai.update({nom: _nombre(metriques.get(nom)) for nom in METRIQUES_DIFFUSEES})
+            self._publier('essai', essai)
+            n += 1
+        self._essais_publies = n
+
+    def publier_images(self, statistiques):
+        """
+        Publie les statistiques de cadencement des dernières images
+
+        Args:
+            statistiques: Dictionnaire retourné par CadenceurImages.statistiques
+        """
+        if statistiques is not None:
+            self._publier('images', {nom: _nombre(valeur) for nom, valeur in statistiques.items()})
+
+    def reinitialiser(self):
+        """Commence une nouvelle session (les clients reçoivent un état vide)."""
+        self._essais_publies = 0
+        self._session += 1
+        self._publier('session', self._session)
+
+    async def _servir(self, lecteur, ecrivain):
+        client = None
+        try:
+            requete = await asyncio.wait_for(lecteur.readline(), DELAI_REQUETE_S)
+            while (await asyncio.wait_for(lecteur.readline(), DELAI_REQUETE_S)) not in (b"\r\n", b"\n", b""):
+                pass  # En-têtes ignorés
+            elements = requete.decode('latin-1').split()
+            chemin = elements[1].split('?')[0] if len(elements) > 1 else ""
+            if elements[:1] != ["GET"] or chemin not in ("/flux", "/etat"):
+                ecrivain.write(_reponse("404 Not Found", "text/plain; charset=utf-8", b"/flux ou /etat\n"))
+            elif chemin == "/etat":
+                corps = json.dumps(self._etat, ensure_ascii=False).encode('utf-8')
+                ecrivain.write(_reponse("200 OK", "application/json; charset=utf-8", corps))
+            else:
+                client = _Client(self.taille_file)
+                self._clients.add(client)
+                ecrivain.write(_ENTETES_FLUX + _evenement('etat', self._etat))
+                while True:
+                    await ecrivain.drain()
+                    await client.signal.wait()
+                    client.signal.clear()
+                    messages = list(client.essais)
+                    client.essais.clear()
+                    if client.images is not None:
+                        messages.append(client.images)
+                        client.images = None
+                    ecrivain.write(b"".join(messages))
+            await ecrivain.drain()
+        except (ConnectionError, asyncio.TimeoutError, UnicodeDecodeError):
+            pass  # Client parti ou requête invalide
+        except asyncio.CancelledError:
+            pass  # Arrêt du serveur
+        finally:
+            if client is not None:
+                self._clients.discard(client)
+            ecrivain.close()
+
+    def fermer(self, delai_s=1.0):
+        """Arrête le serveur et déconnecte les clients."""
+        if not self.actif:
+            return
+        self.actif = False
+
+        async def arreter():
+            self._serveur.close()
+            taches = [tache for tache in asyncio.all_tasks() if tache is not asyncio.current_task()]
+            for tache in taches:
+                tache.cancel()
+            await asyncio.gather(*taches, return_exceptions=True)
+            self._boucle.stop()
+
+        asyncio.run_coroutine_threadsafe(arreter(), self._boucle)
+        self._thread.join(delai_s)
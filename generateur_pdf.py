@@ -2,79 +2,76 @@
 Module pour générer un PDF avec les données des chemins du curseur
 """
 import math
+import matplotlib
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.collections import LineCollection
 import config
 import os
 from datetime import datetime
+from metriques_essai import metriques_session, exporter_metriques_csv
+from modeles_adaptation import MODELES, NOMS_MODELES, ajuster_session
+from backends_rapport import creer_backend
+from cache_pages import CachePages, empreinte
+from cible import ANGLES_POSITIONS_FIXES, index_position_fixe
+from session import phase_essai
+from trajectoires_moyennes import trajectoires_moyennes, exporter_trajectoires_npz
+import traces
+import memoire
 
 
-def _intersection_segment_cercle(p0, p1, centre, rayon):
-    """
-    Retourne le point d'intersection du segment [p0, p1] avec le cercle (centre, rayon),
-    en prenant le premier point rencontré en partant de p0 (ou None si pas d'intersection).
-    """
-    cx, cy = centre
-    x0, y0 = p0
-    x1, y1 = p1
-    dx = x1 - x0
-    dy = y1 - y0
-    ex = x0 - cx
-    ey = y0 - cy
-    a = dx * dx + dy * dy
-    if a < 1e-12:
-        return None
-    b = 2 * (ex * dx + ey * dy)
-    c = ex * ex + ey * ey - rayon * rayon
-    disc = b * b - 4 * a * c
-    if disc < 0:
-        return None
-    t1 = (-b - math.sqrt(disc)) / (2 * a)
-    t2 = (-b + math.sqrt(disc)) / (2 * a)
-    for t in sorted([t1, t2]):
-        if 0 <= t <= 1:
-            return (x0 + t * dx, y0 + t * dy)
-    return None
-
-
-def _point_intersection_chemin_cercle(chemin, centre, rayon):
-    """Retourne le premier point où le chemin (liste de (x,y)) croise le cercle, ou None."""
-    if not chemin or len(chemin) < 2:
-        return None
-    for i in range(len(chemin) - 1):
-        pt = _intersection_segment_cercle(chemin[i], chemin[i + 1], centre, rayon)
-        if pt is not None:
-            return pt
-    return None
-
-
-def _angle_entre_vecteurs_deg(centre, p1, p2):
-    """Angle en degrés entre (centre->p1) et (centre->p2), dans [0, 360)."""
-    x0, y0 = centre
-    ux = p1[0] - x0
-    uy = p1[1] - y0
-    vx = p2[0] - x0
-    vy = p2[1] - y0
-    norm_u = math.hypot(ux, uy)
-    norm_v = math.hypot(vx, vy)
-    if norm_u < 1e-10 or norm_v < 1e-10:
-        return None
-    cos_a = (ux * vx + uy * vy) / (norm_u * norm_v)
-    cos_a = max(-1, min(1, cos_a))
-    return math.degrees(math.acos(cos_a))
+# Version du rendu des pages : à incrémenter quand l'apparence d'une page change,
+# pour que les pages en cache rendues par l'ancien code ne soient plus reprises
+VERSION_RENDU_PAGES = 1
+
+# Valeurs de config lues par les pages en cache (elles font partie de leur clé)
+CONFIG_PAGES = (
+    'LARGEUR', 'HAUTEUR', 'CERCLE_CENTRE_X', 'CERCLE_CENTRE_Y', 'CERCLE_RAYON', 'RAYON_CIBLE',
+    'DUREE_AFFICHAGE_RESULTAT', 'ANGLE_DEVIATION', 'CIBLE_DEBUT_DEVIATION', 'CIBLE_FIN_DEVIATION',
+    'COULEUR_SUPERPOSITION', 'NOMBRE_POINTS_NORMALISES', 'BASE_NORMALISATION',
+    'AJUSTEMENT_DEPARTS', 'AJUSTEMENT_ITERATIONS_MAX',
+)
+
+# Couleurs et noms affichés des phases du protocole
+COULEURS_PHASES = {'reference': 'tab:green', 'adaptation': 'tab:red', 'post_adaptation': 'tab:blue'}
+NOMS_PHASES = {'reference': 'Référence', 'adaptation': 'Adaptation', 'post_adaptation': 'Post-adaptation'}
+
+# Données d'un essai utilisées par les pages
+CLES_DONNEES_PAGES = ('chemin', 'temps_chemin', 'cible', 'point_traversee')
+
+
+def _donnees_page(donnees):
+    """Sous-ensemble des données d'un essai qui détermine ses pages."""
+    return {cle: donnees.get(cle) for cle in CLES_DONNEES_PAGES}
 
 
 class GenerateurPDF:
-    """Classe pour générer un PDF avec les chemins du curseur"""
+    """Classe pour générer le rapport (PDF ou autre format) avec les chemins du curseur"""
     
-    def __init__(self):
-        """Initialise le générateur de PDF"""
-        pass
+    def __init__(self, format_sortie=None, dpi=None, mode_pages=None, utiliser_cache=None):
+        """
+        Initialise le générateur de rapport
+        
+        Args:
+            format_sortie: "pdf", "png", "svg" ou "html" (par défaut config.FORMAT_RAPPORT)
+            dpi: Résolution des images pour les formats matriciels (par défaut config.DPI_IMAGES_RAPPORT)
+            mode_pages: "essais" (une page par essai) ou "directions" (une page par direction
+                de cible, tous les chemins superposés) ; par défaut config.MODE_PAGES_RAPPORT
+            utiliser_cache: True pour reprendre les pages inchangées du cache disque
+                (par défaut config.CACHE_PAGES ; sans effet si le format ne le permet pas)
+        """
+        self.backend = creer_backend(format_sortie or config.FORMAT_RAPPORT, dpi)
+        self.mode_pages = mode_pages or config.MODE_PAGES_RAPPORT
+        if utiliser_cache is None:
+            utiliser_cache = bool(config.CACHE_PAGES)
+        self.cache = CachePages() if utiliser_cache and self.backend.pages_separables else None
+        self.pages_en_cache = 0
+        self.pages_rendues = 0
     
     def generer_pdf(self, donnees_chemins, nom_fichier=None):
         """
-        Génère un PDF avec les données des chemins
+        Génère le rapport (PDF par défaut) avec les données des chemins
         
         Args:
             donnees_chemins: Liste de dictionnaires contenant:
@@ -85,7 +82,7 @@ class GenerateurPDF:
             nom_fichier: Nom du fichier (sans extension). Si None, utilise un timestamp
         
         Returns:
-            Chemin complet du fichier créé ou None en cas d'erreur
+            Chemin complet du fichier principal créé (PDF ou index) ou None en cas d'erreur
         """
         # Créer le dossier pdf s'il n'existe pas
         dossier_pdf = "pdf"
@@ -102,219 +99,675 @@ class GenerateurPDF:
         if not nom_fichier:
             nom_fichier = f"donnees_chemins_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        # Ajouter l'extension et le chemin
-        nom_fichier_complet = os.path.join(dossier_pdf, f"{nom_fichier}.pdf")
-        
-        # Créer le PDF avec matplotlib
+        # Créer le rapport avec matplotlib, dans le format du backend choisi
         try:
-            with PdfPages(nom_fichier_complet) as pdf:
-                # ----- Page 1 : Page de garde -----
-                fig_cover = plt.figure(figsize=(11, 8))
-                ax_cover = fig_cover.add_subplot(111)
-                ax_cover.set_xlim(0, 1)
-                ax_cover.set_ylim(0, 1)
-                ax_cover.axis('off')
-
-                # Fond discret
-                fig_cover.patch.set_facecolor('#f8f9fa')
-                ax_cover.set_facecolor('#f8f9fa')
-
-                # Titre principal : PDF des données de [nom du fichier]
-                nom_affiché = nom_fichier.replace('.pdf', '') if nom_fichier.endswith('.pdf') else nom_fichier
-                ax_cover.text(0.5, 0.70, "Rapport des données",
-                              transform=ax_cover.transAxes, fontsize=26, fontweight='bold',
-                              ha='center', va='center', color='#2c3e50')
-                ax_cover.text(0.5, 0.58, f"Données de : {nom_affiché}",
-                              transform=ax_cover.transAxes, fontsize=18, style='italic',
-                              ha='center', va='center', color='#34495e',
-                              bbox=dict(boxstyle='round,pad=0.5', facecolor='white', edgecolor='#bdc3c7', alpha=0.9))
-
-                # Bloc paramètres de l'expérience
-                ax_cover.text(0.5, 0.42, "Paramètres de l'expérience",
-                              transform=ax_cover.transAxes, fontsize=16, fontweight='bold',
-                              ha='center', va='center', color='#2c3e50')
-
-                params_texte = (
-                    f"• Cible à partir de laquelle la déviation a commencé : {config.CIBLE_DEBUT_DEVIATION}\n\n"
-                    f"• Angle de déviation : {config.ANGLE_DEVIATION}°\n\n"
-                    f"• Durée d'affichage du résultat : {config.DUREE_AFFICHAGE_RESULTAT} ms ({config.DUREE_AFFICHAGE_RESULTAT / 1000:.2f} s)"
-                )
-                ax_cover.text(0.5, 0.22, params_texte,
-                              transform=ax_cover.transAxes, fontsize=13,
-                              ha='center', va='center', color='#34495e',
-                              bbox=dict(boxstyle='round,pad=0.8', facecolor='white', edgecolor='#3498db', alpha=0.95),
-                              family='monospace')
-
-                plt.tight_layout()
-                pdf.savefig(fig_cover, bbox_inches='tight', facecolor=fig_cover.get_facecolor())
-                plt.close(fig_cover)
-
-                # ----- Pages suivantes : graphiques par essai -----
-                for i, donnees in enumerate(donnees_chemins):
-                    # Calculer la durée du mouvement (pour l'affichage sur le graphique)
-                    duree_ms = 0
-                    if 'temps_chemin' in donnees and donnees['temps_chemin']:
-                        temps_chemin = donnees['temps_chemin']
-                        duree_ms = temps_chemin[-1] if temps_chemin else 0
-                    elif donnees.get('chemin'):
-                        duree_ms = len(donnees['chemin']) * 16  # estimation ~60 FPS
-                    
-                    # Créer la figure pour le graphique (seule page par essai)
-                    fig_graph = plt.figure(figsize=(11, 8))
-                    ax = fig_graph.add_subplot(111)
-                    
-                    centre = (config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y)
-                    rayon_petit = config.CERCLE_RAYON / 10
-
-                    # Dessiner le cercle imaginaire (grand)
-                    cercle = patches.Circle(
-                        centre,
-                        config.CERCLE_RAYON,
-                        fill=False,
-                        edgecolor='gray',
-                        linewidth=1,
-                        linestyle='--'
-                    )
-                    ax.add_patch(cercle)
-
-                    # Dessiner le 2e cercle (orange), même centre, 1/10 du rayon
-                    cercle_orange = patches.Circle(
-                        centre,
-                        rayon_petit,
-                        fill=False,
-                        edgecolor='orange',
-                        linewidth=2,
-                        linestyle='-'
-                    )
-                    ax.add_patch(cercle_orange)
-                    
-                    # Dessiner le chemin du curseur
-                    if donnees['chemin'] and len(donnees['chemin']) > 1:
-                        chemin_x = [p[0] for p in donnees['chemin']]
-                        chemin_y = [p[1] for p in donnees['chemin']]
-                        ax.plot(chemin_x, chemin_y, 'b-', linewidth=2, alpha=0.7, label='Chemin du curseur')
-                    
-                    # Dessiner le point de départ (centre)
-                    ax.plot(
-                        config.CERCLE_CENTRE_X,
-                        config.CERCLE_CENTRE_Y,
-                        'go',
-                        markersize=10,
-                        label='Départ (centre)'
-                    )
-                    
-                    # Dessiner la cible (cercle)
-                    cible_x, cible_y = donnees['cible']
-                    cercle_cible = patches.Circle(
-                        (cible_x, cible_y),
-                        config.RAYON_CIBLE,
-                        fill=True,
-                        edgecolor='red',
-                        facecolor='lightcoral',
-                        linewidth=2,
-                        label='Cible'
-                    )
-                    ax.add_patch(cercle_cible)
-                    
-                    # Dessiner le point de traversée (croix)
-                    if donnees['point_traversee']:
-                        pt_x, pt_y = donnees['point_traversee']
-                        ax.plot(pt_x, pt_y, 'r+', markersize=15, markeredgewidth=3, label='Point de traversée')
-
-                    # Intersection chemin / cercle orange, droites centre->intersection et centre->cible, angle
-                    cible_x, cible_y = donnees['cible']
-                    pt_intersection = None
-                    if donnees['chemin'] and len(donnees['chemin']) > 1:
-                        pt_intersection = _point_intersection_chemin_cercle(
-                            donnees['chemin'], centre, rayon_petit
-                        )
-                    if pt_intersection is not None:
-                        ix, iy = pt_intersection
-                        ax.plot(ix, iy, 'o', color='orange', markersize=10, markeredgecolor='darkorange',
-                                markeredgewidth=2, label='Intersection cercle orange')
-                        ax.plot([centre[0], ix], [centre[1], iy], 'o-', color='orange', linewidth=2,
-                                label='Centre → intersection')
-                        ax.plot([centre[0], cible_x], [centre[1], cible_y], 'k-', linewidth=1.5,
-                                label='Centre → cible')
-                        angle_deg = _angle_entre_vecteurs_deg(centre, pt_intersection, (cible_x, cible_y))
-                        if angle_deg is not None:
-                            angle_texte = f"Angle entre les deux droites : {angle_deg:.1f}°"
-                            ax.text(0.02, 0.90, angle_texte,
-                                   transform=ax.transAxes,
-                                   fontsize=11,
-                                   verticalalignment='top',
-                                   bbox=dict(boxstyle='round', facecolor='orange', alpha=0.5),
-                                   family='monospace')
-                    
-                    # Configuration de l'axe
-                    ax.set_aspect('equal')
-                    ax.set_xlim(0, config.LARGEUR)
-                    ax.set_ylim(config.HAUTEUR, 0)  # Inverser Y pour correspondre aux coordonnées pygame (0,0 en haut)
-                    ax.set_title(f'Essai {i+1} / {len(donnees_chemins)}', fontsize=14, fontweight='bold')
-                    
-                    # Ajouter les axes avec graduations
-                    ax.set_xlabel('Abscisse (X)', fontsize=10)
-                    ax.set_ylabel('Ordonnée (Y)', fontsize=10)
-                    ax.tick_params(axis='both', which='major', labelsize=8)
-                    
-                    # Activer la grille
-                    ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
-                    ax.set_axisbelow(True)
-                    
-                    # Afficher les coordonnées de la cible
-                    info_texte = f"Cible: ({cible_x}, {cible_y})"
-                    if donnees['point_traversee']:
-                        pt_x, pt_y = donnees['point_traversee']
-                        info_texte += f"\nPoint touché: ({pt_x}, {pt_y})"
-                    
-                    # Ajouter une boîte de texte avec les coordonnées
-                    ax.text(0.02, 0.98, info_texte,
-                           transform=ax.transAxes,
-                           fontsize=9,
-                           verticalalignment='top',
-                           bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
-                           family='monospace')
-                    
-                    # Annoter la cible avec ses coordonnées
-                    ax.annotate(f'({cible_x}, {cible_y})',
-                               xy=(cible_x, cible_y),
-                               xytext=(10, 10),
-                               textcoords='offset points',
-                               fontsize=8,
-                               bbox=dict(boxstyle='round,pad=0.3', facecolor='lightcoral', alpha=0.7),
-                               arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0', color='red', lw=1))
-                    
-                    # Annoter le point de traversée avec ses coordonnées
-                    if donnees['point_traversee']:
-                        ax.annotate(f'({pt_x}, {pt_y})',
-                                   xy=(pt_x, pt_y),
-                                   xytext=(10, -20),
-                                   textcoords='offset points',
-                                   fontsize=8,
-                                   bbox=dict(boxstyle='round,pad=0.3', facecolor='lightgreen', alpha=0.7),
-                                   arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0', color='green', lw=1))
-                    
-                    ax.legend(loc='upper right', fontsize=8)
-                    
-                    # Afficher la durée dans le titre ou dans une boîte de texte
-                    duree_texte = f"Durée du mouvement : {duree_ms:.0f} ms ({duree_ms/1000:.2f} s)"
-                    ax.text(0.98, 0.02, duree_texte,
-                           transform=ax.transAxes,
-                           fontsize=10,
-                           verticalalignment='bottom',
-                           horizontalalignment='right',
-                           bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8),
-                           family='monospace')
-                    
-                    # Sauvegarder la page du graphique (seule page du PDF)
-                    plt.tight_layout()
-                    pdf.savefig(fig_graph, bbox_inches='tight')
-                    plt.close(fig_graph)
+            # Métriques des essais (déjà en cache si calculées pendant la session)
+            with traces.span("metriques_session", "rapport"):
+                liste_metriques = metriques_session(donnees_chemins)
+            
+            backend = self.backend
+            chemin_sortie = backend.ouvrir(os.path.join(dossier_pdf, nom_fichier))
+            self.pages_en_cache = 0
+            self.pages_rendues = 0
+            try:
+                # ----- Page 1 : Page de garde (toujours rendue : nom et date) -----
+                memoire.echantillon("Page de garde : avant", "rapport")
+                with traces.span("construction_figure", "rapport", page="Page de garde"):
+                    fig_cover = self._creer_page_garde(nom_fichier)
+                self._enregistrer_page(fig_cover, "Page de garde", facecolor=fig_cover.get_facecolor())
+
+                # ----- Pages suivantes : profils de vitesse, trajectoires moyennes, essais ou directions -----
+                with traces.span("trajectoires_moyennes", "rapport"):
+                    trajectoires = trajectoires_moyennes(donnees_chemins)
+                for titre, construire, entrees in self._pages_rapport(donnees_chemins, liste_metriques, trajectoires):
+                    self._produire_page(titre, construire, entrees=entrees)
+            finally:
+                with traces.span("fermeture", "rapport"):
+                    backend.fermer()
             
-            print(f"PDF généré : {nom_fichier_complet}")
-            print(f"Emplacement : {os.path.abspath(nom_fichier_complet)}")
-            return os.path.abspath(nom_fichier_complet)
+            # Export des métriques par essai à côté du PDF
+            chemin_csv = os.path.join(dossier_pdf, f"{nom_fichier}_metriques.csv")
+            exporter_metriques_csv(chemin_csv, donnees_chemins, liste_metriques)
+            # Trajectoires normalisées et moyennes, pour les reprendre sans rééchantillonner
+            if trajectoires['groupes']:
+                exporter_trajectoires_npz(os.path.join(dossier_pdf, f"{nom_fichier}_trajectoires.npz"), trajectoires)
+            
+            if self.cache is not None:
+                print(f"Pages reprises du cache : {self.pages_en_cache} / {self.pages_en_cache + self.pages_rendues}")
+            print(f"Rapport généré : {chemin_sortie}")
+            print(f"Emplacement : {os.path.abspath(chemin_sortie)}")
+            return os.path.abspath(chemin_sortie)
         except Exception as e:
-            print(f"Erreur lors de la génération du PDF : {e}")
+            print(f"Erreur lors de la génération du rapport : {e}")
             return None
+    
+    def _pages_rapport(self, donnees_chemins, liste_metriques, trajectoires):
+        """
+        Pages du rapport après la page de garde, dans l'ordre
+        
+        Args:
+            donnees_chemins: Liste de tous les essais (voir generer_pdf)
+            liste_metriques: Métriques des essais (voir metriques_session)
+            trajectoires: Trajectoires moyennes (voir trajectoires_moyennes)
+        
+        Returns:
+            Itérateur de tuples (titre, construire, entrees) (voir _produire_page)
+        """
+        # Profils de vitesse et marqueurs cinématiques
+        yield ("Profils de vitesse", lambda: self._creer_page_cinematique(liste_metriques),
+               ('cinematique', liste_metriques))
+        
+        # Modèles d'adaptation ajustés aux erreurs signées (s'il y a une phase d'adaptation)
+        erreurs = [metriques['erreur_angulaire_signee_deg'] for metriques in liste_metriques]
+        if any(phase_essai(i + 1) == "adaptation" for i in range(len(erreurs))):
+            yield ("Modèles d'adaptation", lambda: self._creer_page_modeles(erreurs),
+                   ('modeles_adaptation', erreurs))
+        
+        # Trajectoires moyennes par direction et par phase
+        if trajectoires['groupes']:
+            yield ("Trajectoires moyennes", lambda: self._creer_page_trajectoires(trajectoires),
+                   ('trajectoires_moyennes', [_donnees_page(donnees) for donnees in donnees_chemins]))
+        
+        if self.mode_pages == "directions":
+            # Une page par direction de cible
+            for index_direction in range(len(ANGLES_POSITIONS_FIXES)):
+                numeros = [i for i, donnees in enumerate(donnees_chemins)
+                           if index_position_fixe(*donnees['cible']) == index_direction]
+                if numeros:
+                    yield self._page_direction(index_direction, donnees_chemins, numeros)
+        else:
+            # Graphiques par essai
+            for i, donnees in enumerate(donnees_chemins):
+                yield self._page_essai(i, donnees, liste_metriques[i], len(donnees_chemins))
+    
+    def _page_essai(self, i, donnees, metriques, nombre_essais):
+        """Titre, constructeur et entrées de la page d'un essai (voir _creer_page_essai)."""
+        return (f"Essai {i + 1}",
+                lambda: self._creer_page_essai(i, donnees, metriques, nombre_essais),
+                ('essai', i, nombre_essais, _donnees_page(donnees), metriques))
+    
+    def _page_direction(self, index_direction, donnees_chemins, numeros):
+        """Titre, constructeur et entrées de la page d'une direction (voir _creer_page_direction)."""
+        return (f"Direction {math.degrees(ANGLES_POSITIONS_FIXES[index_direction]):.0f}°",
+                lambda: self._creer_page_direction(index_direction, donnees_chemins, numeros),
+                ('direction', index_direction, numeros, [_donnees_page(donnees_chemins[i]) for i in numeros]))
+    
+    def anticiper_page(self, titre, construire, entrees):
+        """
+        Rend une page directement dans le cache, sans rapport ouvert (rendu anticipé)
+        
+        Args:
+            titre, construire, entrees: Voir _produire_page
+        
+        Returns:
+            True si la page a été rendue, False si elle était déjà en cache ou sans cache
+        """
+        if self.cache is None:
+            return False
+        cle = self.cle_page(entrees)
+        if self.cache.contient(cle):
+            return False
+        fig = construire()
+        fig.tight_layout()
+        contenu = self.backend.rendre_page(fig)
+        plt.close(fig)
+        self.cache.ajouter(cle, contenu)
+        return True
+    
+    def anticiper_page_essai(self, i, donnees, nombre_essais):
+        """
+        Rend dans le cache la page d'un essai terminé, avant l'export du rapport
+        
+        Args:
+            i: Indice de l'essai (à partir de 0)
+            donnees: Dictionnaire de l'essai, avec ses métriques sous 'metriques'
+            nombre_essais: Nombre d'essais que comptera la session
+        
+        Returns:
+            Nombre de pages rendues (0 ou 1)
+        """
+        if self.mode_pages == "directions":
+            return 0
+        return int(self.anticiper_page(*self._page_essai(i, donnees, donnees['metriques'], nombre_essais)))
+    
+    def anticiper_rapport(self, donnees_chemins):
+        """
+        Rend dans le cache toutes les pages du rapport qui n'y sont pas encore (sauf la page de garde)
+        
+        Args:
+            donnees_chemins: Liste de tous les essais de la session
+        
+        Returns:
+            Nombre de pages rendues
+        """
+        liste_metriques = metriques_session(donnees_chemins)
+        trajectoires = trajectoires_moyennes(donnees_chemins)
+        return sum(self.anticiper_page(*page) for page in self._pages_rapport(donnees_chemins, liste_metriques,
+                                                                              trajectoires))
+    
+    def cle_page(self, entrees):
+        """
+        Clé de cache d'une page : ses entrées, les valeurs de config qu'elle lit,
+        la version du rendu et le format de sortie
+        
+        Args:
+            entrees: Valeurs dont dépend le contenu de la page
+        
+        Returns:
+            Empreinte hexadécimale
+        """
+        return empreinte(
+            VERSION_RENDU_PAGES, matplotlib.__version__,
+            type(self.backend).__name__, getattr(self.backend, 'dpi', None),
+            {nom: getattr(config, nom) for nom in CONFIG_PAGES},
+            entrees,
+        )
+    
+    def _produire_page(self, titre, construire, entrees=None, **options):
+        """
+        Ajoute une page au rapport, reprise du cache si ses entrées n'ont pas changé
+        
+        Args:
+            titre: Titre court de la page
+            construire: Fonction sans argument qui retourne la figure de la page
+            entrees: Valeurs dont dépend le contenu de la page (None : page jamais mise en cache)
+            options: Options passées à savefig (ex. facecolor)
+        """
+        cle = None
+        if self.cache is not None and entrees is not None:
+            cle = self.cle_page(entrees)
+            contenu = self.cache.obtenir(cle)
+            if contenu is not None:
+                with traces.span("page_en_cache", "rapport", page=titre):
+                    self.backend.inserer_page(contenu, titre)
+                self.pages_en_cache += 1
+                return
+        memoire.echantillon(f"{titre} : avant", "rapport")
+        with traces.span("construction_figure", "rapport", page=titre):
+            fig = construire()
+        contenu = self._enregistrer_page(fig, titre, **options)
+        if cle is not None and contenu is not None:
+            self.cache.ajouter(cle, contenu)
+    
+    def _enregistrer_page(self, fig, titre, **options):
+        """
+        Met en page une figure, l'enregistre avec le backend puis la libère
+        
+        Args:
+            fig: Figure matplotlib de la page
+            titre: Titre court de la page
+            options: Options passées à savefig (ex. facecolor)
+        
+        Returns:
+            Contenu de la page rendue (octets) si le backend produit des pages séparables
+        """
+        with traces.span("mise_en_page", "rapport", page=titre):
+            fig.tight_layout()
+        with traces.span("savefig", "rapport", page=titre):
+            contenu = self.backend.ajouter_page(fig, titre, **options)
+        plt.close(fig)
+        self.pages_rendues += 1
+        memoire.echantillon(f"{titre} : après", "rapport")
+        return contenu
+    
+    def _creer_page_garde(self, nom_fichier):
+        """
+        Crée la page de garde avec le nom des données et les paramètres de l'expérience
+        
+        Args:
+            nom_fichier: Nom du fichier (sans extension)
+        
+        Returns:
+            Figure matplotlib de la page
+        """
+        fig_cover = plt.figure(figsize=(11, 8))
+        ax_cover = fig_cover.add_subplot(111)
+        ax_cover.set_xlim(0, 1)
+        ax_cover.set_ylim(0, 1)
+        ax_cover.axis('off')
 
+        # Fond discret
+        fig_cover.patch.set_facecolor('#f8f9fa')
+        ax_cover.set_facecolor('#f8f9fa')
+
+        # Titre principal : PDF des données de [nom du fichier]
+        nom_affiché = nom_fichier.replace('.pdf', '') if nom_fichier.endswith('.pdf') else nom_fichier
+        ax_cover.text(0.5, 0.70, "Rapport des données",
+                      transform=ax_cover.transAxes, fontsize=26, fontweight='bold',
+                      ha='center', va='center', color='#2c3e50')
+        ax_cover.text(0.5, 0.58, f"Données de : {nom_affiché}",
+                      transform=ax_cover.transAxes, fontsize=18, style='italic',
+                      ha='center', va='center', color='#34495e',
+                      bbox=dict(boxstyle='round,pad=0.5', facecolor='white', edgecolor='#bdc3c7', alpha=0.9))
+
+        # Bloc paramètres de l'expérience
+        ax_cover.text(0.5, 0.42, "Paramètres de l'expérience",
+                      transform=ax_cover.transAxes, fontsize=16, fontweight='bold',
+                      ha='center', va='center', color='#2c3e50')
+
+        params_texte = (
+            f"• Cible à partir de laquelle la déviation a commencé : {config.CIBLE_DEBUT_DEVIATION}\n\n"
+            + (f"• Cible à partir de laquelle la déviation s'est arrêtée : {config.CIBLE_FIN_DEVIATION}\n\n"
+               if config.CIBLE_FIN_DEVIATION else "") +
+            f"• Angle de déviation : {config.ANGLE_DEVIATION}°\n\n"
+            f"• Durée d'affichage du résultat : {config.DUREE_AFFICHAGE_RESULTAT} ms ({config.DUREE_AFFICHAGE_RESULTAT / 1000:.2f} s)"
+        )
+        ax_cover.text(0.5, 0.22, params_texte,
+                      transform=ax_cover.transAxes, fontsize=13,
+                      ha='center', va='center', color='#34495e',
+                      bbox=dict(boxstyle='round,pad=0.8', facecolor='white', edgecolor='#3498db', alpha=0.95),
+                      family='monospace')
+
+        return fig_cover
+    
+    def _creer_page_essai(self, i, donnees, metriques, nombre_essais):
+        """
+        Crée la page d'un essai (figure partagée par tous les formats de sortie)
+        
+        Args:
+            i: Indice de l'essai (à partir de 0)
+            donnees: Dictionnaire de l'essai (voir generer_pdf)
+            metriques: Métriques de l'essai (voir metriques_session)
+            nombre_essais: Nombre total d'essais (pour le titre)
+        
+        Returns:
+            Figure matplotlib de la page
+        """
+        # Calculer la durée du mouvement (pour l'affichage sur le graphique)
+        duree_ms = 0
+        if 'temps_chemin' in donnees and donnees['temps_chemin']:
+            temps_chemin = donnees['temps_chemin']
+            duree_ms = temps_chemin[-1] if temps_chemin else 0
+        elif donnees.get('chemin'):
+            duree_ms = len(donnees['chemin']) * 16  # estimation ~60 FPS
+
+        # Créer la figure pour le graphique (seule page par essai)
+        fig_graph = plt.figure(figsize=(11, 8))
+        ax = fig_graph.add_subplot(111)
+
+        centre = (config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y)
+        rayon_petit = config.CERCLE_RAYON / 10
+
+        # Dessiner le cercle imaginaire (grand)
+        cercle = patches.Circle(
+            centre,
+            config.CERCLE_RAYON,
+            fill=False,
+            edgecolor='gray',
+            linewidth=1,
+            linestyle='--'
+        )
+        ax.add_patch(cercle)
+
+        # Dessiner le 2e cercle (orange), même centre, 1/10 du rayon
+        cercle_orange = patches.Circle(
+            centre,
+            rayon_petit,
+            fill=False,
+            edgecolor='orange',
+            linewidth=2,
+            linestyle='-'
+        )
+        ax.add_patch(cercle_orange)
+
+        # Dessiner le chemin du curseur
+        if donnees['chemin'] and len(donnees['chemin']) > 1:
+            chemin_x = [p[0] for p in donnees['chemin']]
+            chemin_y = [p[1] for p in donnees['chemin']]
+            ax.plot(chemin_x, chemin_y, 'b-', linewidth=2, alpha=0.7, label='Chemin du curseur')
+
+        # Dessiner le point de départ (centre)
+        ax.plot(
+            config.CERCLE_CENTRE_X,
+            config.CERCLE_CENTRE_Y,
+            'go',
+            markersize=10,
+            label='Départ (centre)'
+        )
+
+        # Dessiner la cible (cercle)
+        cible_x, cible_y = donnees['cible']
+        cercle_cible = patches.Circle(
+            (cible_x, cible_y),
+            config.RAYON_CIBLE,
+            fill=True,
+            edgecolor='red',
+            facecolor='lightcoral',
+            linewidth=2,
+            label='Cible'
+        )
+        ax.add_patch(cercle_cible)
+
+        # Dessiner le point de traversée (croix)
+        if donnees['point_traversee']:
+            pt_x, pt_y = donnees['point_traversee']
+            ax.plot(pt_x, pt_y, 'r+', markersize=15, markeredgewidth=3, label='Point de traversée')
+
+        # Intersection chemin / cercle orange, droites centre->intersection et centre->cible, angle
+        cible_x, cible_y = donnees['cible']
+        pt_intersection = metriques['point_intersection']
+        if pt_intersection is not None:
+            ix, iy = pt_intersection
+            ax.plot(ix, iy, 'o', color='orange', markersize=10, markeredgecolor='darkorange',
+                    markeredgewidth=2, label='Intersection cercle orange')
+            ax.plot([centre[0], ix], [centre[1], iy], 'o-', color='orange', linewidth=2,
+                    label='Centre → intersection')
+            ax.plot([centre[0], cible_x], [centre[1], cible_y], 'k-', linewidth=1.5,
+                    label='Centre → cible')
+            angle_deg = metriques['erreur_angulaire_deg']
+            if angle_deg is not None:
+                angle_texte = f"Angle entre les deux droites : {angle_deg:.1f}°"
+                ax.text(0.02, 0.90, angle_texte,
+                       transform=ax.transAxes,
+                       fontsize=11,
+                       verticalalignment='top',
+                       bbox=dict(boxstyle='round', facecolor='orange', alpha=0.5),
+                       family='monospace')
+
+        # Configuration de l'axe
+        ax.set_aspect('equal')
+        ax.set_xlim(0, config.LARGEUR)
+        ax.set_ylim(config.HAUTEUR, 0)  # Inverser Y pour correspondre aux coordonnées pygame (0,0 en haut)
+        ax.set_title(f'Essai {i+1} / {nombre_essais}', fontsize=14, fontweight='bold')
+
+        # Ajouter les axes avec graduations
+        ax.set_xlabel('Abscisse (X)', fontsize=10)
+        ax.set_ylabel('Ordonnée (Y)', fontsize=10)
+        ax.tick_params(axis='both', which='major', labelsize=8)
+
+        # Activer la grille
+        ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+        ax.set_axisbelow(True)
+
+        # Afficher les coordonnées de la cible
+        info_texte = f"Cible: ({cible_x}, {cible_y})"
+        if donnees['point_traversee']:
+            pt_x, pt_y = donnees['point_traversee']
+            info_texte += f"\nPoint touché: ({pt_x}, {pt_y})"
+
+        # Ajouter une boîte de texte avec les coordonnées
+        ax.text(0.02, 0.98, info_texte,
+               transform=ax.transAxes,
+               fontsize=9,
+               verticalalignment='top',
+               bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
+               family='monospace')
+
+        # Annoter la cible avec ses coordonnées
+        ax.annotate(f'({cible_x}, {cible_y})',
+                   xy=(cible_x, cible_y),
+                   xytext=(10, 10),
+                   textcoords='offset points',
+                   fontsize=8,
+                   bbox=dict(boxstyle='round,pad=0.3', facecolor='lightcoral', alpha=0.7),
+                   arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0', color='red', lw=1))
+
+        # Annoter le point de traversée avec ses coordonnées
+        if donnees['point_traversee']:
+            ax.annotate(f'({pt_x}, {pt_y})',
+                       xy=(pt_x, pt_y),
+                       xytext=(10, -20),
+                       textcoords='offset points',
+                       fontsize=8,
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor='lightgreen', alpha=0.7),
+                       arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0', color='green', lw=1))
+
+        ax.legend(loc='upper right', fontsize=8)
+
+        # Afficher la durée dans le titre ou dans une boîte de texte
+        duree_texte = f"Durée du mouvement : {duree_ms:.0f} ms ({duree_ms/1000:.2f} s)"
+        if metriques['vitesse_max'] is not None:
+            duree_texte += (
+                f"\nTemps de réaction : {metriques['temps_reaction_ms']:.0f} ms"
+                f"\nPic de vitesse : {metriques['vitesse_max']:.0f} px/s"
+                f" à {metriques['temps_vitesse_max_ms']:.0f} ms"
+            )
+        ax.text(0.98, 0.02, duree_texte,
+               transform=ax.transAxes,
+               fontsize=10,
+               verticalalignment='bottom',
+               horizontalalignment='right',
+               bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8),
+               family='monospace')
+
+        return fig_graph
+    
+    def _creer_page_direction(self, index_direction, donnees_chemins, numeros):
+        """
+        Crée la page superposant tous les chemins vers une même direction de cible
+        
+        Tous les chemins forment une seule LineCollection colorée par numéro d'essai
+        ou par phase (config.COULEUR_SUPERPOSITION), et les points de traversée un
+        seul nuage de points : le coût de rendu ne dépend pas du nombre d'essais.
+        
+        Args:
+            index_direction: Indice dans ANGLES_POSITIONS_FIXES
+            donnees_chemins: Liste de tous les essais (voir generer_pdf)
+            numeros: Indices (à partir de 0) des essais vers cette direction
+        
+        Returns:
+            Figure matplotlib de la page
+        """
+        fig = plt.figure(figsize=(11, 8))
+        ax = fig.add_subplot(111)
+        centre = (config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y)
+        
+        # Cercle imaginaire, cercle orange et cible de cette direction
+        ax.add_patch(patches.Circle(centre, config.CERCLE_RAYON, fill=False, edgecolor='gray',
+                                    linewidth=1, linestyle='--'))
+        ax.add_patch(patches.Circle(centre, config.CERCLE_RAYON / 10, fill=False, edgecolor='orange',
+                                    linewidth=2))
+        cible_x, cible_y = donnees_chemins[numeros[0]]['cible']
+        ax.add_patch(patches.Circle((cible_x, cible_y), config.RAYON_CIBLE, fill=True, edgecolor='red',
+                                    facecolor='lightcoral', linewidth=2, label='Cible'))
+        ax.plot(centre[0], centre[1], 'go', markersize=10, label='Départ (centre)')
+        
+        # Tous les chemins dans une seule collection
+        segments = [donnees_chemins[i]['chemin'] for i in numeros if len(donnees_chemins[i]['chemin']) > 1]
+        numeros_traces = [i for i in numeros if len(donnees_chemins[i]['chemin']) > 1]
+        if config.COULEUR_SUPERPOSITION == "phase":
+            collection = LineCollection(segments, colors=[COULEURS_PHASES[phase_essai(i + 1)] for i in numeros_traces],
+                                        linewidths=1.5, alpha=0.7)
+            ax.add_collection(collection)
+            for phase in sorted({phase_essai(i + 1) for i in numeros_traces}, key=list(COULEURS_PHASES).index):
+                ax.plot([], [], color=COULEURS_PHASES[phase], linewidth=1.5, label=NOMS_PHASES[phase])
+        else:
+            collection = LineCollection(segments, cmap='viridis', linewidths=1.5, alpha=0.7)
+            collection.set_array([i + 1 for i in numeros_traces])
+            collection.set_clim(1, max(len(donnees_chemins), 2))
+            ax.add_collection(collection)
+            fig.colorbar(collection, ax=ax, label='Numéro d\'essai', shrink=0.8)
+        
+        # Points de traversée
+        points = [donnees_chemins[i]['point_traversee'] for i in numeros if donnees_chemins[i]['point_traversee']]
+        if points:
+            ax.scatter([p[0] for p in points], [p[1] for p in points], marker='+', s=120, color='red',
+                       linewidths=2, label='Points de traversée', zorder=3)
+        
+        angle_deg = math.degrees(ANGLES_POSITIONS_FIXES[index_direction])
+        ax.set_aspect('equal')
+        ax.set_xlim(0, config.LARGEUR)
+        ax.set_ylim(config.HAUTEUR, 0)  # Inverser Y pour correspondre aux coordonnées pygame (0,0 en haut)
+        ax.set_title(f'Direction {angle_deg:.0f}° : {len(numeros)} essai(s)', fontsize=14, fontweight='bold')
+        ax.set_xlabel('Abscisse (X)', fontsize=10)
+        ax.set_ylabel('Ordonnée (Y)', fontsize=10)
+        ax.tick_params(axis='both', which='major', labelsize=8)
+        ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+        ax.set_axisbelow(True)
+        ax.legend(loc='upper right', fontsize=8)
+        
+        return fig
+    
+    def _creer_page_cinematique(self, liste_metriques):
+        """
+        Crée la page des profils de vitesse et des marqueurs par essai
+        
+        Args:
+            liste_metriques: Métriques des essais (voir metriques_session)
+        
+        Returns:
+            Figure matplotlib de la page
+        """
+        fig = plt.figure(figsize=(11, 8))
+        ax_profils = fig.add_subplot(211)
+        ax_marqueurs = fig.add_subplot(212)
+        
+        # Profils de vitesse tangentielle superposés
+        for metriques in liste_metriques:
+            if len(metriques['profil_temps_ms']):
+                ax_profils.plot(metriques['profil_temps_ms'], metriques['profil_vitesse'], linewidth=1, alpha=0.5)
+        ax_profils.set_title('Profils de vitesse tangentielle', fontsize=14, fontweight='bold')
+        ax_profils.set_xlabel('Temps depuis l\'apparition de la cible (ms)', fontsize=10)
+        ax_profils.set_ylabel('Vitesse (px/s)', fontsize=10)
+        ax_profils.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+        
+        # Marqueurs par essai
+        def serie(nom):
+            return [math.nan if m[nom] is None else m[nom] for m in liste_metriques]
+        
+        numeros = range(1, len(liste_metriques) + 1)
+        ax_marqueurs.plot(numeros, serie('temps_reaction_ms'), 'o-', color='tab:blue',
+                          label='Temps de réaction (ms)')
+        ax_marqueurs.plot(numeros, serie('temps_mouvement_ms'), 's-', color='tab:green',
+                          label='Temps de mouvement (ms)')
+        ax_marqueurs.set_xlabel('Essai', fontsize=10)
+        ax_marqueurs.set_ylabel('Temps (ms)', fontsize=10)
+        ax_marqueurs.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+        ax_vitesse = ax_marqueurs.twinx()
+        ax_vitesse.plot(numeros, serie('vitesse_max'), '^--', color='tab:red',
+                        label='Pic de vitesse (px/s)')
+        ax_vitesse.set_ylabel('Pic de vitesse (px/s)', fontsize=10)
+        lignes = ax_marqueurs.get_lines() + ax_vitesse.get_lines()
+        ax_marqueurs.legend(lignes, [l.get_label() for l in lignes], loc='upper right', fontsize=8)
+        
+        return fig
+    
+    def _creer_page_modeles(self, erreurs):
+        """
+        Crée la page des modèles d'adaptation : erreurs signées et courbes ajustées,
+        compensation prédite par composante et tableau des paramètres
+        
+        Args:
+            erreurs: Erreurs angulaires signées de chaque essai (None si indisponible)
+        
+        Returns:
+            Figure matplotlib de la page
+        """
+        ajustements = ajuster_session(erreurs)
+        fig = plt.figure(figsize=(11, 8))
+        ax_erreurs = fig.add_subplot(211)
+        ax_etats = fig.add_subplot(223)
+        ax_tableau = fig.add_subplot(224)
+        numeros = np.arange(1, len(erreurs) + 1)
+        phases = [phase_essai(int(n)) for n in numeros]
+        
+        # Erreurs observées (couleur de la phase) et erreurs prédites par chaque modèle
+        observees = np.array([np.nan if e is None else e for e in erreurs], dtype=float)
+        for phase, couleur in COULEURS_PHASES.items():
+            dans_phase = np.array([p == phase for p in phases])
+            if dans_phase.any():
+                ax_erreurs.plot(numeros[dans_phase], observees[dans_phase], 'o', color=couleur, markersize=4,
+                                alpha=0.7, label=NOMS_PHASES[phase])
+        styles = {'un_taux': ('black', '-'), 'deux_taux': ('tab:purple', '--')}
+        for modele, resultats in ajustements.items():
+            couleur, style = styles[modele]
+            ax_erreurs.plot(numeros, resultats['courbe'], color=couleur, linestyle=style, linewidth=2,
+                            label=f"{NOMS_MODELES[modele]} (AIC {resultats['aic']:.1f})")
+            ax_etats.plot(numeros, resultats['etats'].sum(axis=1), color=couleur, linestyle=style, linewidth=2,
+                          label=NOMS_MODELES[modele])
+            if modele == 'deux_taux':
+                ax_etats.plot(numeros, resultats['etats'][:, 0], color=couleur, linestyle=':', linewidth=1,
+                              label='Composante rapide')
+                ax_etats.plot(numeros, resultats['etats'][:, 1], color=couleur, linestyle='-.', linewidth=1,
+                              label='Composante lente')
+        ax_erreurs.axhline(0, color='black', linewidth=0.8)
+        ax_erreurs.set_title("Modèles d'adaptation à l'espace d'états", fontsize=14, fontweight='bold')
+        ax_erreurs.set_xlabel('Essai', fontsize=10)
+        ax_erreurs.set_ylabel('Erreur angulaire signée (°)', fontsize=10)
+        ax_erreurs.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+        ax_erreurs.legend(loc='upper right', fontsize=8)
+        ax_etats.set_title('Compensation prédite', fontsize=11, fontweight='bold')
+        ax_etats.set_xlabel('Essai', fontsize=10)
+        ax_etats.set_ylabel('Compensation (°)', fontsize=10)
+        ax_etats.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+        if ajustements:
+            ax_etats.legend(loc='upper right', fontsize=7)
+        
+        # Tableau des paramètres ajustés
+        ax_tableau.axis('off')
+        if not ajustements:
+            ax_tableau.text(0.5, 0.5, "Trop peu d'essais pour ajuster les modèles", ha='center', va='center',
+                            fontsize=10)
+            return fig
+        libelles = {'retention': 'Rétention A', 'taux_apprentissage': 'Taux B',
+                    'retention_rapide': 'A rapide', 'retention_lente': 'A lente',
+                    'taux_rapide': 'B rapide', 'taux_lent': 'B lent'}
+        lignes = []
+        for modele, resultats in ajustements.items():
+            valeurs = ", ".join(f"{libelles[nom]} {valeur:.3f}"
+                                for nom, valeur in zip(MODELES[modele], resultats['parametres']))
+            lignes.append([NOMS_MODELES[modele], valeurs])
+            lignes.append(["", f"Asymptote {resultats['asymptote_deg']:.1f}°, biais {resultats['biais']:.1f}°, "
+                               f"σ {resultats['sigma']:.1f}°"])
+            lignes.append(["", f"AIC {resultats['aic']:.1f}, BIC {resultats['bic']:.1f}, "
+                               f"départs convergents {resultats['departs_convergents']:.0%}"])
+        tableau = ax_tableau.table(cellText=lignes, colWidths=[0.2, 0.8], loc='center', cellLoc='left',
+                                   edges='open')
+        tableau.auto_set_font_size(False)
+        tableau.set_fontsize(8)
+        ax_tableau.set_title('Paramètres ajustés', fontsize=11, fontweight='bold')
+        
+        return fig
+    
+    def _creer_page_trajectoires(self, trajectoires):
+        """
+        Crée la page des trajectoires moyennes : une vue par phase, une trajectoire
+        moyenne par direction entourée d'une bande de ± un écart-type latéral
+        
+        Args:
+            trajectoires: Dictionnaire retourné par trajectoires_moyennes
+        
+        Returns:
+            Figure matplotlib de la page
+        """
+        phases = [phase for phase in COULEURS_PHASES if any(g['phase'] == phase for g in trajectoires['groupes'])]
+        fig = plt.figure(figsize=(11, 8))
+        centre = (config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y)
+        marge = config.CERCLE_RAYON * 1.15
+        couleurs = plt.get_cmap('tab10')
+        for colonne, phase in enumerate(phases):
+            ax = fig.add_subplot(1, len(phases), colonne + 1)
+            ax.add_patch(patches.Circle(centre, config.CERCLE_RAYON, fill=False, edgecolor='gray',
+                                        linewidth=1, linestyle='--'))
+            for angle in ANGLES_POSITIONS_FIXES:
+                ax.add_patch(patches.Circle(
+                    (centre[0] + config.CERCLE_RAYON * math.cos(angle), centre[1] + config.CERCLE_RAYON * math.sin(angle)),
+                    config.RAYON_CIBLE, fill=False, edgecolor='lightcoral', linewidth=1))
+            for groupe in trajectoires['groupes']:
+                if groupe['phase'] != phase:
+                    continue
+                couleur = couleurs(groupe['direction'])
+                moyenne = groupe['moyenne']
+                # Bande de ± un écart-type perpendiculairement à la trajectoire moyenne
+                definie = np.isfinite(groupe['ecart_type_lateral'])
+                decalage = groupe['normales'][definie] * groupe['ecart_type_lateral'][definie, None]
+                haut, bas = moyenne[definie] + decalage, moyenne[definie] - decalage
+                ax.fill(np.concatenate((haut[:, 0], bas[::-1, 0])), np.concatenate((haut[:, 1], bas[::-1, 1])),
+                        color=couleur, alpha=0.25, linewidth=0)
+                angle_deg = math.degrees(ANGLES_POSITIONS_FIXES[groupe['direction']])
+                ax.plot(moyenne[:, 0], moyenne[:, 1], color=couleur, linewidth=2,
+                        label=f"{angle_deg:.0f}° (n = {len(groupe['essais'])})")
+            ax.plot(centre[0], centre[1], 'go', markersize=6)
+            ax.set_aspect('equal')
+            ax.set_xlim(centre[0] - marge, centre[0] + marge)
+            ax.set_ylim(centre[1] + marge, centre[1] - marge)  # Y inversé comme à l'écran
+            ax.set_title(NOMS_PHASES[phase], fontsize=12, fontweight='bold')
+            ax.tick_params(axis='both', which='major', labelsize=7)
+            ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+            ax.set_axisbelow(True)
+            ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.06), ncol=2, fontsize=7)
+        base = "fraction de la durée" if trajectoires['base'] == "temps" else "fraction du chemin parcouru"
+        fig.suptitle(f"Trajectoires moyennes ± écart-type latéral ({len(trajectoires['grille'])} points, {base})",
+                     fontsize=14, fontweight='bold')
+        
+        return fig
@@ -0,0 +1,149 @@
+"""
+Fonctions géométriques communes au jeu, à l'analyse et au rapport
+
+Les versions vectorisées (suffixe _lot) traitent N segments ou points à la fois
+avec numpy et donnent les mêmes valeurs que les fonctions scalaires : à l'identique
+pour les intersections, au dernier bit près pour les angles
+(voir benchmarks/bench_geometrie.py).
+"""
+import math
+import numpy as np
+
+
+def intersection_segment_cercle(p0, p1, centre, rayon):
+    """
+    Retourne le point d'intersection du segment [p0, p1] avec le cercle (centre, rayon),
+    en prenant le premier point rencontré en partant de p0 (ou None si pas d'intersection).
+    """
+    cx, cy = centre
+    x0, y0 = p0
+    x1, y1 = p1
+    dx = x1 - x0
+    dy = y1 - y0
+    ex = x0 - cx
+    ey = y0 - cy
+    a = dx * dx + dy * dy
+    if a < 1e-12:
+        return None
+    b = 2 * (ex * dx + ey * dy)
+    c = ex * ex + ey * ey - rayon * rayon
+    if c < 0:
+        # p0 dans le disque : si p1 y est aussi, le segment ne peut pas couper le cercle
+        fx = x1 - cx
+        fy = y1 - cy
+        if fx * fx + fy * fy < rayon * rayon:
+            return None
+    disc = b * b - 4 * a * c
+    if disc < 0:
+        return None
+    t1 = (-b - math.sqrt(disc)) / (2 * a)
+    t2 = (-b + math.sqrt(disc)) / (2 * a)
+    for t in sorted([t1, t2]):
+        if 0 <= t <= 1:
+            return (x0 + t * dx, y0 + t * dy)
+    return None
+
+
+def intersections_segments_cercle_lot(debuts, fins, centre, rayon):
+    """
+    Version vectorisée de intersection_segment_cercle pour N segments
+    
+    Args:
+        debuts: Tableau (N, 2) des points de départ p0
+        fins: Tableau (N, 2) des points d'arrivée p1
+        centre: Tuple (x, y) du centre du cercle
+        rayon: Rayon du cercle
+        
+    Returns:
+        Tableau (N, 2) des premiers points d'intersection (NaN si pas d'intersection)
+    """
+    debuts = np.asarray(debuts, dtype=float).reshape(-1, 2)
+    fins = np.asarray(fins, dtype=float).reshape(-1, 2)
+    dx = fins[:, 0] - debuts[:, 0]
+    dy = fins[:, 1] - debuts[:, 1]
+    ex = debuts[:, 0] - centre[0]
+    ey = debuts[:, 1] - centre[1]
+    a = dx * dx + dy * dy
+    b = 2 * (ex * dx + ey * dy)
+    c = ex * ex + ey * ey - rayon * rayon
+    disc = b * b - 4 * a * c
+    valide = (a >= 1e-12) & (disc >= 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        racine = np.sqrt(np.where(valide, disc, 0.0))
+        t1 = (-b - racine) / (2 * a)
+        t2 = (-b + racine) / (2 * a)
+    # t1 <= t2 : garder la première racine comprise dans [0, 1]
+    t = np.where((t1 >= 0) & (t1 <= 1), t1, np.where((t2 >= 0) & (t2 <= 1), t2, np.nan))
+    t[~valide] = np.nan
+    return np.column_stack((debuts[:, 0] + t * dx, debuts[:, 1] + t * dy))
+
+
+def point_intersection_chemin_cercle(chemin, centre, rayon):
+    """Retourne le premier point où le chemin (liste de (x,y)) croise le cercle, ou None."""
+    if not chemin or len(chemin) < 2:
+        return None
+    for i in range(len(chemin) - 1):
+        pt = intersection_segment_cercle(chemin[i], chemin[i + 1], centre, rayon)
+        if pt is not None:
+            return pt
+    return None
+
+
+def angle_entre_vecteurs_deg(centre, p1, p2):
+    """Angle en degrés entre (centre->p1) et (centre->p2), dans [0, 180]."""
+    x0, y0 = centre
+    ux = p1[0] - x0
+    uy = p1[1] - y0
+    vx = p2[0] - x0
+    vy = p2[1] - y0
+    norm_u = math.hypot(ux, uy)
+    norm_v = math.hypot(vx, vy)
+    if norm_u < 1e-10 or norm_v < 1e-10:
+        return None
+    cos_a = (ux * vx + uy * vy) / (norm_u * norm_v)
+    cos_a = max(-1, min(1, cos_a))
+    return math.degrees(math.acos(cos_a))
+
+
+def angles_entre_vecteurs_deg_lot(centre, p1, p2):
+    """
+    Version vectorisée de angle_entre_vecteurs_deg
+    
+    Args:
+        centre: Tuple (x, y) commun aux deux vecteurs
+        p1, p2: Tableaux (N, 2) des extrémités
+        
+    Returns:
+        Tableau (N,) des angles en degrés dans [0, 180] (NaN si un vecteur est nul)
+    """
+    p1 = np.asarray(p1, dtype=float).reshape(-1, 2)
+    p2 = np.asarray(p2, dtype=float).reshape(-1, 2)
+    ux = p1[:, 0] - centre[0]
+    uy = p1[:, 1] - centre[1]
+    vx = p2[:, 0] - centre[0]
+    vy = p2[:, 1] - centre[1]
+    norm_u = np.hypot(ux, uy)
+    norm_v = np.hypot(vx, vy)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_a = np.clip((ux * vx + uy * vy) / (norm_u * norm_v), -1, 1)
+    angles = np.degrees(np.arccos(cos_a))
+    angles[(norm_u < 1e-10) | (norm_v < 1e-10)] = np.nan
+    return angles
+
+
+def angle_signe_deg(centre, p_reference, p):
+    """
+    Angle signé en degrés de (centre->p_reference) vers (centre->p), dans (-180, 180].
+    Positif dans le sens horaire à l'écran (axe Y vers le bas), comme la déviation.
+    """
+    x0, y0 = centre
+    if math.hypot(p[0] - x0, p[1] - y0) < 1e-10 or math.hypot(p_reference[0] - x0, p_reference[1] - y0) < 1e-10:
+        return None
+    angle = math.degrees(math.atan2(p[1] - y0, p[0] - x0) - math.atan2(p_reference[1] - y0, p_reference[0] - x0))
+    angle = (angle + 180.0) % 360.0 - 180.0
+    return 180.0 if angle == -180.0 else angle
+
+
+def longueur_chemin(chemin):
+    """Longueur totale en pixels d'un chemin (liste de (x, y))."""
+    return sum(math.hypot(x1 - x0, y1 - y0) for (x0, y0), (x1, y1) in zip(chemin, chemin[1:]))
@@ -4,6 +4,12 @@ Module pour gérer l'interface de configuration
 import pygame
 import config
 import re
+from widgets import Bouton, ChampTexte, Couche, Etiquette, Panneau, invalider_dispositions
+
+
+def _caractere_numerique(caractere):
+    """Caractères acceptés dans les champs : chiffres et signe moins"""
+    return caractere.isdigit() or caractere == '-'
 
 
 class InterfaceConfig:
@@ -17,31 +23,6 @@ class InterfaceConfig:
             ecran: Surface pygame de la fenêtre
         """
         self.ecran = ecran
-        
-        # Ajuster les tailles de police
-        taille_titre = int(config.HAUTEUR * 0.08)
-        taille_label = int(config.HAUTEUR * 0.04)
-        taille_champ = int(config.HAUTEUR * 0.035)
-        self.font_titre = pygame.font.Font(None, taille_titre)
-        self.font_label = pygame.font.Font(None, taille_label)
-        self.font_champ = pygame.font.Font(None, taille_champ)
-        
-        # Dimensions de la fenêtre de configuration
-        self.largeur_fen = int(config.LARGEUR * 0.5)
-        self.hauteur_fen = int(config.HAUTEUR * 0.7)
-        self.x_fen = (config.LARGEUR - self.largeur_fen) // 2
-        self.y_fen = (config.HAUTEUR - self.hauteur_fen) // 2
-        
-        # Dimensions des champs
-        self.hauteur_champ = int(config.HAUTEUR * 0.05)
-        self.largeur_champ = int(self.largeur_fen * 0.4)
-        self.espacement = int(config.HAUTEUR * 0.08)
-        
-        # Position du titre
-        self.titre_y = self.y_fen + int(self.hauteur_fen * 0.05)
-        
-        # Champs de configuration
-        self.champs = []
         self.champ_actif = None
         
         # Définir les champs avec leurs labels et valeurs initiales
@@ -50,111 +31,74 @@ class InterfaceConfig:
             ("DUREE_AFFICHAGE_RESULTAT", "Durée affichage résultat (ms)", config.DUREE_AFFICHAGE_RESULTAT),
             ("NOMBRE_CIBLES_MAX", "Nombre de cibles max", config.NOMBRE_CIBLES_MAX),
             ("CIBLE_DEBUT_DEVIATION", "Cible début déviation", config.CIBLE_DEBUT_DEVIATION),
+            ("CIBLE_FIN_DEVIATION", "Cible fin déviation (0 = jamais)", config.CIBLE_FIN_DEVIATION),
             ("ANGLE_DEVIATION", "Angle de déviation (°)", config.ANGLE_DEVIATION),
         ]
         
-        # Initialiser les champs
-        y_debut = self.titre_y + int(self.hauteur_fen * 0.12)
-        for i, (nom, label, valeur) in enumerate(self.definitions_champs):
-            y_champ = y_debut + i * self.espacement
-            self.champs.append({
-                'nom': nom,
-                'label': label,
-                'valeur': str(valeur),
-                'x_label': self.x_fen + int(self.largeur_fen * 0.1),
-                'y_label': y_champ,
-                'x_champ': self.x_fen + int(self.largeur_fen * 0.5),
-                'y_champ': y_champ,
-                'rect': pygame.Rect(
-                    self.x_fen + int(self.largeur_fen * 0.5),
-                    y_champ,
-                    self.largeur_champ,
-                    self.hauteur_champ
-                )
-            })
-        
-        # Boutons
-        self.hauteur_bouton = int(config.HAUTEUR * 0.06)
-        self.largeur_bouton = int(self.largeur_fen * 0.25)
-        self.y_bouton = self.y_fen + int(self.hauteur_fen * 0.85)
-        
-        # Bouton Sauvegarder
-        self.bouton_sauvegarder_rect = pygame.Rect(
-            self.x_fen + int(self.largeur_fen * 0.15),
-            self.y_bouton,
-            self.largeur_bouton,
-            self.hauteur_bouton
-        )
-        
-        # Bouton Annuler
-        self.bouton_annuler_rect = pygame.Rect(
-            self.x_fen + int(self.largeur_fen * 0.6),
-            self.y_bouton,
-            self.largeur_bouton,
-            self.hauteur_bouton
-        )
+        # Fenêtre modale sur un fond assombri (disposée d'après la taille de l'écran)
+        self.couche = Couche(self.disposer, fond=config.NOIR, opacite_fond=180)
+        self.panneau = self.couche.ajouter(Panneau())
+        self.titre = self.couche.ajouter(Etiquette("Configuration", 0.08))
+        self.labels = []
+        self.champs = []
+        for nom, label, valeur in self.definitions_champs:
+            self.labels.append(self.couche.ajouter(Etiquette(label, 0.04)))
+            self.champs.append(self.couche.ajouter(
+                ChampTexte(valeur, 0.035, caracteres_acceptes=_caractere_numerique, nom=nom)))
+        self.bouton_sauvegarder = self.couche.ajouter(Bouton("sauvegarder", "Sauvegarder", config.VERT, 0.04, 2))
+        self.bouton_annuler = self.couche.ajouter(Bouton("annuler", "Annuler", config.ROUGE, 0.04, 2))
     
-    def dessiner(self):
-        """Dessine l'interface de configuration"""
-        # Overlay semi-transparent
-        overlay = pygame.Surface((config.LARGEUR, config.HAUTEUR))
-        overlay.set_alpha(180)
-        overlay.fill(config.NOIR)
-        self.ecran.blit(overlay, (0, 0))
-        
-        # Fond de la fenêtre
-        fen_rect = pygame.Rect(
-            self.x_fen,
-            self.y_fen,
-            self.largeur_fen,
-            self.hauteur_fen
-        )
-        pygame.draw.rect(self.ecran, config.BLANC, fen_rect)
-        pygame.draw.rect(self.ecran, config.NOIR, fen_rect, 3)
+    def disposer(self):
+        """Place la fenêtre, les champs et les boutons (proportionnellement à l'écran)"""
+        # Dimensions de la fenêtre de configuration
+        largeur_fen = int(config.LARGEUR * 0.5)
+        hauteur_fen = int(config.HAUTEUR * 0.7)
+        x_fen = (config.LARGEUR - largeur_fen) // 2
+        y_fen = (config.HAUTEUR - hauteur_fen) // 2
+        self.panneau.placer((x_fen, y_fen, largeur_fen, hauteur_fen))
         
         # Titre
-        titre = self.font_titre.render("Configuration", True, config.NOIR)
-        titre_rect = titre.get_rect(center=(config.LARGEUR // 2, self.titre_y))
-        self.ecran.blit(titre, titre_rect)
+        titre_y = y_fen + int(hauteur_fen * 0.05)
+        self.titre.placer((config.LARGEUR // 2, titre_y))
+        
+        # Champs (label à gauche, saisie à droite)
+        hauteur_champ = int(config.HAUTEUR * 0.05)
+        largeur_champ = int(largeur_fen * 0.4)
+        espacement = int(config.HAUTEUR * 0.08)
+        y_debut = titre_y + int(hauteur_fen * 0.12)
+        for i, (label, champ) in enumerate(zip(self.labels, self.champs)):
+            y_champ = y_debut + i * espacement
+            label.placer((x_fen + int(largeur_fen * 0.1), y_champ), "topleft")
+            champ.placer((x_fen + int(largeur_fen * 0.5), y_champ, largeur_champ, hauteur_champ))
         
-        # Dessiner les champs
-        for champ in self.champs:
-            # Label
-            label = self.font_label.render(champ['label'], True, config.NOIR)
-            self.ecran.blit(label, (champ['x_label'], champ['y_label']))
-            
-            # Champ de saisie
-            couleur_bordure = config.ROUGE if self.champ_actif == champ else config.NOIR
-            pygame.draw.rect(self.ecran, config.BLANC, champ['rect'])
-            pygame.draw.rect(self.ecran, couleur_bordure, champ['rect'], 2)
-            
-            # Texte dans le champ
-            texte_affiche = champ['valeur']
-            if self.champ_actif == champ and pygame.time.get_ticks() % 1000 < 500:
-                texte_affiche += "|"  # Curseur clignotant
-            
-            texte_surface = self.font_champ.render(texte_affiche, True, config.NOIR)
-            # Limiter la largeur du texte
-            if texte_surface.get_width() > self.largeur_champ - 10:
-                while texte_surface.get_width() > self.largeur_champ - 30:
-                    texte_affiche = texte_affiche[:-1]
-                    texte_surface = self.font_champ.render(texte_affiche + "...", True, config.NOIR)
-            
-            self.ecran.blit(texte_surface, (champ['rect'].x + 5, champ['rect'].y + (self.hauteur_champ - texte_surface.get_height()) // 2))
+        # Boutons
+        hauteur_bouton = int(config.HAUTEUR * 0.06)
+        largeur_bouton = int(largeur_fen * 0.25)
+        y_bouton = y_fen + int(hauteur_fen * 0.85)
+        self.bouton_sauvegarder.placer((x_fen + int(largeur_fen * 0.15), y_bouton, largeur_bouton, hauteur_bouton))
+        self.bouton_annuler.placer((x_fen + int(largeur_fen * 0.6), y_bouton, largeur_bouton, hauteur_bouton))
+    
+    def activer_champ(self, champ):
+        """
+        Donne le focus à un champ
         
-        # Bouton Sauvegarder
-        pygame.draw.rect(self.ecran, config.VERT, self.bouton_sauvegarder_rect)
-        pygame.draw.rect(self.ecran, config.NOIR, self.bouton_sauvegarder_rect, 2)
-        texte_sauvegarder = self.font_label.render("Sauvegarder", True, config.BLANC)
-        texte_rect = texte_sauvegarder.get_rect(center=self.bouton_sauvegarder_rect.center)
-        self.ecran.blit(texte_sauvegarder, texte_rect)
+        Args:
+            champ: Champ à activer (None pour n'en activer aucun)
+        """
+        if self.champ_actif is not None:
+            self.champ_actif.definir_actif(False)
+        self.champ_actif = champ
+        if champ is not None:
+            champ.definir_actif(True)
+    
+    def dessiner(self):
+        """
+        Dessine l'interface de configuration
         
-        # Bouton Annuler
-        pygame.draw.rect(self.ecran, config.ROUGE, self.bouton_annuler_rect)
-        pygame.draw.rect(self.ecran, config.NOIR, self.bouton_annuler_rect, 2)
-        texte_annuler = self.font_label.render("Annuler", True, config.BLANC)
-        texte_rect = texte_annuler.get_rect(center=self.bouton_annuler_rect.center)
-        self.ecran.blit(texte_annuler, texte_rect)
+        Returns:
+            État de l'image dessinée (voir Couche.dessiner)
+        """
+        return self.couche.dessiner(self.ecran)
     
     def gerer_evenement(self, event):
         """
@@ -168,20 +112,15 @@ class InterfaceConfig:
         """
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Clic gauche
-                # Vérifier si on clique sur un champ
-                for champ in self.champs:
-                    if champ['rect'].collidepoint(event.pos):
-                        self.champ_actif = champ
-                        return None
-                
-                # Vérifier si on clique sur un bouton
-                if self.bouton_sauvegarder_rect.collidepoint(event.pos):
-                    return "sauvegarder"
-                elif self.bouton_annuler_rect.collidepoint(event.pos):
-                    return "annuler"
+                widget = self.couche.widget_a(event.pos)
+                if isinstance(widget, ChampTexte):
+                    self.activer_champ(widget)
+                    return None
+                if widget is not None:
+                    return widget.action
                 
                 # Clic ailleurs : désélectionner le champ actif
-                self.champ_actif = None
+                self.activer_champ(None)
         
         elif event.type == pygame.KEYDOWN:
             if self.champ_actif:
@@ -191,17 +130,13 @@ class InterfaceConfig:
                 elif event.key == pygame.K_TAB:
                     # Passer au champ suivant
                     index = self.champs.index(self.champ_actif)
-                    self.champ_actif = self.champs[(index + 1) % len(self.champs)]
+                    self.activer_champ(self.champs[(index + 1) % len(self.champs)])
                     return None
-                elif event.key == pygame.K_BACKSPACE:
-                    self.champ_actif['valeur'] = self.champ_actif['valeur'][:-1]
                 elif event.key == pygame.K_ESCAPE:
                     return "annuler"
                 else:
-                    # Ajouter le caractère si c'est un chiffre ou un signe moins
-                    caractere = event.unicode
-                    if caractere and (caractere.isdigit() or caractere == '-'):
-                        self.champ_actif['valeur'] += caractere
+                    # Retour arrière, chiffre ou signe moins
+                    self.champ_actif.gerer_touche(event)
         
         return None
     
@@ -215,21 +150,28 @@ class InterfaceConfig:
         valeurs = {}
         for champ in self.champs:
             try:
-                valeur = int(champ['valeur'])
+                valeur = int(champ.valeur)
                 # Vérifier les limites raisonnables
-                if champ['nom'] == 'RAYON_CIBLE' and (valeur < 10 or valeur > 200):
+                if champ.nom == 'RAYON_CIBLE' and (valeur < 10 or valeur > 200):
+                    return None
+                elif champ.nom == 'DUREE_AFFICHAGE_RESULTAT' and (valeur < 100 or valeur > 5000):
                     return None
-                elif champ['nom'] == 'DUREE_AFFICHAGE_RESULTAT' and (valeur < 100 or valeur > 5000):
+                elif champ.nom == 'NOMBRE_CIBLES_MAX' and (valeur < 1 or valeur > 100):
                     return None
-                elif champ['nom'] == 'NOMBRE_CIBLES_MAX' and (valeur < 1 or valeur > 100):
+                elif champ.nom == 'CIBLE_DEBUT_DEVIATION' and (valeur < 1 or valeur > 100):
                     return None
-                elif champ['nom'] == 'CIBLE_DEBUT_DEVIATION' and (valeur < 1 or valeur > 100):
+                elif champ.nom == 'CIBLE_FIN_DEVIATION' and (valeur < 0 or valeur > 100):
                     return None
-                elif champ['nom'] == 'ANGLE_DEVIATION' and (valeur < 0 or valeur > 180):
+                elif champ.nom == 'ANGLE_DEVIATION' and (valeur < 0 or valeur > 180):
                     return None
-                valeurs[champ['nom']] = valeur
+                valeurs[champ.nom] = valeur
             except ValueError:
                 return None
+        # Une fin de déviation au plus égale au début ferait passer de la référence à la post-adaptation
+        fin = valeurs.get('CIBLE_FIN_DEVIATION', config.CIBLE_FIN_DEVIATION)
+        debut = valeurs.get('CIBLE_DEBUT_DEVIATION', config.CIBLE_DEBUT_DEVIATION)
+        if 0 < fin <= debut:
+            return None
         return valeurs
     
     def sauvegarder_config(self):
@@ -253,7 +195,9 @@ class InterfaceConfig:
                 for i, ligne in enumerate(lignes):
                     # Chercher la ligne qui définit cette variable (sans les espaces en début)
                     if re.match(rf'^{nom}\s*=', ligne.strip()):
-                        lignes[i] = f"{nom} = {valeur}\n"
+                        # Garder le commentaire de fin de ligne
+                        commentaire = re.search(r'\s+#.*$', ligne.rstrip('\n'))
+                        lignes[i] = f"{nom} = {valeur}{commentaire.group(0) if commentaire else ''}\n"
                         break
             
             # Écrire le fichier modifié
@@ -263,6 +207,7 @@ class InterfaceConfig:
             # Mettre à jour les valeurs dans le module config
             for nom, valeur in valeurs.items():
                 setattr(config, nom, valeur)
+            invalider_dispositions()
             
             return True
         except Exception as e:
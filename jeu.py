@@ -2,29 +2,45 @@
 Module principal du jeu - Gère la boucle de jeu
 """
 import math
+import time
 import pygame
 import sys
 import config
+from polices import obtenir_police
 from cible import Cible
 from interface_fin import InterfaceFin
-from generateur_pdf import GenerateurPDF
-from dialogue_nom_fichier import DialogueNomFichier
+from metriques_essai import calculer_metriques_essai, metriques_session, resume_session
+from session import phase_essai, sauvegarder_session
+from cadence import CadenceurImages
+import traces
+import memoire
+import ramasse_miettes
+from rendu import RenduLogiciel
 
 
 class Jeu:
     """Classe principale gérant le jeu"""
     
-    def __init__(self, ecran):
+    def __init__(self, ecran, rendu=None):
         """
         Initialise le jeu
         
         Args:
             ecran: Surface pygame de la fenêtre (déjà créée)
+            rendu: Moteur de rendu (par défaut, rendu logiciel sur ecran)
         """
         self.ecran = ecran
+        self.rendu = rendu or RenduLogiciel(ecran)
+        
+        # Mode d'entrée relatif : souris capturée, position réelle accumulée à partir des déplacements
+        # bruts (ni bord d'écran qui bloque le mouvement, ni repositionnement du curseur système)
+        self.entree_relative = config.MODE_ENTREE == "relatif"
+        self.position_reelle_relative = (config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
+        if self.entree_relative:
+            self.capturer_souris(True)
         
         # Positionner le curseur au centre du cercle au démarrage du jeu
-        pygame.mouse.set_pos(config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
+        self.recentrer_curseur()
         
         # Position précédente du curseur pour détecter la traversée (position réelle, pas déviée)
         self.position_curseur_precedente = (config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
@@ -49,14 +65,24 @@ class Jeu:
         self.cible_precedente = None  # Position de la cible précédente pour l'affichage
         self.fin_de_partie = False  # Indique si on a atteint le nombre max de cibles
         
-        # Position déviée actuelle pour l'affichage du curseur
+        # Position déviée actuelle pour l'affichage du curseur (et celle du pas précédent, pour l'interpolation)
         self.position_deviée_actuelle = (config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
+        self.position_deviée_pas_precedent = self.position_deviée_actuelle
+        # Angle de déviation en radians (converti une fois plutôt qu'à chaque pas)
+        self.angle_deviation_rad = math.radians(config.ANGLE_DEVIATION)
         
         # Enregistrement des données pour le PDF
         self.donnees_chemins = []  # Liste de dictionnaires avec chemin, cible, point_traversee, temps_chemin
         self.chemin_actuel = []  # Liste des tuples (x, y, temps_ms) du curseur pour la tentative actuelle
         self.enregistrement_chemin = True  # Démarrer l'enregistrement pour la première cible
-        self.temps_debut_chemin = pygame.time.get_ticks()  # Temps de début de l'enregistrement du chemin
+        # Horloge de simulation : avance d'un pas fixe à chaque mise à jour, indépendamment de l'affichage
+        self.pas_simulation_ms = 1000 / config.FREQUENCE_SIMULATION
+        self.temps_simulation_ms = 0.0
+        self.horloge_simulation = time.perf_counter()  # Instant réel du dernier pas exécuté
+        self.temps_debut_chemin = self.temps_simulation_ms  # Temps de début de l'enregistrement du chemin
+        self.essais_a_analyser = []  # Essais terminés dont les métriques restent à calculer
+        self.echantillon_memoire_du = False  # Échantillon mémoire à prendre pendant l'affichage du résultat
+        self.collecte_gc_due = False  # Collecte du ramasse-miettes à lancer hors de l'enregistrement d'un essai
         
         # Interface de fin de partie
         self.interface_fin = InterfaceFin(ecran)
@@ -65,6 +91,32 @@ class Jeu:
         self.dialogue_actif = None
         self.popup_succes = None
         self.temps_popup = 0
+        
+        # Fenêtre de suivi de l'expérimentateur (processus séparé)
+        self.moniteur = None
+        if config.MONITEUR:
+            from moniteur import Moniteur  # Chargé seulement si le suivi est demandé
+            self.moniteur = Moniteur()
+            self.moniteur.lancer()
+            self.suivre_nouvel_essai()
+        
+        # Diffusion des métriques en direct (serveur HTTP dans son propre thread)
+        self.diffusion = None
+        if config.DIFFUSION:
+            from diffusion import ServeurDiffusion  # Chargé seulement si la diffusion est demandée
+            self.diffusion = ServeurDiffusion()
+            adresse = self.diffusion.demarrer()
+            if adresse is None:
+                self.diffusion = None
+            else:
+                print(f"Métriques en direct : {adresse}/flux")
+        
+        # Rendu anticipé des pages du rapport dans le cache (processus de basse priorité)
+        self.rendu_anticipe = None
+        if config.RENDU_ANTICIPE and config.CACHE_PAGES:
+            from rendu_anticipe import RenduAnticipe  # Chargé seulement si le rendu anticipé est demandé
+            self.rendu_anticipe = RenduAnticipe()
+            self.rendu_anticipe.lancer()
     
     def gerer_evenements(self):
         """Gère les événements du jeu"""
@@ -84,6 +136,8 @@ class Jeu:
                         self.dialogue_actif = None
                 elif event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_F9:
+                    traces.basculer()
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if self.dialogue_actif:
                     # Gérer les événements du dialogue
@@ -102,9 +156,27 @@ class Jeu:
                     elif action == "quitter":
                         self.running = False
                     elif action == "recuperer_donnees":
-                        # Ouvrir le dialogue pour demander le nom
+                        # Ouvrir le dialogue pour demander le nom (module chargé au premier usage)
+                        from dialogue_nom_fichier import DialogueNomFichier
                         self.dialogue_actif = DialogueNomFichier(self.ecran)
     
+    def mettre_a_jour_curseur(self):
+        """Gère le curseur système une fois par image (masqué pendant la déviation, main au survol des boutons de fin)"""
+        if not self.fin_de_partie:
+            # Masquer le curseur système si la déviation est active (toujours masqué en mode relatif)
+            pygame.mouse.set_visible(not (self.deviation_active() or self.entree_relative))
+            return
+        # Réafficher le curseur système pour la fin de partie
+        pygame.mouse.set_visible(True)
+        if self.dialogue_actif:
+            # Ne pas changer le curseur pendant le dialogue
+            return
+        position_souris = pygame.mouse.get_pos()
+        if self.interface_fin.est_sur_bouton(position_souris):
+            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
+        else:
+            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+    
     def detecter_traversee_cercle(self, position_actuelle):
         """
         Détecte si le curseur a traversé le cercle imaginaire
@@ -135,11 +207,18 @@ class Jeu:
         fx = x0 - cx
         fy = y0 - cy
         
+        c = fx * fx + fy * fy - r * r
+        if c < 0:
+            # Les deux positions dans le disque (presque tous les pas) : pas de traversée possible
+            gx = x1 - cx
+            gy = y1 - cy
+            if gx * gx + gy * gy < r * r:
+                return None
+        
         a = dx * dx + dy * dy
         if a == 0:
             return None
         b = 2 * (fx * dx + fy * dy)
-        c = fx * fx + fy * fy - r * r
         
         discriminant = b * b - 4 * a * c
         if discriminant < 0:
@@ -173,9 +252,10 @@ class Jeu:
         # Arrêter l'enregistrement du chemin et sauvegarder les données
         if self.enregistrement_chemin:
             # Ajouter le point de traversée au chemin avec son timestamp
-            temps_actuel = pygame.time.get_ticks()
-            temps_relatif = temps_actuel - self.temps_debut_chemin
+            temps_relatif = round(self.temps_simulation_ms - self.temps_debut_chemin)
             self.chemin_actuel.append((point_traversee[0], point_traversee[1], temps_relatif))
+            if self.moniteur is not None:
+                self.moniteur.ajouter_point(point_traversee[0], point_traversee[1])
             
             # Extraire les chemins (x, y) et les timestamps séparément pour compatibilité
             chemin_xy = [(p[0], p[1]) for p in self.chemin_actuel]
@@ -188,35 +268,32 @@ class Jeu:
                 'cible': (self.cible.x, self.cible.y),
                 'point_traversee': point_traversee
             })
+            # Les métriques (et l'échantillon mémoire) seront calculés pendant l'affichage du résultat
+            self.essais_a_analyser.append(self.donnees_chemins[-1])
+            self.echantillon_memoire_du = memoire.est_actif()
+            ramasse_miettes.fin_essai()
+            self.collecte_gc_due = True
             # Réinitialiser pour la prochaine tentative
             self.chemin_actuel = []
             self.enregistrement_chemin = False
         
         # Activer l'affichage du résultat
         self.en_affichage_resultat = True
-        self.temps_debut_resultat = pygame.time.get_ticks()
+        self.temps_debut_resultat = self.temps_simulation_ms
         
         print(f"Traversée détectée au point: x={point_traversee[0]}, y={point_traversee[1]}")
         print(f"Cible était à: x={self.cible_precedente[0]}, y={self.cible_precedente[1]}")
     
     def mettre_a_jour(self):
-        """Met à jour l'état du jeu"""
-        # Si fin de partie, gérer le curseur au survol des boutons
+        """Met à jour l'état du jeu (un pas fixe de simulation)"""
+        self.temps_simulation_ms += self.pas_simulation_ms
+        
+        # Si fin de partie, plus rien à simuler (le curseur est géré une fois par image, voir mettre_a_jour_curseur)
         if self.fin_de_partie:
-            # Réafficher le curseur système pour la fin de partie
-            pygame.mouse.set_visible(True)
-            if self.dialogue_actif:
-                # Ne pas changer le curseur pendant le dialogue
-                return
-            position_souris = pygame.mouse.get_pos()
-            if self.interface_fin.est_sur_bouton(position_souris):
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-            else:
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
             return
         
         # Obtenir la position actuelle du curseur (position réelle)
-        position_reelle = pygame.mouse.get_pos()
+        position_reelle = self.lire_position_reelle()
         
         # Appliquer la déviation au mouvement si nécessaire
         position_actuelle = self.appliquer_deviation_mouvement(position_reelle)
@@ -224,12 +301,6 @@ class Jeu:
         # Stocker la position déviée actuelle pour l'affichage
         self.position_deviée_actuelle = position_actuelle
         
-        # Masquer le curseur système si la déviation est active
-        if self.nombre_cibles >= config.CIBLE_DEBUT_DEVIATION:
-            pygame.mouse.set_visible(False)
-        else:
-            pygame.mouse.set_visible(True)
-        
         # Stocker la position précédente déviée pour la détection de traversée
         if not hasattr(self, 'position_curseur_precedente_deviée'):
             self.position_curseur_precedente_deviée = self.position_curseur_precedente
@@ -239,9 +310,10 @@ class Jeu:
             # Ajouter la position déviée au chemin avec son timestamp (éviter les doublons si le curseur ne bouge pas)
             if (not self.chemin_actuel or 
                 (position_actuelle[0], position_actuelle[1]) != (self.chemin_actuel[-1][0], self.chemin_actuel[-1][1])):
-                temps_actuel = pygame.time.get_ticks()
-                temps_relatif = temps_actuel - self.temps_debut_chemin
+                temps_relatif = round(self.temps_simulation_ms - self.temps_debut_chemin)
                 self.chemin_actuel.append((position_actuelle[0], position_actuelle[1], temps_relatif))
+                if self.moniteur is not None:
+                    self.moniteur.ajouter_point(position_actuelle[0], position_actuelle[1])
         
         # Détecter la traversée du cercle avec la position déviée
         point_traversee = self.detecter_traversee_cercle(position_actuelle)
@@ -254,11 +326,17 @@ class Jeu:
         
         # Vérifier si on doit terminer l'affichage du résultat
         if self.en_affichage_resultat:
-            temps_ecoule = pygame.time.get_ticks() - self.temps_debut_resultat
+            temps_ecoule = self.temps_simulation_ms - self.temps_debut_resultat
             if temps_ecoule >= config.DUREE_AFFICHAGE_RESULTAT:
                 # Vérifier si on a atteint le nombre maximum de cibles
                 if self.nombre_cibles >= config.NOMBRE_CIBLES_MAX:
                     self.fin_de_partie = True
+                    if self.entree_relative:
+                        # Rendre le curseur système pour l'interface de fin
+                        self.capturer_souris(False)
+                        pygame.mouse.set_pos(config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
+                    self.afficher_resume_session()
+                    self.collecte_gc_due = True
                 else:
                     # Générer une nouvelle cible sur le cercle
                     self.cible.generer_nouvelle_position_sur_cercle()
@@ -271,35 +349,42 @@ class Jeu:
                     self.cible_precedente = None
                     
                     # Repositionner le curseur au centre
-                    pygame.mouse.set_pos(config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
+                    self.recentrer_curseur()
                     self.position_curseur_precedente = (config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
                     self.position_curseur_precedente_deviée = (config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
                     self.position_deviée_actuelle = (config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
+                    self.position_deviée_pas_precedent = self.position_deviée_actuelle
                     
                     # Démarrer l'enregistrement du chemin pour la nouvelle tentative
                     self.enregistrement_chemin = True
-                    self.temps_debut_chemin = pygame.time.get_ticks()
+                    self.temps_debut_chemin = self.temps_simulation_ms
                     self.chemin_actuel = [(config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC, 0)]
+                    ramasse_miettes.debut_essai(self.nombre_cibles)
+                    self.suivre_nouvel_essai()
     
-    def dessiner(self):
-        """Dessine tous les éléments du jeu"""
+    def dessiner(self, interpolation=1.0):
+        """
+        Dessine tous les éléments du jeu
+        
+        Args:
+            interpolation: Position entre le pas de simulation précédent (0) et le dernier (1)
+                à laquelle dessiner le curseur
+        """
         # Remplir l'écran avec le fond
-        self.ecran.fill(config.BLEU_CIEL)
+        self.rendu.effacer(config.BLEU_CIEL)
         # Dessiner le cercle imaginaire (visible provisoirement)
-        pygame.draw.circle(
-            self.ecran,
-            config.NOIR,
-            (config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y),
-            config.CERCLE_RAYON,
-            2
+        self.rendu.dessiner_sprite(
+            ('cercle', config.CERCLE_RAYON),
+            rect_autour((config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y), config.CERCLE_RAYON),
+            lambda surface, rect: pygame.draw.circle(surface, config.NOIR, rect.center, config.CERCLE_RAYON, 2)
         )
         
         if self.en_affichage_resultat:
             # Mode affichage du résultat : afficher le point de traversée et la cible précédente
             if self.point_traversee:
                 # Dessiner un point visible à l'endroit de la traversée
-                pygame.draw.circle(self.ecran, config.VERT, self.point_traversee, 8)
-                pygame.draw.circle(self.ecran, config.NOIR, self.point_traversee, 8, 2)
+                self.rendu.dessiner_sprite(('point_traversee',), rect_autour(self.point_traversee, 8),
+                                           dessiner_point_traversee)
             
             # Dessiner la cible précédente (fantôme)
             if self.cible_precedente:
@@ -309,37 +394,142 @@ class Jeu:
                     config.RAYON_CIBLE
                 )
                 # Dessiner avec transparence (en gris clair)
-                cible_fantome.dessiner_fantome(self.ecran)
+                self.rendu.dessiner_sprite(
+                    ('cible_fantome', cible_fantome.rayon),
+                    rect_autour(self.cible_precedente, cible_fantome.rayon),
+                    lambda surface, rect: cible_fantome.dessiner_fantome(surface, rect.center)
+                )
         else:
             # Mode normal : dessiner la cible actuelle
-            self.cible.dessiner(self.ecran)
+            self.rendu.dessiner_sprite(
+                ('cible', self.cible.rayon),
+                rect_autour((self.cible.x, self.cible.y), self.cible.rayon),
+                lambda surface, rect: self.cible.dessiner(surface, rect.center)
+            )
         
         # Si fin de partie, dessiner l'interface
         if self.fin_de_partie:
-            self.interface_fin.dessiner()
+            self.rendu.preparer_interface()
+            self.rendu.noter_interface(self.interface_fin.dessiner())
         
         # Dessiner le dialogue si actif
         if self.dialogue_actif:
-            self.dialogue_actif.dessiner()
+            self.rendu.noter_interface(self.dialogue_actif.dessiner())
         
         # Dessiner la pop-up de succès si active
         if self.popup_succes:
             self.dessiner_popup_succes()
         
-        # Dessiner le curseur personnalisé si la déviation est active
-        if self.nombre_cibles >= config.CIBLE_DEBUT_DEVIATION and not self.fin_de_partie:
-            self.dessiner_curseur_personnalise()
+        # Dessiner le curseur personnalisé si la déviation est active (toujours en mode relatif)
+        if (self.deviation_active() or self.entree_relative) and not self.fin_de_partie:
+            self.dessiner_curseur_personnalise(interpolation)
+    
+    def avancer_simulation(self):
+        """
+        Exécute les pas fixes de simulation dus depuis le dernier appel, en temps réel.
+        L'entrée est échantillonnée à chaque pas tant que la boucle suit le rythme ; après une
+        image lente, les pas en retard ne peuvent plus lire la souris à leur instant : ils sont
+        regroupés en un seul pas, daté de l'instant de la lecture (l'horloge de simulation saute
+        les pas manqués), pour que les temps du chemin restent exacts.
+        
+        Returns:
+            Délai en secondes avant le prochain pas
+        """
+        pas_s = self.pas_simulation_ms / 1000
+        pas_dus = int((time.perf_counter() - self.horloge_simulation) / pas_s)
+        if pas_dus > config.PAS_SIMULATION_MAX_RATTRAPAGE:
+            # Trop de retard (ex. export du rapport) : abandonner le retard plutôt que le rejouer
+            self.horloge_simulation += (pas_dus - config.PAS_SIMULATION_MAX_RATTRAPAGE) * pas_s
+            pas_dus = config.PAS_SIMULATION_MAX_RATTRAPAGE
+        if pas_dus > 1:
+            # Pas en retard : une seule lecture de la souris, datée de maintenant et non d'instants passés
+            self.temps_simulation_ms += (pas_dus - 1) * self.pas_simulation_ms
+            self.horloge_simulation += (pas_dus - 1) * pas_s
+        if pas_dus > 0:
+            pygame.event.pump()  # Rafraîchir la position de la souris
+            self.position_deviée_pas_precedent = self.position_deviée_actuelle
+            with traces.span("mettre_a_jour"):
+                self.mettre_a_jour()
+            self.horloge_simulation += pas_s
+        return self.horloge_simulation + pas_s - time.perf_counter()
+    
+    def facteur_interpolation(self):
+        """Fraction écoulée du pas de simulation en cours, dans [0, 1]"""
+        ecoule = (time.perf_counter() - self.horloge_simulation) / (self.pas_simulation_ms / 1000)
+        return max(0.0, min(1.0, ecoule))
     
     def boucle_principale(self):
         """Boucle principale du jeu"""
-        clock = pygame.time.Clock()
+        cadenceur = CadenceurImages(vsync=bool(config.VSYNC))
+        print(f"Cadence d'affichage : {cadenceur.frequence} Hz")
+        
+        print(f"Simulation : {config.FREQUENCE_SIMULATION} Hz")
+        # Démarrage terminé : figer les objets existants et suspendre le ramasse-miettes pendant les essais
+        ramasse_miettes.demarrer()
+        if self.enregistrement_chemin:
+            ramasse_miettes.debut_essai(self.nombre_cibles)
+        self.horloge_simulation = time.perf_counter()
+        prochaine_diffusion = 0.0  # Instant de la prochaine publication des statistiques d'images
+        images_diffusees = 0
         
         while self.running:
-            self.gerer_evenements()
-            self.mettre_a_jour()
-            self.dessiner()
-            pygame.display.flip()
-            clock.tick(60)  # Limiter à 60 FPS
+            with traces.span("gerer_evenements"):
+                self.gerer_evenements()
+            self.avancer_simulation()
+            self.mettre_a_jour_curseur()
+            with traces.span("dessiner"):
+                self.dessiner(self.facteur_interpolation())
+            with traces.span("presenter"):
+                self.rendu.presenter()
+            
+            # Profiter de l'affichage du résultat pour calculer les métriques des essais terminés
+            if self.en_affichage_resultat:
+                with traces.span("analyser_essais_en_attente"):
+                    self.analyser_essais_en_attente()
+                if self.echantillon_memoire_du:
+                    with traces.span("echantillon_memoire"):
+                        memoire.echantillon(f"essai {len(self.donnees_chemins)}", "essai")
+                    self.echantillon_memoire_du = False
+            
+            # Collecte explicite pendant l'affichage du résultat ou à l'écran de fin, jamais pendant un essai
+            if self.collecte_gc_due and not self.enregistrement_chemin:
+                with traces.span("collecte_gc"):
+                    ramasse_miettes.collecter()
+                self.collecte_gc_due = False
+            
+            # Attendre précisément l'échéance de l'image suivante en continuant la simulation
+            with traces.span("attente_image"):
+                cadenceur.attendre(self.avancer_simulation)
+            if traces.est_actif() and cadenceur.erreurs_ms:
+                traces.compteur("cadence", erreur_ms=cadenceur.erreurs_ms[-1], duree_image_ms=cadenceur.durees_ms[-1])
+            # Statistiques des images depuis la publication précédente, pour le flux en direct (à cadence réduite)
+            if self.diffusion is not None and time.perf_counter() >= prochaine_diffusion:
+                self.diffusion.publier_images(cadenceur.statistiques(depuis=images_diffusees))
+                images_diffusees = len(cadenceur.erreurs_ms)
+                prochaine_diffusion = time.perf_counter() + 1 / config.DIFFUSION_IMAGES_PAR_SECONDE
+        
+        # Bilan du cadencement
+        statistiques = cadenceur.statistiques()
+        if statistiques:
+            print(f"Cadencement : erreur moyenne {statistiques['erreur_moyenne_ms']:.2f} ms, "
+                  f"95e centile {statistiques['erreur_p95_ms']:.2f} ms, "
+                  f"{statistiques['images_en_retard']} image(s) en retard sur {statistiques['images']}")
+        if config.JOURNAL_CADENCE:
+            print(f"Journal de cadencement : {cadenceur.ecrire_journal()}")
+        if traces.est_actif():
+            print(f"Trace enregistrée : {traces.arreter()}")
+        if memoire.est_actif():
+            memoire.afficher_resume()
+            print(f"Télémétrie mémoire : {memoire.ecrire_resume()}")
+        if ramasse_miettes.est_actif():
+            ramasse_miettes.afficher_resume()
+            ramasse_miettes.arreter()
+        if self.moniteur is not None:
+            self.moniteur.fermer()
+        if self.diffusion is not None:
+            self.diffusion.fermer()
+        if self.rendu_anticipe is not None:
+            self.rendu_anticipe.fermer()
         
         # Quitter pygame
         pygame.quit()
@@ -361,25 +551,129 @@ class Jeu:
         # Générer une nouvelle cible
         self.cible.generer_nouvelle_position_sur_cercle()
         
-        # Repositionner le curseur au centre
-        pygame.mouse.set_pos(config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
+        # Repositionner le curseur au centre (en reprenant la souris en mode relatif)
+        if self.entree_relative:
+            self.capturer_souris(True)
+        self.recentrer_curseur()
         self.position_curseur_precedente = (config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
         self.position_curseur_precedente_deviée = (config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
         self.position_deviée_actuelle = (config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
+        self.position_deviée_pas_precedent = self.position_deviée_actuelle
         
         # Réafficher le curseur système si nécessaire
-        if self.nombre_cibles < config.CIBLE_DEBUT_DEVIATION:
+        if not self.deviation_active() and not self.entree_relative:
             pygame.mouse.set_visible(True)
         
         # Réinitialiser les données
         self.donnees_chemins = []
         self.chemin_actuel = []
         self.enregistrement_chemin = False
+        self.essais_a_analyser = []
         
         # Démarrer l'enregistrement pour la première cible
         self.enregistrement_chemin = True
-        self.temps_debut_chemin = pygame.time.get_ticks()
+        self.temps_debut_chemin = self.temps_simulation_ms
         self.chemin_actuel = [(config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC, 0)]
+        ramasse_miettes.debut_essai(self.nombre_cibles)
+        if self.moniteur is not None:
+            self.moniteur.reinitialiser()
+        if self.diffusion is not None:
+            self.diffusion.reinitialiser()
+        if self.rendu_anticipe is not None:
+            self.rendu_anticipe.reinitialiser()
+        self.suivre_nouvel_essai()
+    
+    def suivre_nouvel_essai(self):
+        """Signale à la fenêtre de suivi (si elle est ouverte) le début de l'essai et son premier point"""
+        if self.moniteur is None:
+            return
+        self.moniteur.nouvel_essai(len(self.donnees_chemins), (self.cible.x, self.cible.y))
+        for x, y, _ in self.chemin_actuel:
+            self.moniteur.ajouter_point(x, y)
+    
+    def publier_metriques(self):
+        """Transmet les métriques des essais terminés à la fenêtre de suivi et au flux en direct (s'ils sont ouverts)"""
+        if self.moniteur is not None:
+            self.moniteur.publier_metriques(self.donnees_chemins)
+        if self.diffusion is not None:
+            self.diffusion.publier_essais(self.donnees_chemins)
+    
+    def analyser_essais_en_attente(self):
+        """
+        Calcule les métriques des essais terminés, dans la limite du budget de temps.
+        Les essais non traités restent en attente pour la prochaine fenêtre de résultat.
+        """
+        debut = time.perf_counter()
+        budget_s = config.BUDGET_CALCUL_METRIQUES_MS / 1000
+        while self.essais_a_analyser and time.perf_counter() - debut < budget_s:
+            essai = self.essais_a_analyser.pop(0)
+            calculer_metriques_essai(essai)
+            if self.rendu_anticipe is not None:
+                # Essai définitif : sa page peut être rendue sans attendre l'export
+                self.rendu_anticipe.soumettre_essai(len(self.donnees_chemins) - len(self.essais_a_analyser) - 1, essai)
+        self.publier_metriques()
+    
+    def afficher_resume_session(self):
+        """Affiche dans la console le résumé des métriques de la session"""
+        self.essais_a_analyser = []
+        resume = resume_session(metriques_session(self.donnees_chemins))
+        self.publier_metriques()
+        if self.rendu_anticipe is not None:
+            self.rendu_anticipe.soumettre_rapport(self.donnees_chemins)
+        if resume['erreur_angulaire_deg'] is not None:
+            print(f"Erreur angulaire moyenne : {resume['erreur_angulaire_deg']:.1f}°")
+        if resume['duree_ms'] is not None:
+            print(f"Durée moyenne : {resume['duree_ms']:.0f} ms")
+        if resume['temps_reaction_ms'] is not None:
+            print(f"Temps de réaction moyen : {resume['temps_reaction_ms']:.0f} ms")
+    
+    def deviation_active(self):
+        """
+        Indique si la cible actuelle est dans la phase de déviation
+        
+        Returns:
+            True entre CIBLE_DEBUT_DEVIATION (inclus) et CIBLE_FIN_DEVIATION (exclu, 0 = jamais)
+        """
+        return phase_essai(self.nombre_cibles) == "adaptation"
+    
+    def capturer_souris(self, capturer):
+        """
+        Capture la souris pour l'entrée relative, ou la libère
+        
+        Curseur système masqué et entrée capturée : SDL passe en mouvement relatif,
+        les déplacements ne sont plus bornés par les bords de l'écran.
+        
+        Args:
+            capturer: True pour capturer la souris, False pour la libérer
+        """
+        pygame.event.set_grab(capturer)
+        pygame.mouse.set_visible(not capturer)
+        pygame.mouse.get_rel()  # Oublier les déplacements accumulés
+    
+    def recentrer_curseur(self):
+        """Replace la position réelle du curseur au centre du cercle"""
+        if self.entree_relative:
+            # Pas de set_pos : il produirait un déplacement synthétique
+            self.position_reelle_relative = (config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
+            pygame.mouse.get_rel()
+        else:
+            pygame.mouse.set_pos(config.CURSEUR_X_APRES_CLIC, config.CURSEUR_Y_APRES_CLIC)
+    
+    def lire_position_reelle(self):
+        """
+        Position réelle (non déviée) du curseur
+        
+        Returns:
+            Tuple (x, y) : position du curseur système, ou en mode relatif position
+            accumulée à partir des déplacements bruts (peut sortir de l'écran)
+        """
+        if not self.entree_relative:
+            return pygame.mouse.get_pos()
+        dx, dy = pygame.mouse.get_rel()
+        if dx or dy:
+            x, y = self.position_reelle_relative
+            self.position_reelle_relative = (x + dx, y + dy)
+        return self.position_reelle_relative
     
     def appliquer_deviation_mouvement(self, position_reelle):
         """
@@ -392,8 +686,8 @@ class Jeu:
         Returns:
             Tuple (x, y) de la position déviée
         """
-        # Si on n'a pas encore atteint la cible de début de déviation, pas de déviation
-        if self.nombre_cibles < config.CIBLE_DEBUT_DEVIATION:
+        # En dehors de la phase d'adaptation, pas de déviation
+        if not self.deviation_active():
             return position_reelle
         
         # S'assurer que la position précédente déviée existe
@@ -416,7 +710,7 @@ class Jeu:
         angle_mouvement = math.atan2(dy_reel, dx_reel)
         
         # Ajouter la déviation de 30 degrés vers la droite (rotation dans le sens horaire)
-        angle_devié = angle_mouvement + math.radians(config.ANGLE_DEVIATION)
+        angle_devié = angle_mouvement + self.angle_deviation_rad
         
         # Calculer la longueur du vecteur de mouvement réel
         longueur = math.sqrt(dx_reel * dx_reel + dy_reel * dy_reel)
@@ -439,10 +733,24 @@ class Jeu:
             print("Aucune donnée à exporter")
             return
         
+        # Sauvegarder les données brutes de la session avant le rapport
+        chemin_session = sauvegarder_session(self.donnees_chemins, nom_fichier)
+        
+        # Laisser le rendu anticipé finir : l'export reprendra ses pages du cache
+        if self.rendu_anticipe is not None:
+            with traces.span("attente_rendu_anticipe", "rapport"):
+                self.rendu_anticipe.attendre()
+        
+        # matplotlib n'est importé qu'au premier rapport (démarrage plus rapide)
+        from generateur_pdf import GenerateurPDF
         generateur = GenerateurPDF()
-        chemin_fichier = generateur.generer_pdf(self.donnees_chemins, nom_fichier)
+        with traces.span("GenerateurPDF.generer_pdf", "rapport"):
+            chemin_fichier = generateur.generer_pdf(self.donnees_chemins, nom_fichier)
         
         if chemin_fichier:
+            if chemin_session:
+                from catalogue import associer_rapport
+                associer_rapport(chemin_session, chemin_fichier)
             # Afficher la pop-up de succès
             self.popup_succes = True
             self.temps_popup = pygame.time.get_ticks()
@@ -464,28 +772,66 @@ class Jeu:
         x_popup = config.LARGEUR - largeur_popup - 20
         y_popup = 20
         
-        # Fond de la pop-up
+        # Fond et texte de la pop-up (dessinés une seule fois)
         popup_rect = pygame.Rect(x_popup, y_popup, largeur_popup, hauteur_popup)
-        pygame.draw.rect(self.ecran, config.VERT, popup_rect)
-        pygame.draw.rect(self.ecran, config.NOIR, popup_rect, 2)
-        
-        # Texte
-        taille_texte = int(config.HAUTEUR * 0.04)
-        font = pygame.font.Font(None, taille_texte)
-        texte = font.render("PDF créé avec succès", True, config.BLANC)
-        texte_rect = texte.get_rect(center=popup_rect.center)
-        self.ecran.blit(texte, texte_rect)
+        self.rendu.dessiner_sprite(('popup_succes', popup_rect.size), popup_rect, dessiner_contenu_popup)
     
-    def dessiner_curseur_personnalise(self):
-        """Dessine un curseur personnalisé à la position déviée"""
-        x, y = self.position_deviée_actuelle
+    def dessiner_curseur_personnalise(self, interpolation=1.0):
+        """
+        Dessine un curseur personnalisé à la position déviée
+        
+        Args:
+            interpolation: Position entre le pas de simulation précédent (0) et le dernier (1)
+        """
+        x_prec, y_prec = self.position_deviée_pas_precedent
+        x_act, y_act = self.position_deviée_actuelle
+        x = int(round(x_prec + (x_act - x_prec) * interpolation))
+        y = int(round(y_prec + (y_act - y_prec) * interpolation))
         
         # Dessiner un curseur en forme de flèche simple
-        # Ligne verticale
-        pygame.draw.line(self.ecran, config.NOIR, (x, y - 10), (x, y + 10), 2)
-        # Ligne horizontale
-        pygame.draw.line(self.ecran, config.NOIR, (x - 10, y), (x + 10, y), 2)
-        # Point central
-        pygame.draw.circle(self.ecran, config.NOIR, (x, y), 3)
-        # Bordure blanche pour la visibilité
-        pygame.draw.circle(self.ecran, config.BLANC, (x, y), 4, 1)
+        self.rendu.dessiner_sprite(('curseur',), rect_autour((x, y), 11), dessiner_curseur)
+
+
+def rect_autour(centre, rayon):
+    """
+    Rectangle de côté 2 * rayon + 1 centré sur un point
+    
+    Args:
+        centre: Tuple (x, y) du centre
+        rayon: Demi-côté en pixels
+        
+    Returns:
+        pygame.Rect
+    """
+    return pygame.Rect(centre[0] - rayon, centre[1] - rayon, 2 * rayon + 1, 2 * rayon + 1)
+
+
+def dessiner_point_traversee(surface, rect):
+    """Dessine le point de traversée (disque vert cerclé de noir) au centre de rect"""
+    pygame.draw.circle(surface, config.VERT, rect.center, 8)
+    pygame.draw.circle(surface, config.NOIR, rect.center, 8, 2)
+
+
+def dessiner_contenu_popup(surface, rect):
+    """Dessine le fond et le texte de la pop-up de succès dans rect"""
+    pygame.draw.rect(surface, config.VERT, rect)
+    pygame.draw.rect(surface, config.NOIR, rect, 2)
+    
+    taille_texte = int(config.HAUTEUR * 0.04)
+    font = obtenir_police(taille_texte)
+    texte = font.render("PDF créé avec succès", True, config.BLANC)
+    texte_rect = texte.get_rect(center=rect.center)
+    surface.blit(texte, texte_rect)
+
+
+def dessiner_curseur(surface, rect):
+    """Dessine le curseur personnalisé (croix noire et point central) au centre de rect"""
+    x, y = rect.center
+    # Ligne verticale
+    pygame.draw.line(surface, config.NOIR, (x, y - 10), (x, y + 10), 2)
+    # Ligne horizontale
+    pygame.draw.line(surface, config.NOIR, (x - 10, y), (x + 10, y), 2)
+    # Point central
+    pygame.draw.circle(surface, config.NOIR, (x, y), 3)
+    # Bordure blanche pour la visibilité
+    pygame.draw.circle(surface, config.BLANC, (x, y), 4, 1)
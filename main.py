@@ -3,39 +3,64 @@ Point d'entrée principal du jeu
 """
 import pygame
 import sys
-from menu import Menu
-from jeu import Jeu
 import config
+import traces
+import memoire
+from polices import precharger_polices
+from rendu import creer_rendu
 
-if __name__ == "__main__":
-    # Initialiser pygame
-    pygame.init()
+
+def initialiser(tous_sous_systemes=False):
+    """
+    Initialise pygame et crée la fenêtre en plein écran
+    
+    Seuls l'affichage (qui inclut les événements), les polices et le minuteur sont
+    initialisés : le son, le joystick et la caméra ne servent pas au jeu.
     
-    # Obtenir les dimensions de l'écran et mettre à jour config
-    config.LARGEUR, config.HAUTEUR = config.obtenir_dimensions_ecran()
+    Args:
+        tous_sous_systemes: True pour initialiser tous les sous-systèmes (pygame.init)
+    
+    Returns:
+        Moteur de rendu de la fenêtre (voir rendu.creer_rendu)
+    """
+    if tous_sous_systemes:
+        pygame.init()
+    else:
+        pygame.display.init()
+        pygame.font.init()
+        # Démarre le minuteur SDL, sans lequel pygame.time.get_ticks reste à 0
+        pygame.time.wait(0)
     
-    # Définir le cercle imaginaire (centré et proportionnel à l'écran)
-    config.CERCLE_CENTRE_X = config.LARGEUR // 2
-    config.CERCLE_CENTRE_Y = config.HAUTEUR // 2
-    config.CERCLE_RAYON = int(min(config.LARGEUR, config.HAUTEUR) * 0.35)
+    # Obtenir les dimensions de l'écran et mettre à jour config (cercle, positions)
+    config.definir_geometrie(*config.obtenir_dimensions_ecran())
     
-    # Mettre à jour les positions liées au cercle
-    config.POSITION_X_INITIALE = config.CERCLE_CENTRE_X + config.CERCLE_RAYON
-    config.POSITION_Y_INITIALE = config.CERCLE_CENTRE_Y
-    config.CURSEUR_X_APRES_CLIC = config.CERCLE_CENTRE_X
-    config.CURSEUR_Y_APRES_CLIC = config.CERCLE_CENTRE_Y
+    # Créer la fenêtre en plein écran avec le moteur de rendu choisi
+    rendu = creer_rendu(vsync=bool(config.VSYNC))
+    
+    # Charger en une passe les polices de tous les écrans
+    precharger_polices()
+    return rendu
+
+
+if __name__ == "__main__":
+    if config.TRACES_AU_DEMARRAGE:
+        traces.demarrer()
+    if config.TELEMETRIE_MEMOIRE:
+        memoire.demarrer()
     
-    # Créer la fenêtre en plein écran
-    ecran = pygame.display.set_mode((config.LARGEUR, config.HAUTEUR), pygame.FULLSCREEN)
-    pygame.display.set_caption("Jeu de Cible")
+    with traces.span("initialiser", "interface"):
+        rendu = initialiser()
     
-    # Afficher le menu
-    menu = Menu(ecran)
-    demarrer_jeu = menu.boucle_menu()
+    # Afficher le menu (le jeu et ses dépendances ne sont importés qu'ensuite)
+    from menu import Menu
+    menu = Menu(rendu.surface, rendu)
+    with traces.span("Menu.boucle_menu", "interface"):
+        demarrer_jeu = menu.boucle_menu()
     
     # Si l'utilisateur a cliqué sur Start, lancer le jeu
     if demarrer_jeu:
-        jeu = Jeu(ecran)
+        from jeu import Jeu
+        jeu = Jeu(rendu.surface, rendu)
         jeu.boucle_principale()
     else:
         # Quitter pygame
@@ -0,0 +1,196 @@
+"""
+Module de télémétrie mémoire (optionnelle) : échantillons tracemalloc et RSS
+
+Les échantillons sont pris aux frontières d'essai et autour de chaque page du
+rapport. Chacun compare l'instantané tracemalloc au précédent pour attribuer la
+croissance aux lignes de code qui ont alloué. Quand la télémétrie est désactivée,
+echantillon() ne fait rien.
+
+Usage :
+    memoire.demarrer()
+    memoire.echantillon("essai 3", "essai")
+    memoire.ecrire_resume()
+"""
+import json
+import os
+import sys
+import tracemalloc
+from datetime import datetime
+import config
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Allocations ignorées : celles de tracemalloc lui-même et du système d'import
+_FILTRES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+_actif = False
+_instantane_initial = None
+_instantane_precedent = None
+_echantillons = []
+_au_dessus_du_budget = False
+
+
+def rss_mo():
+    """
+    Mémoire résidente actuelle du processus en Mo
+
+    Returns:
+        RSS actuelle (Linux), sinon pic de RSS (autres Unix), sinon None
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        pass
+    if resource is None:
+        return None
+    pic = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pic / (1024 * 1024) if sys.platform == 'darwin' else pic / 1024
+
+
+def _instantane():
+    return tracemalloc.take_snapshot().filter_traces(_FILTRES)
+
+
+def _sites_en_croissance(instantane, reference, nombre):
+    """Lignes de code dont les allocations ont le plus augmenté depuis reference."""
+    differences = instantane.compare_to(reference, 'lineno')
+    sites = []
+    for statistique in differences[:nombre]:
+        if statistique.size_diff <= 0:
+            break
+        cadre = statistique.traceback[0]
+        sites.append({
+            'site': f"{cadre.filename}:{cadre.lineno}",
+            'croissance_ko': statistique.size_diff / 1024,
+            'blocs': statistique.count_diff,
+        })
+    return sites
+
+
+def est_actif():
+    """Indique si la télémétrie mémoire est en cours."""
+    return _actif
+
+
+def demarrer(nombre_cadres=1):
+    """
+    Démarre tracemalloc et prend l'instantané de référence
+
+    Args:
+        nombre_cadres: Profondeur de pile enregistrée par allocation
+    """
+    global _actif, _instantane_initial, _instantane_precedent, _au_dessus_du_budget
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(nombre_cadres)
+    _instantane_initial = _instantane_precedent = _instantane()
+    _echantillons.clear()
+    _au_dessus_du_budget = False
+    _actif = True
+
+
+def arreter():
+    """Arrête tracemalloc (les échantillons restent disponibles pour le résumé)."""
+    global _actif
+    _actif = False
+    tracemalloc.stop()
+
+
+def echantillon(etiquette, categorie="essai"):
+    """
+    Enregistre la mémoire utilisée et les sites d'allocation en croissance depuis l'échantillon précédent
+
+    Args:
+        etiquette: Nom de l'échantillon (ex. "essai 3", "Essai 12 : après")
+        categorie: "essai" ou "rapport"
+    """
+    global _instantane_precedent, _au_dessus_du_budget
+    if not _actif:
+        return
+    actuelle, pic = tracemalloc.get_traced_memory()
+    instantane = _instantane()
+    rss = rss_mo()
+    _echantillons.append({
+        'etiquette': etiquette,
+        'categorie': categorie,
+        'rss_mo': rss,
+        'python_mo': actuelle / (1024 * 1024),
+        'python_pic_mo': pic / (1024 * 1024),
+        'sites': _sites_en_croissance(instantane, _instantane_precedent, 3),
+    })
+    _instantane_precedent = instantane
+
+    # Avertir au franchissement du budget (et non à chaque échantillon au-dessus)
+    utilisee = rss if rss is not None else actuelle / (1024 * 1024)
+    if utilisee > config.BUDGET_MEMOIRE_MO and not _au_dessus_du_budget:
+        print(f"Attention : mémoire {utilisee:.0f} Mo au-delà du budget de {config.BUDGET_MEMOIRE_MO} Mo ({etiquette})")
+    _au_dessus_du_budget = utilisee > config.BUDGET_MEMOIRE_MO
+
+
+def resume(nombre_sites=None):
+    """
+    Résume la télémétrie
+
+    Args:
+        nombre_sites: Nombre de sites d'allocation retenus (par défaut config.MEMOIRE_SITES_AFFICHES)
+
+    Returns:
+        Dictionnaire (RSS initiale, finale et maximale, pic Python, sites en croissance
+        depuis le démarrage, échantillons), ou None sans échantillon
+    """
+    if not _echantillons:
+        return None
+    nombre_sites = nombre_sites or config.MEMOIRE_SITES_AFFICHES
+    rss = [e['rss_mo'] for e in _echantillons if e['rss_mo'] is not None]
+    return {
+        'budget_mo': config.BUDGET_MEMOIRE_MO,
+        'rss_initiale_mo': rss[0] if rss else None,
+        'rss_finale_mo': rss[-1] if rss else None,
+        'rss_max_mo': max(rss) if rss else None,
+        'python_pic_mo': max(e['python_pic_mo'] for e in _echantillons),
+        'sites_en_croissance': _sites_en_croissance(_instantane_precedent, _instantane_initial, nombre_sites),
+        'echantillons': list(_echantillons),
+    }
+
+
+def afficher_resume():
+    """Affiche le résumé dans la console."""
+    bilan = resume()
+    if bilan is None:
+        return
+    if bilan['rss_max_mo'] is not None:
+        print(f"Mémoire : RSS {bilan['rss_initiale_mo']:.0f} -> {bilan['rss_finale_mo']:.0f} Mo "
+              f"(max {bilan['rss_max_mo']:.0f} Mo, budget {bilan['budget_mo']} Mo), "
+              f"pic Python {bilan['python_pic_mo']:.1f} Mo")
+    for site in bilan['sites_en_croissance']:
+        print(f"  +{site['croissance_ko']:.0f} Ko ({site['blocs']:+d} blocs) {site['site']}")
+
+
+def ecrire_resume(dossier=None):
+    """
+    Écrit le résumé au format JSON avec les sorties de la session
+
+    Args:
+        dossier: Dossier de destination (par défaut config.DOSSIER_SESSIONS)
+
+    Returns:
+        Chemin du fichier écrit, ou None sans échantillon
+    """
+    bilan = resume()
+    if bilan is None:
+        return None
+    dossier = dossier or config.DOSSIER_SESSIONS
+    if not os.path.exists(dossier):
+        os.makedirs(dossier)
+    chemin = os.path.join(dossier, f"memoire_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(chemin, 'w', encoding='utf-8') as f:
+        json.dump(bilan, f, indent=2, ensure_ascii=False)
+    return chemin
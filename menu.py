@@ -3,72 +3,52 @@ Module pour gérer le menu de démarrage
 """
 import pygame
 import config
+import traces
+from rendu import RenduLogiciel
+from widgets import Bouton, Couche, Etiquette
 
 
 class Menu:
     """Classe gérant le menu de démarrage"""
     
-    def __init__(self, ecran):
+    def __init__(self, ecran, rendu=None):
         """
         Initialise le menu
         
         Args:
             ecran: Surface pygame de la fenêtre
+            rendu: Moteur de rendu (par défaut, rendu logiciel sur ecran)
         """
         self.ecran = ecran
-        # Ajuster les tailles de police selon la taille de l'écran
-        taille_titre = int(config.HAUTEUR * 0.12)
-        taille_bouton = int(config.HAUTEUR * 0.08)
-        self.font_titre = pygame.font.Font(None, taille_titre)
-        self.font_bouton = pygame.font.Font(None, taille_bouton)
+        self.rendu = rendu or RenduLogiciel(ecran)
         
-        # Dimensions des boutons (proportionnelles à l'écran)
-        self.bouton_largeur = int(config.LARGEUR * 0.25)
-        self.bouton_hauteur = int(config.HAUTEUR * 0.1)
-        self.bouton_x = config.LARGEUR // 2 - self.bouton_largeur // 2
-        self.bouton_y_start = config.HAUTEUR // 2 + int(config.HAUTEUR * 0.08)
-        self.espacement_boutons = int(config.HAUTEUR * 0.05)
-        self.bouton_y_config = self.bouton_y_start + self.bouton_hauteur + self.espacement_boutons
+        # Widgets du menu (disposés d'après la taille de l'écran)
+        self.couche = Couche(self.disposer, fond=config.BLEU_CIEL)
+        self.titre = self.couche.ajouter(Etiquette("Jeu de Cible", 0.12))
+        self.bouton_start = self.couche.ajouter(Bouton("start", "START", config.ROUGE, 0.08))
+        self.bouton_config = self.couche.ajouter(Bouton("config", "CONFIG", (100, 100, 200), 0.08))  # Bleu
     
-    def dessiner(self):
-        """Dessine le menu"""
-        # Fond
-        self.ecran.fill(config.BLEU_CIEL)
-        
-        # Titre
-        titre = self.font_titre.render("Jeu de Cible", True, config.NOIR)
-        titre_rect = titre.get_rect(center=(config.LARGEUR // 2, config.HAUTEUR // 2 - 100))
-        self.ecran.blit(titre, titre_rect)
-        
-        # Bouton Start
-        bouton_start_rect = pygame.Rect(
-            self.bouton_x,
-            self.bouton_y_start,
-            self.bouton_largeur,
-            self.bouton_hauteur
-        )
-        pygame.draw.rect(self.ecran, config.ROUGE, bouton_start_rect)
-        pygame.draw.rect(self.ecran, config.NOIR, bouton_start_rect, 3)
-        
-        # Texte du bouton Start
-        texte_start = self.font_bouton.render("START", True, config.BLANC)
-        texte_rect = texte_start.get_rect(center=bouton_start_rect.center)
-        self.ecran.blit(texte_start, texte_rect)
+    def disposer(self):
+        """Place les widgets du menu (proportionnellement à l'écran)"""
+        bouton_largeur = int(config.LARGEUR * 0.25)
+        bouton_hauteur = int(config.HAUTEUR * 0.1)
+        bouton_x = config.LARGEUR // 2 - bouton_largeur // 2
+        bouton_y_start = config.HAUTEUR // 2 + int(config.HAUTEUR * 0.08)
+        espacement_boutons = int(config.HAUTEUR * 0.05)
         
-        # Bouton Config
-        bouton_config_rect = pygame.Rect(
-            self.bouton_x,
-            self.bouton_y_config,
-            self.bouton_largeur,
-            self.bouton_hauteur
-        )
-        pygame.draw.rect(self.ecran, (100, 100, 200), bouton_config_rect)  # Bleu
-        pygame.draw.rect(self.ecran, config.NOIR, bouton_config_rect, 3)
+        self.titre.placer((config.LARGEUR // 2, config.HAUTEUR // 2 - 100))
+        self.bouton_start.placer((bouton_x, bouton_y_start, bouton_largeur, bouton_hauteur))
+        self.bouton_config.placer((bouton_x, bouton_y_start + bouton_hauteur + espacement_boutons,
+                                   bouton_largeur, bouton_hauteur))
+    
+    def dessiner(self):
+        """
+        Dessine le menu
         
-        # Texte du bouton Config
-        texte_config = self.font_bouton.render("CONFIG", True, config.BLANC)
-        texte_rect = texte_config.get_rect(center=bouton_config_rect.center)
-        self.ecran.blit(texte_config, texte_rect)
+        Returns:
+            État de l'image dessinée (voir Couche.dessiner)
+        """
+        return self.couche.dessiner(self.ecran)
     
     def est_sur_bouton(self, position):
         """
@@ -80,25 +60,7 @@ class Menu:
         Returns:
             "start", "config" ou None
         """
-        x, y = position
-        bouton_start_rect = pygame.Rect(
-            self.bouton_x,
-            self.bouton_y_start,
-            self.bouton_largeur,
-            self.bouton_hauteur
-        )
-        bouton_config_rect = pygame.Rect(
-            self.bouton_x,
-            self.bouton_y_config,
-            self.bouton_largeur,
-            self.bouton_hauteur
-        )
-        
-        if bouton_start_rect.collidepoint(x, y):
-            return "start"
-        elif bouton_config_rect.collidepoint(x, y):
-            return "config"
-        return None
+        return self.couche.action_a(position)
     
     def est_clique_sur_bouton(self, position_clic):
         """
@@ -120,47 +82,49 @@ class Menu:
         Returns:
             True si le jeu doit démarrer, False pour quitter
         """
-        from interface_config import InterfaceConfig
-        
         running = True
         interface_config = None
         
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return False
-                elif event.type == pygame.KEYDOWN:
-                    if interface_config:
-                        # Gérer les événements de l'interface de config
-                        resultat = interface_config.gerer_evenement(event)
-                        if resultat == "sauvegarder":
-                            if interface_config.sauvegarder_config():
-                                interface_config = None
-                            # Sinon, rester dans l'interface (erreur de validation)
-                        elif resultat == "annuler":
-                            interface_config = None
-                    elif event.key == pygame.K_ESCAPE:
-                        if interface_config:
-                            interface_config = None
-                        else:
-                            return False
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Clic gauche
+            with traces.span("Menu.gerer_evenements", "interface"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        return False
+                    elif event.type == pygame.KEYDOWN:
                         if interface_config:
                             # Gérer les événements de l'interface de config
                             resultat = interface_config.gerer_evenement(event)
                             if resultat == "sauvegarder":
                                 if interface_config.sauvegarder_config():
                                     interface_config = None
+                                # Sinon, rester dans l'interface (erreur de validation)
                             elif resultat == "annuler":
                                 interface_config = None
-                        else:
-                            # Vérifier les boutons du menu
-                            bouton = self.est_sur_bouton(event.pos)
-                            if bouton == "start":
-                                return True
-                            elif bouton == "config":
-                                interface_config = InterfaceConfig(self.ecran)
+                        elif event.key == pygame.K_ESCAPE:
+                            if interface_config:
+                                interface_config = None
+                            else:
+                                return False
+                        elif event.key == pygame.K_F9:
+                            traces.basculer()
+                    elif event.type == pygame.MOUSEBUTTONDOWN:
+                        if event.button == 1:  # Clic gauche
+                            if interface_config:
+                                # Gérer les événements de l'interface de config
+                                resultat = interface_config.gerer_evenement(event)
+                                if resultat == "sauvegarder":
+                                    if interface_config.sauvegarder_config():
+                                        interface_config = None
+                                elif resultat == "annuler":
+                                    interface_config = None
+                            else:
+                                # Vérifier les boutons du menu
+                                bouton = self.est_sur_bouton(event.pos)
+                                if bouton == "start":
+                                    return True
+                                elif bouton == "config":
+                                    from interface_config import InterfaceConfig  # Chargée au premier usage
+                                    interface_config = InterfaceConfig(self.ecran)
             
             # Gérer le curseur au survol des boutons
             if not interface_config:
@@ -170,10 +134,13 @@ class Menu:
                 else:
                     pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
             
-            self.dessiner()
-            if interface_config:
-                interface_config.dessiner()
-            pygame.display.flip()
+            with traces.span("Menu.dessiner", "interface"):
+                self.rendu.preparer_interface(effacer=False)  # Le menu recouvre tout l'écran
+                self.rendu.noter_interface(self.dessiner())
+                if interface_config:
+                    self.rendu.noter_interface(interface_config.dessiner())
+            with traces.span("presenter", "interface"):
+                self.rendu.presenter()
         
         return False
 
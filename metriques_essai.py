@@ -0,0 +1,127 @@
+"""
+Module de calcul des métriques par essai (erreur angulaire, durée, longueur, cinématique)
+
+Les métriques sont mises en cache dans le dictionnaire de l'essai (clé 'metriques')
+pour que le jeu puisse les calculer au fil de la session et que le rapport
+n'ait plus qu'à les relire.
+"""
+import math
+import config
+from analyse_cinematique import analyser_cinematique
+from geometrie import point_intersection_chemin_cercle, angle_entre_vecteurs_deg, angle_signe_deg, longueur_chemin
+
+# Marqueurs cinématiques repris de analyser_cinematique
+NOMS_MARQUEURS = ('duree_ms', 'temps_reaction_ms', 'temps_mouvement_ms', 'vitesse_max',
+                  'temps_vitesse_max_ms', 'acceleration_max')
+
+
+def _metriques_geometriques(donnees):
+    """Calcule l'intersection avec le cercle orange, les erreurs angulaires et la longueur du chemin."""
+    centre = (config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y)
+    rayon_petit = config.CERCLE_RAYON / 10
+    chemin = donnees.get('chemin') or []
+    pt_intersection = point_intersection_chemin_cercle(chemin, centre, rayon_petit)
+    erreur = erreur_signee = None
+    if pt_intersection is not None:
+        erreur = angle_entre_vecteurs_deg(centre, pt_intersection, donnees['cible'])
+        erreur_signee = angle_signe_deg(centre, donnees['cible'], pt_intersection)
+    return {
+        'point_intersection': pt_intersection,
+        'erreur_angulaire_deg': erreur,
+        'erreur_angulaire_signee_deg': erreur_signee,
+        'longueur_chemin': longueur_chemin(chemin),
+    }
+
+
+def calculer_metriques(donnees_chemins):
+    """
+    Calcule les métriques d'une liste d'essais (analyse cinématique en un seul lot)
+
+    Args:
+        donnees_chemins: Liste de dictionnaires (voir GenerateurPDF.generer_pdf)
+
+    Returns:
+        Liste de dictionnaires de métriques, un par essai
+    """
+    cinematique = analyser_cinematique(donnees_chemins)
+    liste_metriques = []
+    for i, donnees in enumerate(donnees_chemins):
+        metriques = _metriques_geometriques(donnees)
+        for nom in NOMS_MARQUEURS:
+            valeur = float(cinematique[nom][i])
+            metriques[nom] = None if math.isnan(valeur) else valeur
+        valide = cinematique['valide'][i]
+        metriques['profil_temps_ms'] = cinematique['temps'][valide].copy()
+        metriques['profil_vitesse'] = cinematique['vitesse'][i][valide].copy()
+        liste_metriques.append(metriques)
+    return liste_metriques
+
+
+def calculer_metriques_essai(donnees):
+    """
+    Calcule et met en cache les métriques d'un essai
+
+    Args:
+        donnees: Dictionnaire de l'essai, complété par la clé 'metriques'
+
+    Returns:
+        Dictionnaire de métriques
+    """
+    donnees['metriques'] = calculer_metriques([donnees])[0]
+    return donnees['metriques']
+
+
+def metriques_session(donnees_chemins):
+    """
+    Retourne les métriques de tous les essais, en ne calculant que celles absentes du cache
+
+    Args:
+        donnees_chemins: Liste de dictionnaires (voir GenerateurPDF.generer_pdf)
+
+    Returns:
+        Liste de dictionnaires de métriques, un par essai
+    """
+    manquants = [donnees for donnees in donnees_chemins if 'metriques' not in donnees]
+    if manquants:
+        for donnees, metriques in zip(manquants, calculer_metriques(manquants)):
+            donnees['metriques'] = metriques
+    return [donnees['metriques'] for donnees in donnees_chemins]
+
+
+def resume_session(liste_metriques):
+    """
+    Résume les métriques d'une session (moyennes sur les essais disponibles)
+
+    Args:
+        liste_metriques: Liste de dictionnaires de métriques
+
+    Returns:
+        Dictionnaire {nom: moyenne ou None}
+    """
+    resume = {}
+    for nom in ('erreur_angulaire_deg', 'longueur_chemin') + NOMS_MARQUEURS:
+        valeurs = [m[nom] for m in liste_metriques if m.get(nom) is not None]
+        resume[nom] = sum(valeurs) / len(valeurs) if valeurs else None
+    return resume
+
+
+def exporter_metriques_csv(chemin_fichier, donnees_chemins, liste_metriques):
+    """
+    Écrit un fichier CSV avec une ligne de métriques par essai
+
+    Args:
+        chemin_fichier: Chemin du fichier CSV à créer
+        donnees_chemins: Liste de dictionnaires (voir GenerateurPDF.generer_pdf)
+        liste_metriques: Métriques des essais (voir metriques_session)
+
+    Returns:
+        Chemin du fichier créé
+    """
+    colonnes = ('erreur_angulaire_deg', 'erreur_angulaire_signee_deg', 'longueur_chemin') + NOMS_MARQUEURS
+    with open(chemin_fichier, 'w', encoding='utf-8') as f:
+        f.write("essai;cible_x;cible_y;" + ";".join(colonnes) + "\n")
+        for i, (donnees, metriques) in enumerate(zip(donnees_chemins, liste_metriques)):
+            cible_x, cible_y = donnees['cible']
+            valeurs = ["" if metriques[c] is None else f"{metriques[c]:.1f}" for c in colonnes]
+            f.write(f"{i + 1};{cible_x};{cible_y};" + ";".join(valeurs) + "\n")
+    return chemin_fichier
@@ -0,0 +1,502 @@
+"""
+Module d'ajustement des modèles d'adaptation à l'espace d'états (un et deux taux)
+
+La compensation x de la déviation évolue d'un essai à l'autre selon l'erreur
+e = p - x (p : perturbation de l'essai, l'angle de déviation en adaptation) :
+
+    un taux :   x(n+1) = A x(n) + B e(n)
+    deux taux : x = x_rapide + x_lent, chaque composante suivant la même règle
+                avec A_lent > A_rapide et B_rapide > B_lent
+
+L'erreur observée vaut p - x + biais + bruit gaussien ; le biais et l'écart-type
+du bruit sont estimés en forme close, il reste à optimiser les taux. La
+vraisemblance est évaluée en lot (un calcul par essai pour toutes les séries et
+tous les points proposés) et l'optimisation part de plusieurs points à la fois :
+toutes les instances de Nelder-Mead d'un lot avancent ensemble. Les sessions
+d'une étude sont réparties sur plusieurs processus.
+
+Usage : python modeles_adaptation.py sessions/*.json [--departs N] [--processus N] [--nom NOM]
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import numpy as np
+import config
+from session import phase_essai
+
+# Paramètres de chaque modèle, dans l'ordre des colonnes de 'parametres'
+MODELES = {
+    'un_taux': ('retention', 'taux_apprentissage'),
+    'deux_taux': ('retention_rapide', 'retention_lente', 'taux_rapide', 'taux_lent'),
+}
+NOMS_MODELES = {'un_taux': 'Un taux', 'deux_taux': 'Deux taux'}
+ECART_DEPARTS_CONVERGENTS = 0.01  # Écart de log-vraisemblance sous lequel un départ a trouvé le meilleur optimum
+
+
+def perturbations_protocole(nombre_essais, parametres=None):
+    """
+    Perturbation de chaque essai : l'angle de déviation pendant l'adaptation, 0 sinon
+
+    Args:
+        nombre_essais: Nombre d'essais
+        parametres: Paramètres de la session (par défaut, ceux de config)
+
+    Returns:
+        Tableau (nombre_essais,) en degrés
+    """
+    angle = config.ANGLE_DEVIATION if parametres is None else parametres['ANGLE_DEVIATION']
+    return np.array([angle if phase_essai(i + 1, parametres) == "adaptation" else 0.0
+                     for i in range(nombre_essais)], dtype=float)
+
+
+def _sigmoide(u):
+    with np.errstate(over='ignore'):
+        return 1.0 / (1.0 + np.exp(-u))
+
+
+def _logit(v):
+    return np.log(v / (1.0 - v))
+
+
+def parametres_naturels(modele, u):
+    """
+    Paramètres du modèle à partir des variables non contraintes de l'optimisation
+
+    Chaque taux est dans ]0, 1[ ; pour deux taux, A_rapide = A_lent x s et
+    B_lent = B_rapide x s' (s, s' dans ]0, 1[) garantissent l'ordre des composantes.
+
+    Args:
+        modele: 'un_taux' ou 'deux_taux'
+        u: Tableau (M, k) des variables non contraintes
+
+    Returns:
+        Tableau (M, k) dans l'ordre de MODELES[modele]
+    """
+    v = _sigmoide(np.atleast_2d(u))
+    if modele == 'un_taux':
+        return v
+    retention_lente, taux_rapide = v[:, 0], v[:, 2]
+    return np.column_stack((retention_lente * v[:, 1], retention_lente, taux_rapide, taux_rapide * v[:, 3]))
+
+
+def _departs_aleatoires(modele, nombre, generateur):
+    """Points de départ (nombre, k) tirés dans une plage plausible des paramètres, en variables non contraintes."""
+    if modele == 'un_taux':
+        return np.column_stack((_logit(generateur.uniform(0.5, 0.999, nombre)),
+                                _logit(generateur.uniform(0.01, 0.6, nombre))))
+    return np.column_stack((_logit(generateur.uniform(0.8, 0.999, nombre)),
+                            _logit(generateur.uniform(0.2, 0.95, nombre)),
+                            _logit(generateur.uniform(0.05, 0.6, nombre)),
+                            _logit(generateur.uniform(0.05, 0.9, nombre))))
+
+
+def _composantes(modele, parametres):
+    """Rétentions et taux d'apprentissage (M, composantes) de chaque composante du modèle."""
+    if modele == 'un_taux':
+        return parametres[:, [0]], parametres[:, [1]]
+    return parametres[:, [0, 1]], parametres[:, [2, 3]]
+
+
+def etats_modele(modele, parametres, perturbations):
+    """
+    Compensation prédite au début de chaque essai, composante par composante (un calcul par essai pour tout le lot)
+
+    Args:
+        modele: 'un_taux' ou 'deux_taux'
+        parametres: Tableau (M, k) dans l'ordre de MODELES[modele]
+        perturbations: Tableau (M, N) des perturbations de chaque série
+
+    Returns:
+        Tableau (M, N, composantes) en degrés (une composante pour un taux ; rapide, lente pour deux taux)
+    """
+    retentions, taux = _composantes(modele, np.atleast_2d(parametres))
+    nombre, n_essais = perturbations.shape
+    composantes = retentions.shape[1]
+    # Essais en colonnes contiguës : chaque pas de la récurrence lit et écrit des vecteurs (M,)
+    etats = np.zeros((composantes, n_essais, nombre))
+    p = np.ascontiguousarray(perturbations.T)
+    with np.errstate(over='ignore', invalid='ignore'):
+        if composantes == 1:
+            # x(n+1) = (A - B) x(n) + B p(n)
+            a, b = retentions[:, 0] - taux[:, 0], taux[:, 0]
+            x = etats[0]
+            for n in range(1, n_essais):
+                np.multiply(a, x[n - 1], out=x[n])
+                x[n] += b * p[n - 1]
+        else:
+            (a_r, a_l), (b_r, b_l) = retentions.T, taux.T
+            x_r, x_l = etats
+            for n in range(1, n_essais):
+                erreur = p[n - 1] - x_r[n - 1] - x_l[n - 1]
+                x_r[n] = a_r * x_r[n - 1] + b_r * erreur
+                x_l[n] = a_l * x_l[n - 1] + b_l * erreur
+    return etats.transpose(2, 1, 0)
+
+
+def _ajustement_biais(modele, parametres, erreurs, perturbations):
+    """Résidus centrés, biais et effectifs pour des paramètres donnés (essais manquants : NaN dans erreurs)."""
+    masque = ~np.isnan(erreurs)
+    compensation = etats_modele(modele, parametres, perturbations).sum(axis=2)
+    residus = np.where(masque, erreurs - (perturbations - compensation), 0.0)
+    effectifs = masque.sum(axis=1)
+    biais = residus.sum(axis=1) / effectifs
+    residus = np.where(masque, residus - biais[:, None], 0.0)
+    return residus, biais, effectifs
+
+
+def log_vraisemblance_negative(modele, u, erreurs, perturbations):
+    """
+    Opposé de la log-vraisemblance de chaque série, biais et écart-type du bruit à leur optimum
+
+    Args:
+        modele: 'un_taux' ou 'deux_taux'
+        u: Tableau (M, k) des variables non contraintes
+        erreurs: Tableau (M, N) des erreurs signées (NaN : essai manquant)
+        perturbations: Tableau (M, N)
+
+    Returns:
+        Tableau (M,) ; inf si la prédiction diverge
+    """
+    residus, _, effectifs = _ajustement_biais(modele, parametres_naturels(modele, u), erreurs, perturbations)
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        variance = np.maximum((residus * residus).sum(axis=1) / effectifs, 1e-12)
+        valeurs = 0.5 * effectifs * (np.log(2 * np.pi * variance) + 1)
+    return np.where(np.isfinite(valeurs), valeurs, np.inf)
+
+
+def nelder_mead_lot(fonction, departs, pas_initial=0.5, iterations_max=1000, tolerance_valeur=1e-4,
+                    tolerance_points=1e-3):
+    """
+    Minimise une fonction depuis plusieurs points de départ à la fois (Nelder-Mead en lot)
+
+    Toutes les instances avancent ensemble : à chaque étape, les points proposés
+    par les instances encore actives sont évalués en un seul appel. Une instance
+    s'arrête quand les valeurs et les sommets de son simplexe sont sous les
+    tolérances, ou dès que ses valeurs ne diffèrent plus du tout : le simplexe
+    glisse alors le long d'une direction où la fonction est plate (paramètre non
+    identifiable, par exemple deux composantes confondues) sans jamais se resserrer.
+
+    Args:
+        fonction: fonction(points (M, d), instances (M,)) -> valeurs (M,), où
+            instances indique l'instance (indice de départ) de chaque point
+        departs: Tableau (I, d) des points de départ
+        pas_initial: Longueur des arêtes du simplexe initial
+        iterations_max: Nombre maximal d'itérations
+        tolerance_valeur, tolerance_points: Critères d'arrêt (absolus)
+
+    Returns:
+        Tuple (points (I, d), valeurs (I,), iterations (I,)) : meilleur sommet de chaque instance
+    """
+    departs = np.array(departs, dtype=float)
+    nombre, d = departs.shape
+    simplexes = np.repeat(departs[:, None, :], d + 1, axis=1)
+    simplexes[:, 1:] += pas_initial * np.eye(d)
+    valeurs = fonction(simplexes.reshape(-1, d), np.repeat(np.arange(nombre), d + 1)).reshape(nombre, d + 1)
+    iterations = np.zeros(nombre, dtype=np.int64)
+    actives = np.arange(nombre)
+    for _ in range(iterations_max + 1):
+        # Sommets des instances actives, du meilleur au pire
+        ordre = np.argsort(valeurs[actives], axis=1)
+        S = np.take_along_axis(simplexes[actives], ordre[:, :, None], axis=1)
+        V = np.take_along_axis(valeurs[actives], ordre, axis=1)
+        simplexes[actives], valeurs[actives] = S, V
+        with np.errstate(invalid='ignore'):
+            ecarts = V[:, -1] - V[:, 0]
+            convergees = (((ecarts <= tolerance_valeur)
+                           & (np.abs(S[:, 1:] - S[:, :1]).max(axis=(1, 2)) <= tolerance_points))
+                          | (ecarts <= tolerance_valeur * 1e-4))
+        garder = ~convergees & (iterations[actives] < iterations_max)
+        actives, S, V = actives[garder], S[garder], V[garder]
+        if not len(actives):
+            break
+        iterations[actives] += 1
+
+        centroides = S[:, :-1].mean(axis=1)
+        pires = S[:, -1]
+        reflechis = 2 * centroides - pires
+        f_reflechis = fonction(reflechis, actives)
+        nouveaux, f_nouveaux = reflechis.copy(), f_reflechis.copy()
+
+        # Expansion au-delà du point réfléchi s'il est meilleur que le meilleur sommet
+        expansion = np.flatnonzero(f_reflechis < V[:, 0])
+        if len(expansion):
+            etendus = 3 * centroides[expansion] - 2 * pires[expansion]
+            f_etendus = fonction(etendus, actives[expansion])
+            meilleurs = f_etendus < f_reflechis[expansion]
+            nouveaux[expansion[meilleurs]] = etendus[meilleurs]
+            f_nouveaux[expansion[meilleurs]] = f_etendus[meilleurs]
+
+        # Contraction (extérieure ou intérieure) si le point réfléchi n'améliore pas le deuxième pire sommet
+        contraction = np.flatnonzero(~(f_reflechis < V[:, -2]))
+        if len(contraction):
+            exterieure = f_reflechis[contraction] < V[contraction, -1]
+            c = centroides[contraction]
+            contractes = np.where(exterieure[:, None], c + 0.5 * (reflechis[contraction] - c),
+                                  c + 0.5 * (pires[contraction] - c))
+            f_contractes = fonction(contractes, actives[contraction])
+            acceptes = np.where(exterieure, f_contractes <= f_reflechis[contraction],
+                                f_contractes < V[contraction, -1])
+            nouveaux[contraction] = contractes
+            f_nouveaux[contraction] = f_contractes
+            # Réduction du simplexe vers son meilleur sommet
+            reduction = contraction[~acceptes]
+            if len(reduction):
+                meilleurs = S[reduction, :1]
+                S[reduction, 1:] = meilleurs + 0.5 * (S[reduction, 1:] - meilleurs)
+                V[reduction, 1:] = fonction(S[reduction, 1:].reshape(-1, d),
+                                            np.repeat(actives[reduction], d)).reshape(len(reduction), d)
+                nouveaux[reduction] = S[reduction, -1]
+                f_nouveaux[reduction] = V[reduction, -1]
+        S[:, -1], V[:, -1] = nouveaux, f_nouveaux
+        simplexes[actives], valeurs[actives] = S, V
+
+    meilleurs = np.argmin(valeurs, axis=1)
+    lignes = np.arange(nombre)
+    return simplexes[lignes, meilleurs], valeurs[lignes, meilleurs], iterations
+
+
+def asymptotes(modele, parametres, perturbation):
+    """
+    Compensation atteinte à l'équilibre sous une perturbation constante
+
+    Chaque composante s'équilibre à B e / (1 - A) : avec g la somme des B / (1 - A),
+    la compensation vaut p g / (1 + g).
+
+    Args:
+        modele: 'un_taux' ou 'deux_taux'
+        parametres: Tableau (M, k)
+        perturbation: Perturbation constante (°), scalaire ou tableau (M,)
+
+    Returns:
+        Tableau (M,) en degrés
+    """
+    retentions, taux = _composantes(modele, np.atleast_2d(parametres))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gain = (taux / (1.0 - retentions)).sum(axis=1)
+        return np.where(np.isinf(gain), 1.0, gain / (1.0 + gain)) * perturbation
+
+
+def ajuster_modele(modele, erreurs, perturbations, departs, iterations_max=None):
+    """
+    Ajuste un modèle à plusieurs séries d'erreurs (toutes les séries et tous les départs en un lot)
+
+    Args:
+        modele: 'un_taux' ou 'deux_taux'
+        erreurs: Tableau (S, N) des erreurs signées (NaN : essai manquant ou absent)
+        perturbations: Tableau (S, N)
+        departs: Tableau (S, D, k) des points de départ, en variables non contraintes
+        iterations_max: Itérations maximales (par défaut config.AJUSTEMENT_ITERATIONS_MAX)
+
+    Returns:
+        Dictionnaire de tableaux, une ligne par série (NaN si la série a trop peu d'essais) :
+            - 'parametres' (S, k) dans l'ordre de MODELES[modele]
+            - 'biais', 'sigma' : biais et écart-type du bruit d'observation (°)
+            - 'log_vraisemblance', 'aic', 'bic', 'observations'
+            - 'asymptote_deg' : compensation à l'équilibre sous la déviation de la série
+            - 'courbe' (S, N) : erreurs prédites, biais compris
+            - 'etats' (S, N, composantes) : compensation prédite de chaque composante
+            - 'departs_convergents' : part des départs arrivés au meilleur optimum
+            - 'iterations' : itérations du meilleur départ
+    """
+    iterations_max = iterations_max or config.AJUSTEMENT_ITERATIONS_MAX
+    erreurs = np.atleast_2d(np.asarray(erreurs, dtype=float))
+    perturbations = np.atleast_2d(np.asarray(perturbations, dtype=float))
+    nombre, n_essais = erreurs.shape
+    k = len(MODELES[modele])
+    n_parametres = k + 2  # Taux, biais et écart-type du bruit
+    observations = (~np.isnan(erreurs)).sum(axis=1)
+    ajustables = np.flatnonzero(observations > n_parametres)
+
+    resultats = {
+        'parametres': np.full((nombre, k), np.nan),
+        'biais': np.full(nombre, np.nan),
+        'sigma': np.full(nombre, np.nan),
+        'log_vraisemblance': np.full(nombre, np.nan),
+        'aic': np.full(nombre, np.nan),
+        'bic': np.full(nombre, np.nan),
+        'observations': observations,
+        'asymptote_deg': np.full(nombre, np.nan),
+        'courbe': np.full((nombre, n_essais), np.nan),
+        'etats': np.full((nombre, n_essais, 1 if modele == 'un_taux' else 2), np.nan),
+        'departs_convergents': np.full(nombre, np.nan),
+        'iterations': np.zeros(nombre, dtype=np.int64),
+    }
+    if not len(ajustables):
+        return resultats
+
+    n_departs = departs.shape[1]
+    series = np.repeat(ajustables, n_departs)  # Série de chaque instance d'optimisation
+
+    def fonction(points, instances):
+        lignes = series[instances]
+        return log_vraisemblance_negative(modele, points, erreurs[lignes], perturbations[lignes])
+
+    points, valeurs, iterations = nelder_mead_lot(fonction, departs[ajustables].reshape(-1, k),
+                                                  iterations_max=iterations_max)
+    valeurs = valeurs.reshape(len(ajustables), n_departs)
+    meilleurs = np.argmin(valeurs, axis=1)
+    u = points.reshape(len(ajustables), n_departs, k)[np.arange(len(ajustables)), meilleurs]
+    naturels = parametres_naturels(modele, u)
+    nll = valeurs[np.arange(len(ajustables)), meilleurs]
+
+    residus, biais, effectifs = _ajustement_biais(modele, naturels, erreurs[ajustables], perturbations[ajustables])
+    etats = etats_modele(modele, naturels, perturbations[ajustables])
+    # Déviation de chaque série (la plus grande perturbation en valeur absolue)
+    p = perturbations[ajustables]
+    deviation = p[np.arange(len(ajustables)), np.argmax(np.abs(p), axis=1)]
+
+    resultats['parametres'][ajustables] = naturels
+    resultats['biais'][ajustables] = biais
+    resultats['sigma'][ajustables] = np.sqrt((residus * residus).sum(axis=1) / effectifs)
+    resultats['log_vraisemblance'][ajustables] = -nll
+    resultats['aic'][ajustables] = 2 * n_parametres + 2 * nll
+    resultats['bic'][ajustables] = n_parametres * np.log(effectifs) + 2 * nll
+    resultats['asymptote_deg'][ajustables] = asymptotes(modele, naturels, deviation)
+    resultats['courbe'][ajustables] = p - etats.sum(axis=2) + biais[:, None]
+    resultats['etats'][ajustables] = etats
+    resultats['departs_convergents'][ajustables] = (valeurs - nll[:, None] <= ECART_DEPARTS_CONVERGENTS).mean(axis=1)
+    resultats['iterations'][ajustables] = iterations.reshape(len(ajustables), n_departs)[
+        np.arange(len(ajustables)), meilleurs]
+    return resultats
+
+
+def _ajuster_paquet(erreurs, perturbations, departs_par_modele, iterations_max):
+    """Ajuste tous les modèles à un paquet de séries (exécuté dans un processus)."""
+    return {modele: ajuster_modele(modele, erreurs, perturbations, departs, iterations_max)
+            for modele, departs in departs_par_modele.items()}
+
+
+def ajuster_series(erreurs, perturbations, departs=None, graine=0, processus=None, iterations_max=None):
+    """
+    Ajuste les deux modèles à plusieurs séries, réparties sur plusieurs processus
+
+    Args:
+        erreurs: Tableau (S, N) des erreurs signées (NaN : essai manquant)
+        perturbations: Tableau (S, N)
+        departs: Nombre de points de départ par série (par défaut config.AJUSTEMENT_DEPARTS)
+        graine: Graine des points de départ (résultat indépendant du nombre de processus)
+        processus: Nombre de processus (1 = calcul dans le processus courant)
+        iterations_max: Voir ajuster_modele
+
+    Returns:
+        Dictionnaire {modele: résultats de ajuster_modele}
+    """
+    erreurs = np.atleast_2d(np.asarray(erreurs, dtype=float))
+    perturbations = np.atleast_2d(np.asarray(perturbations, dtype=float))
+    nombre = len(erreurs)
+    departs = departs or config.AJUSTEMENT_DEPARTS
+    generateur = np.random.default_rng(graine)
+    departs_par_modele = {modele: _departs_aleatoires(modele, nombre * departs, generateur).reshape(nombre, departs, -1)
+                          for modele in MODELES}
+
+    processus = processus or os.cpu_count() or 1
+    paquets = np.array_split(np.arange(nombre), min(processus, nombre)) if nombre else []
+    arguments = [(erreurs[lignes], perturbations[lignes],
+                  {modele: d[lignes] for modele, d in departs_par_modele.items()}, iterations_max)
+                 for lignes in paquets]
+    if len(arguments) < 2:
+        morceaux = [_ajuster_paquet(*a) for a in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=len(arguments)) as executeur:
+            morceaux = list(executeur.map(_ajuster_paquet, *zip(*arguments)))
+    return {modele: {cle: np.concatenate([m[modele][cle] for m in morceaux]) for cle in morceaux[0][modele]}
+            for modele in MODELES} if morceaux else {}
+
+
+def ajuster_session(erreurs, parametres=None, departs=None, graine=0):
+    """
+    Ajuste les deux modèles aux erreurs signées d'une session (dans le processus courant)
+
+    Args:
+        erreurs: Erreurs signées de chaque essai (None ou NaN si indisponible)
+        parametres: Paramètres de la session (par défaut, ceux de config)
+        departs, graine: Voir ajuster_series
+
+    Returns:
+        Dictionnaire {modele: dictionnaire des résultats de la série} ; un modèle
+        est absent si la session a trop peu d'essais pour lui
+    """
+    serie = np.array([np.nan if e is None else e for e in erreurs], dtype=float)
+    perturbations = perturbations_protocole(len(serie), parametres)
+    resultats = ajuster_series(serie[None, :], perturbations[None, :], departs, graine, processus=1)
+    return {modele: {cle: valeurs[0] for cle, valeurs in r.items()}
+            for modele, r in resultats.items() if not np.isnan(r['log_vraisemblance'][0])}
+
+
+def ajuster_etude(sessions, departs=None, graine=0, processus=None):
+    """
+    Ajuste les deux modèles à chaque session d'une étude
+
+    Args:
+        sessions: Liste renvoyée par analyse_groupe.charger_sessions
+        departs, graine, processus: Voir ajuster_series
+
+    Returns:
+        Dictionnaire avec 'noms' et, pour chaque modèle, les résultats de ajuster_modele
+        (une ligne par session, essais alignés sur la plus longue)
+    """
+    n_max = max((len(s['erreurs']) for s in sessions), default=0)
+    erreurs = np.full((len(sessions), n_max), np.nan)
+    perturbations = np.zeros((len(sessions), n_max))
+    for i, session in enumerate(sessions):
+        n = len(session['erreurs'])
+        erreurs[i, :n] = session['erreurs']
+        perturbations[i, :n] = perturbations_protocole(n, session['parametres'])
+    resultats = ajuster_series(erreurs, perturbations, departs, graine, processus)
+    resultats['noms'] = [s['nom'] for s in sessions]
+    return resultats
+
+
+def exporter_ajustements_csv(chemin_fichier, resultats):
+    """
+    Écrit un fichier CSV avec une ligne par session et par modèle
+
+    Args:
+        chemin_fichier: Chemin du fichier CSV à créer
+        resultats: Dictionnaire renvoyé par ajuster_etude
+
+    Returns:
+        Chemin du fichier créé
+    """
+    noms_parametres = [nom for modele in MODELES for nom in MODELES[modele]]
+    colonnes = noms_parametres + ['asymptote_deg', 'biais', 'sigma', 'log_vraisemblance', 'aic', 'bic',
+                                  'departs_convergents']
+    with open(chemin_fichier, 'w', encoding='utf-8') as f:
+        f.write("session;modele;essais;" + ";".join(colonnes) + "\n")
+        for modele, noms in MODELES.items():
+            r = resultats[modele]
+            for i, nom_session in enumerate(resultats['noms']):
+                valeurs = {nom: r['parametres'][i, j] for j, nom in enumerate(noms)}
+                valeurs.update({cle: r[cle][i] for cle in colonnes if cle in r})
+                cellules = ["" if nom not in valeurs or np.isnan(valeurs[nom]) else f"{valeurs[nom]:.4f}"
+                            for nom in colonnes]
+                f.write(f"{nom_session};{modele};{r['observations'][i]};" + ";".join(cellules) + "\n")
+    return chemin_fichier
+
+
+if __name__ == "__main__":
+    from analyse_groupe import charger_sessions
+
+    parseur = argparse.ArgumentParser(description="Ajustement des modèles d'adaptation à chaque session")
+    parseur.add_argument('fichiers', nargs='+', help="Fichiers de session (.json)")
+    parseur.add_argument('--departs', type=int, default=None, help="Points de départ par session et par modèle")
+    parseur.add_argument('--processus', type=int, default=None, help="Nombre de processus")
+    parseur.add_argument('--nom', default=None, help="Nom du fichier CSV (dans pdf/)")
+    arguments = parseur.parse_args()
+
+    debut = time.perf_counter()
+    sessions = charger_sessions(arguments.fichiers, arguments.processus)
+    resultats = ajuster_etude(sessions, arguments.departs, processus=arguments.processus)
+    if not os.path.exists("pdf"):
+        os.makedirs("pdf")
+    nom = arguments.nom or f"modeles_adaptation_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    chemin = exporter_ajustements_csv(os.path.join("pdf", f"{nom}.csv"), resultats)
+    for modele in MODELES:
+        r = resultats[modele]
+        print(f"{NOMS_MODELES[modele]} : asymptote médiane {np.nanmedian(r['asymptote_deg']):.1f}°, "
+              f"AIC médian {np.nanmedian(r['aic']):.1f}")
+    meilleur_deux_taux = np.sum(resultats['deux_taux']['aic'] < resultats['un_taux']['aic'])
+    print(f"Deux taux préféré (AIC) pour {meilleur_deux_taux} session(s) sur {len(sessions)}")
+    print(f"Ajustement de {len(sessions)} sessions en {time.perf_counter() - debut:.2f} s ; CSV : {chemin}")
@@ -0,0 +1,339 @@
+"""
+Module de la fenêtre de suivi de l'expérimentateur (processus séparé)
+
+Le jeu écrit chaque point du chemin et les métriques de chaque essai dans une
+mémoire partagée organisée en tampons circulaires. La fenêtre de suivi, dans
+son propre processus, les relit à son rythme pour afficher le chemin en cours,
+les métriques du dernier essai et la courbe d'apprentissage. L'écriture ne
+prend aucun verrou et n'écrit que le point ajouté : si la fenêtre prend du
+retard, les points les plus anciens sont écrasés et elle les saute.
+
+Usage (côté jeu) :
+    moniteur = Moniteur()
+    moniteur.lancer()
+    moniteur.nouvel_essai(0, (cible.x, cible.y))
+    moniteur.ajouter_point(x, y)
+    moniteur.publier_metriques(donnees_chemins)
+    moniteur.fermer()
+"""
+import math
+import os
+from multiprocessing import get_context, shared_memory
+import numpy as np
+import pygame
+import config
+from polices import obtenir_police
+from session import phase_essai
+
+PHASES = ("reference", "adaptation", "post_adaptation")
+COULEURS_PHASES = {'reference': (0, 150, 0), 'adaptation': (220, 0, 0), 'post_adaptation': (0, 90, 200)}
+COLONNES_METRIQUES = ('erreur_angulaire_deg', 'erreur_angulaire_signee_deg', 'duree_ms', 'temps_reaction_ms')
+
+# Cases de l'en-tête de la mémoire partagée
+POINTS_ECRITS, ESSAIS_PUBLIES, ESSAI_COURANT, CIBLE_X, CIBLE_Y, ARRET, SESSION = range(7)
+_TAILLE_ENTETE = 8
+
+
+def _vues(tampon, capacite_points, capacite_essais):
+    """
+    Tableaux numpy posés sur la mémoire partagée (sans copie)
+
+    Returns:
+        Tuple (entete, points, essais) : en-tête int64, points (x, y, essai) et
+        métriques des essais (colonnes de COLONNES_METRIQUES puis indice de phase)
+    """
+    entete = np.ndarray((_TAILLE_ENTETE,), np.int64, tampon, 0)
+    decalage = entete.nbytes
+    points = np.ndarray((capacite_points, 3), np.float64, tampon, decalage)
+    decalage += points.nbytes
+    essais = np.ndarray((capacite_essais, len(COLONNES_METRIQUES) + 1), np.float64, tampon, decalage)
+    return entete, points, essais
+
+
+def _taille_memoire(capacite_points, capacite_essais):
+    return 8 * (_TAILLE_ENTETE + 3 * capacite_points + (len(COLONNES_METRIQUES) + 1) * capacite_essais)
+
+
+class Moniteur:
+    """Côté jeu : écrit la session dans la mémoire partagée et lance la fenêtre de suivi"""
+
+    def __init__(self, capacite_points=None, capacite_essais=None):
+        """
+        Args:
+            capacite_points: Points conservés dans le tampon circulaire (par défaut config.MONITEUR_CAPACITE_POINTS)
+            capacite_essais: Essais conservés dans le tampon circulaire (par défaut config.MONITEUR_CAPACITE_ESSAIS)
+        """
+        self.capacite_points = capacite_points or config.MONITEUR_CAPACITE_POINTS
+        self.capacite_essais = capacite_essais or config.MONITEUR_CAPACITE_ESSAIS
+        self.memoire = shared_memory.SharedMemory(
+            create=True, size=_taille_memoire(self.capacite_points, self.capacite_essais))
+        self.entete, self.points, self.essais = _vues(self.memoire.buf, self.capacite_points, self.capacite_essais)
+        self.entete[:] = 0
+        # Copies locales des compteurs : le jeu ne relit jamais la mémoire partagée
+        self._points_ecrits = 0
+        self._essais_publies = 0
+        self._essai = 0
+        self._session = 0
+        self.processus = None
+
+    def lancer(self, images_max=None, capture=None):
+        """
+        Ouvre la fenêtre de suivi dans un nouveau processus (l'appel ne bloque pas)
+
+        Args:
+            images_max: Nombre d'images avant de fermer la fenêtre (None : jusqu'à fermer())
+            capture: Chemin d'une image PNG de la dernière image affichée (None : aucune)
+        """
+        # Sans cela, la fenêtre plein écran du jeu se réduit quand la fenêtre de suivi s'ouvre
+        os.environ.setdefault('SDL_VIDEO_MINIMIZE_ON_FOCUS_LOSS', '0')
+        geometrie = {
+            'largeur': config.LARGEUR, 'hauteur': config.HAUTEUR,
+            'nombre_essais': config.NOMBRE_CIBLES_MAX,
+        }
+        self.processus = get_context("spawn").Process(
+            target=executer_moniteur,
+            args=(self.memoire.name, self.capacite_points, self.capacite_essais, geometrie, images_max, capture),
+            daemon=True,
+        )
+        self.processus.start()
+
+    def nouvel_essai(self, numero, cible):
+        """
+        Signale le début d'un essai
+
+        Args:
+            numero: Indice de l'essai (à partir de 0)
+            cible: Tuple (x, y) de la cible
+        """
+        self._essai = numero
+        self.entete[CIBLE_X], self.entete[CIBLE_Y] = cible
+        self.entete[ESSAI_COURANT] = numero
+
+    def ajouter_point(self, x, y):
+        """Ajoute un point au chemin de l'essai en cours."""
+        n = self._points_ecrits
+        self.points[n % self.capacite_points] = (x, y, self._essai)
+        # Le compteur est publié après le point : le lecteur ne voit jamais un point à moitié écrit
+        self._points_ecrits = n + 1
+        self.entete[POINTS_ECRITS] = n + 1
+
+    def publier_metriques(self, donnees_chemins):
+        """
+        Publie les métriques des essais terminés qui ne l'ont pas encore été (dans l'ordre)
+
+        Args:
+            donnees_chemins: Liste des essais de la session (voir Jeu.donnees_chemins)
+        """
+        n = self._essais_publies
+        while n < len(donnees_chemins) and 'metriques' in donnees_chemins[n]:
+            metriques = donnees_chemins[n]['metriques']
+            ligne = [math.nan if metriques.get(nom) is None else metriques[nom] for nom in COLONNES_METRIQUES]
+            ligne.append(PHASES.index(phase_essai(n + 1)))
+            self.essais[n % self.capacite_essais] = ligne
+            n += 1
+        if n != self._essais_publies:
+            self._essais_publies = n
+            self.entete[ESSAIS_PUBLIES] = n
+
+    def reinitialiser(self):
+        """Commence une nouvelle session (la courbe d'apprentissage repart de zéro)."""
+        self._essais_publies = 0
+        self.entete[ESSAIS_PUBLIES] = 0
+        self._session += 1
+        self.entete[SESSION] = self._session
+
+    def fermer(self, delai_s=1.0):
+        """
+        Ferme la fenêtre de suivi et libère la mémoire partagée
+
+        Args:
+            delai_s: Temps laissé à la fenêtre pour se fermer d'elle-même
+        """
+        self.entete[ARRET] = 1
+        if self.processus is not None:
+            self.processus.join(delai_s)
+            if self.processus.is_alive():
+                self.processus.terminate()
+            self.processus = None
+        # Les vues numpy doivent être libérées avant de fermer la mémoire partagée
+        self.entete = self.points = self.essais = None
+        self.memoire.close()
+        self.memoire.unlink()
+
+
+class LecteurMoniteur:
+    """Côté fenêtre de suivi : relit la mémoire partagée écrite par le jeu"""
+
+    def __init__(self, nom_memoire, capacite_points, capacite_essais):
+        """
+        Args:
+            nom_memoire: Nom de la mémoire partagée créée par Moniteur
+            capacite_points, capacite_essais: Capacités des tampons circulaires
+        """
+        self.memoire = shared_memory.SharedMemory(name=nom_memoire)
+        self.capacite_points = capacite_points
+        self.capacite_essais = capacite_essais
+        self.entete, self.points, self.essais = _vues(self.memoire.buf, capacite_points, capacite_essais)
+        self.points_lus = 0
+        self.points_perdus = 0  # Points écrasés avant d'avoir été lus
+        self.essai_chemin = None
+        self.chemin_courant = np.empty((0, 2))
+        self.chemin_precedent = np.empty((0, 2))
+        self.session = 0
+        self.metriques = np.empty((0, len(COLONNES_METRIQUES) + 1))
+
+    def arret_demande(self):
+        """Indique si le jeu a demandé la fermeture."""
+        return bool(self.entete[ARRET])
+
+    def lire(self):
+        """Récupère les points et les métriques écrits depuis la lecture précédente."""
+        ecrits = int(self.entete[POINTS_ECRITS])
+        debut = max(self.points_lus, ecrits - self.capacite_points)
+        if ecrits > debut:
+            nouveaux = self.points[np.arange(debut, ecrits) % self.capacite_points]
+            # Points écrasés par le jeu pendant la copie : ignorés
+            ecrases = int(self.entete[POINTS_ECRITS]) - self.capacite_points - debut
+            if ecrases > 0:
+                nouveaux = nouveaux[ecrases:]
+            self.points_perdus += ecrits - len(nouveaux) - self.points_lus
+            self.points_lus = ecrits
+            self._ajouter_points(nouveaux)
+
+        session = int(self.entete[SESSION])
+        if session != self.session:
+            self.session = session
+            self.metriques = self.metriques[:0]
+        publies = int(self.entete[ESSAIS_PUBLIES])
+        lus = len(self.metriques)
+        if publies > lus:
+            debut = max(lus, publies - self.capacite_essais)
+            nouveaux = self.essais[np.arange(debut, publies) % self.capacite_essais]
+            self.metriques = np.concatenate((self.metriques, nouveaux))
+
+    def _ajouter_points(self, nouveaux):
+        # Découper aux changements d'essai (les numéros repartent de 0 à chaque session)
+        coupures = np.flatnonzero(np.diff(nouveaux[:, 2])) + 1
+        for bloc in np.split(nouveaux, coupures):
+            if bloc[0, 2] != self.essai_chemin:
+                self.chemin_precedent = self.chemin_courant
+                self.chemin_courant = bloc[:, :2]
+                self.essai_chemin = bloc[0, 2]
+            else:
+                self.chemin_courant = np.concatenate((self.chemin_courant, bloc[:, :2]))
+
+    def fermer(self):
+        """Détache la mémoire partagée (sans la supprimer : elle appartient au jeu)."""
+        self.entete = self.points = self.essais = None
+        self.memoire.close()
+
+
+def _ecrire(surface, police, texte, position, couleur=None):
+    surface.blit(police.render(texte, True, couleur or config.NOIR), position)
+
+
+def dessiner_moniteur(surface, lecteur, geometrie):
+    """
+    Dessine la vue de l'expérimentateur : chemins, métriques du dernier essai et courbe d'apprentissage
+
+    Args:
+        surface: Surface de destination
+        lecteur: LecteurMoniteur à jour
+        geometrie: Dictionnaire (largeur, hauteur, nombre_essais) de l'écran du jeu
+    """
+    largeur, hauteur = surface.get_size()
+    surface.fill(config.BLANC)
+    police = obtenir_police(max(14, hauteur // 24))
+
+    # ----- Zone des chemins (à gauche, carrée) : coordonnées du jeu ramenées à la zone -----
+    cx, cy = geometrie['largeur'] // 2, geometrie['hauteur'] // 2
+    rayon = int(min(geometrie['largeur'], geometrie['hauteur']) * 0.35)
+    cote = min(hauteur, largeur // 2)
+    echelle = cote * 0.42 / rayon
+    centre = (cote // 2, hauteur // 2)
+
+    def vers_zone(points):
+        return np.column_stack((centre[0] + (points[:, 0] - cx) * echelle,
+                                centre[1] + (points[:, 1] - cy) * echelle)).astype(int).tolist()
+
+    pygame.draw.circle(surface, (200, 200, 200), centre, int(rayon * echelle), 1)
+    pygame.draw.circle(surface, (255, 165, 0), centre, max(2, int(rayon * echelle / 10)), 1)
+    cible = np.array([[lecteur.entete[CIBLE_X], lecteur.entete[CIBLE_Y]]], dtype=float)
+    pygame.draw.circle(surface, config.ROUGE, vers_zone(cible)[0], max(3, int(config.RAYON_CIBLE * echelle)))
+    if len(lecteur.chemin_precedent) >= 2:
+        pygame.draw.lines(surface, (180, 180, 180), False, vers_zone(lecteur.chemin_precedent), 1)
+    if len(lecteur.chemin_courant) >= 2:
+        pygame.draw.lines(surface, config.NOIR, False, vers_zone(lecteur.chemin_courant), 2)
+
+    # ----- Progression et métriques du dernier essai (en haut à droite) -----
+    x_texte = cote + 10
+    interligne = police.get_linesize()
+    essai = int(lecteur.entete[ESSAI_COURANT]) + 1
+    lignes = [f"Essai {essai} / {geometrie['nombre_essais']} ({phase_essai(essai)})"]
+    if len(lecteur.metriques):
+        erreur, erreur_signee, duree, temps_reaction, _ = lecteur.metriques[-1]
+        lignes.append(f"Dernier essai ({len(lecteur.metriques)}) :")
+        lignes.append(f"  erreur angulaire {erreur:.1f}° (signée {erreur_signee:+.1f}°)")
+        lignes.append(f"  durée {duree:.0f} ms, temps de réaction {temps_reaction:.0f} ms")
+    if lecteur.points_perdus:
+        lignes.append(f"{lecteur.points_perdus} point(s) non affiché(s)")
+    for i, ligne in enumerate(lignes):
+        _ecrire(surface, police, ligne, (x_texte, 10 + i * interligne))
+
+    # ----- Courbe d'apprentissage : erreur signée par essai, colorée par phase (en bas à droite) -----
+    zone = pygame.Rect(x_texte + 30, 20 + 5 * interligne, largeur - x_texte - 45, hauteur - 40 - 5 * interligne)
+    if zone.width <= 0 or zone.height <= 0:
+        return
+    pygame.draw.rect(surface, (120, 120, 120), zone, 1)
+    erreurs = lecteur.metriques[:, 1]
+    valides = ~np.isnan(erreurs)
+    limite = max(10.0, float(np.abs(erreurs[valides]).max()) if valides.any() else 0.0)
+    y_zero = zone.centery
+    pygame.draw.line(surface, (200, 200, 200), (zone.left, y_zero), (zone.right, y_zero))
+    _ecrire(surface, police, f"{limite:+.0f}°", (x_texte, zone.top))
+    _ecrire(surface, police, f"{-limite:+.0f}°", (x_texte, zone.bottom - interligne))
+    nombre = max(geometrie['nombre_essais'], len(erreurs))
+    for i in np.flatnonzero(valides):
+        x = zone.left + int((i + 0.5) * zone.width / nombre)
+        y = y_zero - int(erreurs[i] / limite * (zone.height / 2 - 4))
+        couleur = COULEURS_PHASES[PHASES[int(lecteur.metriques[i, -1])]]
+        pygame.draw.circle(surface, couleur, (x, y), 3)
+
+
+def executer_moniteur(nom_memoire, capacite_points, capacite_essais, geometrie, images_max=None, capture=None):
+    """
+    Boucle de la fenêtre de suivi (point d'entrée du processus lancé par Moniteur.lancer)
+
+    Args:
+        nom_memoire: Nom de la mémoire partagée
+        capacite_points, capacite_essais: Capacités des tampons circulaires
+        geometrie: Dictionnaire (largeur, hauteur, nombre_essais) de l'écran du jeu
+        images_max: Nombre d'images avant de fermer (None : jusqu'à l'arrêt demandé par le jeu)
+        capture: Chemin d'une image PNG de la dernière image (None : aucune)
+    """
+    # La fenêtre de suivi ne doit pas prendre le focus au participant
+    os.environ.setdefault('SDL_WINDOW_NO_ACTIVATION_WHEN_SHOWN', '1')
+    pygame.display.init()
+    pygame.font.init()
+    ecran_suivi = config.MONITEUR_ECRAN if config.MONITEUR_ECRAN < pygame.display.get_num_displays() else 0
+    surface = pygame.display.set_mode((config.MONITEUR_LARGEUR, config.MONITEUR_HAUTEUR), display=ecran_suivi)
+    pygame.display.set_caption("Suivi de l'expérimentateur")
+    lecteur = LecteurMoniteur(nom_memoire, capacite_points, capacite_essais)
+    horloge = pygame.time.Clock()
+    images = 0
+    try:
+        while not lecteur.arret_demande():
+            if any(event.type == pygame.QUIT for event in pygame.event.get()):
+                break  # Fermer le suivi n'interrompt pas le jeu
+            lecteur.lire()
+            dessiner_moniteur(surface, lecteur, geometrie)
+            pygame.display.flip()
+            images += 1
+            if images_max is not None and images >= images_max:
+                break
+            horloge.tick(config.MONITEUR_IMAGES_PAR_SECONDE)
+        if capture:
+            pygame.image.save(surface, capture)
+    finally:
+        lecteur.fermer()
+        pygame.quit()
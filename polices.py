@@ -0,0 +1,41 @@
+"""
+Module de cache des polices partagées par les écrans
+
+Chaque taille de police n'est chargée qu'une fois ; precharger_polices charge
+en une seule passe toutes celles des écrans, avant la première image du menu.
+"""
+import pygame
+import config
+
+# Tailles utilisées par les écrans, en proportion de la hauteur de l'écran
+PROPORTIONS_POLICES = (
+    0.12, 0.08,          # Menu : titre, boutons
+    0.1, 0.06,           # Interface de fin : titre, boutons
+    0.04, 0.035,         # Interface de configuration : labels, champs (titre 0.08)
+    0.05,                # Dialogue du nom de fichier : titre
+)
+
+_polices = {}
+
+
+def obtenir_police(taille):
+    """
+    Retourne la police par défaut à la taille demandée (chargée une seule fois)
+
+    Args:
+        taille: Taille en pixels
+
+    Returns:
+        pygame.font.Font
+    """
+    police = _polices.get(taille)
+    if police is None:
+        police = pygame.font.Font(None, taille)
+        _polices[taille] = police
+    return police
+
+
+def precharger_polices():
+    """Charge toutes les polices des écrans pour la hauteur d'écran actuelle."""
+    for proportion in PROPORTIONS_POLICES:
+        obtenir_police(int(config.HAUTEUR * proportion))
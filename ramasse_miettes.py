@@ -0,0 +1,175 @@
+"""
+Module de pilotage du ramasse-miettes (gc) autour des essais
+
+Chaque pas de simulation alloue des tuples, des listes et des dictionnaires. Ces
+allocations déclenchent le ramasse-miettes cyclique, qui peut parcourir tous
+les objets du processus au milieu d'un mouvement : le pas prend du retard et le
+chemin enregistré présente un trou. La politique est donc la suivante :
+- au démarrage, les objets déjà créés (modules, polices, surfaces, jeu) sont
+  figés (gc.freeze) et ne sont plus jamais parcourus ;
+- pendant l'enregistrement d'un essai, le ramasse-miettes est suspendu ou ses
+  seuils sont relevés (config.GC_POLITIQUE_ESSAI) ;
+- une collecte complète est lancée explicitement pendant l'affichage du
+  résultat (config.DUREE_AFFICHAGE_RESULTAT) et à l'écran de fin.
+
+Les pauses du ramasse-miettes sont mesurées par gc.callbacks et comptées par
+essai, séparément pendant l'enregistrement et en dehors.
+
+Usage :
+    ramasse_miettes.demarrer()
+    ramasse_miettes.debut_essai(1)
+    ramasse_miettes.fin_essai()
+    ramasse_miettes.collecter()
+    ramasse_miettes.afficher_resume()
+"""
+import gc
+import time
+import config
+
+_actif = False
+_en_essai = False
+_seuils_initiaux = gc.get_threshold()
+_debut_pause = None
+_essais = []  # Statistiques des pauses par essai (voir _nouvel_essai)
+
+
+def _nouvel_essai(numero):
+    return {
+        'essai': numero,
+        'pauses_enregistrement': 0, 'duree_enregistrement_ms': 0.0, 'pause_max_enregistrement_ms': 0.0,
+        'pauses_hors_enregistrement': 0, 'duree_hors_enregistrement_ms': 0.0,
+    }
+
+
+def _rappel(phase, informations):
+    """Rappel de gc.callbacks : mesure chaque pause et l'attribue à l'essai en cours."""
+    global _debut_pause
+    if phase == 'start':
+        _debut_pause = time.perf_counter()
+        return
+    if _debut_pause is None or not _essais:
+        return
+    duree_ms = (time.perf_counter() - _debut_pause) * 1000
+    _debut_pause = None
+    essai = _essais[-1]
+    if _en_essai:
+        essai['pauses_enregistrement'] += 1
+        essai['duree_enregistrement_ms'] += duree_ms
+        essai['pause_max_enregistrement_ms'] = max(essai['pause_max_enregistrement_ms'], duree_ms)
+    else:
+        essai['pauses_hors_enregistrement'] += 1
+        essai['duree_hors_enregistrement_ms'] += duree_ms
+
+
+def est_actif():
+    """Indique si la politique est en place."""
+    return _actif
+
+
+def demarrer():
+    """
+    Met la politique en place à la fin du démarrage : collecte, gel des objets existants
+    (si config.GC_FIGER_DEMARRAGE) et mesure des pauses
+    """
+    global _actif, _seuils_initiaux
+    if _actif:
+        return
+    _seuils_initiaux = gc.get_threshold()
+    gc.collect()
+    if config.GC_FIGER_DEMARRAGE:
+        gc.freeze()
+    _essais.clear()
+    gc.callbacks.append(_rappel)
+    _actif = True
+
+
+def arreter():
+    """Rétablit le comportement par défaut du ramasse-miettes (les statistiques restent disponibles)."""
+    global _actif, _en_essai
+    if not _actif:
+        return
+    gc.callbacks.remove(_rappel)
+    gc.enable()
+    gc.set_threshold(*_seuils_initiaux)
+    gc.unfreeze()
+    _en_essai = False
+    _actif = False
+
+
+def debut_essai(numero):
+    """
+    Début de l'enregistrement d'un essai : suspend le ramasse-miettes ou relève ses seuils
+
+    Args:
+        numero: Numéro de l'essai (à partir de 1)
+    """
+    global _en_essai
+    if not _actif:
+        return
+    _essais.append(_nouvel_essai(numero))
+    _en_essai = True
+    # Un essai alloue peu d'objets cycliques : ils attendent sans risque la collecte suivante
+    if config.GC_POLITIQUE_ESSAI == "suspendu":
+        gc.disable()
+    elif config.GC_POLITIQUE_ESSAI == "seuils":
+        gc.set_threshold(*config.GC_SEUILS_ESSAI)
+
+
+def fin_essai():
+    """Fin de l'enregistrement d'un essai : rétablit le ramasse-miettes automatique."""
+    global _en_essai
+    if not _actif or not _en_essai:
+        return
+    _en_essai = False
+    gc.set_threshold(*_seuils_initiaux)
+    gc.enable()
+
+
+def collecter():
+    """
+    Collecte complète explicite, à lancer quand aucun essai n'est enregistré
+    (affichage du résultat, écran de fin)
+
+    Returns:
+        Nombre d'objets inaccessibles trouvés
+    """
+    if not _actif or _en_essai:
+        return 0
+    return gc.collect()
+
+
+def resume():
+    """
+    Résume les pauses du ramasse-miettes
+
+    Returns:
+        Dictionnaire (totaux pendant et hors enregistrement, pause maximale pendant un
+        enregistrement, objets figés, statistiques par essai), ou None sans essai
+    """
+    if not _essais:
+        return None
+    return {
+        'politique': config.GC_POLITIQUE_ESSAI,
+        'objets_figes': gc.get_freeze_count(),
+        'pauses_enregistrement': sum(e['pauses_enregistrement'] for e in _essais),
+        'duree_enregistrement_ms': sum(e['duree_enregistrement_ms'] for e in _essais),
+        'pause_max_enregistrement_ms': max(e['pause_max_enregistrement_ms'] for e in _essais),
+        'pauses_hors_enregistrement': sum(e['pauses_hors_enregistrement'] for e in _essais),
+        'duree_hors_enregistrement_ms': sum(e['duree_hors_enregistrement_ms'] for e in _essais),
+        'essais': [dict(e) for e in _essais],
+    }
+
+
+def afficher_resume():
+    """Affiche dans la console le bilan et les essais dont l'enregistrement a été interrompu."""
+    bilan = resume()
+    if bilan is None:
+        return
+    print(f"Ramasse-miettes ({bilan['politique']}, {bilan['objets_figes']} objets figés) : "
+          f"{bilan['pauses_enregistrement']} pause(s) pendant les essais "
+          f"({bilan['duree_enregistrement_ms']:.1f} ms, max {bilan['pause_max_enregistrement_ms']:.2f} ms), "
+          f"{bilan['pauses_hors_enregistrement']} en dehors ({bilan['duree_hors_enregistrement_ms']:.1f} ms)")
+    for essai in bilan['essais']:
+        if essai['pauses_enregistrement']:
+            print(f"  essai {essai['essai']} : {essai['pauses_enregistrement']} pause(s), "
+                  f"{essai['duree_enregistrement_ms']:.2f} ms")
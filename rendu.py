@@ -0,0 +1,197 @@
+"""
+Module des moteurs de rendu (logiciel ou par textures SDL2)
+
+Le rendu logiciel dessine tout avec pygame.draw sur la surface de la fenêtre puis
+la recopie avec display.flip. Le rendu par textures (pygame._sdl2.video) dessine
+une seule fois chaque élément statique (cercle, cibles, curseur, textes) dans une
+texture, que le renderer SDL compose ensuite à chaque image. Les écrans d'interface
+(menu, fin de partie, dialogues) dessinent sur un calque transparent, envoyé comme
+une texture seulement quand son contenu a changé depuis l'envoi précédent.
+"""
+import pygame
+import config
+
+try:
+    from pygame._sdl2.sdl2 import error as ErreurSDL2
+except ImportError:  # pygame compilé sans le module _sdl2
+    ErreurSDL2 = pygame.error
+
+RENDUS = ("logiciel", "textures")
+
+
+class RenduLogiciel:
+    """Rendu historique : pygame.draw sur la surface de la fenêtre, puis display.flip"""
+
+    accelere = False
+
+    def __init__(self, ecran):
+        """
+        Args:
+            ecran: Surface pygame de la fenêtre (créée par display.set_mode)
+        """
+        # Surface sur laquelle dessinent les écrans d'interface
+        self.surface = ecran
+
+    def effacer(self, couleur):
+        """Commence une image en remplissant le fond"""
+        self.surface.fill(couleur)
+
+    def dessiner_sprite(self, cle, rect, dessin):
+        """
+        Dessine un élément statique
+
+        Args:
+            cle: Identifiant de l'élément (même clé = même apparence)
+            rect: Rectangle occupé à l'écran
+            dessin: Fonction dessin(surface, rect) qui dessine l'élément dans rect
+        """
+        dessin(self.surface, rect)
+
+    def preparer_interface(self, effacer=True):
+        """
+        Signale que des écrans d'interface vont dessiner sur self.surface pendant l'image
+
+        Args:
+            effacer: False si l'écran recouvre toute la surface (inutile de la vider)
+        """
+        pass
+
+    def noter_interface(self, etat):
+        """
+        Décrit ce qu'un écran d'interface vient de dessiner sur self.surface
+
+        Args:
+            etat: Valeur retournée par Couche.dessiner (égale d'une image à l'autre si rien n'a changé)
+        """
+        pass
+
+    def presenter(self):
+        """Affiche l'image terminée"""
+        pygame.display.flip()
+
+    def fermer(self):
+        """Libère la fenêtre"""
+        pygame.display.quit()
+
+
+class RenduTextures(RenduLogiciel):
+    """Rendu par textures avec le renderer SDL2 (accéléré si un pilote est disponible)"""
+
+    def __init__(self, taille, plein_ecran=True, vsync=False):
+        """
+        Crée la fenêtre et son renderer
+
+        Args:
+            taille: Tuple (largeur, hauteur) de la fenêtre
+            plein_ecran: True pour une fenêtre en plein écran
+            vsync: True pour synchroniser present() sur le rafraîchissement de l'écran
+
+        Raises:
+            ErreurSDL2: Si SDL ne peut créer ni renderer accéléré ni renderer logiciel
+        """
+        from pygame._sdl2.video import Window, Renderer, Texture
+        self._Texture = Texture
+        self.fenetre = Window("Jeu de Cible", size=taille, fullscreen=plein_ecran)
+        try:
+            self.renderer = Renderer(self.fenetre, accelerated=1, vsync=vsync)
+            self.accelere = True
+        except ErreurSDL2:
+            # Pas de pilote accéléré (machine sans GPU) : renderer logiciel de SDL
+            self.renderer = Renderer(self.fenetre, accelerated=0, vsync=vsync)
+        super().__init__(pygame.Surface(taille, pygame.SRCALPHA))
+        self.textures = {}
+        self.texture_interface = Texture(self.renderer, taille, streaming=True)
+        self.texture_interface.blend_mode = pygame.BLENDMODE_BLEND
+        self.interface_affichee = False   # Calque d'interface présent dans l'image en cours
+        self.interface_a_vider = False    # Calque encore rempli par une image précédente
+        self.etat_interface = []          # Ce qui a été dessiné sur le calque pendant l'image en cours
+        self.etat_interface_envoye = None # Ce que contient texture_interface
+
+    def effacer(self, couleur):
+        self.renderer.draw_color = (*couleur, 255)
+        self.renderer.clear()
+        self.interface_affichee = False
+
+    def dessiner_sprite(self, cle, rect, dessin):
+        if self.interface_affichee:
+            # Au-dessus d'un écran d'interface : dessiner sur le calque pour garder l'ordre
+            dessin(self.surface, rect)
+            self.etat_interface.append((cle, tuple(rect)))
+            return
+        texture = self.textures.get(cle)
+        if texture is None:
+            # Première apparition : dessiner l'élément une seule fois, puis l'envoyer au renderer
+            image = pygame.Surface(rect.size, pygame.SRCALPHA)
+            dessin(image, image.get_rect())
+            texture = self._Texture.from_surface(self.renderer, image)
+            texture.blend_mode = pygame.BLENDMODE_BLEND
+            self.textures[cle] = texture
+        texture.draw(dstrect=rect)
+
+    def preparer_interface(self, effacer=True):
+        if effacer and self.interface_a_vider and not self.interface_affichee:
+            self.surface.fill((0, 0, 0, 0))
+        self.interface_affichee = True
+        self.interface_a_vider = True
+
+    def noter_interface(self, etat):
+        self.etat_interface.append(etat)
+
+    def presenter(self):
+        if self.interface_affichee:
+            # Renvoyer le calque (plein écran) seulement s'il diffère de la texture
+            if self.etat_interface != self.etat_interface_envoye:
+                self.texture_interface.update(self.surface)
+                self.etat_interface_envoye = self.etat_interface
+            self.texture_interface.draw()
+        self.renderer.present()
+        self.interface_affichee = False
+        self.etat_interface = []
+
+    def fermer(self):
+        self.textures.clear()
+        self.fenetre.destroy()
+        pygame.display.quit()
+
+
+def creer_rendu(mode=None, taille=None, plein_ecran=True, vsync=False):
+    """
+    Crée la fenêtre du jeu avec le moteur de rendu demandé
+
+    Le rendu par textures se replie sur le rendu logiciel si pygame._sdl2 est
+    absent ou si SDL ne peut pas créer de renderer.
+
+    Args:
+        mode: "logiciel" ou "textures" (par défaut config.RENDU)
+        taille: Tuple (largeur, hauteur) (par défaut la taille de l'écran dans config)
+        plein_ecran: True pour une fenêtre en plein écran
+        vsync: True pour activer la synchronisation verticale
+
+    Returns:
+        Instance de RenduLogiciel ou RenduTextures
+    """
+    mode = mode or config.RENDU
+    taille = taille or (config.LARGEUR, config.HAUTEUR)
+    if mode not in RENDUS:
+        raise ValueError(f"Rendu inconnu : {mode} (rendus : {', '.join(RENDUS)})")
+    if mode == "textures":
+        try:
+            rendu = RenduTextures(taille, plein_ecran, vsync)
+            print(f"Rendu par textures ({'accéléré' if rendu.accelere else 'logiciel SDL'})")
+            return rendu
+        except (ImportError, ErreurSDL2, pygame.error) as e:
+            print(f"Rendu par textures indisponible : {e}")
+
+    drapeaux = pygame.FULLSCREEN if plein_ecran else 0
+    ecran = None
+    if vsync:
+        # La synchronisation verticale demande le mode SCALED
+        try:
+            ecran = pygame.display.set_mode(taille, drapeaux | pygame.SCALED, vsync=1)
+        except pygame.error as e:
+            print(f"Synchronisation verticale indisponible : {e}")
+            config.VSYNC = 0
+    if ecran is None:
+        ecran = pygame.display.set_mode(taille, drapeaux)
+    pygame.display.set_caption("Jeu de Cible")
+    return RenduLogiciel(ecran)
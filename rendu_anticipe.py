@@ -0,0 +1,173 @@
+"""
+Module du rendu anticipé des pages du rapport (processus séparé, basse priorité)
+
+La page d'un essai ne dépend que de cet essai, dont les données sont définitives
+dès la traversée. Dès que ses métriques sont calculées, le jeu transmet l'essai
+à un processus de rendu de basse priorité qui rend sa page dans le cache des
+pages. À la fin de la session, les pages qui dépendent de tous les essais
+(profils de vitesse, trajectoires moyennes, directions) sont rendues de la même
+façon. L'export ne rend alors plus que la page de garde et assemble les pages
+reprises du cache.
+
+Usage (côté jeu) :
+    rendu_anticipe = RenduAnticipe()
+    rendu_anticipe.lancer()
+    rendu_anticipe.soumettre_essai(i, donnees)
+    rendu_anticipe.soumettre_rapport(donnees_chemins)
+    rendu_anticipe.attendre()  # avant GenerateurPDF.generer_pdf
+    rendu_anticipe.fermer()
+"""
+import os
+import queue
+import time
+from multiprocessing import get_context
+import config
+
+PRIORITE = 19  # Valeur de nice du processus de rendu (la plus basse priorité)
+CLES_TRANSMISES = ('chemin', 'temps_chemin', 'cible', 'point_traversee', 'metriques')
+
+
+def _essai_transmis(donnees):
+    """Données d'un essai envoyées au processus de rendu (sans les champs propres au jeu)."""
+    return {cle: donnees[cle] for cle in CLES_TRANSMISES if cle in donnees}
+
+
+class RenduAnticipe:
+    """Côté jeu : transmet les essais terminés au processus de rendu et suit l'avancement"""
+
+    def __init__(self):
+        contexte = get_context("spawn")
+        self.travaux = contexte.Queue()
+        self.termines = contexte.Queue()
+        self.processus = None
+        self.soumis = 0  # Travaux transmis
+        self.acheves = 0  # Travaux terminés (ou abandonnés)
+        self.pages_rendues = 0
+        self._contexte = contexte
+
+    def lancer(self):
+        """Démarre le processus de rendu (l'appel ne bloque pas)."""
+        # Valeurs de config du jeu (géométrie calculée au démarrage, paramètres modifiés) : les pages en dépendent
+        instantane = {nom: valeur for nom, valeur in vars(config).items() if nom.isupper()}
+        self.processus = self._contexte.Process(
+            target=executer_rendu_anticipe, args=(self.travaux, self.termines, instantane),
+            name="rendu_anticipe", daemon=True,
+        )
+        self.processus.start()
+
+    def _soumettre(self, nature, arguments):
+        if self.processus is None:
+            return
+        self.soumis += 1
+        self.travaux.put((nature, arguments))
+
+    def soumettre_essai(self, indice, donnees):
+        """
+        Demande le rendu de la page d'un essai terminé (métriques déjà calculées)
+
+        Args:
+            indice: Indice de l'essai (à partir de 0)
+            donnees: Dictionnaire de l'essai (voir Jeu.donnees_chemins)
+        """
+        if config.MODE_PAGES_RAPPORT == "essais":
+            self._soumettre('essai', (indice, _essai_transmis(donnees), config.NOMBRE_CIBLES_MAX))
+
+    def soumettre_rapport(self, donnees_chemins):
+        """
+        Demande le rendu des pages qui dépendent de toute la session (à la fin de la session)
+
+        Args:
+            donnees_chemins: Liste de tous les essais, métriques calculées
+        """
+        self._soumettre('rapport', ([_essai_transmis(donnees) for donnees in donnees_chemins],))
+
+    def _relever(self, delai_s=0.0):
+        """Relève les travaux terminés (attend au plus delai_s le premier)."""
+        while self.acheves < self.soumis:
+            try:
+                pages = self.termines.get(timeout=delai_s) if delai_s > 0 else self.termines.get_nowait()
+            except queue.Empty:
+                return
+            self.acheves += 1
+            self.pages_rendues += pages
+            delai_s = 0.0
+
+    def en_attente(self):
+        """Nombre de travaux transmis et pas encore terminés."""
+        self._relever()
+        return self.soumis - self.acheves
+
+    def attendre(self, delai_s=60.0):
+        """
+        Attend la fin des travaux transmis (avant l'export du rapport)
+
+        Args:
+            delai_s: Attente maximale ; les pages non rendues à temps le seront par l'export
+
+        Returns:
+            True si tous les travaux sont terminés
+        """
+        fin = time.perf_counter() + delai_s
+        while self.acheves < self.soumis:
+            restant = fin - time.perf_counter()
+            if restant <= 0 or self.processus is None or not self.processus.is_alive():
+                break
+            self._relever(min(restant, 0.1))
+        return self.acheves >= self.soumis
+
+    def reinitialiser(self):
+        """Abandonne les travaux pas encore commencés (nouvelle session)."""
+        while True:
+            try:
+                self.travaux.get_nowait()
+            except queue.Empty:
+                break
+            self.acheves += 1
+
+    def fermer(self, delai_s=1.0):
+        """Arrête le processus de rendu (le travail en cours est abandonné)."""
+        if self.processus is None:
+            return
+        self.travaux.put(None)
+        self.processus.join(delai_s)
+        if self.processus.is_alive():
+            self.processus.terminate()
+        self.processus = None
+
+
+def executer_rendu_anticipe(travaux, termines, instantane):
+    """
+    Boucle du processus de rendu : rend dans le cache les pages demandées par le jeu
+
+    Args:
+        travaux: File des travaux ('essai' ou 'rapport', arguments) ; None pour s'arrêter
+        termines: File des nombres de pages rendues, un par travail
+        instantane: Valeurs de config du jeu
+    """
+    if hasattr(os, 'nice'):
+        try:
+            os.nice(PRIORITE)
+        except OSError:
+            pass
+    for nom, valeur in instantane.items():
+        setattr(config, nom, valeur)
+    from generateur_pdf import GenerateurPDF  # matplotlib n'est chargé que dans ce processus
+
+    generateur = GenerateurPDF()
+    if generateur.cache is None:
+        print("Rendu anticipé impossible : le format du rapport ne permet pas le cache des pages")
+        return
+    while True:
+        travail = travaux.get()
+        if travail is None:
+            break
+        nature, arguments = travail
+        try:
+            if nature == 'essai':
+                pages = generateur.anticiper_page_essai(*arguments)
+            else:
+                pages = generateur.anticiper_rapport(*arguments)
+        except Exception as e:  # Une page ratée sera rendue par l'export
+            print(f"Rendu anticipé : erreur ({e})")
+            pages = 0
+        termines.put(pages)
@@ -0,0 +1,271 @@
+"""
+Service de génération automatique des rapports : surveille le dossier des sessions
+
+Le dossier est scruté périodiquement. Un fichier de session n'est pris en compte
+qu'une fois resté inchangé pendant un délai de stabilité (fichier en cours de
+copie ou d'écriture), puis mis en file et rendu avec GenerateurPDF dans un pool
+de processus au nombre de travaux simultanés borné. Un registre des sessions
+traitées (empreinte du contenu, rapport produit, durées) est conservé dans le
+dossier des sessions : après un redémarrage, seules les sessions nouvelles ou
+modifiées sont rendues. La profondeur de la file et la durée de chaque travail
+sont affichées au fil de l'eau.
+
+Usage : python service_rapports.py [--dossier sessions] [--processus 2] [--format pdf] [--une-fois]
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import config
+from catalogue import associer_rapport
+
+
+def _empreinte_fichier(chemin):
+    """Empreinte SHA-256 du contenu d'un fichier."""
+    hachage = hashlib.sha256()
+    with open(chemin, 'rb') as f:
+        for bloc in iter(lambda: f.read(1024 * 1024), b''):
+            hachage.update(bloc)
+    return hachage.hexdigest()
+
+
+def generer_rapport_session(chemin_session, format_sortie=None):
+    """
+    Génère le rapport d'une session sauvegardée (exécuté dans un processus du pool)
+
+    Args:
+        chemin_session: Fichier de session (.json)
+        format_sortie: Format du rapport (par défaut config.FORMAT_RAPPORT)
+
+    Returns:
+        Dictionnaire avec 'sortie' (chemin du rapport, None en cas d'échec), 'duree_s',
+        'erreur' (message, None si tout s'est bien passé) et 'ignore' (vrai pour un
+        fichier JSON qui n'est pas une session, comme un résumé mémoire)
+    """
+    from generateur_pdf import GenerateurPDF
+    from session import appliquer_session, charger_session
+
+    debut = time.perf_counter()
+    try:
+        session = charger_session(chemin_session)
+    except (KeyError, TypeError):
+        return {'sortie': None, 'duree_s': time.perf_counter() - debut, 'erreur': None, 'ignore': True}
+    except (OSError, ValueError) as e:
+        return {'sortie': None, 'duree_s': time.perf_counter() - debut, 'erreur': f"session illisible : {e}",
+                'ignore': False}
+    appliquer_session(session)
+    nom = os.path.splitext(os.path.basename(chemin_session))[0]
+    sortie = GenerateurPDF(format_sortie).generer_pdf(session['essais'], nom)
+    return {
+        'sortie': sortie,
+        'duree_s': time.perf_counter() - debut,
+        'erreur': None if sortie else "échec de la génération du rapport",
+        'ignore': False,
+    }
+
+
+class ServiceRapports:
+    """Surveille un dossier de sessions et génère leurs rapports dans un pool de processus"""
+
+    def __init__(self, dossier=None, processus=None, format_sortie=None, stabilite_s=None):
+        """
+        Args:
+            dossier: Dossier surveillé (par défaut config.DOSSIER_SESSIONS)
+            processus: Nombre maximal de rapports générés en même temps (par défaut config.SERVICE_RAPPORTS_PROCESSUS)
+            format_sortie: Format des rapports (par défaut config.FORMAT_RAPPORT)
+            stabilite_s: Délai sans modification avant de traiter un fichier (par défaut config.SERVICE_RAPPORTS_STABILITE_S)
+        """
+        self.dossier = dossier or config.DOSSIER_SESSIONS
+        self.processus = processus or config.SERVICE_RAPPORTS_PROCESSUS
+        self.format_sortie = format_sortie or config.FORMAT_RAPPORT
+        self.stabilite_s = config.SERVICE_RAPPORTS_STABILITE_S if stabilite_s is None else stabilite_s
+        self.chemin_registre = os.path.join(self.dossier, config.FICHIER_RAPPORTS_TRAITES)
+        self.registre = self._charger_registre()
+        self.observes = {}  # Nom de fichier -> (taille, date de modification) au dernier passage
+        self.file = deque()  # Travaux en attente : (nom, empreinte, instant de mise en file)
+        self.en_cours = {}  # Future -> (nom, empreinte, instant de mise en file, instant de lancement)
+
+    def _charger_registre(self):
+        try:
+            with open(self.chemin_registre, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _enregistrer_registre(self):
+        """Écrit le registre (écriture atomique : un arrêt brutal ne le corrompt pas)."""
+        chemin_temporaire = self.chemin_registre + ".tmp"
+        with open(chemin_temporaire, 'w', encoding='utf-8') as f:
+            json.dump(self.registre, f, indent=2, ensure_ascii=False)
+        os.replace(chemin_temporaire, self.chemin_registre)
+
+    def _est_en_file(self, nom):
+        return (any(travail[0] == nom for travail in self.file)
+                or any(travail[0] == nom for travail in self.en_cours.values()))
+
+    def scruter(self):
+        """
+        Parcourt le dossier et met en file les sessions nouvelles ou modifiées, une fois stables
+
+        Returns:
+            Liste des noms de fichiers mis en file
+        """
+        if not os.path.isdir(self.dossier):
+            return []
+        maintenant = time.time()
+        presents = set()
+        mis_en_file = []
+        for entree in os.scandir(self.dossier):
+            if not entree.is_file() or not entree.name.endswith(".json") or entree.name.startswith("."):
+                continue
+            presents.add(entree.name)
+            statistiques = entree.stat()
+            signature = (statistiques.st_size, statistiques.st_mtime_ns)
+            precedente = self.observes.get(entree.name)
+            self.observes[entree.name] = signature
+            # Attendre que le fichier ne change plus (copie ou écriture en cours)
+            if signature != precedente or maintenant - statistiques.st_mtime < self.stabilite_s:
+                continue
+            connu = self.registre.get(entree.name)
+            if connu is not None and connu.get('signature') == list(signature):
+                continue
+            if self._est_en_file(entree.name):
+                continue
+            empreinte = _empreinte_fichier(entree.path)
+            if connu is not None and connu.get('empreinte') == empreinte:
+                # Même contenu (fichier recopié ou touché) : rien à refaire
+                connu['signature'] = list(signature)
+                self._enregistrer_registre()
+                continue
+            self.file.append((entree.name, empreinte, time.perf_counter()))
+            mis_en_file.append(entree.name)
+        # Oublier les fichiers disparus
+        for nom in set(self.observes) - presents:
+            del self.observes[nom]
+        return mis_en_file
+
+    def lancer_travaux(self, executeur):
+        """Soumet les travaux en attente au pool, sans dépasser le nombre de processus."""
+        while self.file and len(self.en_cours) < self.processus:
+            nom, empreinte, mise_en_file = self.file.popleft()
+            future = executeur.submit(generer_rapport_session, os.path.join(self.dossier, nom), self.format_sortie)
+            self.en_cours[future] = (nom, empreinte, mise_en_file, time.perf_counter())
+
+    def recolter(self):
+        """
+        Enregistre les travaux terminés dans le registre
+
+        Returns:
+            Liste des entrées du registre ajoutées (une par travail terminé)
+        """
+        termines = []
+        for future in [future for future in self.en_cours if future.done()]:
+            nom, empreinte, mise_en_file, lancement = self.en_cours.pop(future)
+            try:
+                resultat = future.result()
+            except Exception as e:  # Processus du pool interrompu, erreur inattendue
+                resultat = {'sortie': None, 'duree_s': time.perf_counter() - lancement, 'erreur': str(e),
+                            'ignore': False}
+            chemin = os.path.join(self.dossier, nom)
+            try:
+                statistiques = os.stat(chemin)
+                signature = [statistiques.st_size, statistiques.st_mtime_ns]
+            except OSError:
+                signature = None
+            entree = {
+                'signature': signature,
+                'empreinte': empreinte,
+                'sortie': resultat['sortie'],
+                'erreur': resultat['erreur'],
+                'ignore': resultat['ignore'],
+                'attente_s': round(lancement - mise_en_file, 3),
+                'duree_s': round(resultat['duree_s'], 3),
+                'date': datetime.now().isoformat(timespec='seconds'),
+            }
+            self.registre[nom] = entree
+            termines.append((nom, entree))
+            if resultat['sortie']:
+                associer_rapport(chemin, resultat['sortie'])
+        if termines:
+            self._enregistrer_registre()
+        return termines
+
+    def etat(self):
+        """
+        Résume l'activité du service
+
+        Returns:
+            Dictionnaire (travaux en attente, en cours, rapports produits, échecs,
+            fichiers ignorés, durée moyenne d'un rapport en s)
+        """
+        entrees = self.registre.values()
+        durees = [entree['duree_s'] for entree in entrees if entree.get('sortie')]
+        return {
+            'en_attente': len(self.file),
+            'en_cours': len(self.en_cours),
+            'produits': len(durees),
+            'echecs': sum(1 for entree in entrees if entree.get('erreur')),
+            'ignores': sum(1 for entree in entrees if entree.get('ignore')),
+            'duree_moyenne_s': sum(durees) / len(durees) if durees else None,
+        }
+
+    def _afficher_etat(self):
+        etat = self.etat()
+        moyenne = f", {etat['duree_moyenne_s']:.1f} s par rapport" if etat['duree_moyenne_s'] is not None else ""
+        print(f"File : {etat['en_attente']} en attente, {etat['en_cours']} en cours ; "
+              f"{etat['produits']} rapport(s), {etat['echecs']} échec(s){moyenne}", flush=True)
+
+    def executer(self, intervalle_s=None, une_fois=False):
+        """
+        Boucle du service (Ctrl+C pour l'arrêter)
+
+        Args:
+            intervalle_s: Période de scrutation (par défaut config.SERVICE_RAPPORTS_INTERVALLE_S)
+            une_fois: Traiter les sessions présentes puis s'arrêter (sans délai de stabilité)
+        """
+        intervalle_s = intervalle_s or config.SERVICE_RAPPORTS_INTERVALLE_S
+        if une_fois:
+            # Pas d'attente de stabilité : un premier passage relève les signatures
+            self.stabilite_s = 0
+            self.scruter()
+        print(f"Surveillance de {os.path.abspath(self.dossier)} ({self.processus} processus, "
+              f"{len(self.registre)} fichier(s) déjà traité(s))", flush=True)
+        with ProcessPoolExecutor(max_workers=self.processus) as executeur:
+            try:
+                while True:
+                    mis_en_file = self.scruter()
+                    termines = self.recolter()
+                    for nom, entree in termines:
+                        if entree['ignore']:
+                            print(f"{nom} : pas un fichier de session, ignoré", flush=True)
+                            continue
+                        resultat = entree['sortie'] or entree['erreur']
+                        print(f"{nom} : {entree['duree_s']:.1f} s (attente {entree['attente_s']:.1f} s) -> {resultat}",
+                              flush=True)
+                    self.lancer_travaux(executeur)
+                    if mis_en_file or termines:
+                        self._afficher_etat()
+                    if une_fois and not self.file and not self.en_cours:
+                        break
+                    time.sleep(intervalle_s if not self.en_cours else min(intervalle_s, 0.2))
+            except KeyboardInterrupt:
+                print("Arrêt du service : travaux en attente abandonnés", flush=True)
+                executeur.shutdown(wait=True, cancel_futures=True)
+                self.recolter()
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Génération automatique des rapports des sessions sauvegardées")
+    parseur.add_argument('--dossier', default=None, help="Dossier des sessions à surveiller")
+    parseur.add_argument('--processus', type=int, default=None, help="Nombre de rapports générés en même temps")
+    parseur.add_argument('--format', default=None, help="Format des rapports (pdf, png, svg, html)")
+    parseur.add_argument('--intervalle', type=float, default=None, help="Période de scrutation en secondes")
+    parseur.add_argument('--une-fois', action='store_true', help="Traiter les sessions présentes puis s'arrêter")
+    arguments = parseur.parse_args()
+
+    ServiceRapports(arguments.dossier, arguments.processus, arguments.format).executer(
+        arguments.intervalle, arguments.une_fois)
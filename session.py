@@ -0,0 +1,181 @@
+"""
+Module de sauvegarde et de chargement des sessions (données brutes et métriques)
+
+Une session est un fichier JSON contenant les paramètres de l'expérience, la
+géométrie de l'écran et la liste des essais au format de Jeu.donnees_chemins.
+"""
+import json
+import os
+from datetime import datetime
+import config
+from metriques_essai import metriques_session
+
+# Paramètres de config enregistrés avec chaque session
+PARAMETRES_SESSION = (
+    'RAYON_CIBLE',
+    'DUREE_AFFICHAGE_RESULTAT',
+    'NOMBRE_CIBLES_MAX',
+    'CIBLE_DEBUT_DEVIATION',
+    'CIBLE_FIN_DEVIATION',
+    'ANGLE_DEVIATION',
+    'DISTANCE_DEVIATION',
+    'MODE_ENTREE',
+)
+
+# Métriques scalaires enregistrées avec chaque essai (les profils sont recalculables)
+METRIQUES_SAUVEGARDEES = (
+    'erreur_angulaire_deg',
+    'erreur_angulaire_signee_deg',
+    'longueur_chemin',
+    'duree_ms',
+    'temps_reaction_ms',
+    'temps_mouvement_ms',
+    'vitesse_max',
+    'temps_vitesse_max_ms',
+    'acceleration_max',
+)
+
+
+def phase_essai(numero, parametres=None):
+    """
+    Retourne la phase du protocole d'un essai
+
+    Args:
+        numero: Numéro de l'essai (à partir de 1)
+        parametres: Dictionnaire des paramètres de la session (par défaut, ceux de config)
+
+    Returns:
+        "reference" avant la déviation, "adaptation" pendant, "post_adaptation" après
+    """
+    if parametres is None:
+        debut, fin = config.CIBLE_DEBUT_DEVIATION, config.CIBLE_FIN_DEVIATION
+    else:
+        debut, fin = parametres['CIBLE_DEBUT_DEVIATION'], parametres.get('CIBLE_FIN_DEVIATION', 0)
+    if numero < debut:
+        return "reference"
+    if fin and numero >= fin:
+        return "post_adaptation"
+    return "adaptation"
+
+
+def construire_session(donnees_chemins, nom=None):
+    """
+    Construit le dictionnaire sérialisable d'une session
+
+    Args:
+        donnees_chemins: Liste de dictionnaires (voir GenerateurPDF.generer_pdf)
+        nom: Nom de la session
+
+    Returns:
+        Dictionnaire de la session
+    """
+    liste_metriques = metriques_session(donnees_chemins)
+    essais = []
+    for donnees, metriques in zip(donnees_chemins, liste_metriques):
+        essais.append({
+            'chemin': [list(p) for p in donnees['chemin']],
+            'temps_chemin': list(donnees.get('temps_chemin') or []),
+            'cible': list(donnees['cible']),
+            'point_traversee': list(donnees['point_traversee']) if donnees['point_traversee'] else None,
+            'metriques': {nom_metrique: metriques[nom_metrique] for nom_metrique in METRIQUES_SAUVEGARDEES},
+        })
+    return {
+        'version': 1,
+        'nom': nom,
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'parametres': {nom_param: getattr(config, nom_param) for nom_param in PARAMETRES_SESSION},
+        'ecran': {
+            'largeur': config.LARGEUR,
+            'hauteur': config.HAUTEUR,
+            'centre': [config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y],
+            'rayon': config.CERCLE_RAYON,
+        },
+        'essais': essais,
+    }
+
+
+def sauvegarder_session(donnees_chemins, nom_fichier=None, dossier=None, cataloguer=True):
+    """
+    Sauvegarde une session dans un fichier JSON et l'ajoute au catalogue du dossier
+
+    Args:
+        donnees_chemins: Liste de dictionnaires (voir GenerateurPDF.generer_pdf)
+        nom_fichier: Nom du fichier (sans extension). Si None, utilise un timestamp
+        dossier: Dossier de destination (par défaut config.DOSSIER_SESSIONS)
+        cataloguer: False pour ne pas mettre à jour le catalogue (voir catalogue.importer_dossier
+            pour cataloguer ensuite de nombreuses sessions en une transaction)
+
+    Returns:
+        Chemin complet du fichier créé ou None en cas d'erreur
+    """
+    dossier = dossier or config.DOSSIER_SESSIONS
+    if not os.path.exists(dossier):
+        os.makedirs(dossier)
+
+    if nom_fichier:
+        nom_fichier = "".join(c for c in nom_fichier if c.isalnum() or c in "._- ")
+    if not nom_fichier:
+        nom_fichier = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    chemin_fichier = os.path.join(dossier, f"{nom_fichier}.json")
+
+    try:
+        # Écriture dans un fichier temporaire puis renommage, pour ne jamais laisser de fichier partiel
+        chemin_temporaire = chemin_fichier + ".tmp"
+        session = construire_session(donnees_chemins, nom_fichier)
+        with open(chemin_temporaire, 'w', encoding='utf-8') as f:
+            json.dump(session, f)
+        os.replace(chemin_temporaire, chemin_fichier)
+        print(f"Session sauvegardée : {chemin_fichier}")
+    except Exception as e:
+        print(f"Erreur lors de la sauvegarde de la session : {e}")
+        return None
+
+    # Le fichier est écrit : un échec du catalogue ne doit pas faire passer la sauvegarde pour ratée
+    if cataloguer:
+        try:
+            from catalogue import cataloguer_session  # Import différé : catalogue importe ce module
+            cataloguer_session(session, chemin_fichier)
+        except Exception as e:
+            print(f"Erreur lors de l'ajout de la session au catalogue : {e}")
+    return os.path.abspath(chemin_fichier)
+
+
+def charger_session(chemin_fichier):
+    """
+    Charge une session depuis un fichier JSON
+
+    Args:
+        chemin_fichier: Chemin du fichier de session
+
+    Returns:
+        Dictionnaire de la session ; 'essais' est au format de Jeu.donnees_chemins
+        (tuples) et chaque essai garde ses métriques scalaires sous 'metriques_sauvegardees'
+    """
+    with open(chemin_fichier, 'r', encoding='utf-8') as f:
+        session = json.load(f)
+    essais = []
+    for essai in session['essais']:
+        essais.append({
+            'chemin': [tuple(p) for p in essai['chemin']],
+            'temps_chemin': essai['temps_chemin'],
+            'cible': tuple(essai['cible']),
+            'point_traversee': tuple(essai['point_traversee']) if essai['point_traversee'] else None,
+            'metriques_sauvegardees': essai.get('metriques', {}),
+        })
+    session['essais'] = essais
+    return session
+
+
+def appliquer_session(session):
+    """
+    Applique la géométrie d'écran et les paramètres d'une session au module config,
+    pour analyser ou régénérer le rapport d'une session dans un autre processus
+
+    Args:
+        session: Dictionnaire de la session (voir charger_session)
+    """
+    config.definir_geometrie(session['ecran']['largeur'], session['ecran']['hauteur'])
+    config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y = session['ecran']['centre']
+    config.CERCLE_RAYON = session['ecran']['rayon']
+    for nom_param, valeur in session['parametres'].items():
+        setattr(config, nom_param, valeur)
@@ -0,0 +1,556 @@
+"""
+Module de simulation de participants synthétiques (conception du protocole, puissance statistique)
+
+Chaque participant suit un modèle d'état à un taux : l'état x (en degrés) est
+la part de la déviation qu'il compense. Il vise la cible moins x, avec un bruit
+moteur, puis corrige x d'une fraction de l'erreur vue au point de traversée :
+
+    x(n+1) = A x(n) + B e(n) + bruit d'état
+
+Le geste est un mouvement à jerk minimal du centre vers la direction visée,
+échantillonné à chaque pas de simulation et arrondi au pixel comme la position
+de la souris. Il passe par la même déviation (troncature au pixel comprise) et
+la même détection de traversée que le jeu ; l'erreur mesurée est celle des
+métriques (intersection avec le cercle orange). Les participants d'un paquet
+sont simulés ensemble, une opération par pas de simulation jusqu'à ce que tous
+aient traversé, et les paquets sont répartis sur plusieurs processus.
+
+Usage : python simulateur.py [--angles 30 50] [--effectifs 8 12 16 24] [--groupes N]
+        [--essais N] [--debut N] [--fin N] [--effet NOM] [--alpha A] [--processus N]
+        python simulateur.py --sessions N [--dossier DOSSIER] [--angles 50] [--essais N] ...
+"""
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+import numpy as np
+import config
+from analyse_groupe import calculer_effets
+from cible import ANGLES_POSITIONS_FIXES
+from geometrie import intersections_segments_cercle_lot
+from session import phase_essai
+
+TEMPS_REACTION_MS = (150, 300)  # Bornes du temps de réaction tiré à chaque essai
+DUREE_MOUVEMENT_MS = (300, 600)  # Bornes de la durée du mouvement tirée à chaque essai
+AMPLITUDE_MOUVEMENT = 1.2  # Amplitude du geste en rayons du cercle (il doit le traverser)
+ECRAN_SIMULE = (1920, 1080)  # Écran utilisé si la géométrie n'est pas encore définie
+PUISSANCE_VISEE = 0.8  # Repère tracé sur les courbes de puissance
+TIRAGES_QUANTILE = 400000  # Tirages pour les quantiles de la loi de Student
+PARAMETRES_PROTOCOLE = ('NOMBRE_CIBLES_MAX', 'CIBLE_DEBUT_DEVIATION', 'CIBLE_FIN_DEVIATION', 'ANGLE_DEVIATION')
+
+
+def parametres_protocole(**modifications):
+    """Paramètres du protocole : ceux de config, remplacés par les arguments nommés."""
+    parametres = {nom: getattr(config, nom) for nom in PARAMETRES_PROTOCOLE}
+    parametres.update(modifications)
+    return parametres
+
+
+def modele_adaptation(**modifications):
+    """Paramètres du modèle d'état : ceux de config, remplacés par les arguments nommés."""
+    modele = {
+        'retention': config.SIMULATION_RETENTION,
+        'taux_apprentissage': config.SIMULATION_TAUX_APPRENTISSAGE,
+        'bruit_moteur_deg': config.SIMULATION_BRUIT_MOTEUR_DEG,
+        'bruit_etat_deg': config.SIMULATION_BRUIT_ETAT_DEG,
+        'variabilite': config.SIMULATION_VARIABILITE_PARTICIPANTS,
+    }
+    modele.update(modifications)
+    return modele
+
+
+def phases_protocole(parametres):
+    """Phase de chaque essai du protocole (tableau de chaînes)."""
+    return np.array([phase_essai(i + 1, parametres) for i in range(parametres['NOMBRE_CIBLES_MAX'])])
+
+
+def _geometrie():
+    """Dimensions de l'écran (celles du simulateur si la géométrie n'est pas définie)."""
+    if config.CERCLE_RAYON is None:
+        config.definir_geometrie(*ECRAN_SIMULE)
+    return config.LARGEUR, config.HAUTEUR
+
+
+def _positions_main(angles_vises, temps_reaction, durees, pas):
+    """
+    Position de la souris (len(pas), P, 2) aux pas de simulation demandés (pas 0 : au centre)
+
+    Après le mouvement à jerk minimal, la main continue dans la même direction à
+    sa vitesse moyenne : comme un participant, elle va jusqu'à la traversée même
+    si la troncature de la déviation a raccourci le geste du curseur.
+    """
+    cx, cy = config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y
+    temps = pas * (1000.0 / config.FREQUENCE_SIMULATION)
+    s = (temps[:, None] - temps_reaction[None, :]) / durees[None, :]
+    progression = np.clip(s, 0.0, 1.0)
+    progression = progression ** 3 * (10 - 15 * progression + 6 * progression * progression)
+    distance = AMPLITUDE_MOUVEMENT * config.CERCLE_RAYON * (progression + np.maximum(s - 1.0, 0.0))
+    mains = np.empty(s.shape + (2,))
+    mains[:, :, 0] = np.rint(cx + distance * np.cos(angles_vises)[None, :])
+    mains[:, :, 1] = np.rint(cy + distance * np.sin(angles_vises)[None, :])
+    return mains
+
+
+def _trajectoires(angles_vises, temps_reaction, durees, angle_rad, nombre_pas, pas_par_bloc=64):
+    """
+    Positions de la souris et du curseur à chaque pas, jusqu'à la sortie du cercle de tous les curseurs
+
+    Avec une déviation, le curseur suit Jeu.appliquer_deviation_mouvement : le
+    déplacement réel de chaque pas est tourné de l'angle de déviation puis ajouté
+    à la position déviée précédente, tronquée au pixel. La troncature s'accumule
+    d'un pas au suivant, seule cette addition reste séquentielle.
+
+    Args:
+        angles_vises, temps_reaction, durees: Geste de chaque participant (P,)
+        angle_rad: Angle de déviation, None sans déviation
+        nombre_pas: Nombre maximal de pas
+
+    Returns:
+        Tuple (mains, curseurs, distances2) : positions (K + 1, P, 2) de la souris
+        et du curseur, carrés des distances (K + 1, P) du curseur au centre
+    """
+    cx, cy = config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y
+    rayon2 = config.CERCLE_RAYON ** 2
+    nombre = len(angles_vises)
+    depart = np.tile(np.array([cx, cy], dtype=float), (1, nombre, 1))
+    blocs_mains, blocs_curseurs, blocs_distances = [depart], [depart], [np.zeros((1, nombre))]
+    sortis = np.zeros(nombre, dtype=bool)
+    for debut in range(0, nombre_pas, pas_par_bloc):
+        mains = _positions_main(angles_vises, temps_reaction, durees,
+                                np.arange(debut + 1, min(debut + pas_par_bloc, nombre_pas) + 1))
+        curseurs = mains
+        if angle_rad is not None:
+            deplacements = np.diff(mains, axis=0, prepend=blocs_mains[-1][-1:])
+            dx, dy = deplacements[:, :, 0], deplacements[:, :, 1]
+            angles = np.arctan2(dy, dx) + angle_rad
+            longueurs = np.sqrt(dx * dx + dy * dy)
+            # Un pas immobile donne un déplacement nul : la position déviée reste la même
+            devies = np.stack((longueurs * np.cos(angles), longueurs * np.sin(angles)), axis=2)
+            curseurs = np.empty_like(mains)
+            precedent = blocs_curseurs[-1][-1]
+            for k in range(len(mains)):
+                np.add(precedent, devies[k], out=curseurs[k])
+                np.trunc(curseurs[k], out=curseurs[k])
+                precedent = curseurs[k]
+        ex, ey = curseurs[:, :, 0] - cx, curseurs[:, :, 1] - cy
+        distances2 = ex * ex + ey * ey
+        blocs_mains.append(mains)
+        blocs_curseurs.append(curseurs)
+        blocs_distances.append(distances2)
+        sortis |= (distances2 >= rayon2).any(axis=0)
+        if sortis.all():
+            break
+    return np.concatenate(blocs_mains), np.concatenate(blocs_curseurs), np.concatenate(blocs_distances)
+
+
+def _premieres_intersections(curseurs, distances2, rayon):
+    """
+    Premier point où chaque chemin, parti du centre, croise un cercle centré sur le cercle du jeu
+
+    Un segment dont les deux extrémités sont dans le disque ne le croise pas : le
+    premier croisement est sur le segment qui mène à la première position hors
+    du disque (ou sur le cercle), seul segment dont on calcule l'intersection.
+
+    Returns:
+        Tuple (points (P, 2), NaN si aucun ; indice du segment (P,), -1 si aucun).
+        Le segment j va de la position j à la position j + 1.
+    """
+    dehors = distances2 >= rayon * rayon
+    segments = np.where(dehors.any(axis=0), dehors.argmax(axis=0) - 1, -1)
+    participants = np.arange(curseurs.shape[1])
+    debuts = np.maximum(segments, 0)
+    points = intersections_segments_cercle_lot(
+        curseurs[debuts, participants], curseurs[debuts + 1, participants],
+        (config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y), rayon,
+    )
+    points[segments < 0] = np.nan
+    return points, segments
+
+
+def _angles_signes_deg(points, cibles):
+    """Version vectorisée de angle_signe_deg (NaN propagés)."""
+    cx, cy = config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y
+    angles = np.degrees(np.arctan2(points[:, 1] - cy, points[:, 0] - cx)
+                        - np.arctan2(cibles[:, 1] - cy, cibles[:, 0] - cx))
+    angles = (angles + 180.0) % 360.0 - 180.0
+    return np.where(angles == -180.0, 180.0, angles)
+
+
+def _donnees_essai(curseur, segment, traversee, cible):
+    """Essai au format de Jeu.donnees_chemins (positions enregistrées jusqu'à la traversée)."""
+    pas_ms = 1000.0 / config.FREQUENCE_SIMULATION
+    points = curseur if segment < 0 else curseur[:segment + 2]
+    # Comme le jeu : une position n'est enregistrée que si elle diffère de la précédente
+    garder = np.ones(len(points), dtype=bool)
+    garder[1:] = (np.diff(points, axis=0) != 0).any(axis=1)
+    indices = np.flatnonzero(garder)
+    chemin = [(int(x), int(y)) for x, y in points[indices]]
+    temps_chemin = [round(int(k) * pas_ms) for k in indices]
+    point_traversee = None
+    if segment >= 0:
+        point_traversee = (int(traversee[0]), int(traversee[1]))
+        chemin.append(point_traversee)
+        temps_chemin.append(round((segment + 1) * pas_ms))
+    return {
+        'chemin': chemin,
+        'temps_chemin': temps_chemin,
+        'cible': (int(cible[0]), int(cible[1])),
+        'point_traversee': point_traversee,
+    }
+
+
+def _simuler_paquet(nombre, parametres, modele, graine, geometrie, conserver_chemins=False):
+    """
+    Simule un paquet de participants (exécuté dans un processus)
+
+    Returns:
+        Dictionnaire (voir simuler_participants)
+    """
+    config.definir_geometrie(*geometrie)
+    generateur = np.random.default_rng(graine)
+    cx, cy, r = config.CERCLE_CENTRE_X, config.CERCLE_CENTRE_Y, config.CERCLE_RAYON
+    n_essais = parametres['NOMBRE_CIBLES_MAX']
+    angle_rad = math.radians(parametres['ANGLE_DEVIATION'])
+    # Assez de pas pour que le geste le plus lent, prolongé, sorte du cercle
+    nombre_pas = math.ceil((TEMPS_REACTION_MS[1] + 2 * DUREE_MOUVEMENT_MS[1]) * config.FREQUENCE_SIMULATION / 1000)
+
+    # Paramètres propres à chaque participant
+    variabilite = modele['variabilite']
+    retention = 1 - (1 - modele['retention']) * generateur.lognormal(0.0, variabilite, nombre)
+    retention = np.clip(retention, 0.0, 1.0)
+    taux = modele['taux_apprentissage'] * generateur.lognormal(0.0, variabilite, nombre)
+
+    # Chaque bloc de 8 essais passe une fois par chaque position, dans un ordre aléatoire (voir Cible)
+    blocs = -(-n_essais // 8)
+    directions = generateur.permuted(np.tile(np.arange(8), (nombre, blocs, 1)), axis=2).reshape(nombre, -1)
+    directions = directions[:, :n_essais]
+    positions_cibles = np.array([(int(cx + r * math.cos(a)), int(cy + r * math.sin(a)))
+                                 for a in ANGLES_POSITIONS_FIXES], dtype=float)
+    angles_cibles = np.array(ANGLES_POSITIONS_FIXES)
+
+    etat = np.zeros(nombre)
+    resultats = {
+        'erreurs': np.full((nombre, n_essais), np.nan),
+        'erreurs_vues': np.full((nombre, n_essais), np.nan),
+        'etats': np.zeros((nombre, n_essais)),
+        'directions': directions,
+    }
+    if conserver_chemins:
+        resultats['donnees_chemins'] = [[] for _ in range(nombre)]
+        resultats['mains'] = [[] for _ in range(nombre)]
+    for n in range(n_essais):
+        resultats['etats'][:, n] = etat
+        cibles = positions_cibles[directions[:, n]]
+        visees = angles_cibles[directions[:, n]] - np.radians(
+            etat + generateur.normal(0.0, modele['bruit_moteur_deg'], nombre))
+        devie = phase_essai(n + 1, parametres) == "adaptation"
+        mains, curseurs, distances2 = _trajectoires(
+            visees, generateur.uniform(*TEMPS_REACTION_MS, nombre), generateur.uniform(*DUREE_MOUVEMENT_MS, nombre),
+            angle_rad if devie else None, nombre_pas)
+
+        traversees, segments = _premieres_intersections(curseurs, distances2, r)
+        traversees = np.trunc(traversees)  # int() du jeu
+        intersections, _ = _premieres_intersections(curseurs, distances2, r / 10)
+        resultats['erreurs'][:, n] = _angles_signes_deg(intersections, cibles)
+        erreurs_vues = _angles_signes_deg(traversees, cibles)
+        resultats['erreurs_vues'][:, n] = erreurs_vues
+
+        # Sans traversée, le participant ne voit pas d'erreur
+        etat = (retention * etat + taux * np.nan_to_num(erreurs_vues)
+                + generateur.normal(0.0, modele['bruit_etat_deg'], nombre))
+        if conserver_chemins:
+            for p in range(nombre):
+                resultats['donnees_chemins'][p].append(
+                    _donnees_essai(curseurs[:, p], segments[p], traversees[p], cibles[p]))
+                resultats['mains'][p].append(mains[:, p])
+    return resultats
+
+
+def simuler_participants(nombre, parametres=None, modele=None, graine=0, conserver_chemins=False,
+                         processus=None):
+    """
+    Simule des participants passant le protocole
+
+    Args:
+        nombre: Nombre de participants
+        parametres: Paramètres du protocole (voir parametres_protocole)
+        modele: Paramètres du modèle d'état (voir modele_adaptation)
+        graine: Graine aléatoire (résultat reproductible quel que soit le nombre de processus)
+        conserver_chemins: True pour garder les essais au format de Jeu.donnees_chemins
+            (à réserver à quelques participants)
+        processus: Nombre de processus (1 = calcul dans le processus courant)
+
+    Returns:
+        Dictionnaire de tableaux (nombre, n_essais) :
+            - 'erreurs': erreur angulaire signée des métriques (cercle orange), NaN sans intersection
+            - 'erreurs_vues': erreur signée au point de traversée, vue par le participant
+            - 'etats': état d'adaptation au début de chaque essai (°)
+            - 'directions': indice de la cible dans ANGLES_POSITIONS_FIXES
+        et, avec conserver_chemins, 'donnees_chemins' (liste des sessions, une par
+        participant) et 'mains' (positions non déviées de la souris à chaque pas)
+    """
+    parametres = parametres or parametres_protocole()
+    modele = modele or modele_adaptation()
+    geometrie = _geometrie()
+    taille = config.SIMULATION_PARTICIPANTS_PAR_PAQUET
+    tailles = [taille] * (nombre // taille) + ([nombre % taille] if nombre % taille else [])
+    graines = np.random.SeedSequence(graine).spawn(len(tailles))
+    arguments = ([parametres] * len(tailles), [modele] * len(tailles), graines,
+                 [geometrie] * len(tailles), [conserver_chemins] * len(tailles))
+    if processus == 1 or len(tailles) < 2:
+        paquets = list(map(_simuler_paquet, tailles, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=processus) as executeur:
+            paquets = list(executeur.map(_simuler_paquet, tailles, *arguments))
+    resultats = {}
+    for cle in paquets[0] if paquets else ():
+        if isinstance(paquets[0][cle], list):
+            resultats[cle] = [element for paquet in paquets for element in paquet[cle]]
+        else:
+            resultats[cle] = np.concatenate([paquet[cle] for paquet in paquets])
+    return resultats
+
+
+@lru_cache(maxsize=None)
+def quantile_student(ddl, probabilite):
+    """Quantile de la loi de Student à ddl degrés de liberté, estimé par tirage (sans scipy)."""
+    tirages = np.random.default_rng(ddl).standard_t(ddl, TIRAGES_QUANTILE)
+    return float(np.quantile(tirages, probabilite))
+
+
+def _effets_paquet(nombre, parametres, modele, graine, geometrie):
+    """Effets et somme des erreurs par essai d'un paquet de participants (exécuté dans un processus)."""
+    erreurs = _simuler_paquet(nombre, parametres, modele, graine, geometrie)['erreurs']
+    effets = calculer_effets(erreurs, phases_protocole(parametres))
+    return effets, np.nansum(erreurs, axis=0), (~np.isnan(erreurs)).sum(axis=0)
+
+
+def puissance_test(valeurs, alpha):
+    """
+    Puissance d'un test t à un échantillon (bilatéral, moyenne nulle sous H0)
+
+    Args:
+        valeurs: Tableau (n_groupes, effectif) des effets de chaque groupe simulé, NaN ignorés
+        alpha: Risque de première espèce
+
+    Returns:
+        Proportion des groupes pour lesquels l'effet est significatif
+    """
+    effectifs = (~np.isnan(valeurs)).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        moyennes = np.nanmean(valeurs, axis=1)
+        ecarts_types = np.nanstd(valeurs, axis=1, ddof=1)
+        statistiques = np.abs(moyennes) / (ecarts_types / np.sqrt(effectifs))
+    critiques = np.full(len(valeurs), np.inf)
+    for ddl in np.unique(effectifs[effectifs >= 2] - 1):
+        critiques[effectifs - 1 == ddl] = quantile_student(int(ddl), 1 - alpha / 2)
+    return float(np.mean(statistiques > critiques))
+
+
+def courbes_puissance(angles, effectifs, groupes=500, parametres=None, modele=None, effet=None, alpha=0.05,
+                      graine=0, processus=None):
+    """
+    Calcule la puissance statistique de l'effet choisi pour chaque angle et chaque effectif
+
+    Pour chaque angle, groupes x max(effectifs) participants sont simulés ; un
+    groupe de n participants est formé des n premiers de chaque groupe complet.
+
+    Args:
+        angles: Angles de déviation à comparer (°)
+        effectifs: Nombres de participants par groupe
+        groupes: Nombre de groupes simulés par angle
+        parametres, modele: Voir simuler_participants (ANGLE_DEVIATION est remplacé)
+        effet: Nom de l'effet testé (voir calculer_effets) ; par défaut l'effet
+            consécutif s'il y a une post-adaptation, sinon l'effet initial
+        alpha: Risque de première espèce du test t
+        graine, processus: Voir simuler_participants
+
+    Returns:
+        Dictionnaire avec les angles, les effectifs, 'puissance' (n_angles, n_effectifs),
+        l'effet moyen et son écart-type entre participants par angle, la courbe
+        d'apprentissage moyenne simulée par angle et les paramètres de la simulation
+    """
+    parametres = parametres or parametres_protocole()
+    modele = modele or modele_adaptation()
+    if effet is None:
+        effet = 'effet_consecutif' if parametres['CIBLE_FIN_DEVIATION'] else 'effet_initial'
+    geometrie = _geometrie()
+    effectif_max = max(effectifs)
+    nombre = groupes * effectif_max
+    taille = config.SIMULATION_PARTICIPANTS_PAR_PAQUET
+    tailles = [taille] * (nombre // taille) + ([nombre % taille] if nombre % taille else [])
+
+    # Un travail par paquet de chaque angle, chacun avec sa propre graine dérivée
+    travaux = []
+    for graine_angle, angle in zip(np.random.SeedSequence(graine).spawn(len(angles)), angles):
+        parametres_angle = dict(parametres, ANGLE_DEVIATION=angle)
+        for taille_paquet, graine_paquet in zip(tailles, graine_angle.spawn(len(tailles))):
+            travaux.append((taille_paquet, parametres_angle, modele, graine_paquet, geometrie))
+    if processus == 1 or len(travaux) < 2:
+        paquets = [_effets_paquet(*travail) for travail in travaux]
+    else:
+        with ProcessPoolExecutor(max_workers=processus) as executeur:
+            paquets = list(executeur.map(_effets_paquet, *zip(*travaux)))
+
+    puissance = np.zeros((len(angles), len(effectifs)))
+    effet_moyen, effet_ecart_type, courbes = [], [], []
+    for a in range(len(angles)):
+        paquets_angle = paquets[a * len(tailles):(a + 1) * len(tailles)]
+        valeurs = np.concatenate([effets[effet] for effets, _, _ in paquets_angle])
+        effet_moyen.append(np.nanmean(valeurs))
+        effet_ecart_type.append(np.nanstd(valeurs, ddof=1))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            courbes.append(sum(p[1] for p in paquets_angle) / sum(p[2] for p in paquets_angle))
+        valeurs = valeurs.reshape(groupes, effectif_max)
+        for e, effectif in enumerate(effectifs):
+            puissance[a, e] = puissance_test(valeurs[:, :effectif], alpha)
+    return {
+        'angles': list(angles),
+        'effectifs': list(effectifs),
+        'puissance': puissance,
+        'effet': effet,
+        'effet_moyen': np.array(effet_moyen),
+        'effet_ecart_type': np.array(effet_ecart_type),
+        'courbes': np.array(courbes),
+        'phases': phases_protocole(parametres),
+        'alpha': alpha,
+        'groupes': groupes,
+        'parametres': parametres,
+        'modele': modele,
+    }
+
+
+def generer_pdf_puissance(resultats, nom_fichier=None):
+    """
+    Génère le PDF des courbes de puissance et des courbes d'apprentissage simulées
+
+    Args:
+        resultats: Dictionnaire renvoyé par courbes_puissance
+        nom_fichier: Nom du fichier (sans extension). Si None, utilise un timestamp
+
+    Returns:
+        Chemin complet du fichier créé ou None en cas d'erreur
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    dossier_pdf = "pdf"
+    if not os.path.exists(dossier_pdf):
+        os.makedirs(dossier_pdf)
+    if nom_fichier:
+        nom_fichier = "".join(c for c in nom_fichier if c.isalnum() or c in "._- ")
+    if not nom_fichier:
+        nom_fichier = f"puissance_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    nom_fichier_complet = os.path.join(dossier_pdf, f"{nom_fichier}.pdf")
+
+    couleurs_phases = {'reference': '#d5f5e3', 'adaptation': '#fadbd8', 'post_adaptation': '#d6eaf8'}
+    noms_phases = {'reference': 'Référence', 'adaptation': 'Adaptation', 'post_adaptation': 'Post-adaptation'}
+    libelles = {'effet_initial': "début de l'adaptation", 'effet_final': "fin de l'adaptation",
+                'effet_consecutif': "effet consécutif"}
+    parametres = resultats['parametres']
+    protocole = (f"{parametres['NOMBRE_CIBLES_MAX']} essais, déviation de l'essai "
+                 f"{parametres['CIBLE_DEBUT_DEVIATION']}"
+                 + (f" à {parametres['CIBLE_FIN_DEVIATION'] - 1}" if parametres['CIBLE_FIN_DEVIATION'] else ""))
+
+    try:
+        with PdfPages(nom_fichier_complet) as pdf:
+            # ----- Page 1 : puissance en fonction de l'effectif -----
+            fig = plt.figure(figsize=(11, 8))
+            ax = fig.add_subplot(111)
+            for a, angle in enumerate(resultats['angles']):
+                ax.plot(resultats['effectifs'], resultats['puissance'][a], 'o-', markersize=4,
+                        label=f"{angle:g}° (effet {resultats['effet_moyen'][a]:.1f} ± "
+                              f"{resultats['effet_ecart_type'][a]:.1f}°)")
+            ax.axhline(PUISSANCE_VISEE, color='black', linewidth=0.8, linestyle='--')
+            ax.set_ylim(0, 1.02)
+            ax.set_title(f"Puissance : {libelles[resultats['effet']]} (test t, α = {resultats['alpha']:g}, "
+                         f"{resultats['groupes']} groupes simulés)", fontsize=14, fontweight='bold')
+            ax.set_xlabel('Participants par groupe', fontsize=10)
+            ax.set_ylabel('Puissance', fontsize=10)
+            ax.text(0.01, 0.01, protocole, transform=ax.transAxes, fontsize=8, color='gray')
+            ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+            ax.legend(loc='lower right', fontsize=8, title="Angle de déviation")
+            fig.tight_layout()
+            pdf.savefig(fig, bbox_inches='tight')
+            plt.close(fig)
+
+            # ----- Page 2 : courbes d'apprentissage moyennes simulées -----
+            fig = plt.figure(figsize=(11, 8))
+            ax = fig.add_subplot(111)
+            numeros = np.arange(1, len(resultats['phases']) + 1)
+            for phase, couleur in couleurs_phases.items():
+                indices = np.flatnonzero(resultats['phases'] == phase)
+                if len(indices):
+                    ax.axvspan(indices[0] + 0.5, indices[-1] + 1.5, color=couleur, alpha=0.6,
+                               label=noms_phases[phase])
+            for angle, courbe in zip(resultats['angles'], resultats['courbes']):
+                ax.plot(numeros, courbe, 'o-', markersize=3, label=f"{angle:g}°")
+            ax.axhline(0, color='black', linewidth=0.8)
+            modele = resultats['modele']
+            ax.set_title(f"Courbes d'apprentissage simulées (A = {modele['retention']:g}, "
+                         f"B = {modele['taux_apprentissage']:g})", fontsize=14, fontweight='bold')
+            ax.set_xlabel('Essai', fontsize=10)
+            ax.set_ylabel('Erreur angulaire signée moyenne (°)', fontsize=10)
+            ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+            ax.legend(loc='upper right', fontsize=8)
+            fig.tight_layout()
+            pdf.savefig(fig, bbox_inches='tight')
+            plt.close(fig)
+
+        return os.path.abspath(nom_fichier_complet)
+    except Exception as e:
+        print(f"Erreur lors de la génération du PDF de puissance : {e}")
+        return None
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Simulation de participants et courbes de puissance")
+    parseur.add_argument('--angles', type=float, nargs='+', default=None, help="Angles de déviation (°)")
+    parseur.add_argument('--effectifs', type=int, nargs='+', default=[8, 12, 16, 24, 32],
+                         help="Nombres de participants par groupe")
+    parseur.add_argument('--groupes', type=int, default=500, help="Groupes simulés par angle")
+    parseur.add_argument('--essais', type=int, default=None, help="Nombre d'essais (NOMBRE_CIBLES_MAX)")
+    parseur.add_argument('--debut', type=int, default=None, help="Premier essai dévié (CIBLE_DEBUT_DEVIATION)")
+    parseur.add_argument('--fin', type=int, default=None, help="Premier essai après la déviation (CIBLE_FIN_DEVIATION)")
+    parseur.add_argument('--effet', choices=('effet_initial', 'effet_final', 'effet_consecutif'), default=None,
+                         help="Effet testé")
+    parseur.add_argument('--alpha', type=float, default=0.05, help="Risque de première espèce")
+    parseur.add_argument('--graine', type=int, default=0, help="Graine aléatoire")
+    parseur.add_argument('--processus', type=int, default=None, help="Nombre de processus")
+    parseur.add_argument('--nom', default=None, help="Nom du PDF")
+    parseur.add_argument('--sessions', type=int, default=0,
+                         help="Enregistrer N sessions synthétiques (premier angle) au lieu des courbes")
+    parseur.add_argument('--dossier', default=None, help="Dossier des sessions synthétiques")
+    arguments = parseur.parse_args()
+
+    # Les sessions enregistrées reprennent les paramètres de config
+    for nom, valeur in (('NOMBRE_CIBLES_MAX', arguments.essais), ('CIBLE_DEBUT_DEVIATION', arguments.debut),
+                        ('CIBLE_FIN_DEVIATION', arguments.fin)):
+        if valeur is not None:
+            setattr(config, nom, valeur)
+    angles = arguments.angles or [config.ANGLE_DEVIATION]
+
+    debut = time.perf_counter()
+    if arguments.sessions:
+        from session import sauvegarder_session
+        from catalogue import importer_dossier
+        config.ANGLE_DEVIATION = angles[0]
+        simulation = simuler_participants(arguments.sessions, graine=arguments.graine, conserver_chemins=True,
+                                          processus=arguments.processus)
+        for p, donnees_chemins in enumerate(simulation['donnees_chemins']):
+            sauvegarder_session(donnees_chemins, f"simulation_{p:03d}", arguments.dossier, cataloguer=False)
+        importer_dossier(arguments.dossier)  # Toutes les sessions en une transaction
+        print(f"{arguments.sessions} sessions synthétiques en {time.perf_counter() - debut:.2f} s")
+    else:
+        resultats = courbes_puissance(angles, arguments.effectifs, arguments.groupes, effet=arguments.effet,
+                                      alpha=arguments.alpha, graine=arguments.graine,
+                                      processus=arguments.processus)
+        for angle, ligne in zip(resultats['angles'], resultats['puissance']):
+            valeurs = ", ".join(f"n={n} : {p:.2f}" for n, p in zip(resultats['effectifs'], ligne))
+            print(f"{angle:g}° : {valeurs}")
+        chemin = generer_pdf_puissance(resultats, arguments.nom)
+        print(f"{arguments.groupes * max(arguments.effectifs) * len(angles)} participants simulés "
+              f"en {time.perf_counter() - debut:.2f} s ; PDF : {chemin}")
@@ -0,0 +1,204 @@
+"""
+Module de traçage léger (spans et compteurs) exporté au format Chrome trace-event
+
+Lorsque l'enregistrement est désactivé, span() retourne un gestionnaire de
+contexte partagé qui ne fait rien : le coût se limite à un appel de fonction.
+Les traces s'ouvrent dans chrome://tracing ou https://ui.perfetto.dev.
+
+Usage :
+    with traces.span("dessiner"):
+        ...
+    traces.compteur("cadence", erreur_ms=0.3)
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+import config
+
+_actif = False
+_evenements = deque(maxlen=config.TRACES_MAX_EVENEMENTS)
+_origine = time.perf_counter()
+
+
+def _horodatage_us():
+    """Temps écoulé depuis le chargement du module, en microsecondes."""
+    return (time.perf_counter() - _origine) * 1e6
+
+
+class _Span:
+    """Intervalle de temps mesuré (événement complet « X »)"""
+
+    __slots__ = ('nom', 'categorie', 'arguments', 'debut')
+
+    def __init__(self, nom, categorie, arguments):
+        self.nom = nom
+        self.categorie = categorie
+        self.arguments = arguments
+        self.debut = 0.0
+
+    def __enter__(self):
+        self.debut = _horodatage_us()
+        return self
+
+    def __exit__(self, *exception):
+        fin = _horodatage_us()
+        evenement = {
+            'name': self.nom, 'cat': self.categorie, 'ph': 'X',
+            'ts': self.debut, 'dur': fin - self.debut,
+            'pid': os.getpid(), 'tid': threading.get_ident(),
+        }
+        if self.arguments:
+            evenement['args'] = self.arguments
+        _evenements.append(evenement)
+        return False
+
+
+class _SpanInactif:
+    """Gestionnaire de contexte vide utilisé quand le traçage est désactivé"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        return False
+
+
+_SPAN_INACTIF = _SpanInactif()
+
+
+def span(nom, categorie="jeu", **arguments):
+    """
+    Mesure la durée d'un bloc de code
+
+    Args:
+        nom: Nom affiché dans la trace
+        categorie: Catégorie (jeu, interface, rapport...)
+        arguments: Valeurs attachées à l'événement
+
+    Returns:
+        Gestionnaire de contexte
+    """
+    if not _actif:
+        return _SPAN_INACTIF
+    return _Span(nom, categorie, arguments)
+
+
+def compteur(nom, categorie="jeu", **valeurs):
+    """
+    Enregistre la valeur d'un ou plusieurs compteurs (événement « C »)
+
+    Args:
+        nom: Nom du groupe de compteurs
+        categorie: Catégorie
+        valeurs: Valeurs numériques à tracer
+    """
+    if not _actif:
+        return
+    _evenements.append({
+        'name': nom, 'cat': categorie, 'ph': 'C', 'ts': _horodatage_us(),
+        'pid': os.getpid(), 'tid': threading.get_ident(), 'args': valeurs,
+    })
+
+
+def est_actif():
+    """Indique si l'enregistrement des traces est en cours."""
+    return _actif
+
+
+def demarrer():
+    """Démarre l'enregistrement (les événements précédents sont effacés)."""
+    global _actif
+    _evenements.clear()
+    _actif = True
+
+
+def arreter(dossier=None):
+    """
+    Arrête l'enregistrement et écrit la trace
+
+    Args:
+        dossier: Dossier de destination (par défaut config.DOSSIER_TRACES)
+
+    Returns:
+        Chemin du fichier écrit, ou None si aucun événement
+    """
+    global _actif
+    _actif = False
+    if not _evenements:
+        return None
+    return exporter_chrome(dossier=dossier)
+
+
+def arreter_en_arriere_plan(dossier=None):
+    """
+    Arrête l'enregistrement et écrit la trace dans un thread, sans bloquer la boucle de jeu
+
+    Le tampon est remplacé par un tampon vide et l'ancien est confié au thread :
+    un nouvel enregistrement peut démarrer pendant l'écriture. Le thread n'est pas
+    démon, la trace est donc terminée même si le jeu se ferme entre-temps.
+
+    Args:
+        dossier: Dossier de destination (par défaut config.DOSSIER_TRACES)
+
+    Returns:
+        Chemin du fichier en cours d'écriture, ou None si aucun événement
+    """
+    global _actif, _evenements
+    _actif = False
+    if not _evenements:
+        return None
+    chemin = _chemin_trace(dossier)
+    evenements, _evenements = _evenements, deque(maxlen=config.TRACES_MAX_EVENEMENTS)
+    threading.Thread(target=exporter_chrome, args=(chemin, None, evenements), name="export_trace").start()
+    return chemin
+
+
+def basculer():
+    """
+    Démarre ou arrête l'enregistrement (raccourci clavier)
+
+    Returns:
+        Chemin de la trace écrite à l'arrêt (écriture en arrière-plan), sinon None
+    """
+    if _actif:
+        chemin = arreter_en_arriere_plan()
+        print(f"Traçage arrêté : {chemin}")
+        return chemin
+    demarrer()
+    print("Traçage démarré")
+    return None
+
+
+def _chemin_trace(dossier=None):
+    """Chemin horodaté d'une nouvelle trace (le dossier est créé si besoin)."""
+    dossier = dossier or config.DOSSIER_TRACES
+    if not os.path.exists(dossier):
+        os.makedirs(dossier)
+    return os.path.join(dossier, f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+
+
+def exporter_chrome(chemin=None, dossier=None, evenements=None):
+    """
+    Écrit les événements enregistrés au format JSON Chrome trace-event
+
+    Args:
+        chemin: Chemin du fichier (par défaut, horodaté dans le dossier des traces)
+        dossier: Dossier de destination si chemin n'est pas donné (par défaut config.DOSSIER_TRACES)
+        evenements: Événements à écrire (par défaut ceux du tampon d'enregistrement)
+
+    Returns:
+        Chemin du fichier écrit
+    """
+    if chemin is None:
+        chemin = _chemin_trace(dossier)
+    if evenements is None:
+        evenements = _evenements
+    metadonnees = {'name': 'process_name', 'ph': 'M', 'pid': os.getpid(), 'args': {'name': 'Jeu de Cible'}}
+    with open(chemin, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': [metadonnees] + list(evenements), 'displayTimeUnit': 'ms'}, f)
+    return chemin
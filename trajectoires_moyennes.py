@@ -0,0 +1,177 @@
+"""
+Module des trajectoires normalisées et des trajectoires moyennes par direction et par phase
+
+Chaque essai est rééchantillonné sur un nombre fixe de points, régulièrement
+répartis en fraction de sa durée ou de la longueur du chemin parcouru. Comme
+dans l'analyse cinématique, les essais sont décalés pour former une seule série
+croissante : une interpolation par coordonnée suffit pour tout le lot, quelles
+que soient les longueurs des chemins. Les trajectoires sont ensuite moyennées
+par direction de cible et par phase du protocole.
+"""
+import numpy as np
+import config
+from analyse_cinematique import mettre_en_tableaux
+from cible import ANGLES_POSITIONS_FIXES, index_position_fixe
+from session import phase_essai
+
+PHASES = ('reference', 'adaptation', 'post_adaptation')
+
+
+def reechantillonner_normalise(donnees_chemins, nombre_points=None, base=None):
+    """
+    Rééchantillonne tous les essais sur une grille normalisée commune
+
+    Args:
+        donnees_chemins: Liste de dictionnaires (voir GenerateurPDF.generer_pdf)
+        nombre_points: Nombre de points par essai (par défaut config.NOMBRE_POINTS_NORMALISES)
+        base: "temps" ou "longueur" (par défaut config.BASE_NORMALISATION)
+
+    Returns:
+        Tuple (grille, positions, exploitable) : grille (nombre_points,) de 0 à 1,
+        positions (n_essais, nombre_points, 2) en pixels (NaN pour un essai
+        inexploitable), masque des essais exploitables (au moins deux points,
+        durée ou longueur non nulle)
+    """
+    nombre_points = nombre_points or config.NOMBRE_POINTS_NORMALISES
+    base = base or config.BASE_NORMALISATION
+    if base not in ("temps", "longueur"):
+        raise ValueError(f"Base de normalisation inconnue : {base}")
+
+    grille = np.linspace(0.0, 1.0, nombre_points)
+    x, y, t, longueurs = mettre_en_tableaux(donnees_chemins)
+    positions = np.full((len(longueurs), nombre_points, 2), np.nan)
+    exploitable = longueurs >= 2
+    if not exploitable.any():
+        return grille, positions, exploitable
+
+    # Ne garder que les points des essais d'au moins deux points
+    garder = np.repeat(exploitable, longueurs)
+    x, y, t, longueurs = x[garder], y[garder], t[garder], longueurs[exploitable]
+    debuts = np.concatenate(([0], np.cumsum(longueurs)[:-1]))
+    fins = debuts + longueurs - 1
+
+    if base == "longueur":
+        pas = np.hypot(np.diff(x), np.diff(y))
+        pas[debuts[1:] - 1] = 0.0  # Pas de saut d'un essai au suivant
+        abscisse = np.concatenate(([0.0], np.cumsum(pas)))
+    else:
+        abscisse = t
+    origines = abscisse[debuts]
+    etendues = abscisse[fins] - origines
+    non_degeneres = etendues > 0
+
+    # Abscisse normalisée dans [0, 1], décalée de 2 par essai pour une série croissante unique
+    decalages = 2.0 * np.arange(len(longueurs))
+    u = (abscisse - np.repeat(origines, longueurs)) / np.repeat(np.where(non_degeneres, etendues, 1.0), longueurs)
+    u_decale = u + np.repeat(decalages, longueurs)
+    requetes = (grille[None, :] + decalages[:, None]).ravel()
+    reechantillonnees = np.empty((len(longueurs), nombre_points, 2))
+    reechantillonnees[:, :, 0] = np.interp(requetes, u_decale, x).reshape(len(longueurs), nombre_points)
+    reechantillonnees[:, :, 1] = np.interp(requetes, u_decale, y).reshape(len(longueurs), nombre_points)
+
+    indices = np.flatnonzero(exploitable)
+    positions[indices[non_degeneres]] = reechantillonnees[non_degeneres]
+    exploitable[indices[~non_degeneres]] = False
+    return grille, positions, exploitable
+
+
+def _ecart_type_lateral(positions, moyenne):
+    """Écart-type des écarts à la trajectoire moyenne, perpendiculairement à celle-ci (NaN où elle est immobile)."""
+    # Tangentes par différences centrées sur ~5 % de la trajectoire (moins sensibles au bruit du tracé)
+    demi = max(1, len(moyenne) // 20)
+    indices = np.arange(len(moyenne))
+    tangentes = (moyenne[np.minimum(indices + demi, len(moyenne) - 1)]
+                 - moyenne[np.maximum(indices - demi, 0)])
+    normes = np.hypot(tangentes[:, 0], tangentes[:, 1])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        normales = np.stack((-tangentes[:, 1], tangentes[:, 0]), axis=1) / normes[:, None]
+    lateral = np.einsum('ekc,kc->ek', positions - moyenne, normales)
+    if len(positions) < 2:
+        return np.where(normes > 0, 0.0, np.nan), normales
+    return lateral.std(axis=0, ddof=1), normales
+
+
+def trajectoires_moyennes(donnees_chemins, nombre_points=None, base=None):
+    """
+    Calcule la trajectoire moyenne ± écart-type de chaque couple (direction, phase)
+
+    Args:
+        donnees_chemins: Liste de dictionnaires (voir GenerateurPDF.generer_pdf)
+        nombre_points, base: Voir reechantillonner_normalise
+
+    Returns:
+        Dictionnaire :
+            - 'base', 'grille': base et grille de la normalisation
+            - 'positions', 'exploitable': trajectoires normalisées de chaque essai
+            - 'directions', 'phases': direction (indice dans ANGLES_POSITIONS_FIXES) et phase de chaque essai
+            - 'groupes': liste de dictionnaires, un par couple (direction, phase) ayant au
+              moins un essai exploitable, avec 'direction', 'phase', 'essais' (indices),
+              'moyenne' (nombre_points, 2), 'ecart_type' (nombre_points, 2, par coordonnée),
+              'ecart_type_lateral' (nombre_points,) et 'normales' (nombre_points, 2)
+    """
+    base = base or config.BASE_NORMALISATION
+    grille, positions, exploitable = reechantillonner_normalise(donnees_chemins, nombre_points, base)
+    directions = np.array([index_position_fixe(*donnees['cible']) for donnees in donnees_chemins], dtype=np.int64)
+    phases = np.array([phase_essai(i + 1) for i in range(len(donnees_chemins))], dtype='<U16')
+
+    groupes = []
+    for phase in PHASES:
+        for direction in range(len(ANGLES_POSITIONS_FIXES)):
+            essais = np.flatnonzero(exploitable & (directions == direction) & (phases == phase))
+            if not len(essais):
+                continue
+            lot = positions[essais]
+            moyenne = lot.mean(axis=0)
+            ecart_type = lot.std(axis=0, ddof=1) if len(essais) > 1 else np.zeros_like(moyenne)
+            ecart_type_lateral, normales = _ecart_type_lateral(lot, moyenne)
+            groupes.append({
+                'direction': direction,
+                'phase': phase,
+                'essais': essais,
+                'moyenne': moyenne,
+                'ecart_type': ecart_type,
+                'ecart_type_lateral': ecart_type_lateral,
+                'normales': normales,
+            })
+    return {
+        'base': base,
+        'grille': grille,
+        'positions': positions,
+        'exploitable': exploitable,
+        'directions': directions,
+        'phases': phases,
+        'groupes': groupes,
+    }
+
+
+def exporter_trajectoires_npz(chemin_fichier, resultats):
+    """
+    Écrit les trajectoires normalisées et moyennes dans une archive NumPy (.npz)
+
+    Args:
+        chemin_fichier: Chemin du fichier à créer
+        resultats: Dictionnaire retourné par trajectoires_moyennes
+
+    Returns:
+        Chemin du fichier créé
+    """
+    groupes = resultats['groupes']
+    nombre_points = len(resultats['grille'])
+    with open(chemin_fichier, 'wb') as f:
+        np.savez_compressed(
+            f,
+            base=np.array(resultats['base']),
+            grille=resultats['grille'],
+            positions=resultats['positions'],
+            exploitable=resultats['exploitable'],
+            directions=resultats['directions'],
+            phases=resultats['phases'],
+            groupes_direction=np.array([g['direction'] for g in groupes], dtype=np.int64),
+            groupes_phase=np.array([g['phase'] for g in groupes], dtype='<U16'),
+            groupes_effectif=np.array([len(g['essais']) for g in groupes], dtype=np.int64),
+            moyennes=np.array([g['moyenne'] for g in groupes]).reshape(len(groupes), nombre_points, 2),
+            ecarts_types=np.array([g['ecart_type'] for g in groupes]).reshape(len(groupes), nombre_points, 2),
+            ecarts_types_lateraux=np.array([g['ecart_type_lateral'] for g in groupes]).reshape(len(groupes),
+                                                                                               nombre_points),
+        )
+    return chemin_fichier
@@ -0,0 +1,370 @@
+"""
+Module des widgets d'interface (boutons, champs de saisie, étiquettes, panneaux)
+
+Les widgets sont conservés d'une image à l'autre : chacun garde son rendu dans
+une surface refaite seulement quand son contenu change, et une couche assemble
+ses widgets dans une surface composite redessinée en un seul blit par image.
+La disposition (position et taille des widgets) n'est recalculée qu'au
+changement de taille de l'écran ou de configuration, et le survol ou le clic
+se résout par un index des rectangles des widgets interactifs.
+"""
+import pygame
+import config
+from polices import obtenir_police
+
+# Incrémentée à chaque changement de configuration : force les couches à se redisposer
+_generation = 0
+
+
+def invalider_dispositions():
+    """Force toutes les couches à recalculer leur disposition à la prochaine image."""
+    global _generation
+    _generation += 1
+
+
+def _tronquer(police, texte, couleur, largeur_max):
+    """
+    Rend un texte en le tronquant avec "..." s'il dépasse la largeur disponible
+
+    Args:
+        police: Police pygame
+        texte: Texte à rendre
+        couleur: Couleur du texte
+        largeur_max: Largeur disponible en pixels
+
+    Returns:
+        Surface du texte
+    """
+    surface = police.render(texte, True, couleur)
+    if surface.get_width() > largeur_max - 10:
+        while surface.get_width() > largeur_max - 30:
+            texte = texte[:-1]
+            surface = police.render(texte + "...", True, couleur)
+    return surface
+
+
+class Widget:
+    """Élément d'interface dont le rendu est conservé tant qu'il n'est pas modifié"""
+
+    interactif = False  # Les widgets interactifs sont indexés pour le survol et le clic
+
+    def __init__(self, proportion_police=None):
+        """
+        Args:
+            proportion_police: Taille de police en proportion de la hauteur de l'écran
+        """
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.proportion_police = proportion_police
+        self.police = None
+        self._surface = None  # Rendu en cache (None : à refaire)
+
+    def placer(self, rect):
+        """
+        Place le widget (appelé par la disposition de sa couche)
+
+        Args:
+            rect: Rectangle du widget à l'écran
+        """
+        self.rect = pygame.Rect(rect)
+        if self.proportion_police:
+            self.police = obtenir_police(int(config.HAUTEUR * self.proportion_police))
+        self.invalider()
+
+    def invalider(self):
+        """Demande un nouveau rendu du widget."""
+        self._surface = None
+
+    @property
+    def modifie(self):
+        """Indique si le rendu en cache est à refaire."""
+        return self._surface is None
+
+    def surface(self):
+        """Retourne le rendu du widget, refait seulement s'il a été invalidé."""
+        if self._surface is None:
+            self._surface = self._rendre()
+        return self._surface
+
+    def _rendre(self):
+        raise NotImplementedError
+
+    def dessiner_dynamique(self, ecran):
+        """
+        Dessine ce qui change à chaque image (ex. curseur clignotant) par-dessus la couche
+
+        Returns:
+            Description de ce qui a été dessiné (None si rien), comparée d'une image à l'autre
+        """
+        return None
+
+    def _fond_et_bordure(self, couleur_fond, couleur_bordure, epaisseur):
+        surface = pygame.Surface(self.rect.size)
+        surface.fill(couleur_fond)
+        pygame.draw.rect(surface, couleur_bordure, surface.get_rect(), epaisseur)
+        return surface
+
+
+class Etiquette(Widget):
+    """Texte statique, ancré sur un point"""
+
+    def __init__(self, texte, proportion_police, couleur=None):
+        """
+        Args:
+            texte: Texte affiché
+            proportion_police: Taille de police en proportion de la hauteur de l'écran
+            couleur: Couleur du texte (noir par défaut)
+        """
+        super().__init__(proportion_police)
+        self.texte = texte
+        self.couleur = couleur or config.NOIR
+        self.position = (0, 0)
+        self.ancrage = "center"
+
+    def placer(self, position, ancrage="center"):
+        """
+        Place l'étiquette
+
+        Args:
+            position: Tuple (x, y) du point d'ancrage
+            ancrage: Point du texte placé sur position ("center", "topleft", ...)
+        """
+        self.position = position
+        self.ancrage = ancrage
+        super().placer(self.rect)
+        self.rect = self.surface().get_rect(**{ancrage: position})
+
+    def definir_texte(self, texte):
+        """Change le texte (nouveau rendu seulement si le texte diffère)."""
+        if texte != self.texte:
+            self.texte = texte
+            self.invalider()
+            self.rect = self.surface().get_rect(**{self.ancrage: self.position})
+
+    def _rendre(self):
+        return self.police.render(self.texte, True, self.couleur)
+
+
+class Panneau(Widget):
+    """Rectangle de fond d'une fenêtre modale"""
+
+    def __init__(self, couleur=None, couleur_bordure=None, epaisseur_bordure=3):
+        """
+        Args:
+            couleur: Couleur du fond (blanc par défaut)
+            couleur_bordure: Couleur de la bordure (noir par défaut)
+            epaisseur_bordure: Épaisseur de la bordure en pixels
+        """
+        super().__init__()
+        self.couleur = couleur or config.BLANC
+        self.couleur_bordure = couleur_bordure or config.NOIR
+        self.epaisseur_bordure = epaisseur_bordure
+
+    def _rendre(self):
+        return self._fond_et_bordure(self.couleur, self.couleur_bordure, self.epaisseur_bordure)
+
+
+class Bouton(Widget):
+    """Bouton cliquable portant un texte centré"""
+
+    interactif = True
+
+    def __init__(self, action, texte, couleur, proportion_police, epaisseur_bordure=3):
+        """
+        Args:
+            action: Valeur retournée quand le bouton est cliqué (ex. "quitter")
+            texte: Texte du bouton
+            couleur: Couleur du fond
+            proportion_police: Taille de police en proportion de la hauteur de l'écran
+            epaisseur_bordure: Épaisseur de la bordure en pixels
+        """
+        super().__init__(proportion_police)
+        self.action = action
+        self.texte = texte
+        self.couleur = couleur
+        self.epaisseur_bordure = epaisseur_bordure
+
+    def _rendre(self):
+        surface = self._fond_et_bordure(self.couleur, config.NOIR, self.epaisseur_bordure)
+        texte = self.police.render(self.texte, True, config.BLANC)
+        surface.blit(texte, texte.get_rect(center=surface.get_rect().center))
+        return surface
+
+
+class ChampTexte(Widget):
+    """Champ de saisie d'une ligne avec curseur clignotant"""
+
+    interactif = True
+
+    def __init__(self, valeur, proportion_police, caracteres_acceptes=None, indication="",
+                 couleur_bordure_active=None, nom=None):
+        """
+        Args:
+            valeur: Texte initial
+            proportion_police: Taille de police en proportion de la hauteur de l'écran
+            caracteres_acceptes: Fonction caractère -> bool filtrant la saisie (tout accepter par défaut)
+            indication: Texte grisé affiché quand le champ est vide
+            couleur_bordure_active: Couleur de la bordure quand le champ a le focus (rouge par défaut)
+            nom: Nom de la valeur saisie (ex. "RAYON_CIBLE")
+        """
+        super().__init__(proportion_police)
+        self.nom = nom
+        self.action = None  # Un champ ne déclenche pas d'action : le clic lui donne le focus
+        self.valeur = str(valeur)
+        self.caracteres_acceptes = caracteres_acceptes or (lambda caractere: True)
+        self.indication = indication
+        self.couleur_bordure_active = couleur_bordure_active or config.ROUGE
+        self.actif = False
+        self._fin_texte = 0  # Abscisse de la fin du texte affiché, pour le curseur
+
+    def definir_actif(self, actif):
+        """Donne ou retire le focus au champ."""
+        if actif != self.actif:
+            self.actif = actif
+            self.invalider()
+
+    def gerer_touche(self, event):
+        """
+        Applique une touche au texte du champ
+
+        Args:
+            event: Événement KEYDOWN
+
+        Returns:
+            True si la touche a modifié le texte, False sinon
+        """
+        if event.key == pygame.K_BACKSPACE:
+            if not self.valeur:
+                return False
+            self.valeur = self.valeur[:-1]
+        elif event.unicode and self.caracteres_acceptes(event.unicode):
+            self.valeur += event.unicode
+        else:
+            return False
+        self.invalider()
+        return True
+
+    def _rendre(self):
+        couleur_bordure = self.couleur_bordure_active if self.actif else config.NOIR
+        surface = self._fond_et_bordure(config.BLANC, couleur_bordure, 2)
+        if self.valeur:
+            texte = _tronquer(self.police, self.valeur, config.NOIR, self.rect.width)
+        else:
+            texte = self.police.render(self.indication, True, (150, 150, 150))
+        surface.blit(texte, (5, (self.rect.height - texte.get_height()) // 2))
+        self._fin_texte = 5 + texte.get_width()
+        return surface
+
+    def dessiner_dynamique(self, ecran):
+        if self.actif and pygame.time.get_ticks() % 1000 < 500:
+            x = self.rect.x + self._fin_texte
+            pygame.draw.line(ecran, config.NOIR, (x, self.rect.y + 5), (x, self.rect.bottom - 5), 2)
+            return x
+        return None
+
+
+class Couche:
+    """Ensemble de widgets disposés ensemble et dessinés en un seul blit"""
+
+    def __init__(self, disposer, fond=None, opacite_fond=255):
+        """
+        Args:
+            disposer: Fonction sans argument qui place les widgets d'après config.LARGEUR/HAUTEUR
+            fond: Couleur de fond de la couche (None : transparente)
+            opacite_fond: Opacité du fond (moins de 255 pour l'assombrissement d'une fenêtre modale)
+        """
+        self.widgets = []
+        self._disposer = disposer
+        self.fond = fond
+        self.opacite_fond = opacite_fond
+        self._cle_disposition = None
+        self._composite = None
+        self._version = 0  # Incrémentée à chaque recomposition
+        self._interactifs = []
+        self._rects = []  # Index des rectangles des widgets interactifs
+        self._derniere_position = None
+        self._dernier_widget = None
+
+    def ajouter(self, widget):
+        """
+        Ajoute un widget (dessiné après ceux déjà ajoutés)
+
+        Returns:
+            Le widget ajouté
+        """
+        self.widgets.append(widget)
+        self._cle_disposition = None
+        return widget
+
+    def disposer_si_besoin(self):
+        """Recalcule la disposition si la taille de l'écran ou la config a changé depuis la précédente."""
+        cle = (config.LARGEUR, config.HAUTEUR, _generation)
+        if cle != self._cle_disposition:
+            self._disposer()
+            self._cle_disposition = cle
+            self._interactifs = [widget for widget in self.widgets if widget.interactif]
+            self._rects = [widget.rect for widget in self._interactifs]
+            self._derniere_position = None
+            self._composite = None
+
+    def _composer(self):
+        taille = (config.LARGEUR, config.HAUTEUR)
+        if self.fond is not None and self.opacite_fond >= 255:
+            composite = pygame.Surface(taille)
+            composite.fill(self.fond)
+        else:
+            composite = pygame.Surface(taille, pygame.SRCALPHA)
+            if self.fond is not None:
+                composite.fill((*self.fond, self.opacite_fond))
+        for widget in self.widgets:
+            composite.blit(widget.surface(), widget.rect)
+        # Format de l'écran : blit plus rapide (impossible sans fenêtre set_mode)
+        if pygame.display.get_surface() is not None:
+            composite = composite.convert_alpha() if composite.get_flags() & pygame.SRCALPHA else composite.convert()
+        self._composite = composite
+        self._version += 1
+
+    def dessiner(self, ecran):
+        """
+        Dessine la couche
+
+        Args:
+            ecran: Surface de destination
+
+        Returns:
+            État de l'image dessinée, égal d'une image à l'autre tant que la couche ne change pas
+            (à transmettre au moteur de rendu par noter_interface)
+        """
+        self.disposer_si_besoin()
+        if self._composite is None or any(widget.modifie for widget in self.widgets):
+            self._composer()
+        ecran.blit(self._composite, (0, 0))
+        dynamique = tuple(widget.dessiner_dynamique(ecran) for widget in self._interactifs)
+        return (self, self._version, dynamique)
+
+    def widget_a(self, position):
+        """
+        Widget interactif sous une position
+
+        Args:
+            position: Tuple (x, y) de la position
+
+        Returns:
+            Le widget (Bouton ou ChampTexte) ou None
+        """
+        self.disposer_si_besoin()
+        position = tuple(position)
+        if position != self._derniere_position:
+            index = pygame.Rect(position, (1, 1)).collidelist(self._rects)
+            self._derniere_position = position
+            self._dernier_widget = self._interactifs[index] if index >= 0 else None
+        return self._dernier_widget
+
+    def action_a(self, position):
+        """
+        Action du bouton sous une position
+
+        Returns:
+            L'action du bouton, ou None hors des boutons
+        """
+        widget = self.widget_a(position)
+        return widget.action if widget is not None else None